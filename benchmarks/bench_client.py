@@ -0,0 +1,185 @@
+"""
+benchmarks the whole client stack (Browser, Tab, Element) against the fake browser
+in fake_browser.py, so no chrome is needed and the measured time is spent in nodriver.
+
+measures:
+
+    - the cost per command sent through a tab, typed and raw (send_raw), and over a pipe
+    - the cost per event received and handled, typed and raw (subscribed by method name)
+    - fetching and querying a document of given size, with and without the dom mirror
+    - extracting the text and class of all links, through elements and through tab.snapshot()
+
+usage:
+
+    python benchmarks/bench_client.py [number of commands] [number of events] [number of nodes]
+"""
+
+import asyncio
+import sys
+import time
+
+try:
+    import nodriver
+    from nodriver import cdp
+    from nodriver.core.connection import Connection, PipeTransport
+except (ModuleNotFoundError, ImportError):
+    import os
+
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+    import nodriver
+    from nodriver import cdp
+    from nodriver.core.connection import Connection, PipeTransport
+
+from fake_browser import FakeBrowser
+
+DATA_RECEIVED = {
+    "requestId": "1000.1",
+    "timestamp": 1.0,
+    "dataLength": 1024,
+    "encodedDataLength": 512,
+}
+
+
+def report(label, number, elapsed):
+    print(
+        "%-36s %8d x  %10.1f us each  %10.0f per second"
+        % (label, number, elapsed / number * 1e6, number / elapsed)
+    )
+
+
+async def bench_commands(tab, number):
+    make = lambda: cdp.dom.describe_node(node_id=cdp.dom.NodeId(1))  # noqa
+    for _ in range(10):
+        await tab.send(make())
+    start = time.perf_counter()
+    for _ in range(number):
+        await tab.send(make())
+    report("tab.send(DOM.describeNode)", number, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(number):
+        await tab.send_raw("DOM.describeNode", {"nodeId": 1})
+    report("tab.send_raw(DOM.describeNode)", number, time.perf_counter() - start)
+
+
+async def bench_pipe(fake, number):
+    read_fd, write_fd = await fake.serve_pipe()
+    connection = Connection("pipe://", transport=PipeTransport(read_fd, write_fd))
+    # an error answer must not close the pipe, which can not be opened again
+    await connection.send(cdp.target.close_target(cdp.target.TargetID("gone")))
+    if connection.closed:
+        raise RuntimeError("the pipe was closed by an error answer")
+    start = time.perf_counter()
+    for _ in range(number):
+        await connection.send_raw("Browser.getVersion")
+    report("pipe send_raw(Browser.getVersion)", number, time.perf_counter() - start)
+    await connection.aclose()
+
+
+async def bench_events(fake, tab, number, event_type=cdp.network.DataReceived):
+    received = 0
+    done = asyncio.Event()
+
+    def handler(event):
+        nonlocal received
+        received += 1
+        if received == number:
+            done.set()
+
+    tab.add_handler(event_type, handler)
+    # makes sure the handler is registered before the flood starts
+    await tab.send(cdp.dom.describe_node(node_id=cdp.dom.NodeId(1)))
+    start = time.perf_counter()
+    await fake.flood("Network.dataReceived", DATA_RECEIVED, count=number)
+    await asyncio.wait_for(done.wait(), 60)
+    label = "raw" if isinstance(event_type, str) else "handled"
+    report("Network.dataReceived (%s)" % label, number, time.perf_counter() - start)
+    tab.remove_handler(event_type, handler)
+
+
+async def bench_document(tab, nodes, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await tab.send(cdp.dom.get_document(-1, True))
+    report("DOM.getDocument (%d nodes)" % nodes, repeat, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await tab.send_raw("DOM.getDocument", {"depth": -1, "pierce": True})
+    report(
+        "DOM.getDocument raw (%d nodes)" % nodes, repeat, time.perf_counter() - start
+    )
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        found = await tab.select_all(".c7")
+    report(
+        "tab.select_all('.c7') (%d found)" % len(found),
+        repeat,
+        time.perf_counter() - start,
+    )
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await tab.find_all("node %d" % (nodes - 1))
+    report("tab.find_all(text)", repeat, time.perf_counter() - start)
+
+    await tab.mirror_dom()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        found = await tab.select_all(".c7")
+    report(
+        "tab.select_all('.c7') mirrored",
+        repeat,
+        time.perf_counter() - start,
+    )
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await tab.find_all("node %d" % (nodes - 1))
+    report("tab.find_all(text) mirrored", repeat, time.perf_counter() - start)
+    await tab.mirror_dom(False)
+
+
+async def bench_extract(tab, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rows = [(link.text_all, link.attrs.get("class")) for link in await tab.select_all("a")]
+    report(
+        "extract links via elements (%d)" % len(rows),
+        repeat,
+        time.perf_counter() - start,
+    )
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        snap = await tab.snapshot()
+        links = snap.find(tag="a")
+        rows = [
+            (text, snap.attributes(i).get("class"))
+            for i, text in zip(links.tolist(), snap.texts(links))
+        ]
+    report(
+        "extract links via snapshot (%d)" % len(rows),
+        repeat,
+        time.perf_counter() - start,
+    )
+
+
+async def main(commands: int = 5000, events: int = 20000, nodes: int = 10000):
+    async with FakeBrowser(nodes=nodes) as fake:
+        browser = await nodriver.Browser.create(host=fake.host, port=fake.port)
+        tab = browser.main_tab
+        await bench_commands(tab, commands)
+        await bench_pipe(fake, commands)
+        await bench_events(fake, tab, events)
+        await bench_events(fake, tab, events, "Network.dataReceived")
+        await bench_document(tab, nodes)
+        await bench_extract(tab)
+        await browser.connection.aclose()
+        for each in browser.tabs:
+            await each.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*map(int, sys.argv[1:])))
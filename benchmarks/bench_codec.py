@@ -0,0 +1,208 @@
+"""
+benchmark of the json codecs used on the CDP wire path
+
+decodes and encodes a corpus of CDP messages with every codec which is installed.
+by default a synthetic corpus is used, modelled after a page with heavy network traffic
+(Network.* and Page.* events, a large DOM.getDocument response).
+you can also pass files with recorded CDP messages, one json message per line.
+
+usage:
+
+    python benchmarks/bench_codec.py [recorded.jsonl ...]
+"""
+
+import json
+import sys
+import time
+
+try:
+    from nodriver.core.connection import CODECS
+except (ModuleNotFoundError, ImportError):
+    import os
+
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+    from nodriver.core.connection import CODECS
+
+
+def synthetic_corpus(number: int = 2000):
+    headers = {
+        "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "accept-encoding": "gzip, deflate, br",
+        "accept-language": "en-US,en;q=0.9",
+        "user-agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "cookie": "session=" + "a1b2c3d4" * 16,
+    }
+    messages = []
+    for i in range(number):
+        request_id = "1000.%d" % i
+        url = "https://example.com/static/asset-%d.js?v=%d" % (i, i * 7)
+        messages.append(
+            {
+                "method": "Network.requestWillBeSent",
+                "params": {
+                    "requestId": request_id,
+                    "loaderId": "F1E2D3C4B5A6",
+                    "documentURL": "https://example.com/",
+                    "request": {
+                        "url": url,
+                        "method": "GET",
+                        "headers": headers,
+                        "mixedContentType": "none",
+                        "initialPriority": "High",
+                        "referrerPolicy": "strict-origin-when-cross-origin",
+                    },
+                    "timestamp": 1000.0 + i / 1000,
+                    "wallTime": 1700000000.0 + i / 1000,
+                    "initiator": {"type": "parser", "url": "https://example.com/"},
+                    "redirectHasExtraInfo": False,
+                    "type": "Script",
+                    "frameId": "F1E2D3C4B5A6",
+                    "hasUserGesture": False,
+                },
+                "sessionId": "0123456789ABCDEF",
+            }
+        )
+        messages.append(
+            {
+                "method": "Network.responseReceived",
+                "params": {
+                    "requestId": request_id,
+                    "loaderId": "F1E2D3C4B5A6",
+                    "timestamp": 1000.1 + i / 1000,
+                    "type": "Script",
+                    "response": {
+                        "url": url,
+                        "status": 200,
+                        "statusText": "OK",
+                        "headers": {
+                            "content-type": "application/javascript; charset=utf-8",
+                            "content-length": str(1000 + i),
+                            "cache-control": "max-age=31536000",
+                            "date": "Mon, 01 Jan 2024 00:00:00 GMT",
+                        },
+                        "mimeType": "application/javascript",
+                        "connectionReused": True,
+                        "connectionId": 42,
+                        "remoteIPAddress": "93.184.216.34",
+                        "remotePort": 443,
+                        "fromDiskCache": False,
+                        "fromServiceWorker": False,
+                        "encodedDataLength": 312,
+                        "timing": {
+                            "requestTime": 1000.0 + i / 1000,
+                            "dnsStart": -1,
+                            "dnsEnd": -1,
+                            "connectStart": -1,
+                            "connectEnd": -1,
+                            "sendStart": 0.1,
+                            "sendEnd": 0.2,
+                            "receiveHeadersEnd": 12.5,
+                        },
+                        "responseTime": 1700000000000.0 + i,
+                        "protocol": "h2",
+                        "securityState": "secure",
+                    },
+                    "hasExtraInfo": True,
+                    "frameId": "F1E2D3C4B5A6",
+                },
+                "sessionId": "0123456789ABCDEF",
+            }
+        )
+        messages.append(
+            {
+                "method": "Network.dataReceived",
+                "params": {
+                    "requestId": request_id,
+                    "timestamp": 1000.2 + i / 1000,
+                    "dataLength": 1000 + i,
+                    "encodedDataLength": 0,
+                },
+            }
+        )
+        if not i % 100:
+            messages.append(
+                {
+                    "method": "Page.lifecycleEvent",
+                    "params": {
+                        "frameId": "F1E2D3C4B5A6",
+                        "loaderId": "F1E2D3C4B5A6",
+                        "name": "networkAlmostIdle",
+                        "timestamp": 1000.0 + i / 1000,
+                    },
+                }
+            )
+    node_id = iter(range(1, 1 << 30))
+
+    def node(depth):
+        n = {
+            "nodeId": next(node_id),
+            "backendNodeId": 1,
+            "nodeType": 1,
+            "nodeName": "DIV",
+            "localName": "div",
+            "nodeValue": "",
+            "attributes": ["class", "item item-%d" % depth, "data-x", "1"],
+        }
+        if depth:
+            n["childNodeCount"] = 4
+            n["children"] = [node(depth - 1) for _ in range(4)]
+        return n
+
+    messages.append({"id": 1, "result": {"root": node(6)}})
+    return messages
+
+
+def load_corpus(paths):
+    messages = []
+    for path in paths:
+        with open(path, "rb") as fh:
+            for line in fh:
+                line = line.strip()
+                if line:
+                    messages.append(json.loads(line))
+    return messages
+
+
+def bench(codec, frames, messages, repeat: int = 5):
+    loads, dumps = codec.loads, codec.dumps
+    results = {}
+    for label, fn, corpus in (
+        ("loads(str)", loads, frames),
+        ("loads(bytes)", loads, [f.encode() for f in frames]),
+        ("dumps", dumps, messages),
+    ):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for item in corpus:
+                fn(item)
+            best = min(best, time.perf_counter() - start)
+        results[label] = best
+    return results
+
+
+def main(paths):
+    messages = load_corpus(paths) if paths else synthetic_corpus()
+    frames = [json.dumps(m) for m in messages]
+    size = sum(map(len, frames))
+    print(
+        "corpus: %d messages, %.1f MB%s"
+        % (len(frames), size / 1e6, "" if paths else " (synthetic)")
+    )
+    for name, codec_cls in CODECS.items():
+        try:
+            codec = codec_cls()
+        except ImportError:
+            print("%-10s not installed" % name)
+            continue
+        results = bench(codec, frames, messages)
+        for label, elapsed in results.items():
+            print(
+                "%-10s %-14s %8.1f ms  %8.1f MB/s"
+                % (name, label, elapsed * 1e3, size / elapsed / 1e6)
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,240 @@
+"""
+benchmarks decoding cdp payloads into the generated types (the from_json methods),
+so the decoder throughput can be compared between releases.
+
+decodes:
+
+    - DOM.getDocument results (the Node tree), and the memory the decoded tree takes
+    - Network.responseReceived events
+    - Page.frameNavigated events
+
+the events are also decoded followed by reading the fields a handler typically reads,
+which shows the difference when the package is generated with lazy decoding
+(generate_cdp.py --lazy). the document is always walked entirely.
+
+by default synthetic payloads are used, the document is the one of fake_browser.py.
+you can also pass logs recorded with Config.record (see nodriver/core/recorder.py),
+in which case the payloads of above methods found in the logs are decoded.
+
+usage:
+
+    python benchmarks/bench_decode.py [recorded.jsonl ...]
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+try:
+    from nodriver import cdp
+except (ModuleNotFoundError, ImportError):
+    import os
+
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+    from nodriver import cdp
+
+from fake_browser import build_document
+
+RESPONSE_RECEIVED = {
+    "requestId": "1000.1",
+    "loaderId": "F1E2D3C4B5A6",
+    "timestamp": 1000.1,
+    "type": "Script",
+    "response": {
+        "url": "https://example.com/static/asset-1.js?v=7",
+        "status": 200,
+        "statusText": "OK",
+        "headers": {
+            "content-type": "application/javascript; charset=utf-8",
+            "content-length": "1001",
+            "cache-control": "max-age=31536000",
+            "date": "Mon, 01 Jan 2024 00:00:00 GMT",
+        },
+        "mimeType": "application/javascript",
+        "charset": "utf-8",
+        "connectionReused": True,
+        "connectionId": 42,
+        "remoteIPAddress": "93.184.216.34",
+        "remotePort": 443,
+        "fromDiskCache": False,
+        "fromServiceWorker": False,
+        "fromPrefetchCache": False,
+        "encodedDataLength": 312,
+        "timing": {
+            "requestTime": 1000.0,
+            "proxyStart": -1,
+            "proxyEnd": -1,
+            "dnsStart": -1,
+            "dnsEnd": -1,
+            "connectStart": -1,
+            "connectEnd": -1,
+            "sslStart": -1,
+            "sslEnd": -1,
+            "workerStart": -1,
+            "workerReady": -1,
+            "workerFetchStart": -1,
+            "workerRespondWithSettled": -1,
+            "sendStart": 0.1,
+            "sendEnd": 0.2,
+            "pushStart": 0,
+            "pushEnd": 0,
+            "receiveHeadersStart": 12.1,
+            "receiveHeadersEnd": 12.5,
+        },
+        "responseTime": 1700000000000.0,
+        "protocol": "h2",
+        "alternateProtocolUsage": "unspecifiedReason",
+        "securityState": "secure",
+        "securityDetails": {
+            "protocol": "TLS 1.3",
+            "keyExchange": "",
+            "keyExchangeGroup": "X25519",
+            "cipher": "AES_128_GCM",
+            "certificateId": 0,
+            "subjectName": "example.com",
+            "sanList": ["example.com", "www.example.com"],
+            "issuer": "Example CA",
+            "validFrom": 1700000000,
+            "validTo": 1800000000,
+            "signedCertificateTimestampList": [],
+            "certificateTransparencyCompliance": "compliant",
+            "encryptedClientHello": False,
+        },
+    },
+    "hasExtraInfo": True,
+    "frameId": "F1E2D3C4B5A6",
+}
+
+FRAME_NAVIGATED = {
+    "frame": {
+        "id": "F1E2D3C4B5A6",
+        "loaderId": "A6B5C4D3E2F1",
+        "url": "https://example.com/",
+        "domainAndRegistry": "example.com",
+        "securityOrigin": "https://example.com",
+        "mimeType": "text/html",
+        "adFrameStatus": {"adFrameType": "none"},
+        "secureContextType": "Secure",
+        "crossOriginIsolatedContextType": "NotIsolated",
+        "gatedAPIFeatures": [],
+    },
+    "type": "Navigation",
+}
+
+
+def synthetic_payloads(nodes=(10000, 100000)):
+    payloads = {
+        "Network.responseReceived": [RESPONSE_RECEIVED] * 1000,
+        "Page.frameNavigated": [FRAME_NAVIGATED] * 1000,
+    }
+    payloads["DOM.getDocument"] = [{"root": build_document(n)} for n in nodes]
+    return payloads
+
+
+def recorded_payloads(paths):
+    """collects the payloads of the benchmarked methods from recorded logs"""
+    payloads = {method: [] for method in DECODERS}
+    for path in paths:
+        # (connection, session, id) => method of the command
+        commands = {}
+        with open(path, "rb") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                message = entry["m"]
+                if entry["d"] == ">":
+                    key = entry["c"], message.get("sessionId"), message.get("id")
+                    commands[key] = message.get("method")
+                elif entry["d"] == "<":
+                    if "method" in message:
+                        method, payload = message["method"], message.get("params")
+                    else:
+                        key = entry["c"], message.get("sessionId"), message.get("id")
+                        method, payload = commands.get(key), message.get("result")
+                    if method in payloads and payload:
+                        payloads[method].append(payload)
+    return payloads
+
+
+def count(node: cdp.dom.Node) -> int:
+    return 1 + sum(map(count, node.children or ()))
+
+
+DECODERS = {
+    "DOM.getDocument": lambda result: cdp.dom.Node.from_json(result["root"]),
+    "Network.responseReceived": cdp.network.ResponseReceived.from_json,
+    "Page.frameNavigated": cdp.page.FrameNavigated.from_json,
+}
+
+# method => fields of the decoded event read by a typical handler
+READERS = {
+    "Network.responseReceived": lambda event: event.response.status,
+    "Page.frameNavigated": lambda event: event.frame.url,
+}
+
+
+def bench(method, payloads, repeat: int = 5):
+    decode = DECODERS[method]
+    read = READERS[method]
+    for label, fn in (
+        (method, decode),
+        (method + " + read", lambda payload: read(decode(payload))),
+    ):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for payload in payloads:
+                fn(payload)
+            best = min(best, time.perf_counter() - start)
+        print(
+            "%-35s %6d x  %10.1f us each  %10.0f per second"
+            % (label, len(payloads), best / len(payloads) * 1e6, len(payloads) / best)
+        )
+
+
+def bench_document(result, repeat: int = 5):
+    decode = DECODERS["DOM.getDocument"]
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count(decode(result))
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    decoded = decode(result)
+    total = count(decoded)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        "DOM.getDocument %7d nodes  %8.1f ms  %6.2f us/node  %8.1f MiB  %5d bytes/node"
+        % (
+            total,
+            best * 1e3,
+            best / total * 1e6,
+            size / 2**20,
+            size / total,
+        )
+    )
+
+
+def main(paths):
+    payloads = recorded_payloads(paths) if paths else synthetic_payloads()
+    print("slotted types: %s  lazy decoding: %s" % (cdp.util.SLOTS, cdp.util.LAZY))
+    for method in DECODERS:
+        if not payloads[method]:
+            print("%-35s no payloads" % method)
+        elif method == "DOM.getDocument":
+            for result in payloads[method]:
+                bench_document(result)
+        else:
+            bench(method, payloads[method])
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
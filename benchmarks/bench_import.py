@@ -0,0 +1,75 @@
+"""
+benchmark of the import time of nodriver and nodriver.cdp
+
+every import is timed in a fresh interpreter, so nothing is cached in sys.modules.
+(importing nodriver.cdp imports the nodriver package as well, so it is not timed separately)
+also reports how many of the generated cdp domain modules got loaded by the import,
+and fails when importing nodriver loads more than cdp.util, since the domains are
+imported on first use.
+
+usage:
+
+    python benchmarks/bench_import.py [number of runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [name for name in sys.modules if name.startswith("nodriver.cdp.")]
+print(elapsed, len(loaded))
+"""
+
+# label, module, the maximum number of cdp modules it may load (None: not checked)
+TARGETS = [
+    # only nodriver.cdp.util
+    ("import nodriver", "nodriver", 1),
+    # a domain which is not used by nodriver itself, and the domains it refers to
+    ("import nodriver; cdp.animation", "nodriver; nodriver.cdp.animation", None),
+]
+
+
+def measure(module: str, runs: int):
+    timings = []
+    loaded = 0
+    env = dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE="")
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, "-c", SCRIPT.format(module=module)], env=env, text=True
+        )
+        elapsed, loaded = output.split()
+        timings.append(float(elapsed))
+    return timings, int(loaded)
+
+
+def main(runs: int = 10):
+    # warms up the bytecode cache
+    measure("nodriver", 1)
+    for label, module, max_loaded in TARGETS:
+        timings, loaded = measure(module, runs)
+        print(
+            "%-32s median %7.1f ms  min %7.1f ms  %3d cdp modules loaded"
+            % (
+                label,
+                statistics.median(timings) * 1e3,
+                min(timings) * 1e3,
+                loaded,
+            )
+        )
+        if max_loaded is not None and loaded > max_loaded:
+            raise AssertionError(
+                "%s loaded %d cdp modules, expected at most %d"
+                % (label, loaded, max_loaded)
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,110 @@
+"""
+micro-benchmark for the cost per command of Connection.send()
+
+runs a local websocket server which answers every command immediately,
+so the measured time is (almost) entirely spent in nodriver itself.
+a few handlers are registered, like you would have in a normal session,
+to include the cost of domain registration.
+
+usage:
+
+    python benchmarks/bench_send.py [number of commands]
+"""
+
+import asyncio
+import json
+import sys
+import time
+
+try:
+    from nodriver import cdp
+    from nodriver.core.connection import Connection
+except (ModuleNotFoundError, ImportError):
+    import os
+
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+    from nodriver import cdp
+    from nodriver.core.connection import Connection
+
+from websockets.asyncio.server import serve
+
+NODE = {
+    "nodeId": 1,
+    "backendNodeId": 1,
+    "nodeType": 1,
+    "nodeName": "DIV",
+    "localName": "div",
+    "nodeValue": "",
+}
+
+
+async def answer(websocket):
+    async for message in websocket:
+        message = json.loads(message)
+        result = {"node": NODE} if message["method"] == "DOM.describeNode" else {}
+        await websocket.send(json.dumps({"id": message["id"], "result": result}))
+
+
+async def bench(label, connection, make_command, number):
+    # warm up (opens the connection, enables the domains)
+    for _ in range(10):
+        await connection.send(make_command())
+    start = time.perf_counter()
+    for _ in range(number):
+        await connection.send(make_command())
+    elapsed = time.perf_counter() - start
+    print(
+        "%-28s %8d commands  %8.1f us/command  %8.0f commands/s"
+        % (label, number, elapsed / number * 1e6, number / elapsed)
+    )
+
+
+async def bench_many(label, connection, make_command, number, batch_size=100):
+    await connection.send_many(make_command() for _ in range(batch_size))
+    start = time.perf_counter()
+    for _ in range(number // batch_size):
+        await connection.send_many(make_command() for _ in range(batch_size))
+    elapsed = time.perf_counter() - start
+    number = number // batch_size * batch_size
+    print(
+        "%-28s %8d commands  %8.1f us/command  %8.0f commands/s"
+        % (label, number, elapsed / number * 1e6, number / elapsed)
+    )
+
+
+async def main(number: int = 5000):
+    async with serve(answer, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        connection = Connection("ws://127.0.0.1:%d/devtools/page/bench" % port)
+        for event_type in (
+            cdp.page.LoadEventFired,
+            cdp.page.FrameNavigated,
+            cdp.network.RequestWillBeSent,
+            cdp.network.ResponseReceived,
+            cdp.runtime.ConsoleAPICalled,
+        ):
+            connection.add_handler(event_type, lambda event: None)
+
+        await bench(
+            "DOM.describeNode",
+            connection,
+            lambda: cdp.dom.describe_node(node_id=cdp.dom.NodeId(1)),
+            number,
+        )
+        await bench(
+            "Input.dispatchKeyEvent",
+            connection,
+            lambda: cdp.input_.dispatch_key_event("char", text="a"),
+            number,
+        )
+        await bench_many(
+            "DOM.describeNode (send_many)",
+            connection,
+            lambda: cdp.dom.describe_node(node_id=cdp.dom.NodeId(1)),
+            number,
+        )
+        await connection.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*map(int, sys.argv[1:])))
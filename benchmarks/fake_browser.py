@@ -0,0 +1,949 @@
+"""
+an in-process stand-in for a browser, to benchmark nodriver itself.
+
+serves the devtools http endpoints (/json/version, /json/list) and websockets on a local port
+(or a browser connection over pipes, see :py:meth:`FakeBrowser.serve_pipe`),
+and implements the part of Target, Page, DOM, DOMSnapshot and Runtime that nodriver uses: enough to attach
+to it using ``Browser.create(host=..., port=...)``, open tabs, navigate, fetch (synthetic) documents
+and query them. it can also flood the connections with events at a chosen rate, and change
+the documents like a page script would (see :py:meth:`FakeTarget.insert`).
+
+since it runs in the same event loop as the client and answers right away, the measured time is
+(almost) entirely spent in nodriver. encoded documents are cached, so serving a large document
+costs the server next to nothing.
+
+.. code-block::
+
+    async with FakeBrowser(nodes=10_000) as fake:
+        browser = await nodriver.Browser.create(host=fake.host, port=fake.port)
+        tab = browser.main_tab
+        await tab.select_all("div")
+        await fake.flood("Network.dataReceived", {...}, count=10_000, rate=50_000)
+
+commands can be added or overridden using the handlers dict:
+
+    fake.handlers["Runtime.evaluate"] = lambda target, params: {"result": {"type": "number", "value": 1}}
+
+unknown commands are answered with an error, like chrome does. commands of the domains in
+:py:attr:`FakeBrowser.accept_all` and any X.enable / X.disable command get an empty result.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from websockets.asyncio.server import serve
+from websockets.datastructures import Headers
+from websockets.http11 import Response
+
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) FakeBrowser/1.0 Safari/537.36"
+)
+
+TAGS = ("div", "span", "p", "a", "li")
+
+
+class CommandError(Exception):
+    """raise from a handler to answer the command with an error"""
+
+    def __init__(self, message: str, code: int = -32000):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+
+def build_document(
+    nodes: int = 1000, fanout: int = 10, url: str = "about:blank"
+) -> dict:
+    """
+    builds a synthetic document, in the shape of DOM.getDocument(depth=-1).
+
+    the body holds `nodes` elements (div, span, p, a, li), `fanout` children per element,
+    and every element holds a text node "node <n>". element n has id "n<n>" and classes "item c<n % 100>".
+
+    :param nodes: number of elements in the body
+    :param fanout: children per element
+    :param url: document url
+    :return: the document node
+    """
+    ids = itertools.count(1)
+
+    def node(node_type, name, value="", attributes=None):
+        node_id = next(ids)
+        item = {
+            "nodeId": node_id,
+            "backendNodeId": node_id,
+            "nodeType": node_type,
+            "nodeName": name.upper() if node_type == 1 else name,
+            "localName": name if node_type == 1 else "",
+            "nodeValue": value,
+            "childNodeCount": 0,
+            "children": [],
+        }
+        if attributes is not None:
+            item["attributes"] = attributes
+        return item
+
+    def append(parent, child):
+        child["parentId"] = parent["nodeId"]
+        parent["children"].append(child)
+        parent["childNodeCount"] += 1
+
+    document = node(9, "#document")
+    document.update(
+        documentURL=url, baseURL=url, xmlVersion="", compatibilityMode="NoQuirksMode"
+    )
+    html = node(1, "html", attributes=[])
+    head = node(1, "head", attributes=[])
+    body = node(1, "body", attributes=[])
+    title = node(1, "title", attributes=[])
+    append(document, html)
+    append(html, head)
+    append(head, title)
+    append(title, node(3, "#text", "fake document"))
+    append(html, body)
+
+    elements = [body]
+    for n in range(nodes):
+        parent = elements[n // fanout]
+        element = node(
+            1,
+            TAGS[n % len(TAGS)],
+            attributes=["id", "n%d" % n, "class", "item c%d" % (n % 100)],
+        )
+        append(element, node(3, "#text", "node %d" % n))
+        append(parent, element)
+        elements.append(element)
+    return document
+
+
+def _matches(node: dict, selector: str) -> bool:
+    """matches the simple selectors: tag, #id, .class, tag.class and tag#id"""
+    if node["nodeType"] != 1:
+        return False
+    attributes = node.get("attributes") or []
+    attrs = dict(zip(attributes[::2], attributes[1::2]))
+    tag, _, rest = (
+        selector.partition("#") if "#" in selector else selector.partition(".")
+    )
+    if tag and tag != "*" and tag.lower() != node["localName"]:
+        return False
+    if "#" in selector:
+        return attrs.get("id") == rest
+    if rest:
+        return rest in attrs.get("class", "").split()
+    return True
+
+
+def _walk(node: dict):
+    yield node
+    for child in node.get("children", ()):
+        yield from _walk(child)
+
+
+def _strip(node: dict, depth: int) -> dict:
+    """copy of node, with children up to depth levels deep"""
+    copy = dict(node)
+    if depth == 0:
+        copy.pop("children", None)
+    else:
+        copy["children"] = [
+            _strip(child, depth - 1) for child in node.get("children", ())
+        ]
+    return copy
+
+
+def _outer_html(node: dict) -> str:
+    if node["nodeType"] == 3:
+        return node["nodeValue"]
+    inner = "".join(_outer_html(child) for child in node.get("children", ()))
+    if node["nodeType"] != 1:
+        return inner
+    attributes = node.get("attributes") or []
+    attrs = "".join(
+        ' %s="%s"' % pair for pair in zip(attributes[::2], attributes[1::2])
+    )
+    return "<%s%s>%s</%s>" % (node["localName"], attrs, inner, node["localName"])
+
+
+def _capture_snapshot(document: dict, computed_styles: List[str]) -> dict:
+    """
+    the document in the shape of DOMSnapshot.captureSnapshot. the head is not rendered, neither is
+    element n when n % 10 == 8 (display: none), element n is invisible when n % 10 == 9 (visibility: hidden).
+    """
+    strings: List[str] = []
+    ids: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        if value not in ids:
+            ids[value] = len(strings)
+            strings.append(value)
+        return ids[value]
+
+    nodes = {
+        "parentIndex": [],
+        "nodeType": [],
+        "nodeName": [],
+        "nodeValue": [],
+        "backendNodeId": [],
+        "attributes": [],
+    }
+    layout = {"nodeIndex": [], "styles": [], "bounds": [], "text": []}
+    stack = [(document, -1, True, "visible")]
+    while stack:
+        node, parent, rendered, visibility = stack.pop()
+        index = len(nodes["parentIndex"])
+        attributes = node.get("attributes") or []
+        nodes["parentIndex"].append(parent)
+        nodes["nodeType"].append(node["nodeType"])
+        nodes["nodeName"].append(intern(node["nodeName"]))
+        nodes["nodeValue"].append(intern(node["nodeValue"]) if node["nodeValue"] else -1)
+        nodes["backendNodeId"].append(node["backendNodeId"])
+        nodes["attributes"].append([intern(each) for each in attributes])
+        attrs = dict(zip(attributes[::2], attributes[1::2]))
+        n = attrs.get("id", "")[1:]
+        if node["localName"] == "head" or n.isdigit() and int(n) % 10 == 8:
+            rendered = False
+        if n.isdigit() and int(n) % 10 == 9:
+            visibility = "hidden"
+        if rendered:
+            style = {"display": "block", "visibility": visibility, "opacity": "1"}
+            layout["nodeIndex"].append(index)
+            layout["styles"].append(
+                [intern(style.get(name, "")) for name in computed_styles]
+            )
+            layout["bounds"].append([0, len(layout["bounds"]) * 20, 100, 20])
+            layout["text"].append(
+                intern(node["nodeValue"]) if node["nodeType"] == 3 else -1
+            )
+        for child in reversed(node.get("children", ())):
+            stack.append((child, index, rendered, visibility))
+    return {
+        "documents": [
+            {
+                "documentURL": intern(document.get("documentURL", "")),
+                "title": -1,
+                "baseURL": intern(document.get("baseURL", "")),
+                "contentLanguage": -1,
+                "encodingName": intern("UTF-8"),
+                "publicId": -1,
+                "systemId": -1,
+                "frameId": -1,
+                "nodes": nodes,
+                "layout": layout,
+                "textBoxes": {"layoutIndex": [], "bounds": [], "start": [], "length": []},
+            }
+        ],
+        "strings": strings,
+    }
+
+
+class FakeTarget:
+    """a page of the fake browser, holding its document"""
+
+    def __init__(
+        self,
+        target_id: str,
+        url: str = "about:blank",
+        nodes: int = 1000,
+        fanout: int = 10,
+    ):
+        self.target_id = target_id
+        self.url = url
+        self.title = url
+        self.loader_ids = itertools.count(1)
+        self.loader_id = "L%s-0" % target_id
+        self.set_document(nodes, fanout)
+
+    def set_document(self, nodes: int = 1000, fanout: int = 10):
+        """replaces the document by a synthetic one (see :py:func:`build_document`)"""
+        self.document = build_document(nodes, fanout, self.url)
+        self.nodes = {node["nodeId"]: node for node in _walk(self.document)}
+        self.node_ids = itertools.count(max(self.nodes) + 1)
+        # getDocument(-1) is answered with this over and over, so it is encoded once
+        # (and again after the document changed)
+        self.encoded_document = json.dumps({"root": self.document})
+        # computed styles => encoded DOMSnapshot.captureSnapshot result
+        self.encoded_snapshots: Dict[Tuple[str, ...], str] = {}
+
+    def insert(
+        self, parent_id: int, tag: str = "div", text: str = "inserted"
+    ) -> Tuple[str, dict]:
+        """
+        appends an element holding a text node to a node.
+        like chrome, the event holds the element without its children, which are sent
+        when requested using DOM.requestChildNodes.
+
+        :return: the DOM.childNodeInserted event, as (method, params) for FakeBrowser.emit
+        """
+        parent = self.nodes[parent_id]
+        previous = parent["children"][-1]["nodeId"] if parent["children"] else 0
+        element = self._new_node(1, tag, attributes=[])
+        self._append(element, self._new_node(3, "#text", text))
+        self._append(parent, element)
+        return "DOM.childNodeInserted", {
+            "parentNodeId": parent_id,
+            "previousNodeId": previous,
+            "node": _strip(element, 0),
+        }
+
+    def remove(self, node_id: int) -> Tuple[str, dict]:
+        """
+        removes a node
+
+        :return: the DOM.childNodeRemoved event, as (method, params) for FakeBrowser.emit
+        """
+        node = self.nodes[node_id]
+        parent = self.nodes[node["parentId"]]
+        parent["children"].remove(node)
+        parent["childNodeCount"] -= 1
+        for each in _walk(node):
+            del self.nodes[each["nodeId"]]
+        self._changed()
+        return "DOM.childNodeRemoved", {
+            "parentNodeId": parent["nodeId"],
+            "nodeId": node_id,
+        }
+
+    def set_attribute(self, node_id: int, name: str, value: str) -> Tuple[str, dict]:
+        """
+        sets an attribute of an element
+
+        :return: the DOM.attributeModified event, as (method, params) for FakeBrowser.emit
+        """
+        attributes = self.nodes[node_id]["attributes"]
+        if name in attributes[::2]:
+            attributes[attributes[::2].index(name) * 2 + 1] = value
+        else:
+            attributes.extend((name, value))
+        self._changed()
+        return "DOM.attributeModified", {"nodeId": node_id, "name": name, "value": value}
+
+    def _new_node(self, node_type, name, value="", attributes=None) -> dict:
+        node_id = next(self.node_ids)
+        node = {
+            "nodeId": node_id,
+            "backendNodeId": node_id,
+            "nodeType": node_type,
+            "nodeName": name.upper() if node_type == 1 else name,
+            "localName": name if node_type == 1 else "",
+            "nodeValue": value,
+            "childNodeCount": 0,
+            "children": [],
+        }
+        if attributes is not None:
+            node["attributes"] = attributes
+        self.nodes[node_id] = node
+        return node
+
+    def _append(self, parent, child):
+        child["parentId"] = parent["nodeId"]
+        parent["children"].append(child)
+        parent["childNodeCount"] += 1
+        self._changed()
+
+    def _changed(self):
+        self.encoded_document = None
+        self.encoded_snapshots.clear()
+
+    @property
+    def info(self) -> dict:
+        return {
+            "targetId": self.target_id,
+            "type": "page",
+            "title": self.title,
+            "url": self.url,
+            "attached": True,
+            "canAccessOpener": False,
+            "browserContextId": "C1",
+        }
+
+    def node(self, params: dict) -> dict:
+        node_id = params.get("nodeId") or params.get("backendNodeId")
+        if node_id is None and params.get("objectId"):
+            node_id = int(params["objectId"].rpartition("-")[2])
+        try:
+            return self.nodes[node_id]
+        except KeyError:
+            raise CommandError("Could not find node with given id")
+
+
+class _PipeSocket:
+    """
+    the browser's end of a pair of pipes (like --remote-debugging-pipe: messages separated by a NUL byte),
+    with the send() and async iteration of a websocket
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, message: str):
+        self.writer.write(message.encode() + b"\0")
+        await self.writer.drain()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+        try:
+            return (await self.reader.readuntil(b"\0"))[:-1]
+        except asyncio.IncompleteReadError:
+            raise StopAsyncIteration
+
+    def close(self):
+        self.writer.close()
+
+
+class _Client:
+    """a websocket (or pipe) connected to the fake browser"""
+
+    def __init__(self, websocket, target: Optional[FakeTarget]):
+        self.websocket = websocket
+        self.target = target
+        self.sessions: Dict[str, FakeTarget] = {}
+        self.discover = False
+
+
+class FakeBrowser:
+    """
+    the fake browser (see module docs).
+
+    :param host: host to listen on
+    :param port: port to listen on, 0 (default) picks a free port
+    :param nodes: number of elements in the document of every page
+    :param fanout: children per element in those documents
+    :param pages: number of pages open at the start
+    """
+
+    accept_all = {"Input", "Overlay", "Emulation", "Network", "Log", "Fetch", "Storage"}
+
+    events_first = ("Target.", "DOM.setChildNodes")
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        nodes: int = 1000,
+        fanout: int = 10,
+        pages: int = 1,
+    ):
+        self.host = host
+        self.port = port
+        self.nodes = nodes
+        self.fanout = fanout
+        self.handlers: Dict[str, Callable[[Optional[FakeTarget], dict], dict]] = {}
+        #: expression => value, for Runtime.evaluate
+        self.evaluate: Dict[str, object] = {
+            "document.readyState": "complete",
+            "navigator.userAgent": USER_AGENT,
+        }
+        self.targets: Dict[str, FakeTarget] = {}
+        self.clients: List[_Client] = []
+        self.commands = 0
+        self._target_ids = itertools.count(1)
+        self._session_ids = itertools.count(1)
+        self._script_ids = itertools.count(1)
+        self._searches: Dict[str, list] = {}
+        self._server = None
+        self._pipe_tasks: List[asyncio.Task] = []
+        for _ in range(pages):
+            self.new_target()
+
+    @property
+    def version(self) -> dict:
+        return {
+            "Browser": "FakeBrowser/1.0",
+            "Protocol-Version": "1.3",
+            "User-Agent": USER_AGENT,
+            "V8-Version": "1.0",
+            "WebKit-Version": "537.36",
+            "webSocketDebuggerUrl": "ws://%s:%d/devtools/browser/fake"
+            % (self.host, self.port),
+        }
+
+    def new_target(self, url: str = "about:blank") -> FakeTarget:
+        target_id = "T%d" % next(self._target_ids)
+        target = self.targets[target_id] = FakeTarget(
+            target_id, url, self.nodes, self.fanout
+        )
+        return target
+
+    async def start(self):
+        self._server = await serve(
+            self._serve,
+            self.host,
+            self.port,
+            process_request=self._http,
+            max_size=2**30,
+            compression=None,
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in self._pipe_tasks:
+            task.cancel()
+
+    async def serve_pipe(self) -> Tuple[int, int]:
+        """
+        serves a browser connection over a pair of pipes, like a browser started with --remote-debugging-pipe.
+
+        .. code-block::
+
+            read_fd, write_fd = await fake.serve_pipe()
+            connection = Connection("pipe://", transport=PipeTransport(read_fd, write_fd))
+
+        :return: the client's ends of the pipes: the one to read from, and the one to write to
+        """
+        loop = asyncio.get_running_loop()
+        client_read, browser_write = os.pipe()
+        browser_read, client_write = os.pipe()
+        reader = asyncio.StreamReader(limit=2**30)
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader),
+            open(browser_read, "rb", buffering=0),
+        )
+        transport, protocol = await loop.connect_write_pipe(
+            asyncio.streams.FlowControlMixin, open(browser_write, "wb", buffering=0)
+        )
+        writer = asyncio.StreamWriter(transport, protocol, None, loop)
+        client = _Client(_PipeSocket(reader, writer), None)
+        self._pipe_tasks.append(asyncio.ensure_future(self._serve_client(client)))
+        return client_read, client_write
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def flood(
+        self,
+        method: str,
+        params: dict = None,
+        count: int = 1000,
+        rate: Optional[float] = None,
+        target: Optional[FakeTarget] = None,
+    ) -> float:
+        """
+        sends `count` events to every connection of target (by default the first page).
+
+        :param method: event, eg: "Network.dataReceived"
+        :param params: event params
+        :param count: number of events
+        :param rate: events per second, None (default) sends as fast as possible
+        :return: seconds it took to send them
+        """
+        target = target or next(iter(self.targets.values()))
+        messages = [
+            json.dumps(
+                self._with_session(
+                    {"method": method, "params": params or {}}, session_id
+                )
+            )
+            for session_id, client in self._recipients(target)
+        ]
+        websockets = [client.websocket for _, client in self._recipients(target)]
+        start = time.perf_counter()
+        for n in range(count):
+            for websocket, message in zip(websockets, messages):
+                await websocket.send(message)
+            if rate:
+                ahead = (n + 1) / rate - (time.perf_counter() - start)
+                if ahead > 0:
+                    await asyncio.sleep(ahead)
+        return time.perf_counter() - start
+
+    async def emit(
+        self, method: str, params: dict = None, target: Optional[FakeTarget] = None
+    ):
+        """
+        sends an event to every connection of target,
+        or to the browser connections when target is None
+        """
+        if target is None:
+            recipients = [
+                (None, client) for client in self.clients if client.target is None
+            ]
+        else:
+            recipients = self._recipients(target)
+        for session_id, client in recipients:
+            message = self._with_session(
+                {"method": method, "params": params or {}}, session_id
+            )
+            await client.websocket.send(json.dumps(message))
+
+    def _recipients(self, target: FakeTarget) -> List[Tuple[Optional[str], _Client]]:
+        recipients = []
+        for client in self.clients:
+            if client.target is target:
+                recipients.append((None, client))
+            for session_id, session_target in client.sessions.items():
+                if session_target is target:
+                    recipients.append((session_id, client))
+        return recipients
+
+    @staticmethod
+    def _with_session(message: dict, session_id: Optional[str]) -> dict:
+        if session_id:
+            message["sessionId"] = session_id
+        return message
+
+    def _http(self, connection, request):
+        path = request.path.split("?")[0].rstrip("/")
+        if path == "/json/version":
+            body = self.version
+        elif path in ("/json", "/json/list"):
+            body = [
+                dict(
+                    id=target.target_id,
+                    type="page",
+                    title=target.title,
+                    url=target.url,
+                    webSocketDebuggerUrl="ws://%s:%d/devtools/page/%s"
+                    % (self.host, self.port, target.target_id),
+                )
+                for target in self.targets.values()
+            ]
+        else:
+            # websocket handshake
+            return None
+        body = json.dumps(body).encode()
+        return Response(
+            200,
+            "OK",
+            Headers(
+                [
+                    ("Content-Type", "application/json"),
+                    ("Content-Length", str(len(body))),
+                ]
+            ),
+            body,
+        )
+
+    async def _serve(self, websocket):
+        kind, _, target_id = websocket.request.path.rpartition("/")
+        target = None
+        if not kind.endswith("/browser"):
+            target = self.targets.get(target_id)
+            if target is None:
+                await websocket.close(1011, "no such target")
+                return
+        await self._serve_client(_Client(websocket, target))
+
+    async def _serve_client(self, client: _Client):
+        self.clients.append(client)
+        try:
+            async for message in client.websocket:
+                await self._handle(client, json.loads(message))
+        finally:
+            self.clients.remove(client)
+            if isinstance(client.websocket, _PipeSocket):
+                client.websocket.close()
+
+    async def _handle(self, client: _Client, message: dict):
+        self.commands += 1
+        session_id = message.get("sessionId")
+        target = client.sessions.get(session_id) if session_id else client.target
+        method = message["method"]
+        params = message.get("params") or {}
+        events = []
+        try:
+            handler = self.handlers.get(method)
+            if handler is not None:
+                result = handler(target, params)
+            else:
+                result = self._command(client, target, method, params, events)
+            if isinstance(result, str):
+                # encoded already
+                answer = '{"id":%d,"result":%s%s}' % (
+                    message["id"],
+                    result,
+                    ',"sessionId":"%s"' % session_id if session_id else "",
+                )
+            else:
+                answer = json.dumps(
+                    self._with_session(
+                        {"id": message["id"], "result": result}, session_id
+                    )
+                )
+        except CommandError as e:
+            answer = json.dumps(
+                self._with_session(
+                    {
+                        "id": message["id"],
+                        "error": {"code": e.code, "message": e.message},
+                    },
+                    session_id,
+                )
+            )
+        # like chrome, target events and pushed nodes are sent before the answer,
+        # page events after it
+        for event_target, event_method, event_params in events:
+            if event_method.startswith(self.events_first):
+                await self.emit(event_method, event_params, event_target)
+        await client.websocket.send(answer)
+        for event_target, event_method, event_params in events:
+            if not event_method.startswith(self.events_first):
+                await self.emit(event_method, event_params, event_target)
+
+    def _command(self, client, target, method, params, events):
+        """
+        the built-in commands. events caused by the command are added to events,
+        as (target, method, params).
+        """
+        domain, _, command = method.partition(".")
+        if method == "Browser.getVersion":
+            version = self.version
+            return {
+                "protocolVersion": version["Protocol-Version"],
+                "product": version["Browser"],
+                "revision": version["WebKit-Version"],
+                "userAgent": version["User-Agent"],
+                "jsVersion": version["V8-Version"],
+            }
+        if domain == "Target":
+            return self._target_command(client, target, command, params, events)
+        if domain in ("Page", "DOM", "DOMSnapshot", "Runtime") and target is None:
+            raise CommandError("'%s' wasn't found" % method, -32601)
+        if method in ("Page.navigate", "Page.reload"):
+            if command == "navigate":
+                target.url = target.title = params["url"]
+                events.append(
+                    (None, "Target.targetInfoChanged", {"targetInfo": target.info})
+                )
+            target.loader_id = "L%s-%d" % (target.target_id, next(target.loader_ids))
+            frame = {"frameId": target.target_id, "loaderId": target.loader_id}
+            timestamp = time.monotonic()
+            events.append(
+                (target, "Page.frameStartedLoading", {"frameId": target.target_id})
+            )
+            for name in (
+                "init",
+                "DOMContentLoaded",
+                "load",
+                "networkAlmostIdle",
+                "networkIdle",
+            ):
+                events.append(
+                    (
+                        target,
+                        "Page.lifecycleEvent",
+                        dict(frame, name=name, timestamp=timestamp),
+                    )
+                )
+            events.append(
+                (target, "Page.domContentEventFired", {"timestamp": timestamp})
+            )
+            events.append((target, "Page.loadEventFired", {"timestamp": timestamp}))
+            events.append(
+                (target, "Page.frameStoppedLoading", {"frameId": target.target_id})
+            )
+            return frame if command == "navigate" else {}
+        if method == "Page.getFrameTree":
+            return {
+                "frameTree": {
+                    "frame": {
+                        "id": target.target_id,
+                        "loaderId": target.loader_id,
+                        "url": target.url,
+                        "domainAndRegistry": "",
+                        "securityOrigin": "null",
+                        "mimeType": "text/html",
+                        "secureContextType": "InsecureScheme",
+                        "crossOriginIsolatedContextType": "NotIsolated",
+                        "gatedAPIFeatures": [],
+                    }
+                }
+            }
+        if method == "Page.setLifecycleEventsEnabled":
+            # Page.navigate and Page.reload send the lifecycle events either way
+            return {}
+        if method == "Page.addScriptToEvaluateOnNewDocument":
+            return {"identifier": str(next(self._script_ids))}
+        if method == "Runtime.evaluate":
+            expression = params.get("expression")
+            if expression not in self.evaluate:
+                return {"result": {"type": "undefined"}}
+            return {"result": self._remote_object(self.evaluate[expression])}
+        if method == "Runtime.callFunctionOn":
+            return {"result": {"type": "undefined"}}
+        if domain == "DOM":
+            return self._dom_command(target, command, params, events)
+        if method == "DOMSnapshot.captureSnapshot":
+            styles = tuple(params.get("computedStyles", ()))
+            if styles not in target.encoded_snapshots:
+                target.encoded_snapshots[styles] = json.dumps(
+                    _capture_snapshot(target.document, list(styles))
+                )
+            return target.encoded_snapshots[styles]
+        if command in ("enable", "disable") or domain in self.accept_all:
+            return {}
+        raise CommandError("'%s' wasn't found" % method, -32601)
+
+    def _target_command(self, client, target, command, params, events):
+        if command == "setDiscoverTargets":
+            client.discover = params.get("discover", False)
+            if client.discover:
+                for each in self.targets.values():
+                    events.append(
+                        (None, "Target.targetCreated", {"targetInfo": each.info})
+                    )
+            return {}
+        if command == "getTargets":
+            return {"targetInfos": [each.info for each in self.targets.values()]}
+        if command == "getTargetInfo":
+            target = self.targets.get(params.get("targetId")) or target
+            if target is None:
+                raise CommandError("No target with given id found")
+            return {"targetInfo": target.info}
+        if command == "attachToTarget":
+            target = self.targets.get(params["targetId"])
+            if target is None:
+                raise CommandError("No target with given id found")
+            session_id = "S%d" % next(self._session_ids)
+            client.sessions[session_id] = target
+            return {"sessionId": session_id}
+        if command == "detachFromTarget":
+            target = client.sessions.pop(params.get("sessionId"), None)
+            if target is None:
+                raise CommandError("No session with given id")
+            events.append(
+                (
+                    None,
+                    "Target.detachedFromTarget",
+                    {"sessionId": params["sessionId"], "targetId": target.target_id},
+                )
+            )
+            return {}
+        if command == "createTarget":
+            target = self.new_target(params.get("url", "about:blank"))
+            events.append((None, "Target.targetCreated", {"targetInfo": target.info}))
+            return {"targetId": target.target_id}
+        if command == "closeTarget":
+            target = self.targets.pop(params.get("targetId"), None)
+            if target is None:
+                raise CommandError("No target with given id found")
+            # like chrome, the sessions attached to the target are detached first
+            for each in self.clients:
+                for session_id, session_target in list(each.sessions.items()):
+                    if session_target is target:
+                        del each.sessions[session_id]
+                        events.append(
+                            (
+                                None,
+                                "Target.detachedFromTarget",
+                                {"sessionId": session_id, "targetId": target.target_id},
+                            )
+                        )
+            events.append(
+                (None, "Target.targetDestroyed", {"targetId": target.target_id})
+            )
+            return {"success": True}
+        if command == "activateTarget":
+            return {}
+        raise CommandError("'Target.%s' wasn't found" % command, -32601)
+
+    def _dom_command(self, target, command, params, events):
+        if command == "getDocument":
+            depth = params.get("depth", 1)
+            if depth == -1:
+                if target.encoded_document is None:
+                    target.encoded_document = json.dumps({"root": target.document})
+                return target.encoded_document
+            return {"root": _strip(target.document, depth)}
+        if command == "requestChildNodes":
+            node = target.node(params)
+            depth = params.get("depth", 1)
+            events.append(
+                (
+                    target,
+                    "DOM.setChildNodes",
+                    {
+                        "parentId": node["nodeId"],
+                        "nodes": [
+                            _strip(child, depth - 1 if depth > 0 else -1)
+                            for child in node["children"]
+                        ],
+                    },
+                )
+            )
+            return {}
+        if command == "describeNode":
+            return {"node": _strip(target.node(params), 0)}
+        if command in ("querySelector", "querySelectorAll"):
+            root = target.node(params)
+            node_ids = [
+                node["nodeId"]
+                for node in _walk(root)
+                if node is not root and _matches(node, params["selector"])
+            ]
+            if command == "querySelector":
+                return {"nodeId": node_ids[0] if node_ids else 0}
+            return {"nodeIds": node_ids}
+        if command == "resolveNode":
+            node = target.node(params)
+            return {
+                "object": {
+                    "type": "object",
+                    "subtype": "node",
+                    "className": "HTML%sElement" % node["localName"].capitalize(),
+                    "description": node["localName"],
+                    "objectId": "node-%d" % node["nodeId"],
+                }
+            }
+        if command == "requestNode":
+            return {"nodeId": target.node(params)["nodeId"]}
+        if command == "getOuterHTML":
+            return {"outerHTML": _outer_html(target.node(params))}
+        if command == "performSearch":
+            query = params["query"].lower()
+            results = [
+                node["nodeId"]
+                for node in _walk(target.document)
+                if node["nodeType"] == 3 and query in node["nodeValue"].lower()
+            ]
+            search_id = str(len(self._searches) + 1)
+            self._searches[search_id] = results
+            return {"searchId": search_id, "resultCount": len(results)}
+        if command == "getSearchResults":
+            results = self._searches.get(params["searchId"], [])
+            return {"nodeIds": results[params["fromIndex"] : params["toIndex"]]}
+        if command == "discardSearchResults":
+            self._searches.pop(params["searchId"], None)
+            return {}
+        if command == "getContentQuads":
+            return {"quads": [[0, 0, 100, 0, 100, 20, 0, 20]]}
+        if command in ("enable", "disable", "scrollIntoViewIfNeeded", "highlightNode"):
+            return {}
+        raise CommandError("'DOM.%s' wasn't found" % command, -32601)
+
+    @staticmethod
+    def _remote_object(value) -> dict:
+        if value is None:
+            return {"type": "object", "subtype": "null", "value": None}
+        if isinstance(value, bool):
+            return {"type": "boolean", "value": value}
+        if isinstance(value, (int, float)):
+            return {"type": "number", "value": value, "description": str(value)}
+        if isinstance(value, str):
+            return {"type": "string", "value": value}
+        return {"type": "object", "value": value}
+
+    def __repr__(self):
+        return "<%s %s:%s [targets: %d] [connections: %d] [commands: %d]>" % (
+            self.__class__.__name__,
+            self.host,
+            self.port,
+            len(self.targets),
+            len(self.clients),
+            self.commands,
+        )
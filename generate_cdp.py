@@ -37,6 +37,36 @@ INIT_HEADER = """{}
     SHARED_HEADER
 )
 
+# the domain modules are loaded on first access (PEP 562), since importing all of them
+# at once takes a significant amount of time
+INIT_TEMPLATE = """import importlib
+import typing
+
+from . import util
+
+#: CDP domain => module of this package
+DOMAINS = {{
+{domains}
+}}
+
+__all__ = list(DOMAINS.values())
+
+if typing.TYPE_CHECKING:
+    from . import ({modules})
+
+_MODULES = frozenset(__all__)
+
+
+def __getattr__(name: str):
+    if name in _MODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _MODULES)
+"""
+
 MODULE_HEADER = """{}
 #
 # CDP domain: {{}}{{}}
@@ -44,15 +74,32 @@ MODULE_HEADER = """{}
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import {{}}
 
 """.format(
     SHARED_HEADER
 )
 
+#: the names imported from util by every domain module
+UTIL_IMPORTS = "command_decoder, dataclass, event_class, T_JSON_DICT"
+LAZY_UTIL_IMPORTS = (
+    "Lazy, LazyList, command_decoder, dataclass, event_class, lazy_fields, T_JSON_DICT"
+)
+
 current_version = ""
 
+# CDP types which are generated as a subclass of a builtin (eg: DOM.NodeId), filled in
+# by register_types(). their from_json() is cls(json), so decoders call the class directly
+primitive_types: typing.Set[str] = set()
+
+# CDP types which are generated as a dataclass (eg: Network.Response), also filled in by
+# register_types(). in lazy mode, properties of these types are decoded on first access
+object_types: typing.Set[str] = set()
+
+# when set, from_json() keeps nested objects as JSON until they are accessed, see
+# lazy_fields() in the generated util module
+lazy_decoding = False
+
 BACKTICK_RE = re.compile(r"`([^`]+)`(\w+)?")
 
 
@@ -298,6 +345,88 @@ class CdpProperty:
             expr = f"{expr} if {dict_}.get('{self.name}', None) is not None else None"
         return expr
 
+    def generate_fast_from_json(self, dict_) -> str:
+        """Generate an optimized expression that decodes this property from a JSON
+        dict named ``dict_``. Optional properties are looked up with ``get``, which
+        has to be bound to ``dict_.get``."""
+        if self.items:
+            if self.items.ref:
+                decode = f"list(map({self.decoder(self.items.ref)}, {{}}))"
+            elif self.items.type == "number":
+                decode = "list(map(float, {}))"
+            else:
+                decode = "list({})"
+        elif self.ref:
+            decode = f"{self.decoder(self.ref)}({{}})"
+        elif self.type == "number":
+            # json has no separate type for whole numbers
+            decode = "float({})"
+        else:
+            # the json value is of the python type already
+            decode = "{}"
+        if self.lazy:
+            ref = self.items.ref if self.items else self.ref
+            wrapper = "LazyList" if self.items else "Lazy"
+            decode = f"{wrapper}({self.decoder(ref)}, {{}})"
+        if not self.optional:
+            return decode.format(f"{dict_}['{self.name}']")
+        if decode == "{}":
+            return f"get('{self.name}')"
+        return f"{decode.format('v')} if (v := get('{self.name}')) is not None else None"
+
+    @property
+    def lazy(self) -> bool:
+        """Whether this property is decoded on first access, see ``lazy_decoding``."""
+        if not lazy_decoding:
+            return False
+        ref = self.items.ref if self.items else self.ref
+        if not ref:
+            return False
+        qualified = ref if "." in ref else f"{self.domain}.{ref}"
+        return qualified in object_types
+
+    def decoder(self, ref: str) -> str:
+        """Return the callable which decodes the JSON value of a ref."""
+        py_ref = ref_to_python_domain(ref, self.domain)
+        qualified = ref if "." in ref else f"{self.domain}.{ref}"
+        if qualified in primitive_types:
+            return py_ref
+        return f"{py_ref}.from_json"
+
+
+def generate_from_json_method(py_name: str, props: typing.List[CdpProperty]) -> str:
+    """
+    Generate the from_json() classmethod of a type or event.
+
+    The fields are passed positionally, which is a lot faster than passing them by
+    keyword, so ``props`` must be in the order of the dataclass fields.
+    """
+    code = dedent(
+        f"""\
+        @classmethod
+        def from_json(cls, json: T_JSON_DICT) -> {py_name}:
+        """
+    )
+    if not props:
+        return code + indent("return cls()", 4)
+    if any(p.optional for p in props):
+        code += indent("get = json.get", 4) + "\n"
+    code += indent("return cls(", 4) + "\n"
+    code += "\n".join(
+        indent(p.generate_fast_from_json(dict_="json") + ",", 8) for p in props
+    )
+    code += "\n" + indent(")", 4)
+    return code
+
+
+def generate_lazy_fields(props: typing.List[CdpProperty]) -> str:
+    """Generate the decorator which makes the lazily decoded properties of a type or
+    event decode on first access, or an empty string if there are none."""
+    names = [p.py_name for p in props if p.lazy]
+    if not names:
+        return ""
+    return "@lazy_fields({})\n".format(", ".join(map(repr, names)))
+
 
 @dataclass
 class CdpType:
@@ -390,11 +519,15 @@ class CdpType:
                 return self.value"""
         )
 
+        # looks the member up directly, instead of going through EnumMeta.__call__
         def_from_json = dedent(
             f"""\
             @classmethod
             def from_json(cls, json: str) -> {self.id}:
-                return cls(json)"""
+                try:
+                    return cls._value2member_map_[json]
+                except KeyError:
+                    return cls(json)"""
         )
 
         code = f"class {self.id}(enum.Enum):\n"
@@ -418,7 +551,14 @@ class CdpType:
         dataclasses.
         """
         # children = set()
-        code = dedent(
+        # Emit property declarations. These are sorted so that optional
+        # properties come after required properties, which is required to make
+        # the dataclass constructor work.
+        props = list(self.properties)
+        props.sort(key=operator.attrgetter("optional"))
+
+        code = generate_lazy_fields(props)
+        code += dedent(
             f"""\
             @dataclass
             class {self.id}:\n"""
@@ -427,11 +567,6 @@ class CdpType:
         if doc:
             code += indent(doc, 4) + "\n"
 
-        # Emit property declarations. These are sorted so that optional
-        # properties come after required properties, which is required to make
-        # the dataclass constructor work.
-        props = list(self.properties)
-        props.sort(key=operator.attrgetter("optional"))
         code += "\n\n".join(indent(p.generate_decl(), 4) for p in props)
         code += "\n\n"
 
@@ -449,23 +584,9 @@ class CdpType:
         def_to_json += indent("return json", 4)
         code += indent(def_to_json, 4) + "\n\n"
 
-        # Emit from_json() method. The properties are sorted in the same order
-        # as above for readability.
-        def_from_json = dedent(
-            f"""\
-            @classmethod
-            def from_json(cls, json: T_JSON_DICT) -> {self.id}:
-                return cls(
-        """
-        )
-        from_jsons = list()
-        for p in props:
-            from_json = p.generate_from_json(dict_="json")
-            from_jsons.append(f"{p.py_name}={from_json},")
-        def_from_json += indent("\n".join(from_jsons), 8)
-        def_from_json += "\n"
-        def_from_json += indent(")", 4)
-        code += indent(def_from_json, 4)
+        # Emit from_json() method. The properties are passed in the same order
+        # as above, which is the order of the dataclass fields.
+        code += indent(generate_from_json_method(self.id, props), 4)
 
         return code
 
@@ -635,9 +756,10 @@ class CdpCommand:
         else:
             nested_types = ", ".join(r.py_annotation for r in self.returns)
             ret_type = f"typing.Tuple[{nested_types}]"
-        ret_type = f"typing.Generator[T_JSON_DICT,T_JSON_DICT,{ret_type}]"
-
         code = ""
+        if self.returns:
+            code += self.generate_decoder(ret_type) + "\n\n\n"
+        ret_type = f"typing.Generator[T_JSON_DICT,T_JSON_DICT,{ret_type}]"
 
         if self.deprecated:
             code += f'@deprecated(version="{current_version}")\n'
@@ -699,13 +821,31 @@ class CdpCommand:
             code += indent("'params': params,\n", 8)
         code += indent("}\n", 4)
         code += indent("json = yield cmd_dict", 4)
-        if len(self.returns) == 0:
-            pass
-        elif len(self.returns) == 1:
+        if self.returns:
+            code += indent(f"\nreturn {self.decoder_name}(json)", 4)
+        return code
+
+    @property
+    def decoder_name(self) -> str:
+        """The name of the function which decodes the result of this command."""
+        return f"_decode_{self.py_name}"
+
+    def generate_decoder(self, ret_type: str) -> str:
+        """
+        Generate the function which decodes the result of this command. It is
+        registered, so a :py:class:`Command` can be made for this command as well.
+        """
+        code = dedent(
+            f"""\
+            @command_decoder('{self.domain}.{self.name}')
+            def {self.decoder_name}(json: T_JSON_DICT) -> {ret_type}:
+            """
+        )
+        if len(self.returns) == 1:
             ret = self.returns[0].generate_return(dict_="json")
-            code += indent(f"\nreturn {ret}", 4)
+            code += indent(f"return {ret}", 4)
         else:
-            ret = "\nreturn (\n"
+            ret = "return (\n"
             expr = ",\n".join(r.generate_return(dict_="json") for r in self.returns)
             ret += indent(expr, 4)
             ret += "\n)"
@@ -757,9 +897,10 @@ class CdpEvent:
     def generate_code(self) -> str:
         """Generate code for a CDP event."""
         global current_version
-        code = dedent(
+        code = f"@event_class('{self.domain}.{self.name}')\n"
+        code += generate_lazy_fields(self.parameters)
+        code += dedent(
             f"""\
-            @event_class('{self.domain}.{self.name}')
             @dataclass
             class {self.py_name}:"""
         )
@@ -780,20 +921,7 @@ class CdpEvent:
             code += "\n"
         code += indent("\n".join(p.generate_decl() for p in self.parameters), 4)
         code += "\n\n"
-        def_from_json = dedent(
-            f"""\
-            @classmethod
-            def from_json(cls, json: T_JSON_DICT) -> {self.py_name}:
-                return cls(
-        """
-        )
-        code += indent(def_from_json, 4)
-        from_json = ",\n".join(
-            p.generate_from_json(dict_="json") for p in self.parameters
-        )
-        code += indent(from_json, 12)
-        code += "\n"
-        code += indent(")", 8)
+        code += indent(generate_from_json_method(self.py_name, self.parameters), 4)
         return code
 
     def get_refs(self):
@@ -845,7 +973,8 @@ class CdpDomain:
     def generate_code(self) -> str:
         """Generate the Python module code for a given CDP domain."""
         exp = " (experimental)" if self.experimental else ""
-        code = MODULE_HEADER.format(self.domain, exp)
+        imports = LAZY_UTIL_IMPORTS if lazy_decoding else UTIL_IMPORTS
+        code = MODULE_HEADER.format(self.domain, exp, imports)
         import_code = self.generate_imports()
         if import_code:
             code += import_code
@@ -988,9 +1117,24 @@ def parse(json_path, output_path):
     return domains
 
 
+def register_types(domains):
+    """
+    Register the types which are generated as a subclass of a builtin, see
+    :py:meth:`CdpProperty.decoder`, and the types which are generated as a dataclass,
+    see :py:attr:`CdpProperty.lazy`.
+    """
+    for domain in domains:
+        for type_ in domain.types:
+            if type_.properties:
+                object_types.add(f"{domain.domain}.{type_.id}")
+            elif not type_.enum:
+                primitive_types.add(f"{domain.domain}.{type_.id}")
+
+
 def generate_init(init_path, domains):
     """
     Generate an ``__init__.py`` that exports the specified modules.
+    The modules are imported when they are first accessed.
 
     :param Path init_path: a file path to create the init file in
     :param list[tuple] modules: a list of modules each represented as tuples
@@ -999,7 +1143,12 @@ def generate_init(init_path, domains):
     with init_path.open("w") as init_file:
         init_file.write(INIT_HEADER)
         init_file.write(
-            "from . import ({})".format(", ".join(domain.module for domain in domains))
+            INIT_TEMPLATE.format(
+                domains="\n".join(
+                    f"    {domain.domain!r}: {domain.module!r}," for domain in domains
+                ),
+                modules=", ".join(domain.module for domain in domains),
+            )
         )
 
 
@@ -1047,8 +1196,14 @@ def fix_protocol_spec(domains):
                             break
 
 
-def selfgen():
-    """Generate CDP types and docs for ourselves"""
+def selfgen(lazy: bool = False):
+    """
+    Generate CDP types and docs for ourselves
+
+    :param lazy: generate types which decode their nested objects on first access
+    """
+    global lazy_decoding
+    lazy_decoding = lazy
     here = Path(__file__).parent.resolve()
 
     json_paths = [
@@ -1072,6 +1227,7 @@ def selfgen():
             domains.extend(parse(json_path, output_path))
         domains.sort(key=operator.attrgetter("domain"))
         fix_protocol_spec(domains)
+        register_types(domains)
         for domain in domains:
             logger.info("Generating module: %s → %s.py", domain.domain, domain.module)
             module_path = output_path / f"{domain.module}.py"
@@ -1091,10 +1247,110 @@ def selfgen():
         util_path.write_text(
             dedent(
                 """
+            import dataclasses
+            import importlib
+            import sys
+            import types
             import typing
 
             T_JSON_DICT = typing.Dict[str, typing.Any]
             _event_parsers = dict()
+            _command_decoders = dict()
+
+            #: the generated types get __slots__ (python 3.10+), which saves a lot of memory
+            #: on large results, eg: the DOM.Node tree of a big page
+            SLOTS = sys.version_info >= (3, 10)
+
+            #: whether the package was generated with lazy decoding (generate_cdp.py --lazy),
+            #: see lazy_fields()
+            LAZY = False
+
+
+            def dataclass(cls):
+                ''' A decorator that turns a generated class into a (slotted) dataclass. '''
+                if not SLOTS:
+                    return dataclasses.dataclass(cls)
+                cls = dataclasses.dataclass(cls, slots=True)
+                cls.__setstate__ = _setstate
+                return cls
+
+
+            def _setstate(self, state):
+                # also accepts the state of instances pickled before the types were slotted
+                if isinstance(state, tuple):
+                    state = {**(state[0] or {}), **(state[1] or {})}
+                for name, value in state.items():
+                    object.__setattr__(self, name, value)
+
+
+            class Lazy:
+                ''' A JSON value which is decoded when the field holding it is first accessed. '''
+                __slots__ = ('decode', 'json')
+
+                def __init__(self, decode: typing.Callable[[typing.Any], typing.Any], json: typing.Any):
+                    self.decode = decode
+                    self.json = json
+
+                def value(self) -> typing.Any:
+                    return self.decode(self.json)
+
+                def __repr__(self):
+                    return '{}({!r})'.format(self.__class__.__name__, self.json)
+
+
+            class LazyList(Lazy):
+                ''' A JSON array of which each item is decoded when the field holding it is first accessed. '''
+                __slots__ = ()
+
+                def value(self) -> typing.List[typing.Any]:
+                    return list(map(self.decode, self.json))
+
+
+            class _LazyField:
+                # replaces the (slot) attribute of a field, and decodes a Lazy value on first access
+                __slots__ = ('name', 'slot')
+
+                def __init__(self, name, slot):
+                    self.name = name
+                    self.slot = slot
+
+                def __get__(self, obj, owner=None):
+                    if obj is None:
+                        return self
+                    if self.slot is not None:
+                        value = self.slot.__get__(obj, owner)
+                    else:
+                        try:
+                            value = obj.__dict__[self.name]
+                        except KeyError:
+                            raise AttributeError(self.name) from None
+                    if isinstance(value, Lazy):
+                        value = value.value()
+                        self.__set__(obj, value)
+                    return value
+
+                def __set__(self, obj, value):
+                    if self.slot is not None:
+                        self.slot.__set__(obj, value)
+                    else:
+                        obj.__dict__[self.name] = value
+
+
+            def lazy_fields(*names):
+                '''
+                A decorator for a generated dataclass, which makes the given fields decode a
+                :py:class:`Lazy` value on first access. The decoded value replaces the JSON value,
+                so it is decoded once. The fields keep their names and types.
+                '''
+                def decorate(cls):
+                    for name in names:
+                        slot = cls.__dict__.get(name)
+                        if not isinstance(slot, types.MemberDescriptorType):
+                            # not slotted, the value is stored in the instance dict
+                            slot = None
+                        setattr(cls, name, _LazyField(name, slot))
+                    return cls
+                return decorate
 
 
             def event_class(method):
@@ -1105,11 +1361,100 @@ def selfgen():
                 return decorate
 
 
+            def command_decoder(method):
+                ''' A decorator that registers a function as the decoder of the result of a command. '''
+                def decorate(fn):
+                    _command_decoders[method] = fn
+                    return fn
+                return decorate
+
+
+            def _no_result(json: T_JSON_DICT) -> None:
+                return None
+
+
+            def _raw_result(json: T_JSON_DICT) -> T_JSON_DICT:
+                return json
+
+
+            class Command:
+                '''
+                A CDP command, as an alternative to the generators returned by the command functions.
+                A command can be sent any number of times, and its message is serialized only once,
+                so the params must not be changed after it has been sent.
+
+                :param method: the CDP method name, eg: 'DOM.getDocument'
+                :param params: the parameters of the command
+                :param decode: function which turns the JSON result into the return value.
+                    when None, the JSON result is returned as is.
+                '''
+                __slots__ = ('method', 'params', 'decode', 'encoded')
+
+                def __init__(
+                        self,
+                        method: str,
+                        params: typing.Optional[T_JSON_DICT] = None,
+                        decode: typing.Optional[typing.Callable[[T_JSON_DICT], typing.Any]] = None
+                    ):
+                    self.method = method
+                    self.params = params if params is not None else {}
+                    self.decode = decode if decode is not None else _raw_result
+                    #: the serialized message without its id, cached by the sender
+                    self.encoded = None
+
+                @classmethod
+                def of(cls, cmd: typing.Generator) -> 'Command':
+                    '''
+                    Create a command from the generator returned by a command function of this package,
+                    eg: ``Command.of(dom.get_document(-1, True))``.
+                    '''
+                    cmd_dict = next(cmd)
+                    cmd.close()
+                    method = cmd_dict['method']
+                    return cls(method, cmd_dict.get('params'), _command_decoders.get(method, _no_result))
+
+                def __iter__(self):
+                    ''' Drive the command like a generator returned by a command function. '''
+                    json = yield {'method': self.method, 'params': self.params}
+                    return self.decode(json)
+
+                def __repr__(self):
+                    return 'Command({!r}, {!r})'.format(self.method, self.params)
+
+
+            def load_domain(method: str) -> None:
+                ''' Import the module of the domain of a CDP method name, which registers its events. '''
+                from . import DOMAINS
+                module = DOMAINS.get(method.partition('.')[0])
+                if module is not None:
+                    importlib.import_module('.' + module, __package__)
+
+
+            def event_parser(method: str, load: bool = True) -> typing.Optional[type]:
+                '''
+                Get the event class for a CDP method name, or None if it is unknown.
+                When load is False, the domain module is not imported, so None is returned
+                for the events of domains which were not imported yet as well.
+                '''
+                try:
+                    return _event_parsers[method]
+                except KeyError:
+                    if not load:
+                        return None
+                    # the domain module may not have been imported yet
+                    load_domain(method)
+                    # unknown methods are remembered as well, so they are looked up only once
+                    return _event_parsers.setdefault(method, None)
+
+
             def parse_json_event(json: T_JSON_DICT) -> typing.Any:
                 ''' Parse a JSON dictionary into a CDP event. '''
-                return _event_parsers[json['method']].from_json(json['params'])
+                parser = event_parser(json['method'])
+                if parser is None:
+                    raise KeyError(json['method'])
+                return parser.from_json(json['params'])
             """
-            )
+            ).replace("LAZY = False", f"LAZY = {lazy_decoding}")
         )
 
     finally:
@@ -1199,4 +1544,11 @@ def dl_file(filename, path=None):
 
 
 if __name__ == "__main__":
-    selfgen()
+    parser = ArgumentParser(description="Generate the nodriver.cdp package.")
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="decode nested objects of types and events on first access, "
+        "instead of in from_json()",
+    )
+    selfgen(lazy=parser.parse_args().lazy)
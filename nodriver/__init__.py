@@ -3,7 +3,9 @@ from nodriver.core.config import Config
 from nodriver.core.connection import Connection
 from nodriver.core.tab import Tab
 from nodriver.core.element import Element
+from nodriver.core.document import DocumentIndex
 from nodriver.core.browser import Browser
+from nodriver.core.runner import Runner
 from nodriver.core import util
 from nodriver.core.util import start
 from nodriver.core._contradict import ContraDict  # noqa
@@ -13,11 +15,13 @@ from nodriver.core.util import loop
 __all__ = [
     "loop",
     "Browser",
+    "Runner",
     "Tab",
     "cdp",
     "Config",
     "start",
     "util",
     "Element",
+    "DocumentIndex",
     "ContraDict",
 ]
@@ -3,4 +3,82 @@
 # This file is generated from the CDP specification. If you need to make
 # changes, edit the generator and regenerate all of the modules.
 
-from . import (accessibility, animation, audits, autofill, background_service, bluetooth_emulation, browser, css, cache_storage, cast, console, dom, dom_debugger, dom_snapshot, dom_storage, database, debugger, device_access, device_orientation, emulation, event_breakpoints, extensions, fed_cm, fetch, file_system, headless_experimental, heap_profiler, io, indexed_db, input_, inspector, layer_tree, log, media, memory, network, overlay, pwa, page, performance, performance_timeline, preload, profiler, runtime, schema, security, service_worker, storage, system_info, target, tethering, tracing, web_audio, web_authn)
\ No newline at end of file
+import importlib
+import typing
+
+from . import util
+
+#: CDP domain => module of this package
+DOMAINS = {
+    'Accessibility': 'accessibility',
+    'Animation': 'animation',
+    'Audits': 'audits',
+    'Autofill': 'autofill',
+    'BackgroundService': 'background_service',
+    'BluetoothEmulation': 'bluetooth_emulation',
+    'Browser': 'browser',
+    'CSS': 'css',
+    'CacheStorage': 'cache_storage',
+    'Cast': 'cast',
+    'Console': 'console',
+    'DOM': 'dom',
+    'DOMDebugger': 'dom_debugger',
+    'DOMSnapshot': 'dom_snapshot',
+    'DOMStorage': 'dom_storage',
+    'Database': 'database',
+    'Debugger': 'debugger',
+    'DeviceAccess': 'device_access',
+    'DeviceOrientation': 'device_orientation',
+    'Emulation': 'emulation',
+    'EventBreakpoints': 'event_breakpoints',
+    'Extensions': 'extensions',
+    'FedCm': 'fed_cm',
+    'Fetch': 'fetch',
+    'FileSystem': 'file_system',
+    'HeadlessExperimental': 'headless_experimental',
+    'HeapProfiler': 'heap_profiler',
+    'IO': 'io',
+    'IndexedDB': 'indexed_db',
+    'Input': 'input_',
+    'Inspector': 'inspector',
+    'LayerTree': 'layer_tree',
+    'Log': 'log',
+    'Media': 'media',
+    'Memory': 'memory',
+    'Network': 'network',
+    'Overlay': 'overlay',
+    'PWA': 'pwa',
+    'Page': 'page',
+    'Performance': 'performance',
+    'PerformanceTimeline': 'performance_timeline',
+    'Preload': 'preload',
+    'Profiler': 'profiler',
+    'Runtime': 'runtime',
+    'Schema': 'schema',
+    'Security': 'security',
+    'ServiceWorker': 'service_worker',
+    'Storage': 'storage',
+    'SystemInfo': 'system_info',
+    'Target': 'target',
+    'Tethering': 'tethering',
+    'Tracing': 'tracing',
+    'WebAudio': 'web_audio',
+    'WebAuthn': 'web_authn',
+}
+
+__all__ = list(DOMAINS.values())
+
+if typing.TYPE_CHECKING:
+    from . import (accessibility, animation, audits, autofill, background_service, bluetooth_emulation, browser, css, cache_storage, cast, console, dom, dom_debugger, dom_snapshot, dom_storage, database, debugger, device_access, device_orientation, emulation, event_breakpoints, extensions, fed_cm, fetch, file_system, headless_experimental, heap_profiler, io, indexed_db, input_, inspector, layer_tree, log, media, memory, network, overlay, pwa, page, performance, performance_timeline, preload, profiler, runtime, schema, security, service_worker, storage, system_info, target, tethering, tracing, web_audio, web_authn)
+
+_MODULES = frozenset(__all__)
+
+
+def __getattr__(name: str):
+    if name in _MODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _MODULES)
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import dom
 from . import page
@@ -58,7 +57,10 @@ class AXValueType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AXValueType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class AXValueSourceType(enum.Enum):
@@ -77,7 +79,10 @@ class AXValueSourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AXValueSourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class AXValueNativeSourceType(enum.Enum):
@@ -100,7 +105,10 @@ class AXValueNativeSourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AXValueNativeSourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -158,16 +166,17 @@ class AXValueSource:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AXValueSource:
+        get = json.get
         return cls(
-            type_=AXValueSourceType.from_json(json['type']),
-            value=AXValue.from_json(json['value']) if json.get('value', None) is not None else None,
-            attribute=str(json['attribute']) if json.get('attribute', None) is not None else None,
-            attribute_value=AXValue.from_json(json['attributeValue']) if json.get('attributeValue', None) is not None else None,
-            superseded=bool(json['superseded']) if json.get('superseded', None) is not None else None,
-            native_source=AXValueNativeSourceType.from_json(json['nativeSource']) if json.get('nativeSource', None) is not None else None,
-            native_source_value=AXValue.from_json(json['nativeSourceValue']) if json.get('nativeSourceValue', None) is not None else None,
-            invalid=bool(json['invalid']) if json.get('invalid', None) is not None else None,
-            invalid_reason=str(json['invalidReason']) if json.get('invalidReason', None) is not None else None,
+            AXValueSourceType.from_json(json['type']),
+            AXValue.from_json(v) if (v := get('value')) is not None else None,
+            get('attribute'),
+            AXValue.from_json(v) if (v := get('attributeValue')) is not None else None,
+            get('superseded'),
+            AXValueNativeSourceType.from_json(v) if (v := get('nativeSource')) is not None else None,
+            AXValue.from_json(v) if (v := get('nativeSourceValue')) is not None else None,
+            get('invalid'),
+            get('invalidReason'),
         )
 
 
@@ -193,10 +202,11 @@ class AXRelatedNode:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AXRelatedNode:
+        get = json.get
         return cls(
-            backend_dom_node_id=dom.BackendNodeId.from_json(json['backendDOMNodeId']),
-            idref=str(json['idref']) if json.get('idref', None) is not None else None,
-            text=str(json['text']) if json.get('text', None) is not None else None,
+            dom.BackendNodeId(json['backendDOMNodeId']),
+            get('idref'),
+            get('text'),
         )
 
 
@@ -217,8 +227,8 @@ class AXProperty:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AXProperty:
         return cls(
-            name=AXPropertyName.from_json(json['name']),
-            value=AXValue.from_json(json['value']),
+            AXPropertyName.from_json(json['name']),
+            AXValue.from_json(json['value']),
         )
 
 
@@ -252,11 +262,12 @@ class AXValue:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AXValue:
+        get = json.get
         return cls(
-            type_=AXValueType.from_json(json['type']),
-            value=json['value'] if json.get('value', None) is not None else None,
-            related_nodes=[AXRelatedNode.from_json(i) for i in json['relatedNodes']] if json.get('relatedNodes', None) is not None else None,
-            sources=[AXValueSource.from_json(i) for i in json['sources']] if json.get('sources', None) is not None else None,
+            AXValueType.from_json(json['type']),
+            get('value'),
+            list(map(AXRelatedNode.from_json, v)) if (v := get('relatedNodes')) is not None else None,
+            list(map(AXValueSource.from_json, v)) if (v := get('sources')) is not None else None,
         )
 
 
@@ -316,7 +327,10 @@ class AXPropertyName(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AXPropertyName:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -393,20 +407,21 @@ class AXNode:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AXNode:
+        get = json.get
         return cls(
-            node_id=AXNodeId.from_json(json['nodeId']),
-            ignored=bool(json['ignored']),
-            ignored_reasons=[AXProperty.from_json(i) for i in json['ignoredReasons']] if json.get('ignoredReasons', None) is not None else None,
-            role=AXValue.from_json(json['role']) if json.get('role', None) is not None else None,
-            chrome_role=AXValue.from_json(json['chromeRole']) if json.get('chromeRole', None) is not None else None,
-            name=AXValue.from_json(json['name']) if json.get('name', None) is not None else None,
-            description=AXValue.from_json(json['description']) if json.get('description', None) is not None else None,
-            value=AXValue.from_json(json['value']) if json.get('value', None) is not None else None,
-            properties=[AXProperty.from_json(i) for i in json['properties']] if json.get('properties', None) is not None else None,
-            parent_id=AXNodeId.from_json(json['parentId']) if json.get('parentId', None) is not None else None,
-            child_ids=[AXNodeId.from_json(i) for i in json['childIds']] if json.get('childIds', None) is not None else None,
-            backend_dom_node_id=dom.BackendNodeId.from_json(json['backendDOMNodeId']) if json.get('backendDOMNodeId', None) is not None else None,
-            frame_id=page.FrameId.from_json(json['frameId']) if json.get('frameId', None) is not None else None,
+            AXNodeId(json['nodeId']),
+            json['ignored'],
+            list(map(AXProperty.from_json, v)) if (v := get('ignoredReasons')) is not None else None,
+            AXValue.from_json(v) if (v := get('role')) is not None else None,
+            AXValue.from_json(v) if (v := get('chromeRole')) is not None else None,
+            AXValue.from_json(v) if (v := get('name')) is not None else None,
+            AXValue.from_json(v) if (v := get('description')) is not None else None,
+            AXValue.from_json(v) if (v := get('value')) is not None else None,
+            list(map(AXProperty.from_json, v)) if (v := get('properties')) is not None else None,
+            AXNodeId(v) if (v := get('parentId')) is not None else None,
+            list(map(AXNodeId, v)) if (v := get('childIds')) is not None else None,
+            dom.BackendNodeId(v) if (v := get('backendDOMNodeId')) is not None else None,
+            page.FrameId(v) if (v := get('frameId')) is not None else None,
         )
 
 
@@ -431,6 +446,11 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('Accessibility.getPartialAXTree')
+def _decode_get_partial_ax_tree(json: T_JSON_DICT) -> typing.List[AXNode]:
+    return [AXNode.from_json(i) for i in json['nodes']]
+
+
 def get_partial_ax_tree(
         node_id: typing.Optional[dom.NodeId] = None,
         backend_node_id: typing.Optional[dom.BackendNodeId] = None,
@@ -462,6 +482,11 @@ def get_partial_ax_tree(
         'params': params,
     }
     json = yield cmd_dict
+    return _decode_get_partial_ax_tree(json)
+
+
+@command_decoder('Accessibility.getFullAXTree')
+def _decode_get_full_ax_tree(json: T_JSON_DICT) -> typing.List[AXNode]:
     return [AXNode.from_json(i) for i in json['nodes']]
 
 
@@ -488,7 +513,12 @@ def get_full_ax_tree(
         'params': params,
     }
     json = yield cmd_dict
-    return [AXNode.from_json(i) for i in json['nodes']]
+    return _decode_get_full_ax_tree(json)
+
+
+@command_decoder('Accessibility.getRootAXNode')
+def _decode_get_root_ax_node(json: T_JSON_DICT) -> AXNode:
+    return AXNode.from_json(json['node'])
 
 
 def get_root_ax_node(
@@ -511,7 +541,12 @@ def get_root_ax_node(
         'params': params,
     }
     json = yield cmd_dict
-    return AXNode.from_json(json['node'])
+    return _decode_get_root_ax_node(json)
+
+
+@command_decoder('Accessibility.getAXNodeAndAncestors')
+def _decode_get_ax_node_and_ancestors(json: T_JSON_DICT) -> typing.List[AXNode]:
+    return [AXNode.from_json(i) for i in json['nodes']]
 
 
 def get_ax_node_and_ancestors(
@@ -542,6 +577,11 @@ def get_ax_node_and_ancestors(
         'params': params,
     }
     json = yield cmd_dict
+    return _decode_get_ax_node_and_ancestors(json)
+
+
+@command_decoder('Accessibility.getChildAXNodes')
+def _decode_get_child_ax_nodes(json: T_JSON_DICT) -> typing.List[AXNode]:
     return [AXNode.from_json(i) for i in json['nodes']]
 
 
@@ -568,6 +608,11 @@ def get_child_ax_nodes(
         'params': params,
     }
     json = yield cmd_dict
+    return _decode_get_child_ax_nodes(json)
+
+
+@command_decoder('Accessibility.queryAXTree')
+def _decode_query_ax_tree(json: T_JSON_DICT) -> typing.List[AXNode]:
     return [AXNode.from_json(i) for i in json['nodes']]
 
 
@@ -610,7 +655,7 @@ def query_ax_tree(
         'params': params,
     }
     json = yield cmd_dict
-    return [AXNode.from_json(i) for i in json['nodes']]
+    return _decode_query_ax_tree(json)
 
 
 @event_class('Accessibility.loadComplete')
@@ -628,7 +673,7 @@ class LoadComplete:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadComplete:
         return cls(
-            root=AXNode.from_json(json['root'])
+            AXNode.from_json(json['root']),
         )
 
 
@@ -646,5 +691,5 @@ class NodesUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodesUpdated:
         return cls(
-            nodes=[AXNode.from_json(i) for i in json['nodes']]
+            list(map(AXNode.from_json, json['nodes'])),
         )
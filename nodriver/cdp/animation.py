@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import dom
 from . import runtime
@@ -77,18 +76,19 @@ class Animation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Animation:
+        get = json.get
         return cls(
-            id_=str(json['id']),
-            name=str(json['name']),
-            paused_state=bool(json['pausedState']),
-            play_state=str(json['playState']),
-            playback_rate=float(json['playbackRate']),
-            start_time=float(json['startTime']),
-            current_time=float(json['currentTime']),
-            type_=str(json['type']),
-            source=AnimationEffect.from_json(json['source']) if json.get('source', None) is not None else None,
-            css_id=str(json['cssId']) if json.get('cssId', None) is not None else None,
-            view_or_scroll_timeline=ViewOrScrollTimeline.from_json(json['viewOrScrollTimeline']) if json.get('viewOrScrollTimeline', None) is not None else None,
+            json['id'],
+            json['name'],
+            json['pausedState'],
+            json['playState'],
+            float(json['playbackRate']),
+            float(json['startTime']),
+            float(json['currentTime']),
+            json['type'],
+            AnimationEffect.from_json(v) if (v := get('source')) is not None else None,
+            get('cssId'),
+            ViewOrScrollTimeline.from_json(v) if (v := get('viewOrScrollTimeline')) is not None else None,
         )
 
 
@@ -131,12 +131,13 @@ class ViewOrScrollTimeline:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ViewOrScrollTimeline:
+        get = json.get
         return cls(
-            axis=dom.ScrollOrientation.from_json(json['axis']),
-            source_node_id=dom.BackendNodeId.from_json(json['sourceNodeId']) if json.get('sourceNodeId', None) is not None else None,
-            start_offset=float(json['startOffset']) if json.get('startOffset', None) is not None else None,
-            end_offset=float(json['endOffset']) if json.get('endOffset', None) is not None else None,
-            subject_node_id=dom.BackendNodeId.from_json(json['subjectNodeId']) if json.get('subjectNodeId', None) is not None else None,
+            dom.ScrollOrientation.from_json(json['axis']),
+            dom.BackendNodeId(v) if (v := get('sourceNodeId')) is not None else None,
+            float(v) if (v := get('startOffset')) is not None else None,
+            float(v) if (v := get('endOffset')) is not None else None,
+            dom.BackendNodeId(v) if (v := get('subjectNodeId')) is not None else None,
         )
 
 
@@ -196,17 +197,18 @@ class AnimationEffect:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AnimationEffect:
+        get = json.get
         return cls(
-            delay=float(json['delay']),
-            end_delay=float(json['endDelay']),
-            iteration_start=float(json['iterationStart']),
-            iterations=float(json['iterations']),
-            duration=float(json['duration']),
-            direction=str(json['direction']),
-            fill=str(json['fill']),
-            easing=str(json['easing']),
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']) if json.get('backendNodeId', None) is not None else None,
-            keyframes_rule=KeyframesRule.from_json(json['keyframesRule']) if json.get('keyframesRule', None) is not None else None,
+            float(json['delay']),
+            float(json['endDelay']),
+            float(json['iterationStart']),
+            float(json['iterations']),
+            float(json['duration']),
+            json['direction'],
+            json['fill'],
+            json['easing'],
+            dom.BackendNodeId(v) if (v := get('backendNodeId')) is not None else None,
+            KeyframesRule.from_json(v) if (v := get('keyframesRule')) is not None else None,
         )
 
 
@@ -230,9 +232,10 @@ class KeyframesRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> KeyframesRule:
+        get = json.get
         return cls(
-            keyframes=[KeyframeStyle.from_json(i) for i in json['keyframes']],
-            name=str(json['name']) if json.get('name', None) is not None else None,
+            list(map(KeyframeStyle.from_json, json['keyframes'])),
+            get('name'),
         )
 
 
@@ -256,8 +259,8 @@ class KeyframeStyle:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> KeyframeStyle:
         return cls(
-            offset=str(json['offset']),
-            easing=str(json['easing']),
+            json['offset'],
+            json['easing'],
         )
 
 
@@ -281,6 +284,11 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('Animation.getCurrentTime')
+def _decode_get_current_time(json: T_JSON_DICT) -> float:
+    return float(json['currentTime'])
+
+
 def get_current_time(
         id_: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,float]:
@@ -297,7 +305,12 @@ def get_current_time(
         'params': params,
     }
     json = yield cmd_dict
-    return float(json['currentTime'])
+    return _decode_get_current_time(json)
+
+
+@command_decoder('Animation.getPlaybackRate')
+def _decode_get_playback_rate(json: T_JSON_DICT) -> float:
+    return float(json['playbackRate'])
 
 
 def get_playback_rate() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,float]:
@@ -310,7 +323,7 @@ def get_playback_rate() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,float]:
         'method': 'Animation.getPlaybackRate',
     }
     json = yield cmd_dict
-    return float(json['playbackRate'])
+    return _decode_get_playback_rate(json)
 
 
 def release_animations(
@@ -330,6 +343,11 @@ def release_animations(
     json = yield cmd_dict
 
 
+@command_decoder('Animation.resolveAnimation')
+def _decode_resolve_animation(json: T_JSON_DICT) -> runtime.RemoteObject:
+    return runtime.RemoteObject.from_json(json['remoteObject'])
+
+
 def resolve_animation(
         animation_id: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,runtime.RemoteObject]:
@@ -346,7 +364,7 @@ def resolve_animation(
         'params': params,
     }
     json = yield cmd_dict
-    return runtime.RemoteObject.from_json(json['remoteObject'])
+    return _decode_resolve_animation(json)
 
 
 def seek_animations(
@@ -441,7 +459,7 @@ class AnimationCanceled:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AnimationCanceled:
         return cls(
-            id_=str(json['id'])
+            json['id'],
         )
 
 
@@ -457,7 +475,7 @@ class AnimationCreated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AnimationCreated:
         return cls(
-            id_=str(json['id'])
+            json['id'],
         )
 
 
@@ -473,7 +491,7 @@ class AnimationStarted:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AnimationStarted:
         return cls(
-            animation=Animation.from_json(json['animation'])
+            Animation.from_json(json['animation']),
         )
 
 
@@ -489,5 +507,5 @@ class AnimationUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AnimationUpdated:
         return cls(
-            animation=Animation.from_json(json['animation'])
+            Animation.from_json(json['animation']),
         )
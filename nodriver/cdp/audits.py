@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import dom
 from . import network
@@ -39,9 +38,9 @@ class AffectedCookie:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AffectedCookie:
         return cls(
-            name=str(json['name']),
-            path=str(json['path']),
-            domain=str(json['domain']),
+            json['name'],
+            json['path'],
+            json['domain'],
         )
 
 
@@ -64,9 +63,10 @@ class AffectedRequest:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AffectedRequest:
+        get = json.get
         return cls(
-            request_id=network.RequestId.from_json(json['requestId']),
-            url=str(json['url']) if json.get('url', None) is not None else None,
+            network.RequestId(json['requestId']),
+            get('url'),
         )
 
 
@@ -85,7 +85,7 @@ class AffectedFrame:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AffectedFrame:
         return cls(
-            frame_id=page.FrameId.from_json(json['frameId']),
+            page.FrameId(json['frameId']),
         )
 
 
@@ -107,7 +107,10 @@ class CookieExclusionReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieExclusionReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class CookieWarningReason(enum.Enum):
@@ -131,7 +134,10 @@ class CookieWarningReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieWarningReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class CookieOperation(enum.Enum):
@@ -143,7 +149,10 @@ class CookieOperation(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieOperation:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -194,15 +203,16 @@ class CookieIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CookieIssueDetails:
+        get = json.get
         return cls(
-            cookie_warning_reasons=[CookieWarningReason.from_json(i) for i in json['cookieWarningReasons']],
-            cookie_exclusion_reasons=[CookieExclusionReason.from_json(i) for i in json['cookieExclusionReasons']],
-            operation=CookieOperation.from_json(json['operation']),
-            cookie=AffectedCookie.from_json(json['cookie']) if json.get('cookie', None) is not None else None,
-            raw_cookie_line=str(json['rawCookieLine']) if json.get('rawCookieLine', None) is not None else None,
-            site_for_cookies=str(json['siteForCookies']) if json.get('siteForCookies', None) is not None else None,
-            cookie_url=str(json['cookieUrl']) if json.get('cookieUrl', None) is not None else None,
-            request=AffectedRequest.from_json(json['request']) if json.get('request', None) is not None else None,
+            list(map(CookieWarningReason.from_json, json['cookieWarningReasons'])),
+            list(map(CookieExclusionReason.from_json, json['cookieExclusionReasons'])),
+            CookieOperation.from_json(json['operation']),
+            AffectedCookie.from_json(v) if (v := get('cookie')) is not None else None,
+            get('rawCookieLine'),
+            get('siteForCookies'),
+            get('cookieUrl'),
+            AffectedRequest.from_json(v) if (v := get('request')) is not None else None,
         )
 
 
@@ -216,7 +226,10 @@ class MixedContentResolutionStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> MixedContentResolutionStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class MixedContentResourceType(enum.Enum):
@@ -255,7 +268,10 @@ class MixedContentResourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> MixedContentResourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -297,13 +313,14 @@ class MixedContentIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MixedContentIssueDetails:
+        get = json.get
         return cls(
-            resolution_status=MixedContentResolutionStatus.from_json(json['resolutionStatus']),
-            insecure_url=str(json['insecureURL']),
-            main_resource_url=str(json['mainResourceURL']),
-            resource_type=MixedContentResourceType.from_json(json['resourceType']) if json.get('resourceType', None) is not None else None,
-            request=AffectedRequest.from_json(json['request']) if json.get('request', None) is not None else None,
-            frame=AffectedFrame.from_json(json['frame']) if json.get('frame', None) is not None else None,
+            MixedContentResolutionStatus.from_json(json['resolutionStatus']),
+            json['insecureURL'],
+            json['mainResourceURL'],
+            MixedContentResourceType.from_json(v) if (v := get('resourceType')) is not None else None,
+            AffectedRequest.from_json(v) if (v := get('request')) is not None else None,
+            AffectedFrame.from_json(v) if (v := get('frame')) is not None else None,
         )
 
 
@@ -325,7 +342,10 @@ class BlockedByResponseReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BlockedByResponseReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -355,11 +375,12 @@ class BlockedByResponseIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BlockedByResponseIssueDetails:
+        get = json.get
         return cls(
-            request=AffectedRequest.from_json(json['request']),
-            reason=BlockedByResponseReason.from_json(json['reason']),
-            parent_frame=AffectedFrame.from_json(json['parentFrame']) if json.get('parentFrame', None) is not None else None,
-            blocked_frame=AffectedFrame.from_json(json['blockedFrame']) if json.get('blockedFrame', None) is not None else None,
+            AffectedRequest.from_json(json['request']),
+            BlockedByResponseReason.from_json(json['reason']),
+            AffectedFrame.from_json(v) if (v := get('parentFrame')) is not None else None,
+            AffectedFrame.from_json(v) if (v := get('blockedFrame')) is not None else None,
         )
 
 
@@ -372,7 +393,10 @@ class HeavyAdResolutionStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> HeavyAdResolutionStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class HeavyAdReason(enum.Enum):
@@ -385,7 +409,10 @@ class HeavyAdReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> HeavyAdReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -409,9 +436,9 @@ class HeavyAdIssueDetails:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> HeavyAdIssueDetails:
         return cls(
-            resolution=HeavyAdResolutionStatus.from_json(json['resolution']),
-            reason=HeavyAdReason.from_json(json['reason']),
-            frame=AffectedFrame.from_json(json['frame']),
+            HeavyAdResolutionStatus.from_json(json['resolution']),
+            HeavyAdReason.from_json(json['reason']),
+            AffectedFrame.from_json(json['frame']),
         )
 
 
@@ -428,7 +455,10 @@ class ContentSecurityPolicyViolationType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContentSecurityPolicyViolationType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -452,11 +482,12 @@ class SourceCodeLocation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SourceCodeLocation:
+        get = json.get
         return cls(
-            url=str(json['url']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
-            script_id=runtime.ScriptId.from_json(json['scriptId']) if json.get('scriptId', None) is not None else None,
+            json['url'],
+            json['lineNumber'],
+            json['columnNumber'],
+            runtime.ScriptId(v) if (v := get('scriptId')) is not None else None,
         )
 
 
@@ -495,14 +526,15 @@ class ContentSecurityPolicyIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContentSecurityPolicyIssueDetails:
+        get = json.get
         return cls(
-            violated_directive=str(json['violatedDirective']),
-            is_report_only=bool(json['isReportOnly']),
-            content_security_policy_violation_type=ContentSecurityPolicyViolationType.from_json(json['contentSecurityPolicyViolationType']),
-            blocked_url=str(json['blockedURL']) if json.get('blockedURL', None) is not None else None,
-            frame_ancestor=AffectedFrame.from_json(json['frameAncestor']) if json.get('frameAncestor', None) is not None else None,
-            source_code_location=SourceCodeLocation.from_json(json['sourceCodeLocation']) if json.get('sourceCodeLocation', None) is not None else None,
-            violating_node_id=dom.BackendNodeId.from_json(json['violatingNodeId']) if json.get('violatingNodeId', None) is not None else None,
+            json['violatedDirective'],
+            json['isReportOnly'],
+            ContentSecurityPolicyViolationType.from_json(json['contentSecurityPolicyViolationType']),
+            get('blockedURL'),
+            AffectedFrame.from_json(v) if (v := get('frameAncestor')) is not None else None,
+            SourceCodeLocation.from_json(v) if (v := get('sourceCodeLocation')) is not None else None,
+            dom.BackendNodeId(v) if (v := get('violatingNodeId')) is not None else None,
         )
 
 
@@ -515,7 +547,10 @@ class SharedArrayBufferIssueType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SharedArrayBufferIssueType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -540,9 +575,9 @@ class SharedArrayBufferIssueDetails:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedArrayBufferIssueDetails:
         return cls(
-            source_code_location=SourceCodeLocation.from_json(json['sourceCodeLocation']),
-            is_warning=bool(json['isWarning']),
-            type_=SharedArrayBufferIssueType.from_json(json['type']),
+            SourceCodeLocation.from_json(json['sourceCodeLocation']),
+            json['isWarning'],
+            SharedArrayBufferIssueType.from_json(json['type']),
         )
 
 
@@ -576,13 +611,13 @@ class LowTextContrastIssueDetails:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LowTextContrastIssueDetails:
         return cls(
-            violating_node_id=dom.BackendNodeId.from_json(json['violatingNodeId']),
-            violating_node_selector=str(json['violatingNodeSelector']),
-            contrast_ratio=float(json['contrastRatio']),
-            threshold_aa=float(json['thresholdAA']),
-            threshold_aaa=float(json['thresholdAAA']),
-            font_size=str(json['fontSize']),
-            font_weight=str(json['fontWeight']),
+            dom.BackendNodeId(json['violatingNodeId']),
+            json['violatingNodeSelector'],
+            float(json['contrastRatio']),
+            float(json['thresholdAA']),
+            float(json['thresholdAAA']),
+            json['fontSize'],
+            json['fontWeight'],
         )
 
 
@@ -623,14 +658,15 @@ class CorsIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CorsIssueDetails:
+        get = json.get
         return cls(
-            cors_error_status=network.CorsErrorStatus.from_json(json['corsErrorStatus']),
-            is_warning=bool(json['isWarning']),
-            request=AffectedRequest.from_json(json['request']),
-            location=SourceCodeLocation.from_json(json['location']) if json.get('location', None) is not None else None,
-            initiator_origin=str(json['initiatorOrigin']) if json.get('initiatorOrigin', None) is not None else None,
-            resource_ip_address_space=network.IPAddressSpace.from_json(json['resourceIPAddressSpace']) if json.get('resourceIPAddressSpace', None) is not None else None,
-            client_security_state=network.ClientSecurityState.from_json(json['clientSecurityState']) if json.get('clientSecurityState', None) is not None else None,
+            network.CorsErrorStatus.from_json(json['corsErrorStatus']),
+            json['isWarning'],
+            AffectedRequest.from_json(json['request']),
+            SourceCodeLocation.from_json(v) if (v := get('location')) is not None else None,
+            get('initiatorOrigin'),
+            network.IPAddressSpace.from_json(v) if (v := get('resourceIPAddressSpace')) is not None else None,
+            network.ClientSecurityState.from_json(v) if (v := get('clientSecurityState')) is not None else None,
         )
 
 
@@ -662,7 +698,10 @@ class AttributionReportingIssueType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingIssueType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class SharedDictionaryError(enum.Enum):
@@ -695,7 +734,10 @@ class SharedDictionaryError(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SharedDictionaryError:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -725,11 +767,12 @@ class AttributionReportingIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingIssueDetails:
+        get = json.get
         return cls(
-            violation_type=AttributionReportingIssueType.from_json(json['violationType']),
-            request=AffectedRequest.from_json(json['request']) if json.get('request', None) is not None else None,
-            violating_node_id=dom.BackendNodeId.from_json(json['violatingNodeId']) if json.get('violatingNodeId', None) is not None else None,
-            invalid_parameter=str(json['invalidParameter']) if json.get('invalidParameter', None) is not None else None,
+            AttributionReportingIssueType.from_json(json['violationType']),
+            AffectedRequest.from_json(v) if (v := get('request')) is not None else None,
+            dom.BackendNodeId(v) if (v := get('violatingNodeId')) is not None else None,
+            get('invalidParameter'),
         )
 
 
@@ -763,11 +806,11 @@ class QuirksModeIssueDetails:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> QuirksModeIssueDetails:
         return cls(
-            is_limited_quirks_mode=bool(json['isLimitedQuirksMode']),
-            document_node_id=dom.BackendNodeId.from_json(json['documentNodeId']),
-            url=str(json['url']),
-            frame_id=page.FrameId.from_json(json['frameId']),
-            loader_id=network.LoaderId.from_json(json['loaderId']),
+            json['isLimitedQuirksMode'],
+            dom.BackendNodeId(json['documentNodeId']),
+            json['url'],
+            page.FrameId(json['frameId']),
+            network.LoaderId(json['loaderId']),
         )
 
 
@@ -786,9 +829,10 @@ class NavigatorUserAgentIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NavigatorUserAgentIssueDetails:
+        get = json.get
         return cls(
-            url=str(json['url']),
-            location=SourceCodeLocation.from_json(json['location']) if json.get('location', None) is not None else None,
+            json['url'],
+            SourceCodeLocation.from_json(v) if (v := get('location')) is not None else None,
         )
 
 
@@ -807,8 +851,8 @@ class SharedDictionaryIssueDetails:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedDictionaryIssueDetails:
         return cls(
-            shared_dictionary_error=SharedDictionaryError.from_json(json['sharedDictionaryError']),
-            request=AffectedRequest.from_json(json['request']),
+            SharedDictionaryError.from_json(json['sharedDictionaryError']),
+            AffectedRequest.from_json(json['request']),
         )
 
 
@@ -830,7 +874,10 @@ class GenericIssueErrorType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> GenericIssueErrorType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -864,12 +911,13 @@ class GenericIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> GenericIssueDetails:
+        get = json.get
         return cls(
-            error_type=GenericIssueErrorType.from_json(json['errorType']),
-            frame_id=page.FrameId.from_json(json['frameId']) if json.get('frameId', None) is not None else None,
-            violating_node_id=dom.BackendNodeId.from_json(json['violatingNodeId']) if json.get('violatingNodeId', None) is not None else None,
-            violating_node_attribute=str(json['violatingNodeAttribute']) if json.get('violatingNodeAttribute', None) is not None else None,
-            request=AffectedRequest.from_json(json['request']) if json.get('request', None) is not None else None,
+            GenericIssueErrorType.from_json(json['errorType']),
+            page.FrameId(v) if (v := get('frameId')) is not None else None,
+            dom.BackendNodeId(v) if (v := get('violatingNodeId')) is not None else None,
+            get('violatingNodeAttribute'),
+            AffectedRequest.from_json(v) if (v := get('request')) is not None else None,
         )
 
 
@@ -896,10 +944,11 @@ class DeprecationIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DeprecationIssueDetails:
+        get = json.get
         return cls(
-            source_code_location=SourceCodeLocation.from_json(json['sourceCodeLocation']),
-            type_=str(json['type']),
-            affected_frame=AffectedFrame.from_json(json['affectedFrame']) if json.get('affectedFrame', None) is not None else None,
+            SourceCodeLocation.from_json(json['sourceCodeLocation']),
+            json['type'],
+            AffectedFrame.from_json(v) if (v := get('affectedFrame')) is not None else None,
         )
 
 
@@ -922,7 +971,7 @@ class BounceTrackingIssueDetails:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BounceTrackingIssueDetails:
         return cls(
-            tracking_sites=[str(i) for i in json['trackingSites']],
+            list(json['trackingSites']),
         )
 
 
@@ -954,10 +1003,10 @@ class CookieDeprecationMetadataIssueDetails:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CookieDeprecationMetadataIssueDetails:
         return cls(
-            allowed_sites=[str(i) for i in json['allowedSites']],
-            opt_out_percentage=float(json['optOutPercentage']),
-            is_opt_out_top_level=bool(json['isOptOutTopLevel']),
-            operation=CookieOperation.from_json(json['operation']),
+            list(json['allowedSites']),
+            float(json['optOutPercentage']),
+            json['isOptOutTopLevel'],
+            CookieOperation.from_json(json['operation']),
         )
 
 
@@ -970,7 +1019,10 @@ class ClientHintIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ClientHintIssueReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -985,7 +1037,7 @@ class FederatedAuthRequestIssueDetails:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FederatedAuthRequestIssueDetails:
         return cls(
-            federated_auth_request_issue_reason=FederatedAuthRequestIssueReason.from_json(json['federatedAuthRequestIssueReason']),
+            FederatedAuthRequestIssueReason.from_json(json['federatedAuthRequestIssueReason']),
         )
 
 
@@ -1047,7 +1099,10 @@ class FederatedAuthRequestIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> FederatedAuthRequestIssueReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1062,7 +1117,7 @@ class FederatedAuthUserInfoRequestIssueDetails:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FederatedAuthUserInfoRequestIssueDetails:
         return cls(
-            federated_auth_user_info_request_issue_reason=FederatedAuthUserInfoRequestIssueReason.from_json(json['federatedAuthUserInfoRequestIssueReason']),
+            FederatedAuthUserInfoRequestIssueReason.from_json(json['federatedAuthUserInfoRequestIssueReason']),
         )
 
 
@@ -1087,7 +1142,10 @@ class FederatedAuthUserInfoRequestIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> FederatedAuthUserInfoRequestIssueReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1109,8 +1167,8 @@ class ClientHintIssueDetails:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ClientHintIssueDetails:
         return cls(
-            source_code_location=SourceCodeLocation.from_json(json['sourceCodeLocation']),
-            client_hint_issue_reason=ClientHintIssueReason.from_json(json['clientHintIssueReason']),
+            SourceCodeLocation.from_json(json['sourceCodeLocation']),
+            ClientHintIssueReason.from_json(json['clientHintIssueReason']),
         )
 
 
@@ -1134,10 +1192,11 @@ class FailedRequestInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FailedRequestInfo:
+        get = json.get
         return cls(
-            url=str(json['url']),
-            failure_message=str(json['failureMessage']),
-            request_id=network.RequestId.from_json(json['requestId']) if json.get('requestId', None) is not None else None,
+            json['url'],
+            json['failureMessage'],
+            network.RequestId(v) if (v := get('requestId')) is not None else None,
         )
 
 
@@ -1150,7 +1209,10 @@ class StyleSheetLoadingIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StyleSheetLoadingIssueReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1177,10 +1239,11 @@ class StylesheetLoadingIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StylesheetLoadingIssueDetails:
+        get = json.get
         return cls(
-            source_code_location=SourceCodeLocation.from_json(json['sourceCodeLocation']),
-            style_sheet_loading_issue_reason=StyleSheetLoadingIssueReason.from_json(json['styleSheetLoadingIssueReason']),
-            failed_request_info=FailedRequestInfo.from_json(json['failedRequestInfo']) if json.get('failedRequestInfo', None) is not None else None,
+            SourceCodeLocation.from_json(json['sourceCodeLocation']),
+            StyleSheetLoadingIssueReason.from_json(json['styleSheetLoadingIssueReason']),
+            FailedRequestInfo.from_json(v) if (v := get('failedRequestInfo')) is not None else None,
         )
 
 
@@ -1195,7 +1258,10 @@ class PropertyRuleIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PropertyRuleIssueReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1223,10 +1289,11 @@ class PropertyRuleIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PropertyRuleIssueDetails:
+        get = json.get
         return cls(
-            source_code_location=SourceCodeLocation.from_json(json['sourceCodeLocation']),
-            property_rule_issue_reason=PropertyRuleIssueReason.from_json(json['propertyRuleIssueReason']),
-            property_value=str(json['propertyValue']) if json.get('propertyValue', None) is not None else None,
+            SourceCodeLocation.from_json(json['sourceCodeLocation']),
+            PropertyRuleIssueReason.from_json(json['propertyRuleIssueReason']),
+            get('propertyValue'),
         )
 
 
@@ -1263,7 +1330,10 @@ class InspectorIssueCode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InspectorIssueCode:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1363,28 +1433,29 @@ class InspectorIssueDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InspectorIssueDetails:
+        get = json.get
         return cls(
-            cookie_issue_details=CookieIssueDetails.from_json(json['cookieIssueDetails']) if json.get('cookieIssueDetails', None) is not None else None,
-            mixed_content_issue_details=MixedContentIssueDetails.from_json(json['mixedContentIssueDetails']) if json.get('mixedContentIssueDetails', None) is not None else None,
-            blocked_by_response_issue_details=BlockedByResponseIssueDetails.from_json(json['blockedByResponseIssueDetails']) if json.get('blockedByResponseIssueDetails', None) is not None else None,
-            heavy_ad_issue_details=HeavyAdIssueDetails.from_json(json['heavyAdIssueDetails']) if json.get('heavyAdIssueDetails', None) is not None else None,
-            content_security_policy_issue_details=ContentSecurityPolicyIssueDetails.from_json(json['contentSecurityPolicyIssueDetails']) if json.get('contentSecurityPolicyIssueDetails', None) is not None else None,
-            shared_array_buffer_issue_details=SharedArrayBufferIssueDetails.from_json(json['sharedArrayBufferIssueDetails']) if json.get('sharedArrayBufferIssueDetails', None) is not None else None,
-            low_text_contrast_issue_details=LowTextContrastIssueDetails.from_json(json['lowTextContrastIssueDetails']) if json.get('lowTextContrastIssueDetails', None) is not None else None,
-            cors_issue_details=CorsIssueDetails.from_json(json['corsIssueDetails']) if json.get('corsIssueDetails', None) is not None else None,
-            attribution_reporting_issue_details=AttributionReportingIssueDetails.from_json(json['attributionReportingIssueDetails']) if json.get('attributionReportingIssueDetails', None) is not None else None,
-            quirks_mode_issue_details=QuirksModeIssueDetails.from_json(json['quirksModeIssueDetails']) if json.get('quirksModeIssueDetails', None) is not None else None,
-            navigator_user_agent_issue_details=NavigatorUserAgentIssueDetails.from_json(json['navigatorUserAgentIssueDetails']) if json.get('navigatorUserAgentIssueDetails', None) is not None else None,
-            generic_issue_details=GenericIssueDetails.from_json(json['genericIssueDetails']) if json.get('genericIssueDetails', None) is not None else None,
-            deprecation_issue_details=DeprecationIssueDetails.from_json(json['deprecationIssueDetails']) if json.get('deprecationIssueDetails', None) is not None else None,
-            client_hint_issue_details=ClientHintIssueDetails.from_json(json['clientHintIssueDetails']) if json.get('clientHintIssueDetails', None) is not None else None,
-            federated_auth_request_issue_details=FederatedAuthRequestIssueDetails.from_json(json['federatedAuthRequestIssueDetails']) if json.get('federatedAuthRequestIssueDetails', None) is not None else None,
-            bounce_tracking_issue_details=BounceTrackingIssueDetails.from_json(json['bounceTrackingIssueDetails']) if json.get('bounceTrackingIssueDetails', None) is not None else None,
-            cookie_deprecation_metadata_issue_details=CookieDeprecationMetadataIssueDetails.from_json(json['cookieDeprecationMetadataIssueDetails']) if json.get('cookieDeprecationMetadataIssueDetails', None) is not None else None,
-            stylesheet_loading_issue_details=StylesheetLoadingIssueDetails.from_json(json['stylesheetLoadingIssueDetails']) if json.get('stylesheetLoadingIssueDetails', None) is not None else None,
-            property_rule_issue_details=PropertyRuleIssueDetails.from_json(json['propertyRuleIssueDetails']) if json.get('propertyRuleIssueDetails', None) is not None else None,
-            federated_auth_user_info_request_issue_details=FederatedAuthUserInfoRequestIssueDetails.from_json(json['federatedAuthUserInfoRequestIssueDetails']) if json.get('federatedAuthUserInfoRequestIssueDetails', None) is not None else None,
-            shared_dictionary_issue_details=SharedDictionaryIssueDetails.from_json(json['sharedDictionaryIssueDetails']) if json.get('sharedDictionaryIssueDetails', None) is not None else None,
+            CookieIssueDetails.from_json(v) if (v := get('cookieIssueDetails')) is not None else None,
+            MixedContentIssueDetails.from_json(v) if (v := get('mixedContentIssueDetails')) is not None else None,
+            BlockedByResponseIssueDetails.from_json(v) if (v := get('blockedByResponseIssueDetails')) is not None else None,
+            HeavyAdIssueDetails.from_json(v) if (v := get('heavyAdIssueDetails')) is not None else None,
+            ContentSecurityPolicyIssueDetails.from_json(v) if (v := get('contentSecurityPolicyIssueDetails')) is not None else None,
+            SharedArrayBufferIssueDetails.from_json(v) if (v := get('sharedArrayBufferIssueDetails')) is not None else None,
+            LowTextContrastIssueDetails.from_json(v) if (v := get('lowTextContrastIssueDetails')) is not None else None,
+            CorsIssueDetails.from_json(v) if (v := get('corsIssueDetails')) is not None else None,
+            AttributionReportingIssueDetails.from_json(v) if (v := get('attributionReportingIssueDetails')) is not None else None,
+            QuirksModeIssueDetails.from_json(v) if (v := get('quirksModeIssueDetails')) is not None else None,
+            NavigatorUserAgentIssueDetails.from_json(v) if (v := get('navigatorUserAgentIssueDetails')) is not None else None,
+            GenericIssueDetails.from_json(v) if (v := get('genericIssueDetails')) is not None else None,
+            DeprecationIssueDetails.from_json(v) if (v := get('deprecationIssueDetails')) is not None else None,
+            ClientHintIssueDetails.from_json(v) if (v := get('clientHintIssueDetails')) is not None else None,
+            FederatedAuthRequestIssueDetails.from_json(v) if (v := get('federatedAuthRequestIssueDetails')) is not None else None,
+            BounceTrackingIssueDetails.from_json(v) if (v := get('bounceTrackingIssueDetails')) is not None else None,
+            CookieDeprecationMetadataIssueDetails.from_json(v) if (v := get('cookieDeprecationMetadataIssueDetails')) is not None else None,
+            StylesheetLoadingIssueDetails.from_json(v) if (v := get('stylesheetLoadingIssueDetails')) is not None else None,
+            PropertyRuleIssueDetails.from_json(v) if (v := get('propertyRuleIssueDetails')) is not None else None,
+            FederatedAuthUserInfoRequestIssueDetails.from_json(v) if (v := get('federatedAuthUserInfoRequestIssueDetails')) is not None else None,
+            SharedDictionaryIssueDetails.from_json(v) if (v := get('sharedDictionaryIssueDetails')) is not None else None,
         )
 
 
@@ -1427,13 +1498,23 @@ class InspectorIssue:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InspectorIssue:
+        get = json.get
         return cls(
-            code=InspectorIssueCode.from_json(json['code']),
-            details=InspectorIssueDetails.from_json(json['details']),
-            issue_id=IssueId.from_json(json['issueId']) if json.get('issueId', None) is not None else None,
+            InspectorIssueCode.from_json(json['code']),
+            InspectorIssueDetails.from_json(json['details']),
+            IssueId(v) if (v := get('issueId')) is not None else None,
         )
 
 
+@command_decoder('Audits.getEncodedResponse')
+def _decode_get_encoded_response(json: T_JSON_DICT) -> typing.Tuple[typing.Optional[str], int, int]:
+    return (
+        str(json['body']) if json.get('body', None) is not None else None,
+        int(json['originalSize']),
+        int(json['encodedSize'])
+    )
+
+
 def get_encoded_response(
         request_id: network.RequestId,
         encoding: str,
@@ -1466,11 +1547,7 @@ def get_encoded_response(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        str(json['body']) if json.get('body', None) is not None else None,
-        int(json['originalSize']),
-        int(json['encodedSize'])
-    )
+    return _decode_get_encoded_response(json)
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1513,6 +1590,11 @@ def check_contrast(
     json = yield cmd_dict
 
 
+@command_decoder('Audits.checkFormsIssues')
+def _decode_check_forms_issues(json: T_JSON_DICT) -> typing.List[GenericIssueDetails]:
+    return [GenericIssueDetails.from_json(i) for i in json['formIssues']]
+
+
 def check_forms_issues() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[GenericIssueDetails]]:
     '''
     Runs the form issues check for the target page. Found issues are reported
@@ -1524,7 +1606,7 @@ def check_forms_issues() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List
         'method': 'Audits.checkFormsIssues',
     }
     json = yield cmd_dict
-    return [GenericIssueDetails.from_json(i) for i in json['formIssues']]
+    return _decode_check_forms_issues(json)
 
 
 @event_class('Audits.issueAdded')
@@ -1535,5 +1617,5 @@ class IssueAdded:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IssueAdded:
         return cls(
-            issue=InspectorIssue.from_json(json['issue'])
+            InspectorIssue.from_json(json['issue']),
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import dom
 from . import page
@@ -44,11 +43,11 @@ class CreditCard:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CreditCard:
         return cls(
-            number=str(json['number']),
-            name=str(json['name']),
-            expiry_month=str(json['expiryMonth']),
-            expiry_year=str(json['expiryYear']),
-            cvc=str(json['cvc']),
+            json['number'],
+            json['name'],
+            json['expiryMonth'],
+            json['expiryYear'],
+            json['cvc'],
         )
 
 
@@ -69,8 +68,8 @@ class AddressField:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AddressField:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            json['name'],
+            json['value'],
         )
 
 
@@ -89,7 +88,7 @@ class AddressFields:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AddressFields:
         return cls(
-            fields=[AddressField.from_json(i) for i in json['fields']],
+            list(map(AddressField.from_json, json['fields'])),
         )
 
 
@@ -106,7 +105,7 @@ class Address:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Address:
         return cls(
-            fields=[AddressField.from_json(i) for i in json['fields']],
+            list(map(AddressField.from_json, json['fields'])),
         )
 
 
@@ -132,7 +131,7 @@ class AddressUI:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AddressUI:
         return cls(
-            address_fields=[AddressFields.from_json(i) for i in json['addressFields']],
+            list(map(AddressFields.from_json, json['addressFields'])),
         )
 
 
@@ -148,7 +147,10 @@ class FillingStrategy(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> FillingStrategy:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -192,14 +194,14 @@ class FilledField:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FilledField:
         return cls(
-            html_type=str(json['htmlType']),
-            id_=str(json['id']),
-            name=str(json['name']),
-            value=str(json['value']),
-            autofill_type=str(json['autofillType']),
-            filling_strategy=FillingStrategy.from_json(json['fillingStrategy']),
-            frame_id=page.FrameId.from_json(json['frameId']),
-            field_id=dom.BackendNodeId.from_json(json['fieldId']),
+            json['htmlType'],
+            json['id'],
+            json['name'],
+            json['value'],
+            json['autofillType'],
+            FillingStrategy.from_json(json['fillingStrategy']),
+            page.FrameId(json['frameId']),
+            dom.BackendNodeId(json['fieldId']),
         )
 
 
@@ -280,6 +282,6 @@ class AddressFormFilled:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AddressFormFilled:
         return cls(
-            filled_fields=[FilledField.from_json(i) for i in json['filledFields']],
-            address_ui=AddressUI.from_json(json['addressUi'])
+            list(map(FilledField.from_json, json['filledFields'])),
+            AddressUI.from_json(json['addressUi']),
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import network
 from . import service_worker
@@ -33,7 +32,10 @@ class ServiceName(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceName:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -54,8 +56,8 @@ class EventMetadata:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> EventMetadata:
         return cls(
-            key=str(json['key']),
-            value=str(json['value']),
+            json['key'],
+            json['value'],
         )
 
 
@@ -100,14 +102,14 @@ class BackgroundServiceEvent:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackgroundServiceEvent:
         return cls(
-            timestamp=network.TimeSinceEpoch.from_json(json['timestamp']),
-            origin=str(json['origin']),
-            service_worker_registration_id=service_worker.RegistrationID.from_json(json['serviceWorkerRegistrationId']),
-            service=ServiceName.from_json(json['service']),
-            event_name=str(json['eventName']),
-            instance_id=str(json['instanceId']),
-            event_metadata=[EventMetadata.from_json(i) for i in json['eventMetadata']],
-            storage_key=str(json['storageKey']),
+            network.TimeSinceEpoch(json['timestamp']),
+            json['origin'],
+            service_worker.RegistrationID(json['serviceWorkerRegistrationId']),
+            ServiceName.from_json(json['service']),
+            json['eventName'],
+            json['instanceId'],
+            list(map(EventMetadata.from_json, json['eventMetadata'])),
+            json['storageKey'],
         )
 
 
@@ -194,8 +196,8 @@ class RecordingStateChanged:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RecordingStateChanged:
         return cls(
-            is_recording=bool(json['isRecording']),
-            service=ServiceName.from_json(json['service'])
+            json['isRecording'],
+            ServiceName.from_json(json['service']),
         )
 
 
@@ -211,5 +213,5 @@ class BackgroundServiceEventReceived:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackgroundServiceEventReceived:
         return cls(
-            background_service_event=BackgroundServiceEvent.from_json(json['backgroundServiceEvent'])
+            BackgroundServiceEvent.from_json(json['backgroundServiceEvent']),
         )
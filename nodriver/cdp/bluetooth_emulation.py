@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 class CentralState(enum.Enum):
@@ -25,7 +24,10 @@ class CentralState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CentralState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -50,8 +52,8 @@ class ManufacturerData:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ManufacturerData:
         return cls(
-            key=int(json['key']),
-            data=str(json['data']),
+            json['key'],
+            json['data'],
         )
 
 
@@ -90,12 +92,13 @@ class ScanRecord:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScanRecord:
+        get = json.get
         return cls(
-            name=str(json['name']) if json.get('name', None) is not None else None,
-            uuids=[str(i) for i in json['uuids']] if json.get('uuids', None) is not None else None,
-            appearance=int(json['appearance']) if json.get('appearance', None) is not None else None,
-            tx_power=int(json['txPower']) if json.get('txPower', None) is not None else None,
-            manufacturer_data=[ManufacturerData.from_json(i) for i in json['manufacturerData']] if json.get('manufacturerData', None) is not None else None,
+            get('name'),
+            list(v) if (v := get('uuids')) is not None else None,
+            get('appearance'),
+            get('txPower'),
+            list(map(ManufacturerData.from_json, v)) if (v := get('manufacturerData')) is not None else None,
         )
 
 
@@ -120,9 +123,9 @@ class ScanEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScanEntry:
         return cls(
-            device_address=str(json['deviceAddress']),
-            rssi=int(json['rssi']),
-            scan_record=ScanRecord.from_json(json['scanRecord']),
+            json['deviceAddress'],
+            json['rssi'],
+            ScanRecord.from_json(json['scanRecord']),
         )
 
 
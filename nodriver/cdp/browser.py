@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import page
 from . import target
@@ -53,7 +52,10 @@ class WindowState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> WindowState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -92,12 +94,13 @@ class Bounds:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Bounds:
+        get = json.get
         return cls(
-            left=int(json['left']) if json.get('left', None) is not None else None,
-            top=int(json['top']) if json.get('top', None) is not None else None,
-            width=int(json['width']) if json.get('width', None) is not None else None,
-            height=int(json['height']) if json.get('height', None) is not None else None,
-            window_state=WindowState.from_json(json['windowState']) if json.get('windowState', None) is not None else None,
+            get('left'),
+            get('top'),
+            get('width'),
+            get('height'),
+            WindowState.from_json(v) if (v := get('windowState')) is not None else None,
         )
 
 
@@ -138,7 +141,10 @@ class PermissionType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PermissionType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class PermissionSetting(enum.Enum):
@@ -151,7 +157,10 @@ class PermissionSetting(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PermissionSetting:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -197,13 +206,14 @@ class PermissionDescriptor:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PermissionDescriptor:
+        get = json.get
         return cls(
-            name=str(json['name']),
-            sysex=bool(json['sysex']) if json.get('sysex', None) is not None else None,
-            user_visible_only=bool(json['userVisibleOnly']) if json.get('userVisibleOnly', None) is not None else None,
-            allow_without_sanitization=bool(json['allowWithoutSanitization']) if json.get('allowWithoutSanitization', None) is not None else None,
-            allow_without_gesture=bool(json['allowWithoutGesture']) if json.get('allowWithoutGesture', None) is not None else None,
-            pan_tilt_zoom=bool(json['panTiltZoom']) if json.get('panTiltZoom', None) is not None else None,
+            json['name'],
+            get('sysex'),
+            get('userVisibleOnly'),
+            get('allowWithoutSanitization'),
+            get('allowWithoutGesture'),
+            get('panTiltZoom'),
         )
 
 
@@ -219,7 +229,10 @@ class BrowserCommandId(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BrowserCommandId:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -246,9 +259,9 @@ class Bucket:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Bucket:
         return cls(
-            low=int(json['low']),
-            high=int(json['high']),
-            count=int(json['count']),
+            json['low'],
+            json['high'],
+            json['count'],
         )
 
 
@@ -280,10 +293,10 @@ class Histogram:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Histogram:
         return cls(
-            name=str(json['name']),
-            sum_=int(json['sum']),
-            count=int(json['count']),
-            buckets=[Bucket.from_json(i) for i in json['buckets']],
+            json['name'],
+            json['sum'],
+            json['count'],
+            list(map(Bucket.from_json, json['buckets'])),
         )
 
 
@@ -450,6 +463,17 @@ def crash_gpu_process() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('Browser.getVersion')
+def _decode_get_version(json: T_JSON_DICT) -> typing.Tuple[str, str, str, str, str]:
+    return (
+        str(json['protocolVersion']),
+        str(json['product']),
+        str(json['revision']),
+        str(json['userAgent']),
+        str(json['jsVersion'])
+    )
+
+
 def get_version() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, str, str, str, str]]:
     '''
     Returns version information.
@@ -466,13 +490,12 @@ def get_version() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str,
         'method': 'Browser.getVersion',
     }
     json = yield cmd_dict
-    return (
-        str(json['protocolVersion']),
-        str(json['product']),
-        str(json['revision']),
-        str(json['userAgent']),
-        str(json['jsVersion'])
-    )
+    return _decode_get_version(json)
+
+
+@command_decoder('Browser.getBrowserCommandLine')
+def _decode_get_browser_command_line(json: T_JSON_DICT) -> typing.List[str]:
+    return [str(i) for i in json['arguments']]
 
 
 def get_browser_command_line() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
@@ -488,7 +511,12 @@ def get_browser_command_line() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typin
         'method': 'Browser.getBrowserCommandLine',
     }
     json = yield cmd_dict
-    return [str(i) for i in json['arguments']]
+    return _decode_get_browser_command_line(json)
+
+
+@command_decoder('Browser.getHistograms')
+def _decode_get_histograms(json: T_JSON_DICT) -> typing.List[Histogram]:
+    return [Histogram.from_json(i) for i in json['histograms']]
 
 
 def get_histograms(
@@ -514,7 +542,12 @@ def get_histograms(
         'params': params,
     }
     json = yield cmd_dict
-    return [Histogram.from_json(i) for i in json['histograms']]
+    return _decode_get_histograms(json)
+
+
+@command_decoder('Browser.getHistogram')
+def _decode_get_histogram(json: T_JSON_DICT) -> Histogram:
+    return Histogram.from_json(json['histogram'])
 
 
 def get_histogram(
@@ -539,7 +572,12 @@ def get_histogram(
         'params': params,
     }
     json = yield cmd_dict
-    return Histogram.from_json(json['histogram'])
+    return _decode_get_histogram(json)
+
+
+@command_decoder('Browser.getWindowBounds')
+def _decode_get_window_bounds(json: T_JSON_DICT) -> Bounds:
+    return Bounds.from_json(json['bounds'])
 
 
 def get_window_bounds(
@@ -560,7 +598,15 @@ def get_window_bounds(
         'params': params,
     }
     json = yield cmd_dict
-    return Bounds.from_json(json['bounds'])
+    return _decode_get_window_bounds(json)
+
+
+@command_decoder('Browser.getWindowForTarget')
+def _decode_get_window_for_target(json: T_JSON_DICT) -> typing.Tuple[WindowID, Bounds]:
+    return (
+        WindowID.from_json(json['windowId']),
+        Bounds.from_json(json['bounds'])
+    )
 
 
 def get_window_for_target(
@@ -585,10 +631,7 @@ def get_window_for_target(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        WindowID.from_json(json['windowId']),
-        Bounds.from_json(json['bounds'])
-    )
+    return _decode_get_window_for_target(json)
 
 
 def set_window_bounds(
@@ -694,10 +737,10 @@ class DownloadWillBegin:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DownloadWillBegin:
         return cls(
-            frame_id=page.FrameId.from_json(json['frameId']),
-            guid=str(json['guid']),
-            url=str(json['url']),
-            suggested_filename=str(json['suggestedFilename'])
+            page.FrameId(json['frameId']),
+            json['guid'],
+            json['url'],
+            json['suggestedFilename'],
         )
 
 
@@ -721,8 +764,8 @@ class DownloadProgress:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DownloadProgress:
         return cls(
-            guid=str(json['guid']),
-            total_bytes=float(json['totalBytes']),
-            received_bytes=float(json['receivedBytes']),
-            state=str(json['state'])
+            json['guid'],
+            float(json['totalBytes']),
+            float(json['receivedBytes']),
+            json['state'],
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import storage
 
@@ -45,7 +44,10 @@ class CachedResponseType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CachedResponseType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -92,14 +94,14 @@ class DataEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DataEntry:
         return cls(
-            request_url=str(json['requestURL']),
-            request_method=str(json['requestMethod']),
-            request_headers=[Header.from_json(i) for i in json['requestHeaders']],
-            response_time=float(json['responseTime']),
-            response_status=int(json['responseStatus']),
-            response_status_text=str(json['responseStatusText']),
-            response_type=CachedResponseType.from_json(json['responseType']),
-            response_headers=[Header.from_json(i) for i in json['responseHeaders']],
+            json['requestURL'],
+            json['requestMethod'],
+            list(map(Header.from_json, json['requestHeaders'])),
+            float(json['responseTime']),
+            json['responseStatus'],
+            json['responseStatusText'],
+            CachedResponseType.from_json(json['responseType']),
+            list(map(Header.from_json, json['responseHeaders'])),
         )
 
 
@@ -135,12 +137,13 @@ class Cache:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Cache:
+        get = json.get
         return cls(
-            cache_id=CacheId.from_json(json['cacheId']),
-            security_origin=str(json['securityOrigin']),
-            storage_key=str(json['storageKey']),
-            cache_name=str(json['cacheName']),
-            storage_bucket=storage.StorageBucket.from_json(json['storageBucket']) if json.get('storageBucket', None) is not None else None,
+            CacheId(json['cacheId']),
+            json['securityOrigin'],
+            json['storageKey'],
+            json['cacheName'],
+            storage.StorageBucket.from_json(v) if (v := get('storageBucket')) is not None else None,
         )
 
 
@@ -159,8 +162,8 @@ class Header:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Header:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            json['name'],
+            json['value'],
         )
 
 
@@ -180,7 +183,7 @@ class CachedResponse:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CachedResponse:
         return cls(
-            body=str(json['body']),
+            json['body'],
         )
 
 
@@ -221,6 +224,11 @@ def delete_entry(
     json = yield cmd_dict
 
 
+@command_decoder('CacheStorage.requestCacheNames')
+def _decode_request_cache_names(json: T_JSON_DICT) -> typing.List[Cache]:
+    return [Cache.from_json(i) for i in json['caches']]
+
+
 def request_cache_names(
         security_origin: typing.Optional[str] = None,
         storage_key: typing.Optional[str] = None,
@@ -246,7 +254,12 @@ def request_cache_names(
         'params': params,
     }
     json = yield cmd_dict
-    return [Cache.from_json(i) for i in json['caches']]
+    return _decode_request_cache_names(json)
+
+
+@command_decoder('CacheStorage.requestCachedResponse')
+def _decode_request_cached_response(json: T_JSON_DICT) -> CachedResponse:
+    return CachedResponse.from_json(json['response'])
 
 
 def request_cached_response(
@@ -271,7 +284,15 @@ def request_cached_response(
         'params': params,
     }
     json = yield cmd_dict
-    return CachedResponse.from_json(json['response'])
+    return _decode_request_cached_response(json)
+
+
+@command_decoder('CacheStorage.requestEntries')
+def _decode_request_entries(json: T_JSON_DICT) -> typing.Tuple[typing.List[DataEntry], float]:
+    return (
+        [DataEntry.from_json(i) for i in json['cacheDataEntries']],
+        float(json['returnCount'])
+    )
 
 
 def request_entries(
@@ -305,7 +326,4 @@ def request_entries(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        [DataEntry.from_json(i) for i in json['cacheDataEntries']],
-        float(json['returnCount'])
-    )
+    return _decode_request_entries(json)
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 @dataclass
@@ -32,10 +31,11 @@ class Sink:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Sink:
+        get = json.get
         return cls(
-            name=str(json['name']),
-            id_=str(json['id']),
-            session=str(json['session']) if json.get('session', None) is not None else None,
+            json['name'],
+            json['id'],
+            get('session'),
         )
 
 
@@ -152,7 +152,7 @@ class SinksUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SinksUpdated:
         return cls(
-            sinks=[Sink.from_json(i) for i in json['sinks']]
+            list(map(Sink.from_json, json['sinks'])),
         )
 
 
@@ -168,5 +168,5 @@ class IssueUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IssueUpdated:
         return cls(
-            issue_message=str(json['issueMessage'])
+            json['issueMessage'],
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 @dataclass
@@ -50,13 +49,14 @@ class ConsoleMessage:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ConsoleMessage:
+        get = json.get
         return cls(
-            source=str(json['source']),
-            level=str(json['level']),
-            text=str(json['text']),
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            line=int(json['line']) if json.get('line', None) is not None else None,
-            column=int(json['column']) if json.get('column', None) is not None else None,
+            json['source'],
+            json['level'],
+            json['text'],
+            get('url'),
+            get('line'),
+            get('column'),
         )
 
 
@@ -103,5 +103,5 @@ class MessageAdded:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MessageAdded:
         return cls(
-            message=ConsoleMessage.from_json(json['message'])
+            ConsoleMessage.from_json(json['message']),
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import dom
 from . import page
@@ -43,7 +42,10 @@ class StyleSheetOrigin(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StyleSheetOrigin:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -70,10 +72,11 @@ class PseudoElementMatches:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PseudoElementMatches:
+        get = json.get
         return cls(
-            pseudo_type=dom.PseudoType.from_json(json['pseudoType']),
-            matches=[RuleMatch.from_json(i) for i in json['matches']],
-            pseudo_identifier=str(json['pseudoIdentifier']) if json.get('pseudoIdentifier', None) is not None else None,
+            dom.PseudoType.from_json(json['pseudoType']),
+            list(map(RuleMatch.from_json, json['matches'])),
+            get('pseudoIdentifier'),
         )
 
 
@@ -97,9 +100,10 @@ class InheritedStyleEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InheritedStyleEntry:
+        get = json.get
         return cls(
-            matched_css_rules=[RuleMatch.from_json(i) for i in json['matchedCSSRules']],
-            inline_style=CSSStyle.from_json(json['inlineStyle']) if json.get('inlineStyle', None) is not None else None,
+            list(map(RuleMatch.from_json, json['matchedCSSRules'])),
+            CSSStyle.from_json(v) if (v := get('inlineStyle')) is not None else None,
         )
 
 
@@ -119,7 +123,7 @@ class InheritedPseudoElementMatches:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InheritedPseudoElementMatches:
         return cls(
-            pseudo_elements=[PseudoElementMatches.from_json(i) for i in json['pseudoElements']],
+            list(map(PseudoElementMatches.from_json, json['pseudoElements'])),
         )
 
 
@@ -143,8 +147,8 @@ class RuleMatch:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RuleMatch:
         return cls(
-            rule=CSSRule.from_json(json['rule']),
-            matching_selectors=[int(i) for i in json['matchingSelectors']],
+            CSSRule.from_json(json['rule']),
+            list(json['matchingSelectors']),
         )
 
 
@@ -173,10 +177,11 @@ class Value:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Value:
+        get = json.get
         return cls(
-            text=str(json['text']),
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            specificity=Specificity.from_json(json['specificity']) if json.get('specificity', None) is not None else None,
+            json['text'],
+            SourceRange.from_json(v) if (v := get('range')) is not None else None,
+            Specificity.from_json(v) if (v := get('specificity')) is not None else None,
         )
 
 
@@ -206,9 +211,9 @@ class Specificity:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Specificity:
         return cls(
-            a=int(json['a']),
-            b=int(json['b']),
-            c=int(json['c']),
+            json['a'],
+            json['b'],
+            json['c'],
         )
 
 
@@ -232,8 +237,8 @@ class SelectorList:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SelectorList:
         return cls(
-            selectors=[Value.from_json(i) for i in json['selectors']],
-            text=str(json['text']),
+            list(map(Value.from_json, json['selectors'])),
+            json['text'],
         )
 
 
@@ -331,25 +336,26 @@ class CSSStyleSheetHeader:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSStyleSheetHeader:
+        get = json.get
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']),
-            frame_id=page.FrameId.from_json(json['frameId']),
-            source_url=str(json['sourceURL']),
-            origin=StyleSheetOrigin.from_json(json['origin']),
-            title=str(json['title']),
-            disabled=bool(json['disabled']),
-            is_inline=bool(json['isInline']),
-            is_mutable=bool(json['isMutable']),
-            is_constructed=bool(json['isConstructed']),
-            start_line=float(json['startLine']),
-            start_column=float(json['startColumn']),
-            length=float(json['length']),
-            end_line=float(json['endLine']),
-            end_column=float(json['endColumn']),
-            source_map_url=str(json['sourceMapURL']) if json.get('sourceMapURL', None) is not None else None,
-            owner_node=dom.BackendNodeId.from_json(json['ownerNode']) if json.get('ownerNode', None) is not None else None,
-            has_source_url=bool(json['hasSourceURL']) if json.get('hasSourceURL', None) is not None else None,
-            loading_failed=bool(json['loadingFailed']) if json.get('loadingFailed', None) is not None else None,
+            StyleSheetId(json['styleSheetId']),
+            page.FrameId(json['frameId']),
+            json['sourceURL'],
+            StyleSheetOrigin.from_json(json['origin']),
+            json['title'],
+            json['disabled'],
+            json['isInline'],
+            json['isMutable'],
+            json['isConstructed'],
+            float(json['startLine']),
+            float(json['startColumn']),
+            float(json['length']),
+            float(json['endLine']),
+            float(json['endColumn']),
+            get('sourceMapURL'),
+            dom.BackendNodeId(v) if (v := get('ownerNode')) is not None else None,
+            get('hasSourceURL'),
+            get('loadingFailed'),
         )
 
 
@@ -428,19 +434,20 @@ class CSSRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSRule:
+        get = json.get
         return cls(
-            selector_list=SelectorList.from_json(json['selectorList']),
-            origin=StyleSheetOrigin.from_json(json['origin']),
-            style=CSSStyle.from_json(json['style']),
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
-            nesting_selectors=[str(i) for i in json['nestingSelectors']] if json.get('nestingSelectors', None) is not None else None,
-            media=[CSSMedia.from_json(i) for i in json['media']] if json.get('media', None) is not None else None,
-            container_queries=[CSSContainerQuery.from_json(i) for i in json['containerQueries']] if json.get('containerQueries', None) is not None else None,
-            supports=[CSSSupports.from_json(i) for i in json['supports']] if json.get('supports', None) is not None else None,
-            layers=[CSSLayer.from_json(i) for i in json['layers']] if json.get('layers', None) is not None else None,
-            scopes=[CSSScope.from_json(i) for i in json['scopes']] if json.get('scopes', None) is not None else None,
-            rule_types=[CSSRuleType.from_json(i) for i in json['ruleTypes']] if json.get('ruleTypes', None) is not None else None,
-            starting_styles=[CSSStartingStyle.from_json(i) for i in json['startingStyles']] if json.get('startingStyles', None) is not None else None,
+            SelectorList.from_json(json['selectorList']),
+            StyleSheetOrigin.from_json(json['origin']),
+            CSSStyle.from_json(json['style']),
+            StyleSheetId(v) if (v := get('styleSheetId')) is not None else None,
+            list(v) if (v := get('nestingSelectors')) is not None else None,
+            list(map(CSSMedia.from_json, v)) if (v := get('media')) is not None else None,
+            list(map(CSSContainerQuery.from_json, v)) if (v := get('containerQueries')) is not None else None,
+            list(map(CSSSupports.from_json, v)) if (v := get('supports')) is not None else None,
+            list(map(CSSLayer.from_json, v)) if (v := get('layers')) is not None else None,
+            list(map(CSSScope.from_json, v)) if (v := get('scopes')) is not None else None,
+            list(map(CSSRuleType.from_json, v)) if (v := get('ruleTypes')) is not None else None,
+            list(map(CSSStartingStyle.from_json, v)) if (v := get('startingStyles')) is not None else None,
         )
 
 
@@ -462,7 +469,10 @@ class CSSRuleType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CSSRuleType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -494,10 +504,10 @@ class RuleUsage:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RuleUsage:
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']),
-            start_offset=float(json['startOffset']),
-            end_offset=float(json['endOffset']),
-            used=bool(json['used']),
+            StyleSheetId(json['styleSheetId']),
+            float(json['startOffset']),
+            float(json['endOffset']),
+            json['used'],
         )
 
 
@@ -529,10 +539,10 @@ class SourceRange:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SourceRange:
         return cls(
-            start_line=int(json['startLine']),
-            start_column=int(json['startColumn']),
-            end_line=int(json['endLine']),
-            end_column=int(json['endColumn']),
+            json['startLine'],
+            json['startColumn'],
+            json['endLine'],
+            json['endColumn'],
         )
 
 
@@ -557,10 +567,11 @@ class ShorthandEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ShorthandEntry:
+        get = json.get
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
-            important=bool(json['important']) if json.get('important', None) is not None else None,
+            json['name'],
+            json['value'],
+            get('important'),
         )
 
 
@@ -581,8 +592,8 @@ class CSSComputedStyleProperty:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSComputedStyleProperty:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            json['name'],
+            json['value'],
         )
 
 
@@ -621,12 +632,13 @@ class CSSStyle:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSStyle:
+        get = json.get
         return cls(
-            css_properties=[CSSProperty.from_json(i) for i in json['cssProperties']],
-            shorthand_entries=[ShorthandEntry.from_json(i) for i in json['shorthandEntries']],
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
-            css_text=str(json['cssText']) if json.get('cssText', None) is not None else None,
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
+            list(map(CSSProperty.from_json, json['cssProperties'])),
+            list(map(ShorthandEntry.from_json, json['shorthandEntries'])),
+            StyleSheetId(v) if (v := get('styleSheetId')) is not None else None,
+            get('cssText'),
+            SourceRange.from_json(v) if (v := get('range')) is not None else None,
         )
 
 
@@ -685,16 +697,17 @@ class CSSProperty:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSProperty:
+        get = json.get
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
-            important=bool(json['important']) if json.get('important', None) is not None else None,
-            implicit=bool(json['implicit']) if json.get('implicit', None) is not None else None,
-            text=str(json['text']) if json.get('text', None) is not None else None,
-            parsed_ok=bool(json['parsedOk']) if json.get('parsedOk', None) is not None else None,
-            disabled=bool(json['disabled']) if json.get('disabled', None) is not None else None,
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            longhand_properties=[CSSProperty.from_json(i) for i in json['longhandProperties']] if json.get('longhandProperties', None) is not None else None,
+            json['name'],
+            json['value'],
+            get('important'),
+            get('implicit'),
+            get('text'),
+            get('parsedOk'),
+            get('disabled'),
+            SourceRange.from_json(v) if (v := get('range')) is not None else None,
+            list(map(CSSProperty.from_json, v)) if (v := get('longhandProperties')) is not None else None,
         )
 
 
@@ -741,13 +754,14 @@ class CSSMedia:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSMedia:
+        get = json.get
         return cls(
-            text=str(json['text']),
-            source=str(json['source']),
-            source_url=str(json['sourceURL']) if json.get('sourceURL', None) is not None else None,
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
-            media_list=[MediaQuery.from_json(i) for i in json['mediaList']] if json.get('mediaList', None) is not None else None,
+            json['text'],
+            json['source'],
+            get('sourceURL'),
+            SourceRange.from_json(v) if (v := get('range')) is not None else None,
+            StyleSheetId(v) if (v := get('styleSheetId')) is not None else None,
+            list(map(MediaQuery.from_json, v)) if (v := get('mediaList')) is not None else None,
         )
 
 
@@ -771,8 +785,8 @@ class MediaQuery:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MediaQuery:
         return cls(
-            expressions=[MediaQueryExpression.from_json(i) for i in json['expressions']],
-            active=bool(json['active']),
+            list(map(MediaQueryExpression.from_json, json['expressions'])),
+            json['active'],
         )
 
 
@@ -809,12 +823,13 @@ class MediaQueryExpression:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MediaQueryExpression:
+        get = json.get
         return cls(
-            value=float(json['value']),
-            unit=str(json['unit']),
-            feature=str(json['feature']),
-            value_range=SourceRange.from_json(json['valueRange']) if json.get('valueRange', None) is not None else None,
-            computed_length=float(json['computedLength']) if json.get('computedLength', None) is not None else None,
+            float(json['value']),
+            json['unit'],
+            json['feature'],
+            SourceRange.from_json(v) if (v := get('valueRange')) is not None else None,
+            float(v) if (v := get('computedLength')) is not None else None,
         )
 
 
@@ -864,14 +879,15 @@ class CSSContainerQuery:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSContainerQuery:
+        get = json.get
         return cls(
-            text=str(json['text']),
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
-            name=str(json['name']) if json.get('name', None) is not None else None,
-            physical_axes=dom.PhysicalAxes.from_json(json['physicalAxes']) if json.get('physicalAxes', None) is not None else None,
-            logical_axes=dom.LogicalAxes.from_json(json['logicalAxes']) if json.get('logicalAxes', None) is not None else None,
-            queries_scroll_state=bool(json['queriesScrollState']) if json.get('queriesScrollState', None) is not None else None,
+            json['text'],
+            SourceRange.from_json(v) if (v := get('range')) is not None else None,
+            StyleSheetId(v) if (v := get('styleSheetId')) is not None else None,
+            get('name'),
+            dom.PhysicalAxes.from_json(v) if (v := get('physicalAxes')) is not None else None,
+            dom.LogicalAxes.from_json(v) if (v := get('logicalAxes')) is not None else None,
+            get('queriesScrollState'),
         )
 
 
@@ -905,11 +921,12 @@ class CSSSupports:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSSupports:
+        get = json.get
         return cls(
-            text=str(json['text']),
-            active=bool(json['active']),
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            json['text'],
+            json['active'],
+            SourceRange.from_json(v) if (v := get('range')) is not None else None,
+            StyleSheetId(v) if (v := get('styleSheetId')) is not None else None,
         )
 
 
@@ -939,10 +956,11 @@ class CSSScope:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSScope:
+        get = json.get
         return cls(
-            text=str(json['text']),
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            json['text'],
+            SourceRange.from_json(v) if (v := get('range')) is not None else None,
+            StyleSheetId(v) if (v := get('styleSheetId')) is not None else None,
         )
 
 
@@ -972,10 +990,11 @@ class CSSLayer:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSLayer:
+        get = json.get
         return cls(
-            text=str(json['text']),
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            json['text'],
+            SourceRange.from_json(v) if (v := get('range')) is not None else None,
+            StyleSheetId(v) if (v := get('styleSheetId')) is not None else None,
         )
 
 
@@ -1001,9 +1020,10 @@ class CSSStartingStyle:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSStartingStyle:
+        get = json.get
         return cls(
-            range_=SourceRange.from_json(json['range']) if json.get('range', None) is not None else None,
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            SourceRange.from_json(v) if (v := get('range')) is not None else None,
+            StyleSheetId(v) if (v := get('styleSheetId')) is not None else None,
         )
 
 
@@ -1032,10 +1052,11 @@ class CSSLayerData:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSLayerData:
+        get = json.get
         return cls(
-            name=str(json['name']),
-            order=float(json['order']),
-            sub_layers=[CSSLayerData.from_json(i) for i in json['subLayers']] if json.get('subLayers', None) is not None else None,
+            json['name'],
+            float(json['order']),
+            list(map(CSSLayerData.from_json, v)) if (v := get('subLayers')) is not None else None,
         )
 
 
@@ -1067,10 +1088,10 @@ class PlatformFontUsage:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlatformFontUsage:
         return cls(
-            family_name=str(json['familyName']),
-            post_script_name=str(json['postScriptName']),
-            is_custom_font=bool(json['isCustomFont']),
-            glyph_count=float(json['glyphCount']),
+            json['familyName'],
+            json['postScriptName'],
+            json['isCustomFont'],
+            float(json['glyphCount']),
         )
 
 
@@ -1106,11 +1127,11 @@ class FontVariationAxis:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FontVariationAxis:
         return cls(
-            tag=str(json['tag']),
-            name=str(json['name']),
-            min_value=float(json['minValue']),
-            max_value=float(json['maxValue']),
-            default_value=float(json['defaultValue']),
+            json['tag'],
+            json['name'],
+            float(json['minValue']),
+            float(json['maxValue']),
+            float(json['defaultValue']),
         )
 
 
@@ -1167,17 +1188,18 @@ class FontFace:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FontFace:
+        get = json.get
         return cls(
-            font_family=str(json['fontFamily']),
-            font_style=str(json['fontStyle']),
-            font_variant=str(json['fontVariant']),
-            font_weight=str(json['fontWeight']),
-            font_stretch=str(json['fontStretch']),
-            font_display=str(json['fontDisplay']),
-            unicode_range=str(json['unicodeRange']),
-            src=str(json['src']),
-            platform_font_family=str(json['platformFontFamily']),
-            font_variation_axes=[FontVariationAxis.from_json(i) for i in json['fontVariationAxes']] if json.get('fontVariationAxes', None) is not None else None,
+            json['fontFamily'],
+            json['fontStyle'],
+            json['fontVariant'],
+            json['fontWeight'],
+            json['fontStretch'],
+            json['fontDisplay'],
+            json['unicodeRange'],
+            json['src'],
+            json['platformFontFamily'],
+            list(map(FontVariationAxis.from_json, v)) if (v := get('fontVariationAxes')) is not None else None,
         )
 
 
@@ -1206,10 +1228,11 @@ class CSSTryRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSTryRule:
+        get = json.get
         return cls(
-            origin=StyleSheetOrigin.from_json(json['origin']),
-            style=CSSStyle.from_json(json['style']),
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            StyleSheetOrigin.from_json(json['origin']),
+            CSSStyle.from_json(json['style']),
+            StyleSheetId(v) if (v := get('styleSheetId')) is not None else None,
         )
 
 
@@ -1245,12 +1268,13 @@ class CSSPositionTryRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSPositionTryRule:
+        get = json.get
         return cls(
-            name=Value.from_json(json['name']),
-            origin=StyleSheetOrigin.from_json(json['origin']),
-            style=CSSStyle.from_json(json['style']),
-            active=bool(json['active']),
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            Value.from_json(json['name']),
+            StyleSheetOrigin.from_json(json['origin']),
+            CSSStyle.from_json(json['style']),
+            json['active'],
+            StyleSheetId(v) if (v := get('styleSheetId')) is not None else None,
         )
 
 
@@ -1274,8 +1298,8 @@ class CSSKeyframesRule:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSKeyframesRule:
         return cls(
-            animation_name=Value.from_json(json['animationName']),
-            keyframes=[CSSKeyframeRule.from_json(i) for i in json['keyframes']],
+            Value.from_json(json['animationName']),
+            list(map(CSSKeyframeRule.from_json, json['keyframes'])),
         )
 
 
@@ -1303,11 +1327,12 @@ class CSSPropertyRegistration:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSPropertyRegistration:
+        get = json.get
         return cls(
-            property_name=str(json['propertyName']),
-            inherits=bool(json['inherits']),
-            syntax=str(json['syntax']),
-            initial_value=Value.from_json(json['initialValue']) if json.get('initialValue', None) is not None else None,
+            json['propertyName'],
+            json['inherits'],
+            json['syntax'],
+            Value.from_json(v) if (v := get('initialValue')) is not None else None,
         )
 
 
@@ -1340,11 +1365,12 @@ class CSSFontPaletteValuesRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSFontPaletteValuesRule:
+        get = json.get
         return cls(
-            origin=StyleSheetOrigin.from_json(json['origin']),
-            font_palette_name=Value.from_json(json['fontPaletteName']),
-            style=CSSStyle.from_json(json['style']),
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            StyleSheetOrigin.from_json(json['origin']),
+            Value.from_json(json['fontPaletteName']),
+            CSSStyle.from_json(json['style']),
+            StyleSheetId(v) if (v := get('styleSheetId')) is not None else None,
         )
 
 
@@ -1377,11 +1403,12 @@ class CSSPropertyRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSPropertyRule:
+        get = json.get
         return cls(
-            origin=StyleSheetOrigin.from_json(json['origin']),
-            property_name=Value.from_json(json['propertyName']),
-            style=CSSStyle.from_json(json['style']),
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            StyleSheetOrigin.from_json(json['origin']),
+            Value.from_json(json['propertyName']),
+            CSSStyle.from_json(json['style']),
+            StyleSheetId(v) if (v := get('styleSheetId')) is not None else None,
         )
 
 
@@ -1414,11 +1441,12 @@ class CSSKeyframeRule:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSKeyframeRule:
+        get = json.get
         return cls(
-            origin=StyleSheetOrigin.from_json(json['origin']),
-            key_text=Value.from_json(json['keyText']),
-            style=CSSStyle.from_json(json['style']),
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']) if json.get('styleSheetId', None) is not None else None,
+            StyleSheetOrigin.from_json(json['origin']),
+            Value.from_json(json['keyText']),
+            CSSStyle.from_json(json['style']),
+            StyleSheetId(v) if (v := get('styleSheetId')) is not None else None,
         )
 
 
@@ -1446,12 +1474,17 @@ class StyleDeclarationEdit:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StyleDeclarationEdit:
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId']),
-            range_=SourceRange.from_json(json['range']),
-            text=str(json['text']),
+            StyleSheetId(json['styleSheetId']),
+            SourceRange.from_json(json['range']),
+            json['text'],
         )
 
 
+@command_decoder('CSS.addRule')
+def _decode_add_rule(json: T_JSON_DICT) -> CSSRule:
+    return CSSRule.from_json(json['rule'])
+
+
 def add_rule(
         style_sheet_id: StyleSheetId,
         rule_text: str,
@@ -1479,7 +1512,12 @@ def add_rule(
         'params': params,
     }
     json = yield cmd_dict
-    return CSSRule.from_json(json['rule'])
+    return _decode_add_rule(json)
+
+
+@command_decoder('CSS.collectClassNames')
+def _decode_collect_class_names(json: T_JSON_DICT) -> typing.List[str]:
+    return [str(i) for i in json['classNames']]
 
 
 def collect_class_names(
@@ -1498,7 +1536,12 @@ def collect_class_names(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['classNames']]
+    return _decode_collect_class_names(json)
+
+
+@command_decoder('CSS.createStyleSheet')
+def _decode_create_style_sheet(json: T_JSON_DICT) -> StyleSheetId:
+    return StyleSheetId.from_json(json['styleSheetId'])
 
 
 def create_style_sheet(
@@ -1517,7 +1560,7 @@ def create_style_sheet(
         'params': params,
     }
     json = yield cmd_dict
-    return StyleSheetId.from_json(json['styleSheetId'])
+    return _decode_create_style_sheet(json)
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1562,6 +1605,15 @@ def force_pseudo_state(
     json = yield cmd_dict
 
 
+@command_decoder('CSS.getBackgroundColors')
+def _decode_get_background_colors(json: T_JSON_DICT) -> typing.Tuple[typing.Optional[typing.List[str]], typing.Optional[str], typing.Optional[str]]:
+    return (
+        [str(i) for i in json['backgroundColors']] if json.get('backgroundColors', None) is not None else None,
+        str(json['computedFontSize']) if json.get('computedFontSize', None) is not None else None,
+        str(json['computedFontWeight']) if json.get('computedFontWeight', None) is not None else None
+    )
+
+
 def get_background_colors(
         node_id: dom.NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[typing.List[str]], typing.Optional[str], typing.Optional[str]]]:
@@ -1580,11 +1632,12 @@ def get_background_colors(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        [str(i) for i in json['backgroundColors']] if json.get('backgroundColors', None) is not None else None,
-        str(json['computedFontSize']) if json.get('computedFontSize', None) is not None else None,
-        str(json['computedFontWeight']) if json.get('computedFontWeight', None) is not None else None
-    )
+    return _decode_get_background_colors(json)
+
+
+@command_decoder('CSS.getComputedStyleForNode')
+def _decode_get_computed_style_for_node(json: T_JSON_DICT) -> typing.List[CSSComputedStyleProperty]:
+    return [CSSComputedStyleProperty.from_json(i) for i in json['computedStyle']]
 
 
 def get_computed_style_for_node(
@@ -1603,7 +1656,15 @@ def get_computed_style_for_node(
         'params': params,
     }
     json = yield cmd_dict
-    return [CSSComputedStyleProperty.from_json(i) for i in json['computedStyle']]
+    return _decode_get_computed_style_for_node(json)
+
+
+@command_decoder('CSS.getInlineStylesForNode')
+def _decode_get_inline_styles_for_node(json: T_JSON_DICT) -> typing.Tuple[typing.Optional[CSSStyle], typing.Optional[CSSStyle]]:
+    return (
+        CSSStyle.from_json(json['inlineStyle']) if json.get('inlineStyle', None) is not None else None,
+        CSSStyle.from_json(json['attributesStyle']) if json.get('attributesStyle', None) is not None else None
+    )
 
 
 def get_inline_styles_for_node(
@@ -1626,9 +1687,25 @@ def get_inline_styles_for_node(
         'params': params,
     }
     json = yield cmd_dict
+    return _decode_get_inline_styles_for_node(json)
+
+
+@command_decoder('CSS.getMatchedStylesForNode')
+def _decode_get_matched_styles_for_node(json: T_JSON_DICT) -> typing.Tuple[typing.Optional[CSSStyle], typing.Optional[CSSStyle], typing.Optional[typing.List[RuleMatch]], typing.Optional[typing.List[PseudoElementMatches]], typing.Optional[typing.List[InheritedStyleEntry]], typing.Optional[typing.List[InheritedPseudoElementMatches]], typing.Optional[typing.List[CSSKeyframesRule]], typing.Optional[typing.List[CSSPositionTryRule]], typing.Optional[int], typing.Optional[typing.List[CSSPropertyRule]], typing.Optional[typing.List[CSSPropertyRegistration]], typing.Optional[CSSFontPaletteValuesRule], typing.Optional[dom.NodeId]]:
     return (
         CSSStyle.from_json(json['inlineStyle']) if json.get('inlineStyle', None) is not None else None,
-        CSSStyle.from_json(json['attributesStyle']) if json.get('attributesStyle', None) is not None else None
+        CSSStyle.from_json(json['attributesStyle']) if json.get('attributesStyle', None) is not None else None,
+        [RuleMatch.from_json(i) for i in json['matchedCSSRules']] if json.get('matchedCSSRules', None) is not None else None,
+        [PseudoElementMatches.from_json(i) for i in json['pseudoElements']] if json.get('pseudoElements', None) is not None else None,
+        [InheritedStyleEntry.from_json(i) for i in json['inherited']] if json.get('inherited', None) is not None else None,
+        [InheritedPseudoElementMatches.from_json(i) for i in json['inheritedPseudoElements']] if json.get('inheritedPseudoElements', None) is not None else None,
+        [CSSKeyframesRule.from_json(i) for i in json['cssKeyframesRules']] if json.get('cssKeyframesRules', None) is not None else None,
+        [CSSPositionTryRule.from_json(i) for i in json['cssPositionTryRules']] if json.get('cssPositionTryRules', None) is not None else None,
+        int(json['activePositionFallbackIndex']) if json.get('activePositionFallbackIndex', None) is not None else None,
+        [CSSPropertyRule.from_json(i) for i in json['cssPropertyRules']] if json.get('cssPropertyRules', None) is not None else None,
+        [CSSPropertyRegistration.from_json(i) for i in json['cssPropertyRegistrations']] if json.get('cssPropertyRegistrations', None) is not None else None,
+        CSSFontPaletteValuesRule.from_json(json['cssFontPaletteValuesRule']) if json.get('cssFontPaletteValuesRule', None) is not None else None,
+        dom.NodeId.from_json(json['parentLayoutNodeId']) if json.get('parentLayoutNodeId', None) is not None else None
     )
 
 
@@ -1662,21 +1739,12 @@ def get_matched_styles_for_node(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        CSSStyle.from_json(json['inlineStyle']) if json.get('inlineStyle', None) is not None else None,
-        CSSStyle.from_json(json['attributesStyle']) if json.get('attributesStyle', None) is not None else None,
-        [RuleMatch.from_json(i) for i in json['matchedCSSRules']] if json.get('matchedCSSRules', None) is not None else None,
-        [PseudoElementMatches.from_json(i) for i in json['pseudoElements']] if json.get('pseudoElements', None) is not None else None,
-        [InheritedStyleEntry.from_json(i) for i in json['inherited']] if json.get('inherited', None) is not None else None,
-        [InheritedPseudoElementMatches.from_json(i) for i in json['inheritedPseudoElements']] if json.get('inheritedPseudoElements', None) is not None else None,
-        [CSSKeyframesRule.from_json(i) for i in json['cssKeyframesRules']] if json.get('cssKeyframesRules', None) is not None else None,
-        [CSSPositionTryRule.from_json(i) for i in json['cssPositionTryRules']] if json.get('cssPositionTryRules', None) is not None else None,
-        int(json['activePositionFallbackIndex']) if json.get('activePositionFallbackIndex', None) is not None else None,
-        [CSSPropertyRule.from_json(i) for i in json['cssPropertyRules']] if json.get('cssPropertyRules', None) is not None else None,
-        [CSSPropertyRegistration.from_json(i) for i in json['cssPropertyRegistrations']] if json.get('cssPropertyRegistrations', None) is not None else None,
-        CSSFontPaletteValuesRule.from_json(json['cssFontPaletteValuesRule']) if json.get('cssFontPaletteValuesRule', None) is not None else None,
-        dom.NodeId.from_json(json['parentLayoutNodeId']) if json.get('parentLayoutNodeId', None) is not None else None
-    )
+    return _decode_get_matched_styles_for_node(json)
+
+
+@command_decoder('CSS.getMediaQueries')
+def _decode_get_media_queries(json: T_JSON_DICT) -> typing.List[CSSMedia]:
+    return [CSSMedia.from_json(i) for i in json['medias']]
 
 
 def get_media_queries() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[CSSMedia]]:
@@ -1689,7 +1757,12 @@ def get_media_queries() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[
         'method': 'CSS.getMediaQueries',
     }
     json = yield cmd_dict
-    return [CSSMedia.from_json(i) for i in json['medias']]
+    return _decode_get_media_queries(json)
+
+
+@command_decoder('CSS.getPlatformFontsForNode')
+def _decode_get_platform_fonts_for_node(json: T_JSON_DICT) -> typing.List[PlatformFontUsage]:
+    return [PlatformFontUsage.from_json(i) for i in json['fonts']]
 
 
 def get_platform_fonts_for_node(
@@ -1709,7 +1782,12 @@ def get_platform_fonts_for_node(
         'params': params,
     }
     json = yield cmd_dict
-    return [PlatformFontUsage.from_json(i) for i in json['fonts']]
+    return _decode_get_platform_fonts_for_node(json)
+
+
+@command_decoder('CSS.getStyleSheetText')
+def _decode_get_style_sheet_text(json: T_JSON_DICT) -> str:
+    return str(json['text'])
 
 
 def get_style_sheet_text(
@@ -1728,7 +1806,12 @@ def get_style_sheet_text(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['text'])
+    return _decode_get_style_sheet_text(json)
+
+
+@command_decoder('CSS.getLayersForNode')
+def _decode_get_layers_for_node(json: T_JSON_DICT) -> CSSLayerData:
+    return CSSLayerData.from_json(json['rootLayer'])
 
 
 def get_layers_for_node(
@@ -1752,7 +1835,12 @@ def get_layers_for_node(
         'params': params,
     }
     json = yield cmd_dict
-    return CSSLayerData.from_json(json['rootLayer'])
+    return _decode_get_layers_for_node(json)
+
+
+@command_decoder('CSS.getLocationForSelector')
+def _decode_get_location_for_selector(json: T_JSON_DICT) -> typing.List[SourceRange]:
+    return [SourceRange.from_json(i) for i in json['ranges']]
 
 
 def get_location_for_selector(
@@ -1777,7 +1865,7 @@ def get_location_for_selector(
         'params': params,
     }
     json = yield cmd_dict
-    return [SourceRange.from_json(i) for i in json['ranges']]
+    return _decode_get_location_for_selector(json)
 
 
 def track_computed_style_updates_for_node(
@@ -1829,6 +1917,11 @@ def track_computed_style_updates(
     json = yield cmd_dict
 
 
+@command_decoder('CSS.takeComputedStyleUpdates')
+def _decode_take_computed_style_updates(json: T_JSON_DICT) -> typing.List[dom.NodeId]:
+    return [dom.NodeId.from_json(i) for i in json['nodeIds']]
+
+
 def take_computed_style_updates() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[dom.NodeId]]:
     '''
     Polls the next batch of computed style updates.
@@ -1841,7 +1934,7 @@ def take_computed_style_updates() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,ty
         'method': 'CSS.takeComputedStyleUpdates',
     }
     json = yield cmd_dict
-    return [dom.NodeId.from_json(i) for i in json['nodeIds']]
+    return _decode_take_computed_style_updates(json)
 
 
 def set_effective_property_value_for_node(
@@ -1868,6 +1961,11 @@ def set_effective_property_value_for_node(
     json = yield cmd_dict
 
 
+@command_decoder('CSS.setPropertyRulePropertyName')
+def _decode_set_property_rule_property_name(json: T_JSON_DICT) -> Value:
+    return Value.from_json(json['propertyName'])
+
+
 def set_property_rule_property_name(
         style_sheet_id: StyleSheetId,
         range_: SourceRange,
@@ -1890,7 +1988,12 @@ def set_property_rule_property_name(
         'params': params,
     }
     json = yield cmd_dict
-    return Value.from_json(json['propertyName'])
+    return _decode_set_property_rule_property_name(json)
+
+
+@command_decoder('CSS.setKeyframeKey')
+def _decode_set_keyframe_key(json: T_JSON_DICT) -> Value:
+    return Value.from_json(json['keyText'])
 
 
 def set_keyframe_key(
@@ -1915,7 +2018,12 @@ def set_keyframe_key(
         'params': params,
     }
     json = yield cmd_dict
-    return Value.from_json(json['keyText'])
+    return _decode_set_keyframe_key(json)
+
+
+@command_decoder('CSS.setMediaText')
+def _decode_set_media_text(json: T_JSON_DICT) -> CSSMedia:
+    return CSSMedia.from_json(json['media'])
 
 
 def set_media_text(
@@ -1940,7 +2048,12 @@ def set_media_text(
         'params': params,
     }
     json = yield cmd_dict
-    return CSSMedia.from_json(json['media'])
+    return _decode_set_media_text(json)
+
+
+@command_decoder('CSS.setContainerQueryText')
+def _decode_set_container_query_text(json: T_JSON_DICT) -> CSSContainerQuery:
+    return CSSContainerQuery.from_json(json['containerQuery'])
 
 
 def set_container_query_text(
@@ -1967,7 +2080,12 @@ def set_container_query_text(
         'params': params,
     }
     json = yield cmd_dict
-    return CSSContainerQuery.from_json(json['containerQuery'])
+    return _decode_set_container_query_text(json)
+
+
+@command_decoder('CSS.setSupportsText')
+def _decode_set_supports_text(json: T_JSON_DICT) -> CSSSupports:
+    return CSSSupports.from_json(json['supports'])
 
 
 def set_supports_text(
@@ -1994,7 +2112,12 @@ def set_supports_text(
         'params': params,
     }
     json = yield cmd_dict
-    return CSSSupports.from_json(json['supports'])
+    return _decode_set_supports_text(json)
+
+
+@command_decoder('CSS.setScopeText')
+def _decode_set_scope_text(json: T_JSON_DICT) -> CSSScope:
+    return CSSScope.from_json(json['scope'])
 
 
 def set_scope_text(
@@ -2021,7 +2144,12 @@ def set_scope_text(
         'params': params,
     }
     json = yield cmd_dict
-    return CSSScope.from_json(json['scope'])
+    return _decode_set_scope_text(json)
+
+
+@command_decoder('CSS.setRuleSelector')
+def _decode_set_rule_selector(json: T_JSON_DICT) -> SelectorList:
+    return SelectorList.from_json(json['selectorList'])
 
 
 def set_rule_selector(
@@ -2046,7 +2174,12 @@ def set_rule_selector(
         'params': params,
     }
     json = yield cmd_dict
-    return SelectorList.from_json(json['selectorList'])
+    return _decode_set_rule_selector(json)
+
+
+@command_decoder('CSS.setStyleSheetText')
+def _decode_set_style_sheet_text(json: T_JSON_DICT) -> typing.Optional[str]:
+    return str(json['sourceMapURL']) if json.get('sourceMapURL', None) is not None else None
 
 
 def set_style_sheet_text(
@@ -2068,7 +2201,12 @@ def set_style_sheet_text(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['sourceMapURL']) if json.get('sourceMapURL', None) is not None else None
+    return _decode_set_style_sheet_text(json)
+
+
+@command_decoder('CSS.setStyleTexts')
+def _decode_set_style_texts(json: T_JSON_DICT) -> typing.List[CSSStyle]:
+    return [CSSStyle.from_json(i) for i in json['styles']]
 
 
 def set_style_texts(
@@ -2091,7 +2229,7 @@ def set_style_texts(
         'params': params,
     }
     json = yield cmd_dict
-    return [CSSStyle.from_json(i) for i in json['styles']]
+    return _decode_set_style_texts(json)
 
 
 def start_rule_usage_tracking() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2104,6 +2242,11 @@ def start_rule_usage_tracking() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None
     json = yield cmd_dict
 
 
+@command_decoder('CSS.stopRuleUsageTracking')
+def _decode_stop_rule_usage_tracking(json: T_JSON_DICT) -> typing.List[RuleUsage]:
+    return [RuleUsage.from_json(i) for i in json['ruleUsage']]
+
+
 def stop_rule_usage_tracking() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[RuleUsage]]:
     '''
     Stop tracking rule usage and return the list of rules that were used since last call to
@@ -2115,7 +2258,15 @@ def stop_rule_usage_tracking() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typin
         'method': 'CSS.stopRuleUsageTracking',
     }
     json = yield cmd_dict
-    return [RuleUsage.from_json(i) for i in json['ruleUsage']]
+    return _decode_stop_rule_usage_tracking(json)
+
+
+@command_decoder('CSS.takeCoverageDelta')
+def _decode_take_coverage_delta(json: T_JSON_DICT) -> typing.Tuple[typing.List[RuleUsage], float]:
+    return (
+        [RuleUsage.from_json(i) for i in json['coverage']],
+        float(json['timestamp'])
+    )
 
 
 def take_coverage_delta() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[RuleUsage], float]]:
@@ -2132,10 +2283,7 @@ def take_coverage_delta() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tup
         'method': 'CSS.takeCoverageDelta',
     }
     json = yield cmd_dict
-    return (
-        [RuleUsage.from_json(i) for i in json['coverage']],
-        float(json['timestamp'])
-    )
+    return _decode_take_coverage_delta(json)
 
 
 def set_local_fonts_enabled(
@@ -2169,8 +2317,9 @@ class FontsUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FontsUpdated:
+        get = json.get
         return cls(
-            font=FontFace.from_json(json['font']) if json.get('font', None) is not None else None
+            FontFace.from_json(v) if (v := get('font')) is not None else None,
         )
 
 
@@ -2185,9 +2334,7 @@ class MediaQueryResultChanged:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MediaQueryResultChanged:
-        return cls(
-
-        )
+        return cls()
 
 
 @event_class('CSS.styleSheetAdded')
@@ -2202,7 +2349,7 @@ class StyleSheetAdded:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StyleSheetAdded:
         return cls(
-            header=CSSStyleSheetHeader.from_json(json['header'])
+            CSSStyleSheetHeader.from_json(json['header']),
         )
 
 
@@ -2217,7 +2364,7 @@ class StyleSheetChanged:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StyleSheetChanged:
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId'])
+            StyleSheetId(json['styleSheetId']),
         )
 
 
@@ -2233,7 +2380,7 @@ class StyleSheetRemoved:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StyleSheetRemoved:
         return cls(
-            style_sheet_id=StyleSheetId.from_json(json['styleSheetId'])
+            StyleSheetId(json['styleSheetId']),
         )
 
 
@@ -2251,5 +2398,5 @@ class ComputedStyleUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ComputedStyleUpdated:
         return cls(
-            node_id=dom.NodeId.from_json(json['nodeId'])
+            dom.NodeId(json['nodeId']),
         )
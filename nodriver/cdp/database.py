@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 class DatabaseId(str):
@@ -55,10 +54,10 @@ class Database:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Database:
         return cls(
-            id_=DatabaseId.from_json(json['id']),
-            domain=str(json['domain']),
-            name=str(json['name']),
-            version=str(json['version']),
+            DatabaseId(json['id']),
+            json['domain'],
+            json['name'],
+            json['version'],
         )
 
 
@@ -82,8 +81,8 @@ class Error:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Error:
         return cls(
-            message=str(json['message']),
-            code=int(json['code']),
+            json['message'],
+            json['code'],
         )
 
 
@@ -107,6 +106,15 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('Database.executeSQL')
+def _decode_execute_sql(json: T_JSON_DICT) -> typing.Tuple[typing.Optional[typing.List[str]], typing.Optional[typing.List[typing.Any]], typing.Optional[Error]]:
+    return (
+        [str(i) for i in json['columnNames']] if json.get('columnNames', None) is not None else None,
+        [i for i in json['values']] if json.get('values', None) is not None else None,
+        Error.from_json(json['sqlError']) if json.get('sqlError', None) is not None else None
+    )
+
+
 def execute_sql(
         database_id: DatabaseId,
         query: str
@@ -128,11 +136,12 @@ def execute_sql(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        [str(i) for i in json['columnNames']] if json.get('columnNames', None) is not None else None,
-        [i for i in json['values']] if json.get('values', None) is not None else None,
-        Error.from_json(json['sqlError']) if json.get('sqlError', None) is not None else None
-    )
+    return _decode_execute_sql(json)
+
+
+@command_decoder('Database.getDatabaseTableNames')
+def _decode_get_database_table_names(json: T_JSON_DICT) -> typing.List[str]:
+    return [str(i) for i in json['tableNames']]
 
 
 def get_database_table_names(
@@ -149,7 +158,7 @@ def get_database_table_names(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['tableNames']]
+    return _decode_get_database_table_names(json)
 
 
 @event_class('Database.addDatabase')
@@ -160,5 +169,5 @@ class AddDatabase:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AddDatabase:
         return cls(
-            database=Database.from_json(json['database'])
+            Database.from_json(json['database']),
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import runtime
 from deprecated.sphinx import deprecated # type: ignore
@@ -69,10 +68,11 @@ class Location:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Location:
+        get = json.get
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']) if json.get('columnNumber', None) is not None else None,
+            runtime.ScriptId(json['scriptId']),
+            json['lineNumber'],
+            get('columnNumber'),
         )
 
 
@@ -94,8 +94,8 @@ class ScriptPosition:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptPosition:
         return cls(
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
+            json['lineNumber'],
+            json['columnNumber'],
         )
 
 
@@ -120,9 +120,9 @@ class LocationRange:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LocationRange:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            start=ScriptPosition.from_json(json['start']),
-            end=ScriptPosition.from_json(json['end']),
+            runtime.ScriptId(json['scriptId']),
+            ScriptPosition.from_json(json['start']),
+            ScriptPosition.from_json(json['end']),
         )
 
 
@@ -181,16 +181,17 @@ class CallFrame:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CallFrame:
+        get = json.get
         return cls(
-            call_frame_id=CallFrameId.from_json(json['callFrameId']),
-            function_name=str(json['functionName']),
-            location=Location.from_json(json['location']),
-            url=str(json['url']),
-            scope_chain=[Scope.from_json(i) for i in json['scopeChain']],
-            this=runtime.RemoteObject.from_json(json['this']),
-            function_location=Location.from_json(json['functionLocation']) if json.get('functionLocation', None) is not None else None,
-            return_value=runtime.RemoteObject.from_json(json['returnValue']) if json.get('returnValue', None) is not None else None,
-            can_be_restarted=bool(json['canBeRestarted']) if json.get('canBeRestarted', None) is not None else None,
+            CallFrameId(json['callFrameId']),
+            json['functionName'],
+            Location.from_json(json['location']),
+            json['url'],
+            list(map(Scope.from_json, json['scopeChain'])),
+            runtime.RemoteObject.from_json(json['this']),
+            Location.from_json(v) if (v := get('functionLocation')) is not None else None,
+            runtime.RemoteObject.from_json(v) if (v := get('returnValue')) is not None else None,
+            get('canBeRestarted'),
         )
 
 
@@ -229,12 +230,13 @@ class Scope:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Scope:
+        get = json.get
         return cls(
-            type_=str(json['type']),
-            object_=runtime.RemoteObject.from_json(json['object']),
-            name=str(json['name']) if json.get('name', None) is not None else None,
-            start_location=Location.from_json(json['startLocation']) if json.get('startLocation', None) is not None else None,
-            end_location=Location.from_json(json['endLocation']) if json.get('endLocation', None) is not None else None,
+            json['type'],
+            runtime.RemoteObject.from_json(json['object']),
+            get('name'),
+            Location.from_json(v) if (v := get('startLocation')) is not None else None,
+            Location.from_json(v) if (v := get('endLocation')) is not None else None,
         )
 
 
@@ -258,8 +260,8 @@ class SearchMatch:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SearchMatch:
         return cls(
-            line_number=float(json['lineNumber']),
-            line_content=str(json['lineContent']),
+            float(json['lineNumber']),
+            json['lineContent'],
         )
 
 
@@ -288,11 +290,12 @@ class BreakLocation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BreakLocation:
+        get = json.get
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']) if json.get('columnNumber', None) is not None else None,
-            type_=str(json['type']) if json.get('type', None) is not None else None,
+            runtime.ScriptId(json['scriptId']),
+            json['lineNumber'],
+            get('columnNumber'),
+            get('type'),
         )
 
 
@@ -313,8 +316,8 @@ class WasmDisassemblyChunk:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WasmDisassemblyChunk:
         return cls(
-            lines=[str(i) for i in json['lines']],
-            bytecode_offsets=[int(i) for i in json['bytecodeOffsets']],
+            list(json['lines']),
+            list(json['bytecodeOffsets']),
         )
 
 
@@ -330,7 +333,10 @@ class ScriptLanguage(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ScriptLanguage:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -353,9 +359,10 @@ class DebugSymbols:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DebugSymbols:
+        get = json.get
         return cls(
-            type_=str(json['type']),
-            external_url=str(json['externalURL']) if json.get('externalURL', None) is not None else None,
+            json['type'],
+            get('externalURL'),
         )
 
 
@@ -390,6 +397,11 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('Debugger.enable')
+def _decode_enable(json: T_JSON_DICT) -> runtime.UniqueDebuggerId:
+    return runtime.UniqueDebuggerId.from_json(json['debuggerId'])
+
+
 def enable(
         max_scripts_cache_size: typing.Optional[float] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,runtime.UniqueDebuggerId]:
@@ -408,7 +420,15 @@ def enable(
         'params': params,
     }
     json = yield cmd_dict
-    return runtime.UniqueDebuggerId.from_json(json['debuggerId'])
+    return _decode_enable(json)
+
+
+@command_decoder('Debugger.evaluateOnCallFrame')
+def _decode_evaluate_on_call_frame(json: T_JSON_DICT) -> typing.Tuple[runtime.RemoteObject, typing.Optional[runtime.ExceptionDetails]]:
+    return (
+        runtime.RemoteObject.from_json(json['result']),
+        runtime.ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
+    )
 
 
 def evaluate_on_call_frame(
@@ -461,10 +481,12 @@ def evaluate_on_call_frame(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        runtime.RemoteObject.from_json(json['result']),
-        runtime.ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
-    )
+    return _decode_evaluate_on_call_frame(json)
+
+
+@command_decoder('Debugger.getPossibleBreakpoints')
+def _decode_get_possible_breakpoints(json: T_JSON_DICT) -> typing.List[BreakLocation]:
+    return [BreakLocation.from_json(i) for i in json['locations']]
 
 
 def get_possible_breakpoints(
@@ -492,7 +514,15 @@ def get_possible_breakpoints(
         'params': params,
     }
     json = yield cmd_dict
-    return [BreakLocation.from_json(i) for i in json['locations']]
+    return _decode_get_possible_breakpoints(json)
+
+
+@command_decoder('Debugger.getScriptSource')
+def _decode_get_script_source(json: T_JSON_DICT) -> typing.Tuple[str, typing.Optional[str]]:
+    return (
+        str(json['scriptSource']),
+        str(json['bytecode']) if json.get('bytecode', None) is not None else None
+    )
 
 
 def get_script_source(
@@ -514,9 +544,16 @@ def get_script_source(
         'params': params,
     }
     json = yield cmd_dict
+    return _decode_get_script_source(json)
+
+
+@command_decoder('Debugger.disassembleWasmModule')
+def _decode_disassemble_wasm_module(json: T_JSON_DICT) -> typing.Tuple[typing.Optional[str], int, typing.List[int], WasmDisassemblyChunk]:
     return (
-        str(json['scriptSource']),
-        str(json['bytecode']) if json.get('bytecode', None) is not None else None
+        str(json['streamId']) if json.get('streamId', None) is not None else None,
+        int(json['totalNumberOfLines']),
+        [int(i) for i in json['functionBodyOffsets']],
+        WasmDisassemblyChunk.from_json(json['chunk'])
     )
 
 
@@ -543,12 +580,12 @@ def disassemble_wasm_module(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        str(json['streamId']) if json.get('streamId', None) is not None else None,
-        int(json['totalNumberOfLines']),
-        [int(i) for i in json['functionBodyOffsets']],
-        WasmDisassemblyChunk.from_json(json['chunk'])
-    )
+    return _decode_disassemble_wasm_module(json)
+
+
+@command_decoder('Debugger.nextWasmDisassemblyChunk')
+def _decode_next_wasm_disassembly_chunk(json: T_JSON_DICT) -> WasmDisassemblyChunk:
+    return WasmDisassemblyChunk.from_json(json['chunk'])
 
 
 def next_wasm_disassembly_chunk(
@@ -572,7 +609,12 @@ def next_wasm_disassembly_chunk(
         'params': params,
     }
     json = yield cmd_dict
-    return WasmDisassemblyChunk.from_json(json['chunk'])
+    return _decode_next_wasm_disassembly_chunk(json)
+
+
+@command_decoder('Debugger.getWasmBytecode')
+def _decode_get_wasm_bytecode(json: T_JSON_DICT) -> str:
+    return str(json['bytecode'])
 
 
 @deprecated(version="1.3")
@@ -594,7 +636,12 @@ def get_wasm_bytecode(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['bytecode'])
+    return _decode_get_wasm_bytecode(json)
+
+
+@command_decoder('Debugger.getStackTrace')
+def _decode_get_stack_trace(json: T_JSON_DICT) -> runtime.StackTrace:
+    return runtime.StackTrace.from_json(json['stackTrace'])
 
 
 def get_stack_trace(
@@ -615,7 +662,7 @@ def get_stack_trace(
         'params': params,
     }
     json = yield cmd_dict
-    return runtime.StackTrace.from_json(json['stackTrace'])
+    return _decode_get_stack_trace(json)
 
 
 def pause() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -667,6 +714,15 @@ def remove_breakpoint(
     json = yield cmd_dict
 
 
+@command_decoder('Debugger.restartFrame')
+def _decode_restart_frame(json: T_JSON_DICT) -> typing.Tuple[typing.List[CallFrame], typing.Optional[runtime.StackTrace], typing.Optional[runtime.StackTraceId]]:
+    return (
+        [CallFrame.from_json(i) for i in json['callFrames']],
+        runtime.StackTrace.from_json(json['asyncStackTrace']) if json.get('asyncStackTrace', None) is not None else None,
+        runtime.StackTraceId.from_json(json['asyncStackTraceId']) if json.get('asyncStackTraceId', None) is not None else None
+    )
+
+
 def restart_frame(
         call_frame_id: CallFrameId,
         mode: typing.Optional[str] = None
@@ -703,11 +759,7 @@ def restart_frame(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        [CallFrame.from_json(i) for i in json['callFrames']],
-        runtime.StackTrace.from_json(json['asyncStackTrace']) if json.get('asyncStackTrace', None) is not None else None,
-        runtime.StackTraceId.from_json(json['asyncStackTraceId']) if json.get('asyncStackTraceId', None) is not None else None
-    )
+    return _decode_restart_frame(json)
 
 
 def resume(
@@ -728,6 +780,11 @@ def resume(
     json = yield cmd_dict
 
 
+@command_decoder('Debugger.searchInContent')
+def _decode_search_in_content(json: T_JSON_DICT) -> typing.List[SearchMatch]:
+    return [SearchMatch.from_json(i) for i in json['result']]
+
+
 def search_in_content(
         script_id: runtime.ScriptId,
         query: str,
@@ -755,7 +812,7 @@ def search_in_content(
         'params': params,
     }
     json = yield cmd_dict
-    return [SearchMatch.from_json(i) for i in json['result']]
+    return _decode_search_in_content(json)
 
 
 def set_async_call_stack_depth(
@@ -846,6 +903,14 @@ def set_blackboxed_ranges(
     json = yield cmd_dict
 
 
+@command_decoder('Debugger.setBreakpoint')
+def _decode_set_breakpoint(json: T_JSON_DICT) -> typing.Tuple[BreakpointId, Location]:
+    return (
+        BreakpointId.from_json(json['breakpointId']),
+        Location.from_json(json['actualLocation'])
+    )
+
+
 def set_breakpoint(
         location: Location,
         condition: typing.Optional[str] = None
@@ -869,10 +934,12 @@ def set_breakpoint(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        BreakpointId.from_json(json['breakpointId']),
-        Location.from_json(json['actualLocation'])
-    )
+    return _decode_set_breakpoint(json)
+
+
+@command_decoder('Debugger.setInstrumentationBreakpoint')
+def _decode_set_instrumentation_breakpoint(json: T_JSON_DICT) -> BreakpointId:
+    return BreakpointId.from_json(json['breakpointId'])
 
 
 def set_instrumentation_breakpoint(
@@ -891,7 +958,15 @@ def set_instrumentation_breakpoint(
         'params': params,
     }
     json = yield cmd_dict
-    return BreakpointId.from_json(json['breakpointId'])
+    return _decode_set_instrumentation_breakpoint(json)
+
+
+@command_decoder('Debugger.setBreakpointByUrl')
+def _decode_set_breakpoint_by_url(json: T_JSON_DICT) -> typing.Tuple[BreakpointId, typing.List[Location]]:
+    return (
+        BreakpointId.from_json(json['breakpointId']),
+        [Location.from_json(i) for i in json['locations']]
+    )
 
 
 def set_breakpoint_by_url(
@@ -936,10 +1011,12 @@ def set_breakpoint_by_url(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        BreakpointId.from_json(json['breakpointId']),
-        [Location.from_json(i) for i in json['locations']]
-    )
+    return _decode_set_breakpoint_by_url(json)
+
+
+@command_decoder('Debugger.setBreakpointOnFunctionCall')
+def _decode_set_breakpoint_on_function_call(json: T_JSON_DICT) -> BreakpointId:
+    return BreakpointId.from_json(json['breakpointId'])
 
 
 def set_breakpoint_on_function_call(
@@ -966,7 +1043,7 @@ def set_breakpoint_on_function_call(
         'params': params,
     }
     json = yield cmd_dict
-    return BreakpointId.from_json(json['breakpointId'])
+    return _decode_set_breakpoint_on_function_call(json)
 
 
 def set_breakpoints_active(
@@ -1023,6 +1100,18 @@ def set_return_value(
     json = yield cmd_dict
 
 
+@command_decoder('Debugger.setScriptSource')
+def _decode_set_script_source(json: T_JSON_DICT) -> typing.Tuple[typing.Optional[typing.List[CallFrame]], typing.Optional[bool], typing.Optional[runtime.StackTrace], typing.Optional[runtime.StackTraceId], str, typing.Optional[runtime.ExceptionDetails]]:
+    return (
+        [CallFrame.from_json(i) for i in json['callFrames']] if json.get('callFrames', None) is not None else None,
+        bool(json['stackChanged']) if json.get('stackChanged', None) is not None else None,
+        runtime.StackTrace.from_json(json['asyncStackTrace']) if json.get('asyncStackTrace', None) is not None else None,
+        runtime.StackTraceId.from_json(json['asyncStackTraceId']) if json.get('asyncStackTraceId', None) is not None else None,
+        str(json['status']),
+        runtime.ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
+    )
+
+
 def set_script_source(
         script_id: runtime.ScriptId,
         script_source: str,
@@ -1063,14 +1152,7 @@ def set_script_source(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        [CallFrame.from_json(i) for i in json['callFrames']] if json.get('callFrames', None) is not None else None,
-        bool(json['stackChanged']) if json.get('stackChanged', None) is not None else None,
-        runtime.StackTrace.from_json(json['asyncStackTrace']) if json.get('asyncStackTrace', None) is not None else None,
-        runtime.StackTraceId.from_json(json['asyncStackTraceId']) if json.get('asyncStackTraceId', None) is not None else None,
-        str(json['status']),
-        runtime.ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
-    )
+    return _decode_set_script_source(json)
 
 
 def set_skip_all_pauses(
@@ -1181,8 +1263,8 @@ class BreakpointResolved:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BreakpointResolved:
         return cls(
-            breakpoint_id=BreakpointId.from_json(json['breakpointId']),
-            location=Location.from_json(json['location'])
+            BreakpointId(json['breakpointId']),
+            Location.from_json(json['location']),
         )
 
 
@@ -1209,14 +1291,15 @@ class Paused:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Paused:
+        get = json.get
         return cls(
-            call_frames=[CallFrame.from_json(i) for i in json['callFrames']],
-            reason=str(json['reason']),
-            data=dict(json['data']) if json.get('data', None) is not None else None,
-            hit_breakpoints=[str(i) for i in json['hitBreakpoints']] if json.get('hitBreakpoints', None) is not None else None,
-            async_stack_trace=runtime.StackTrace.from_json(json['asyncStackTrace']) if json.get('asyncStackTrace', None) is not None else None,
-            async_stack_trace_id=runtime.StackTraceId.from_json(json['asyncStackTraceId']) if json.get('asyncStackTraceId', None) is not None else None,
-            async_call_stack_trace_id=runtime.StackTraceId.from_json(json['asyncCallStackTraceId']) if json.get('asyncCallStackTraceId', None) is not None else None
+            list(map(CallFrame.from_json, json['callFrames'])),
+            json['reason'],
+            get('data'),
+            list(v) if (v := get('hitBreakpoints')) is not None else None,
+            runtime.StackTrace.from_json(v) if (v := get('asyncStackTrace')) is not None else None,
+            runtime.StackTraceId.from_json(v) if (v := get('asyncStackTraceId')) is not None else None,
+            runtime.StackTraceId.from_json(v) if (v := get('asyncCallStackTraceId')) is not None else None,
         )
 
 
@@ -1230,9 +1313,7 @@ class Resumed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Resumed:
-        return cls(
-
-        )
+        return cls()
 
 
 @event_class('Debugger.scriptFailedToParse')
@@ -1278,24 +1359,25 @@ class ScriptFailedToParse:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptFailedToParse:
+        get = json.get
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            url=str(json['url']),
-            start_line=int(json['startLine']),
-            start_column=int(json['startColumn']),
-            end_line=int(json['endLine']),
-            end_column=int(json['endColumn']),
-            execution_context_id=runtime.ExecutionContextId.from_json(json['executionContextId']),
-            hash_=str(json['hash']),
-            execution_context_aux_data=dict(json['executionContextAuxData']) if json.get('executionContextAuxData', None) is not None else None,
-            source_map_url=str(json['sourceMapURL']) if json.get('sourceMapURL', None) is not None else None,
-            has_source_url=bool(json['hasSourceURL']) if json.get('hasSourceURL', None) is not None else None,
-            is_module=bool(json['isModule']) if json.get('isModule', None) is not None else None,
-            length=int(json['length']) if json.get('length', None) is not None else None,
-            stack_trace=runtime.StackTrace.from_json(json['stackTrace']) if json.get('stackTrace', None) is not None else None,
-            code_offset=int(json['codeOffset']) if json.get('codeOffset', None) is not None else None,
-            script_language=ScriptLanguage.from_json(json['scriptLanguage']) if json.get('scriptLanguage', None) is not None else None,
-            embedder_name=str(json['embedderName']) if json.get('embedderName', None) is not None else None
+            runtime.ScriptId(json['scriptId']),
+            json['url'],
+            json['startLine'],
+            json['startColumn'],
+            json['endLine'],
+            json['endColumn'],
+            runtime.ExecutionContextId(json['executionContextId']),
+            json['hash'],
+            get('executionContextAuxData'),
+            get('sourceMapURL'),
+            get('hasSourceURL'),
+            get('isModule'),
+            get('length'),
+            runtime.StackTrace.from_json(v) if (v := get('stackTrace')) is not None else None,
+            get('codeOffset'),
+            ScriptLanguage.from_json(v) if (v := get('scriptLanguage')) is not None else None,
+            get('embedderName'),
         )
 
 
@@ -1347,24 +1429,25 @@ class ScriptParsed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptParsed:
+        get = json.get
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            url=str(json['url']),
-            start_line=int(json['startLine']),
-            start_column=int(json['startColumn']),
-            end_line=int(json['endLine']),
-            end_column=int(json['endColumn']),
-            execution_context_id=runtime.ExecutionContextId.from_json(json['executionContextId']),
-            hash_=str(json['hash']),
-            execution_context_aux_data=dict(json['executionContextAuxData']) if json.get('executionContextAuxData', None) is not None else None,
-            is_live_edit=bool(json['isLiveEdit']) if json.get('isLiveEdit', None) is not None else None,
-            source_map_url=str(json['sourceMapURL']) if json.get('sourceMapURL', None) is not None else None,
-            has_source_url=bool(json['hasSourceURL']) if json.get('hasSourceURL', None) is not None else None,
-            is_module=bool(json['isModule']) if json.get('isModule', None) is not None else None,
-            length=int(json['length']) if json.get('length', None) is not None else None,
-            stack_trace=runtime.StackTrace.from_json(json['stackTrace']) if json.get('stackTrace', None) is not None else None,
-            code_offset=int(json['codeOffset']) if json.get('codeOffset', None) is not None else None,
-            script_language=ScriptLanguage.from_json(json['scriptLanguage']) if json.get('scriptLanguage', None) is not None else None,
-            debug_symbols=[DebugSymbols.from_json(i) for i in json['debugSymbols']] if json.get('debugSymbols', None) is not None else None,
-            embedder_name=str(json['embedderName']) if json.get('embedderName', None) is not None else None
+            runtime.ScriptId(json['scriptId']),
+            json['url'],
+            json['startLine'],
+            json['startColumn'],
+            json['endLine'],
+            json['endColumn'],
+            runtime.ExecutionContextId(json['executionContextId']),
+            json['hash'],
+            get('executionContextAuxData'),
+            get('isLiveEdit'),
+            get('sourceMapURL'),
+            get('hasSourceURL'),
+            get('isModule'),
+            get('length'),
+            runtime.StackTrace.from_json(v) if (v := get('stackTrace')) is not None else None,
+            get('codeOffset'),
+            ScriptLanguage.from_json(v) if (v := get('scriptLanguage')) is not None else None,
+            list(map(DebugSymbols.from_json, v)) if (v := get('debugSymbols')) is not None else None,
+            get('embedderName'),
         )
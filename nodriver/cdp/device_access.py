@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 class RequestId(str):
@@ -61,8 +60,8 @@ class PromptDevice:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PromptDevice:
         return cls(
-            id_=DeviceId.from_json(json['id']),
-            name=str(json['name']),
+            DeviceId(json['id']),
+            json['name'],
         )
 
 
@@ -136,6 +135,6 @@ class DeviceRequestPrompted:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DeviceRequestPrompted:
         return cls(
-            id_=RequestId.from_json(json['id']),
-            devices=[PromptDevice.from_json(i) for i in json['devices']]
+            RequestId(json['id']),
+            list(map(PromptDevice.from_json, json['devices'])),
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import page
 from . import runtime
@@ -70,9 +69,9 @@ class BackendNode:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackendNode:
         return cls(
-            node_type=int(json['nodeType']),
-            node_name=str(json['nodeName']),
-            backend_node_id=BackendNodeId.from_json(json['backendNodeId']),
+            json['nodeType'],
+            json['nodeName'],
+            BackendNodeId(json['backendNodeId']),
         )
 
 
@@ -123,7 +122,10 @@ class PseudoType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PseudoType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class ShadowRootType(enum.Enum):
@@ -139,7 +141,10 @@ class ShadowRootType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ShadowRootType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class CompatibilityMode(enum.Enum):
@@ -155,7 +160,10 @@ class CompatibilityMode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CompatibilityMode:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class PhysicalAxes(enum.Enum):
@@ -171,7 +179,10 @@ class PhysicalAxes(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PhysicalAxes:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class LogicalAxes(enum.Enum):
@@ -187,7 +198,10 @@ class LogicalAxes(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> LogicalAxes:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class ScrollOrientation(enum.Enum):
@@ -202,7 +216,10 @@ class ScrollOrientation(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ScrollOrientation:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -373,39 +390,40 @@ class Node:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Node:
+        get = json.get
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            backend_node_id=BackendNodeId.from_json(json['backendNodeId']),
-            node_type=int(json['nodeType']),
-            node_name=str(json['nodeName']),
-            local_name=str(json['localName']),
-            node_value=str(json['nodeValue']),
-            parent_id=NodeId.from_json(json['parentId']) if json.get('parentId', None) is not None else None,
-            child_node_count=int(json['childNodeCount']) if json.get('childNodeCount', None) is not None else None,
-            children=[Node.from_json(i) for i in json['children']] if json.get('children', None) is not None else None,
-            attributes=[str(i) for i in json['attributes']] if json.get('attributes', None) is not None else None,
-            document_url=str(json['documentURL']) if json.get('documentURL', None) is not None else None,
-            base_url=str(json['baseURL']) if json.get('baseURL', None) is not None else None,
-            public_id=str(json['publicId']) if json.get('publicId', None) is not None else None,
-            system_id=str(json['systemId']) if json.get('systemId', None) is not None else None,
-            internal_subset=str(json['internalSubset']) if json.get('internalSubset', None) is not None else None,
-            xml_version=str(json['xmlVersion']) if json.get('xmlVersion', None) is not None else None,
-            name=str(json['name']) if json.get('name', None) is not None else None,
-            value=str(json['value']) if json.get('value', None) is not None else None,
-            pseudo_type=PseudoType.from_json(json['pseudoType']) if json.get('pseudoType', None) is not None else None,
-            pseudo_identifier=str(json['pseudoIdentifier']) if json.get('pseudoIdentifier', None) is not None else None,
-            shadow_root_type=ShadowRootType.from_json(json['shadowRootType']) if json.get('shadowRootType', None) is not None else None,
-            frame_id=page.FrameId.from_json(json['frameId']) if json.get('frameId', None) is not None else None,
-            content_document=Node.from_json(json['contentDocument']) if json.get('contentDocument', None) is not None else None,
-            shadow_roots=[Node.from_json(i) for i in json['shadowRoots']] if json.get('shadowRoots', None) is not None else None,
-            template_content=Node.from_json(json['templateContent']) if json.get('templateContent', None) is not None else None,
-            pseudo_elements=[Node.from_json(i) for i in json['pseudoElements']] if json.get('pseudoElements', None) is not None else None,
-            imported_document=Node.from_json(json['importedDocument']) if json.get('importedDocument', None) is not None else None,
-            distributed_nodes=[BackendNode.from_json(i) for i in json['distributedNodes']] if json.get('distributedNodes', None) is not None else None,
-            is_svg=bool(json['isSVG']) if json.get('isSVG', None) is not None else None,
-            compatibility_mode=CompatibilityMode.from_json(json['compatibilityMode']) if json.get('compatibilityMode', None) is not None else None,
-            assigned_slot=BackendNode.from_json(json['assignedSlot']) if json.get('assignedSlot', None) is not None else None,
-            is_scrollable=bool(json['isScrollable']) if json.get('isScrollable', None) is not None else None,
+            NodeId(json['nodeId']),
+            BackendNodeId(json['backendNodeId']),
+            json['nodeType'],
+            json['nodeName'],
+            json['localName'],
+            json['nodeValue'],
+            NodeId(v) if (v := get('parentId')) is not None else None,
+            get('childNodeCount'),
+            list(map(Node.from_json, v)) if (v := get('children')) is not None else None,
+            list(v) if (v := get('attributes')) is not None else None,
+            get('documentURL'),
+            get('baseURL'),
+            get('publicId'),
+            get('systemId'),
+            get('internalSubset'),
+            get('xmlVersion'),
+            get('name'),
+            get('value'),
+            PseudoType.from_json(v) if (v := get('pseudoType')) is not None else None,
+            get('pseudoIdentifier'),
+            ShadowRootType.from_json(v) if (v := get('shadowRootType')) is not None else None,
+            page.FrameId(v) if (v := get('frameId')) is not None else None,
+            Node.from_json(v) if (v := get('contentDocument')) is not None else None,
+            list(map(Node.from_json, v)) if (v := get('shadowRoots')) is not None else None,
+            Node.from_json(v) if (v := get('templateContent')) is not None else None,
+            list(map(Node.from_json, v)) if (v := get('pseudoElements')) is not None else None,
+            Node.from_json(v) if (v := get('importedDocument')) is not None else None,
+            list(map(BackendNode.from_json, v)) if (v := get('distributedNodes')) is not None else None,
+            get('isSVG'),
+            CompatibilityMode.from_json(v) if (v := get('compatibilityMode')) is not None else None,
+            BackendNode.from_json(v) if (v := get('assignedSlot')) is not None else None,
+            get('isScrollable'),
         )
 
 
@@ -427,8 +445,8 @@ class DetachedElementInfo:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DetachedElementInfo:
         return cls(
-            tree_node=Node.from_json(json['treeNode']),
-            retained_node_ids=[NodeId.from_json(i) for i in json['retainedNodeIds']],
+            Node.from_json(json['treeNode']),
+            list(map(NodeId, json['retainedNodeIds'])),
         )
 
 
@@ -460,11 +478,12 @@ class RGBA:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RGBA:
+        get = json.get
         return cls(
-            r=int(json['r']),
-            g=int(json['g']),
-            b=int(json['b']),
-            a=float(json['a']) if json.get('a', None) is not None else None,
+            json['r'],
+            json['g'],
+            json['b'],
+            float(v) if (v := get('a')) is not None else None,
         )
 
 
@@ -523,14 +542,15 @@ class BoxModel:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BoxModel:
+        get = json.get
         return cls(
-            content=Quad.from_json(json['content']),
-            padding=Quad.from_json(json['padding']),
-            border=Quad.from_json(json['border']),
-            margin=Quad.from_json(json['margin']),
-            width=int(json['width']),
-            height=int(json['height']),
-            shape_outside=ShapeOutsideInfo.from_json(json['shapeOutside']) if json.get('shapeOutside', None) is not None else None,
+            Quad(json['content']),
+            Quad(json['padding']),
+            Quad(json['border']),
+            Quad(json['margin']),
+            json['width'],
+            json['height'],
+            ShapeOutsideInfo.from_json(v) if (v := get('shapeOutside')) is not None else None,
         )
 
 
@@ -558,9 +578,9 @@ class ShapeOutsideInfo:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ShapeOutsideInfo:
         return cls(
-            bounds=Quad.from_json(json['bounds']),
-            shape=[i for i in json['shape']],
-            margin_shape=[i for i in json['marginShape']],
+            Quad(json['bounds']),
+            list(json['shape']),
+            list(json['marginShape']),
         )
 
 
@@ -592,10 +612,10 @@ class Rect:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Rect:
         return cls(
-            x=float(json['x']),
-            y=float(json['y']),
-            width=float(json['width']),
-            height=float(json['height']),
+            float(json['x']),
+            float(json['y']),
+            float(json['width']),
+            float(json['height']),
         )
 
 
@@ -616,11 +636,16 @@ class CSSComputedStyleProperty:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CSSComputedStyleProperty:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            json['name'],
+            json['value'],
         )
 
 
+@command_decoder('DOM.collectClassNamesFromSubtree')
+def _decode_collect_class_names_from_subtree(json: T_JSON_DICT) -> typing.List[str]:
+    return [str(i) for i in json['classNames']]
+
+
 def collect_class_names_from_subtree(
         node_id: NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
@@ -639,7 +664,12 @@ def collect_class_names_from_subtree(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['classNames']]
+    return _decode_collect_class_names_from_subtree(json)
+
+
+@command_decoder('DOM.copyTo')
+def _decode_copy_to(json: T_JSON_DICT) -> NodeId:
+    return NodeId.from_json(json['nodeId'])
 
 
 def copy_to(
@@ -668,7 +698,12 @@ def copy_to(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return _decode_copy_to(json)
+
+
+@command_decoder('DOM.describeNode')
+def _decode_describe_node(json: T_JSON_DICT) -> Node:
+    return Node.from_json(json['node'])
 
 
 def describe_node(
@@ -705,7 +740,7 @@ def describe_node(
         'params': params,
     }
     json = yield cmd_dict
-    return Node.from_json(json['node'])
+    return _decode_describe_node(json)
 
 
 def scroll_into_view_if_needed(
@@ -814,6 +849,11 @@ def focus(
     json = yield cmd_dict
 
 
+@command_decoder('DOM.getAttributes')
+def _decode_get_attributes(json: T_JSON_DICT) -> typing.List[str]:
+    return [str(i) for i in json['attributes']]
+
+
 def get_attributes(
         node_id: NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
@@ -830,7 +870,12 @@ def get_attributes(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['attributes']]
+    return _decode_get_attributes(json)
+
+
+@command_decoder('DOM.getBoxModel')
+def _decode_get_box_model(json: T_JSON_DICT) -> BoxModel:
+    return BoxModel.from_json(json['model'])
 
 
 def get_box_model(
@@ -858,7 +903,12 @@ def get_box_model(
         'params': params,
     }
     json = yield cmd_dict
-    return BoxModel.from_json(json['model'])
+    return _decode_get_box_model(json)
+
+
+@command_decoder('DOM.getContentQuads')
+def _decode_get_content_quads(json: T_JSON_DICT) -> typing.List[Quad]:
+    return [Quad.from_json(i) for i in json['quads']]
 
 
 def get_content_quads(
@@ -889,7 +939,12 @@ def get_content_quads(
         'params': params,
     }
     json = yield cmd_dict
-    return [Quad.from_json(i) for i in json['quads']]
+    return _decode_get_content_quads(json)
+
+
+@command_decoder('DOM.getDocument')
+def _decode_get_document(json: T_JSON_DICT) -> Node:
+    return Node.from_json(json['root'])
 
 
 def get_document(
@@ -914,7 +969,12 @@ def get_document(
         'params': params,
     }
     json = yield cmd_dict
-    return Node.from_json(json['root'])
+    return _decode_get_document(json)
+
+
+@command_decoder('DOM.getFlattenedDocument')
+def _decode_get_flattened_document(json: T_JSON_DICT) -> typing.List[Node]:
+    return [Node.from_json(i) for i in json['nodes']]
 
 
 @deprecated(version="1.3")
@@ -943,7 +1003,12 @@ def get_flattened_document(
         'params': params,
     }
     json = yield cmd_dict
-    return [Node.from_json(i) for i in json['nodes']]
+    return _decode_get_flattened_document(json)
+
+
+@command_decoder('DOM.getNodesForSubtreeByStyle')
+def _decode_get_nodes_for_subtree_by_style(json: T_JSON_DICT) -> typing.List[NodeId]:
+    return [NodeId.from_json(i) for i in json['nodeIds']]
 
 
 def get_nodes_for_subtree_by_style(
@@ -971,7 +1036,16 @@ def get_nodes_for_subtree_by_style(
         'params': params,
     }
     json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return _decode_get_nodes_for_subtree_by_style(json)
+
+
+@command_decoder('DOM.getNodeForLocation')
+def _decode_get_node_for_location(json: T_JSON_DICT) -> typing.Tuple[BackendNodeId, page.FrameId, typing.Optional[NodeId]]:
+    return (
+        BackendNodeId.from_json(json['backendNodeId']),
+        page.FrameId.from_json(json['frameId']),
+        NodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None
+    )
 
 
 def get_node_for_location(
@@ -1006,11 +1080,12 @@ def get_node_for_location(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        BackendNodeId.from_json(json['backendNodeId']),
-        page.FrameId.from_json(json['frameId']),
-        NodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None
-    )
+    return _decode_get_node_for_location(json)
+
+
+@command_decoder('DOM.getOuterHTML')
+def _decode_get_outer_html(json: T_JSON_DICT) -> str:
+    return str(json['outerHTML'])
 
 
 def get_outer_html(
@@ -1038,7 +1113,12 @@ def get_outer_html(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['outerHTML'])
+    return _decode_get_outer_html(json)
+
+
+@command_decoder('DOM.getRelayoutBoundary')
+def _decode_get_relayout_boundary(json: T_JSON_DICT) -> NodeId:
+    return NodeId.from_json(json['nodeId'])
 
 
 def get_relayout_boundary(
@@ -1059,7 +1139,12 @@ def get_relayout_boundary(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return _decode_get_relayout_boundary(json)
+
+
+@command_decoder('DOM.getSearchResults')
+def _decode_get_search_results(json: T_JSON_DICT) -> typing.List[NodeId]:
+    return [NodeId.from_json(i) for i in json['nodeIds']]
 
 
 def get_search_results(
@@ -1087,7 +1172,7 @@ def get_search_results(
         'params': params,
     }
     json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return _decode_get_search_results(json)
 
 
 def hide_highlight() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1132,6 +1217,11 @@ def mark_undoable_state() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('DOM.moveTo')
+def _decode_move_to(json: T_JSON_DICT) -> NodeId:
+    return NodeId.from_json(json['nodeId'])
+
+
 def move_to(
         node_id: NodeId,
         target_node_id: NodeId,
@@ -1155,7 +1245,15 @@ def move_to(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return _decode_move_to(json)
+
+
+@command_decoder('DOM.performSearch')
+def _decode_perform_search(json: T_JSON_DICT) -> typing.Tuple[str, int]:
+    return (
+        str(json['searchId']),
+        int(json['resultCount'])
+    )
 
 
 def perform_search(
@@ -1184,10 +1282,12 @@ def perform_search(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        str(json['searchId']),
-        int(json['resultCount'])
-    )
+    return _decode_perform_search(json)
+
+
+@command_decoder('DOM.pushNodeByPathToFrontend')
+def _decode_push_node_by_path_to_frontend(json: T_JSON_DICT) -> NodeId:
+    return NodeId.from_json(json['nodeId'])
 
 
 def push_node_by_path_to_frontend(
@@ -1208,7 +1308,12 @@ def push_node_by_path_to_frontend(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return _decode_push_node_by_path_to_frontend(json)
+
+
+@command_decoder('DOM.pushNodesByBackendIdsToFrontend')
+def _decode_push_nodes_by_backend_ids_to_frontend(json: T_JSON_DICT) -> typing.List[NodeId]:
+    return [NodeId.from_json(i) for i in json['nodeIds']]
 
 
 def push_nodes_by_backend_ids_to_frontend(
@@ -1229,7 +1334,12 @@ def push_nodes_by_backend_ids_to_frontend(
         'params': params,
     }
     json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return _decode_push_nodes_by_backend_ids_to_frontend(json)
+
+
+@command_decoder('DOM.querySelector')
+def _decode_query_selector(json: T_JSON_DICT) -> NodeId:
+    return NodeId.from_json(json['nodeId'])
 
 
 def query_selector(
@@ -1251,7 +1361,12 @@ def query_selector(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return _decode_query_selector(json)
+
+
+@command_decoder('DOM.querySelectorAll')
+def _decode_query_selector_all(json: T_JSON_DICT) -> typing.List[NodeId]:
+    return [NodeId.from_json(i) for i in json['nodeIds']]
 
 
 def query_selector_all(
@@ -1273,6 +1388,11 @@ def query_selector_all(
         'params': params,
     }
     json = yield cmd_dict
+    return _decode_query_selector_all(json)
+
+
+@command_decoder('DOM.getTopLayerElements')
+def _decode_get_top_layer_elements(json: T_JSON_DICT) -> typing.List[NodeId]:
     return [NodeId.from_json(i) for i in json['nodeIds']]
 
 
@@ -1290,7 +1410,12 @@ def get_top_layer_elements() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.
         'method': 'DOM.getTopLayerElements',
     }
     json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return _decode_get_top_layer_elements(json)
+
+
+@command_decoder('DOM.getElementByRelation')
+def _decode_get_element_by_relation(json: T_JSON_DICT) -> NodeId:
+    return NodeId.from_json(json['nodeId'])
 
 
 def get_element_by_relation(
@@ -1314,7 +1439,7 @@ def get_element_by_relation(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return _decode_get_element_by_relation(json)
 
 
 def redo() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1393,6 +1518,11 @@ def request_child_nodes(
     json = yield cmd_dict
 
 
+@command_decoder('DOM.requestNode')
+def _decode_request_node(json: T_JSON_DICT) -> NodeId:
+    return NodeId.from_json(json['nodeId'])
+
+
 def request_node(
         object_id: runtime.RemoteObjectId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,NodeId]:
@@ -1411,7 +1541,12 @@ def request_node(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return _decode_request_node(json)
+
+
+@command_decoder('DOM.resolveNode')
+def _decode_resolve_node(json: T_JSON_DICT) -> runtime.RemoteObject:
+    return runtime.RemoteObject.from_json(json['object'])
 
 
 def resolve_node(
@@ -1443,7 +1578,7 @@ def resolve_node(
         'params': params,
     }
     json = yield cmd_dict
-    return runtime.RemoteObject.from_json(json['object'])
+    return _decode_resolve_node(json)
 
 
 def set_attribute_value(
@@ -1542,6 +1677,11 @@ def set_node_stack_traces_enabled(
     json = yield cmd_dict
 
 
+@command_decoder('DOM.getNodeStackTraces')
+def _decode_get_node_stack_traces(json: T_JSON_DICT) -> typing.Optional[runtime.StackTrace]:
+    return runtime.StackTrace.from_json(json['creation']) if json.get('creation', None) is not None else None
+
+
 def get_node_stack_traces(
         node_id: NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Optional[runtime.StackTrace]]:
@@ -1560,7 +1700,12 @@ def get_node_stack_traces(
         'params': params,
     }
     json = yield cmd_dict
-    return runtime.StackTrace.from_json(json['creation']) if json.get('creation', None) is not None else None
+    return _decode_get_node_stack_traces(json)
+
+
+@command_decoder('DOM.getFileInfo')
+def _decode_get_file_info(json: T_JSON_DICT) -> str:
+    return str(json['path'])
 
 
 def get_file_info(
@@ -1582,7 +1727,12 @@ def get_file_info(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['path'])
+    return _decode_get_file_info(json)
+
+
+@command_decoder('DOM.getDetachedDomNodes')
+def _decode_get_detached_dom_nodes(json: T_JSON_DICT) -> typing.List[DetachedElementInfo]:
+    return [DetachedElementInfo.from_json(i) for i in json['detachedNodes']]
 
 
 def get_detached_dom_nodes() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[DetachedElementInfo]]:
@@ -1597,7 +1747,7 @@ def get_detached_dom_nodes() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.
         'method': 'DOM.getDetachedDomNodes',
     }
     json = yield cmd_dict
-    return [DetachedElementInfo.from_json(i) for i in json['detachedNodes']]
+    return _decode_get_detached_dom_nodes(json)
 
 
 def set_inspected_node(
@@ -1620,6 +1770,11 @@ def set_inspected_node(
     json = yield cmd_dict
 
 
+@command_decoder('DOM.setNodeName')
+def _decode_set_node_name(json: T_JSON_DICT) -> NodeId:
+    return NodeId.from_json(json['nodeId'])
+
+
 def set_node_name(
         node_id: NodeId,
         name: str
@@ -1639,7 +1794,7 @@ def set_node_name(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return _decode_set_node_name(json)
 
 
 def set_node_value(
@@ -1694,6 +1849,14 @@ def undo() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('DOM.getFrameOwner')
+def _decode_get_frame_owner(json: T_JSON_DICT) -> typing.Tuple[BackendNodeId, typing.Optional[NodeId]]:
+    return (
+        BackendNodeId.from_json(json['backendNodeId']),
+        NodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None
+    )
+
+
 def get_frame_owner(
         frame_id: page.FrameId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[BackendNodeId, typing.Optional[NodeId]]]:
@@ -1715,10 +1878,12 @@ def get_frame_owner(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        BackendNodeId.from_json(json['backendNodeId']),
-        NodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None
-    )
+    return _decode_get_frame_owner(json)
+
+
+@command_decoder('DOM.getContainerForNode')
+def _decode_get_container_for_node(json: T_JSON_DICT) -> typing.Optional[NodeId]:
+    return NodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None
 
 
 def get_container_for_node(
@@ -1759,7 +1924,12 @@ def get_container_for_node(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None
+    return _decode_get_container_for_node(json)
+
+
+@command_decoder('DOM.getQueryingDescendantsForContainer')
+def _decode_get_querying_descendants_for_container(json: T_JSON_DICT) -> typing.List[NodeId]:
+    return [NodeId.from_json(i) for i in json['nodeIds']]
 
 
 def get_querying_descendants_for_container(
@@ -1781,7 +1951,12 @@ def get_querying_descendants_for_container(
         'params': params,
     }
     json = yield cmd_dict
-    return [NodeId.from_json(i) for i in json['nodeIds']]
+    return _decode_get_querying_descendants_for_container(json)
+
+
+@command_decoder('DOM.getAnchorElement')
+def _decode_get_anchor_element(json: T_JSON_DICT) -> NodeId:
+    return NodeId.from_json(json['nodeId'])
 
 
 def get_anchor_element(
@@ -1807,7 +1982,7 @@ def get_anchor_element(
         'params': params,
     }
     json = yield cmd_dict
-    return NodeId.from_json(json['nodeId'])
+    return _decode_get_anchor_element(json)
 
 
 @event_class('DOM.attributeModified')
@@ -1826,9 +2001,9 @@ class AttributeModified:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributeModified:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            name=str(json['name']),
-            value=str(json['value'])
+            NodeId(json['nodeId']),
+            json['name'],
+            json['value'],
         )
 
 
@@ -1846,8 +2021,8 @@ class AttributeRemoved:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributeRemoved:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            name=str(json['name'])
+            NodeId(json['nodeId']),
+            json['name'],
         )
 
 
@@ -1865,8 +2040,8 @@ class CharacterDataModified:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CharacterDataModified:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            character_data=str(json['characterData'])
+            NodeId(json['nodeId']),
+            json['characterData'],
         )
 
 
@@ -1884,8 +2059,8 @@ class ChildNodeCountUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ChildNodeCountUpdated:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            child_node_count=int(json['childNodeCount'])
+            NodeId(json['nodeId']),
+            json['childNodeCount'],
         )
 
 
@@ -1905,9 +2080,9 @@ class ChildNodeInserted:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ChildNodeInserted:
         return cls(
-            parent_node_id=NodeId.from_json(json['parentNodeId']),
-            previous_node_id=NodeId.from_json(json['previousNodeId']),
-            node=Node.from_json(json['node'])
+            NodeId(json['parentNodeId']),
+            NodeId(json['previousNodeId']),
+            Node.from_json(json['node']),
         )
 
 
@@ -1925,8 +2100,8 @@ class ChildNodeRemoved:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ChildNodeRemoved:
         return cls(
-            parent_node_id=NodeId.from_json(json['parentNodeId']),
-            node_id=NodeId.from_json(json['nodeId'])
+            NodeId(json['parentNodeId']),
+            NodeId(json['nodeId']),
         )
 
 
@@ -1946,8 +2121,8 @@ class DistributedNodesUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DistributedNodesUpdated:
         return cls(
-            insertion_point_id=NodeId.from_json(json['insertionPointId']),
-            distributed_nodes=[BackendNode.from_json(i) for i in json['distributedNodes']]
+            NodeId(json['insertionPointId']),
+            list(map(BackendNode.from_json, json['distributedNodes'])),
         )
 
 
@@ -1961,9 +2136,7 @@ class DocumentUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DocumentUpdated:
-        return cls(
-
-        )
+        return cls()
 
 
 @event_class('DOM.inlineStyleInvalidated')
@@ -1980,7 +2153,7 @@ class InlineStyleInvalidated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InlineStyleInvalidated:
         return cls(
-            node_ids=[NodeId.from_json(i) for i in json['nodeIds']]
+            list(map(NodeId, json['nodeIds'])),
         )
 
 
@@ -2000,8 +2173,8 @@ class PseudoElementAdded:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PseudoElementAdded:
         return cls(
-            parent_id=NodeId.from_json(json['parentId']),
-            pseudo_element=Node.from_json(json['pseudoElement'])
+            NodeId(json['parentId']),
+            Node.from_json(json['pseudoElement']),
         )
 
 
@@ -2017,9 +2190,7 @@ class TopLayerElementsUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TopLayerElementsUpdated:
-        return cls(
-
-        )
+        return cls()
 
 
 @event_class('DOM.scrollableFlagUpdated')
@@ -2038,8 +2209,8 @@ class ScrollableFlagUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScrollableFlagUpdated:
         return cls(
-            node_id=NodeId.from_json(json['nodeId']),
-            is_scrollable=bool(json['isScrollable'])
+            NodeId(json['nodeId']),
+            json['isScrollable'],
         )
 
 
@@ -2059,8 +2230,8 @@ class PseudoElementRemoved:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PseudoElementRemoved:
         return cls(
-            parent_id=NodeId.from_json(json['parentId']),
-            pseudo_element_id=NodeId.from_json(json['pseudoElementId'])
+            NodeId(json['parentId']),
+            NodeId(json['pseudoElementId']),
         )
 
 
@@ -2079,8 +2250,8 @@ class SetChildNodes:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SetChildNodes:
         return cls(
-            parent_id=NodeId.from_json(json['parentId']),
-            nodes=[Node.from_json(i) for i in json['nodes']]
+            NodeId(json['parentId']),
+            list(map(Node.from_json, json['nodes'])),
         )
 
 
@@ -2100,8 +2271,8 @@ class ShadowRootPopped:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ShadowRootPopped:
         return cls(
-            host_id=NodeId.from_json(json['hostId']),
-            root_id=NodeId.from_json(json['rootId'])
+            NodeId(json['hostId']),
+            NodeId(json['rootId']),
         )
 
 
@@ -2121,6 +2292,6 @@ class ShadowRootPushed:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ShadowRootPushed:
         return cls(
-            host_id=NodeId.from_json(json['hostId']),
-            root=Node.from_json(json['root'])
+            NodeId(json['hostId']),
+            Node.from_json(json['root']),
         )
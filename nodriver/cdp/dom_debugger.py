@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import dom
 from . import runtime
@@ -29,7 +28,10 @@ class DOMBreakpointType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DOMBreakpointType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class CSPViolationType(enum.Enum):
@@ -44,7 +46,10 @@ class CSPViolationType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CSPViolationType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -101,20 +106,26 @@ class EventListener:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> EventListener:
+        get = json.get
         return cls(
-            type_=str(json['type']),
-            use_capture=bool(json['useCapture']),
-            passive=bool(json['passive']),
-            once=bool(json['once']),
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
-            handler=runtime.RemoteObject.from_json(json['handler']) if json.get('handler', None) is not None else None,
-            original_handler=runtime.RemoteObject.from_json(json['originalHandler']) if json.get('originalHandler', None) is not None else None,
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']) if json.get('backendNodeId', None) is not None else None,
+            json['type'],
+            json['useCapture'],
+            json['passive'],
+            json['once'],
+            runtime.ScriptId(json['scriptId']),
+            json['lineNumber'],
+            json['columnNumber'],
+            runtime.RemoteObject.from_json(v) if (v := get('handler')) is not None else None,
+            runtime.RemoteObject.from_json(v) if (v := get('originalHandler')) is not None else None,
+            dom.BackendNodeId(v) if (v := get('backendNodeId')) is not None else None,
         )
 
 
+@command_decoder('DOMDebugger.getEventListeners')
+def _decode_get_event_listeners(json: T_JSON_DICT) -> typing.List[EventListener]:
+    return [EventListener.from_json(i) for i in json['listeners']]
+
+
 def get_event_listeners(
         object_id: runtime.RemoteObjectId,
         depth: typing.Optional[int] = None,
@@ -139,7 +150,7 @@ def get_event_listeners(
         'params': params,
     }
     json = yield cmd_dict
-    return [EventListener.from_json(i) for i in json['listeners']]
+    return _decode_get_event_listeners(json)
 
 
 def remove_dom_breakpoint(
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import dom
 from . import dom_debugger
@@ -169,35 +168,36 @@ class DOMNode:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DOMNode:
+        get = json.get
         return cls(
-            node_type=int(json['nodeType']),
-            node_name=str(json['nodeName']),
-            node_value=str(json['nodeValue']),
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']),
-            text_value=str(json['textValue']) if json.get('textValue', None) is not None else None,
-            input_value=str(json['inputValue']) if json.get('inputValue', None) is not None else None,
-            input_checked=bool(json['inputChecked']) if json.get('inputChecked', None) is not None else None,
-            option_selected=bool(json['optionSelected']) if json.get('optionSelected', None) is not None else None,
-            child_node_indexes=[int(i) for i in json['childNodeIndexes']] if json.get('childNodeIndexes', None) is not None else None,
-            attributes=[NameValue.from_json(i) for i in json['attributes']] if json.get('attributes', None) is not None else None,
-            pseudo_element_indexes=[int(i) for i in json['pseudoElementIndexes']] if json.get('pseudoElementIndexes', None) is not None else None,
-            layout_node_index=int(json['layoutNodeIndex']) if json.get('layoutNodeIndex', None) is not None else None,
-            document_url=str(json['documentURL']) if json.get('documentURL', None) is not None else None,
-            base_url=str(json['baseURL']) if json.get('baseURL', None) is not None else None,
-            content_language=str(json['contentLanguage']) if json.get('contentLanguage', None) is not None else None,
-            document_encoding=str(json['documentEncoding']) if json.get('documentEncoding', None) is not None else None,
-            public_id=str(json['publicId']) if json.get('publicId', None) is not None else None,
-            system_id=str(json['systemId']) if json.get('systemId', None) is not None else None,
-            frame_id=page.FrameId.from_json(json['frameId']) if json.get('frameId', None) is not None else None,
-            content_document_index=int(json['contentDocumentIndex']) if json.get('contentDocumentIndex', None) is not None else None,
-            pseudo_type=dom.PseudoType.from_json(json['pseudoType']) if json.get('pseudoType', None) is not None else None,
-            shadow_root_type=dom.ShadowRootType.from_json(json['shadowRootType']) if json.get('shadowRootType', None) is not None else None,
-            is_clickable=bool(json['isClickable']) if json.get('isClickable', None) is not None else None,
-            event_listeners=[dom_debugger.EventListener.from_json(i) for i in json['eventListeners']] if json.get('eventListeners', None) is not None else None,
-            current_source_url=str(json['currentSourceURL']) if json.get('currentSourceURL', None) is not None else None,
-            origin_url=str(json['originURL']) if json.get('originURL', None) is not None else None,
-            scroll_offset_x=float(json['scrollOffsetX']) if json.get('scrollOffsetX', None) is not None else None,
-            scroll_offset_y=float(json['scrollOffsetY']) if json.get('scrollOffsetY', None) is not None else None,
+            json['nodeType'],
+            json['nodeName'],
+            json['nodeValue'],
+            dom.BackendNodeId(json['backendNodeId']),
+            get('textValue'),
+            get('inputValue'),
+            get('inputChecked'),
+            get('optionSelected'),
+            list(v) if (v := get('childNodeIndexes')) is not None else None,
+            list(map(NameValue.from_json, v)) if (v := get('attributes')) is not None else None,
+            list(v) if (v := get('pseudoElementIndexes')) is not None else None,
+            get('layoutNodeIndex'),
+            get('documentURL'),
+            get('baseURL'),
+            get('contentLanguage'),
+            get('documentEncoding'),
+            get('publicId'),
+            get('systemId'),
+            page.FrameId(v) if (v := get('frameId')) is not None else None,
+            get('contentDocumentIndex'),
+            dom.PseudoType.from_json(v) if (v := get('pseudoType')) is not None else None,
+            dom.ShadowRootType.from_json(v) if (v := get('shadowRootType')) is not None else None,
+            get('isClickable'),
+            list(map(dom_debugger.EventListener.from_json, v)) if (v := get('eventListeners')) is not None else None,
+            get('currentSourceURL'),
+            get('originURL'),
+            float(v) if (v := get('scrollOffsetX')) is not None else None,
+            float(v) if (v := get('scrollOffsetY')) is not None else None,
         )
 
 
@@ -228,9 +228,9 @@ class InlineTextBox:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InlineTextBox:
         return cls(
-            bounding_box=dom.Rect.from_json(json['boundingBox']),
-            start_character_index=int(json['startCharacterIndex']),
-            num_characters=int(json['numCharacters']),
+            dom.Rect.from_json(json['boundingBox']),
+            json['startCharacterIndex'],
+            json['numCharacters'],
         )
 
 
@@ -280,14 +280,15 @@ class LayoutTreeNode:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayoutTreeNode:
+        get = json.get
         return cls(
-            dom_node_index=int(json['domNodeIndex']),
-            bounding_box=dom.Rect.from_json(json['boundingBox']),
-            layout_text=str(json['layoutText']) if json.get('layoutText', None) is not None else None,
-            inline_text_nodes=[InlineTextBox.from_json(i) for i in json['inlineTextNodes']] if json.get('inlineTextNodes', None) is not None else None,
-            style_index=int(json['styleIndex']) if json.get('styleIndex', None) is not None else None,
-            paint_order=int(json['paintOrder']) if json.get('paintOrder', None) is not None else None,
-            is_stacking_context=bool(json['isStackingContext']) if json.get('isStackingContext', None) is not None else None,
+            json['domNodeIndex'],
+            dom.Rect.from_json(json['boundingBox']),
+            get('layoutText'),
+            list(map(InlineTextBox.from_json, v)) if (v := get('inlineTextNodes')) is not None else None,
+            get('styleIndex'),
+            get('paintOrder'),
+            get('isStackingContext'),
         )
 
 
@@ -307,7 +308,7 @@ class ComputedStyle:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ComputedStyle:
         return cls(
-            properties=[NameValue.from_json(i) for i in json['properties']],
+            list(map(NameValue.from_json, json['properties'])),
         )
 
 
@@ -331,8 +332,8 @@ class NameValue:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NameValue:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            json['name'],
+            json['value'],
         )
 
 
@@ -384,8 +385,8 @@ class RareStringData:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RareStringData:
         return cls(
-            index=[int(i) for i in json['index']],
-            value=[StringIndex.from_json(i) for i in json['value']],
+            list(json['index']),
+            list(map(StringIndex, json['value'])),
         )
 
 
@@ -401,7 +402,7 @@ class RareBooleanData:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RareBooleanData:
         return cls(
-            index=[int(i) for i in json['index']],
+            list(json['index']),
         )
 
 
@@ -420,8 +421,8 @@ class RareIntegerData:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RareIntegerData:
         return cls(
-            index=[int(i) for i in json['index']],
-            value=[int(i) for i in json['value']],
+            list(json['index']),
+            list(json['value']),
         )
 
 
@@ -512,22 +513,23 @@ class DocumentSnapshot:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DocumentSnapshot:
+        get = json.get
         return cls(
-            document_url=StringIndex.from_json(json['documentURL']),
-            title=StringIndex.from_json(json['title']),
-            base_url=StringIndex.from_json(json['baseURL']),
-            content_language=StringIndex.from_json(json['contentLanguage']),
-            encoding_name=StringIndex.from_json(json['encodingName']),
-            public_id=StringIndex.from_json(json['publicId']),
-            system_id=StringIndex.from_json(json['systemId']),
-            frame_id=StringIndex.from_json(json['frameId']),
-            nodes=NodeTreeSnapshot.from_json(json['nodes']),
-            layout=LayoutTreeSnapshot.from_json(json['layout']),
-            text_boxes=TextBoxSnapshot.from_json(json['textBoxes']),
-            scroll_offset_x=float(json['scrollOffsetX']) if json.get('scrollOffsetX', None) is not None else None,
-            scroll_offset_y=float(json['scrollOffsetY']) if json.get('scrollOffsetY', None) is not None else None,
-            content_width=float(json['contentWidth']) if json.get('contentWidth', None) is not None else None,
-            content_height=float(json['contentHeight']) if json.get('contentHeight', None) is not None else None,
+            StringIndex(json['documentURL']),
+            StringIndex(json['title']),
+            StringIndex(json['baseURL']),
+            StringIndex(json['contentLanguage']),
+            StringIndex(json['encodingName']),
+            StringIndex(json['publicId']),
+            StringIndex(json['systemId']),
+            StringIndex(json['frameId']),
+            NodeTreeSnapshot.from_json(json['nodes']),
+            LayoutTreeSnapshot.from_json(json['layout']),
+            TextBoxSnapshot.from_json(json['textBoxes']),
+            float(v) if (v := get('scrollOffsetX')) is not None else None,
+            float(v) if (v := get('scrollOffsetY')) is not None else None,
+            float(v) if (v := get('contentWidth')) is not None else None,
+            float(v) if (v := get('contentHeight')) is not None else None,
         )
 
 
@@ -630,24 +632,25 @@ class NodeTreeSnapshot:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodeTreeSnapshot:
+        get = json.get
         return cls(
-            parent_index=[int(i) for i in json['parentIndex']] if json.get('parentIndex', None) is not None else None,
-            node_type=[int(i) for i in json['nodeType']] if json.get('nodeType', None) is not None else None,
-            shadow_root_type=RareStringData.from_json(json['shadowRootType']) if json.get('shadowRootType', None) is not None else None,
-            node_name=[StringIndex.from_json(i) for i in json['nodeName']] if json.get('nodeName', None) is not None else None,
-            node_value=[StringIndex.from_json(i) for i in json['nodeValue']] if json.get('nodeValue', None) is not None else None,
-            backend_node_id=[dom.BackendNodeId.from_json(i) for i in json['backendNodeId']] if json.get('backendNodeId', None) is not None else None,
-            attributes=[ArrayOfStrings.from_json(i) for i in json['attributes']] if json.get('attributes', None) is not None else None,
-            text_value=RareStringData.from_json(json['textValue']) if json.get('textValue', None) is not None else None,
-            input_value=RareStringData.from_json(json['inputValue']) if json.get('inputValue', None) is not None else None,
-            input_checked=RareBooleanData.from_json(json['inputChecked']) if json.get('inputChecked', None) is not None else None,
-            option_selected=RareBooleanData.from_json(json['optionSelected']) if json.get('optionSelected', None) is not None else None,
-            content_document_index=RareIntegerData.from_json(json['contentDocumentIndex']) if json.get('contentDocumentIndex', None) is not None else None,
-            pseudo_type=RareStringData.from_json(json['pseudoType']) if json.get('pseudoType', None) is not None else None,
-            pseudo_identifier=RareStringData.from_json(json['pseudoIdentifier']) if json.get('pseudoIdentifier', None) is not None else None,
-            is_clickable=RareBooleanData.from_json(json['isClickable']) if json.get('isClickable', None) is not None else None,
-            current_source_url=RareStringData.from_json(json['currentSourceURL']) if json.get('currentSourceURL', None) is not None else None,
-            origin_url=RareStringData.from_json(json['originURL']) if json.get('originURL', None) is not None else None,
+            list(v) if (v := get('parentIndex')) is not None else None,
+            list(v) if (v := get('nodeType')) is not None else None,
+            RareStringData.from_json(v) if (v := get('shadowRootType')) is not None else None,
+            list(map(StringIndex, v)) if (v := get('nodeName')) is not None else None,
+            list(map(StringIndex, v)) if (v := get('nodeValue')) is not None else None,
+            list(map(dom.BackendNodeId, v)) if (v := get('backendNodeId')) is not None else None,
+            list(map(ArrayOfStrings, v)) if (v := get('attributes')) is not None else None,
+            RareStringData.from_json(v) if (v := get('textValue')) is not None else None,
+            RareStringData.from_json(v) if (v := get('inputValue')) is not None else None,
+            RareBooleanData.from_json(v) if (v := get('inputChecked')) is not None else None,
+            RareBooleanData.from_json(v) if (v := get('optionSelected')) is not None else None,
+            RareIntegerData.from_json(v) if (v := get('contentDocumentIndex')) is not None else None,
+            RareStringData.from_json(v) if (v := get('pseudoType')) is not None else None,
+            RareStringData.from_json(v) if (v := get('pseudoIdentifier')) is not None else None,
+            RareBooleanData.from_json(v) if (v := get('isClickable')) is not None else None,
+            RareStringData.from_json(v) if (v := get('currentSourceURL')) is not None else None,
+            RareStringData.from_json(v) if (v := get('originURL')) is not None else None,
         )
 
 
@@ -714,18 +717,19 @@ class LayoutTreeSnapshot:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayoutTreeSnapshot:
+        get = json.get
         return cls(
-            node_index=[int(i) for i in json['nodeIndex']],
-            styles=[ArrayOfStrings.from_json(i) for i in json['styles']],
-            bounds=[Rectangle.from_json(i) for i in json['bounds']],
-            text=[StringIndex.from_json(i) for i in json['text']],
-            stacking_contexts=RareBooleanData.from_json(json['stackingContexts']),
-            paint_orders=[int(i) for i in json['paintOrders']] if json.get('paintOrders', None) is not None else None,
-            offset_rects=[Rectangle.from_json(i) for i in json['offsetRects']] if json.get('offsetRects', None) is not None else None,
-            scroll_rects=[Rectangle.from_json(i) for i in json['scrollRects']] if json.get('scrollRects', None) is not None else None,
-            client_rects=[Rectangle.from_json(i) for i in json['clientRects']] if json.get('clientRects', None) is not None else None,
-            blended_background_colors=[StringIndex.from_json(i) for i in json['blendedBackgroundColors']] if json.get('blendedBackgroundColors', None) is not None else None,
-            text_color_opacities=[float(i) for i in json['textColorOpacities']] if json.get('textColorOpacities', None) is not None else None,
+            list(json['nodeIndex']),
+            list(map(ArrayOfStrings, json['styles'])),
+            list(map(Rectangle, json['bounds'])),
+            list(map(StringIndex, json['text'])),
+            RareBooleanData.from_json(json['stackingContexts']),
+            list(v) if (v := get('paintOrders')) is not None else None,
+            list(map(Rectangle, v)) if (v := get('offsetRects')) is not None else None,
+            list(map(Rectangle, v)) if (v := get('scrollRects')) is not None else None,
+            list(map(Rectangle, v)) if (v := get('clientRects')) is not None else None,
+            list(map(StringIndex, v)) if (v := get('blendedBackgroundColors')) is not None else None,
+            list(map(float, v)) if (v := get('textColorOpacities')) is not None else None,
         )
 
 
@@ -760,10 +764,10 @@ class TextBoxSnapshot:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TextBoxSnapshot:
         return cls(
-            layout_index=[int(i) for i in json['layoutIndex']],
-            bounds=[Rectangle.from_json(i) for i in json['bounds']],
-            start=[int(i) for i in json['start']],
-            length=[int(i) for i in json['length']],
+            list(json['layoutIndex']),
+            list(map(Rectangle, json['bounds'])),
+            list(json['start']),
+            list(json['length']),
         )
 
 
@@ -787,6 +791,15 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('DOMSnapshot.getSnapshot')
+def _decode_get_snapshot(json: T_JSON_DICT) -> typing.Tuple[typing.List[DOMNode], typing.List[LayoutTreeNode], typing.List[ComputedStyle]]:
+    return (
+        [DOMNode.from_json(i) for i in json['domNodes']],
+        [LayoutTreeNode.from_json(i) for i in json['layoutTreeNodes']],
+        [ComputedStyle.from_json(i) for i in json['computedStyles']]
+    )
+
+
 @deprecated(version="1.3")
 def get_snapshot(
         computed_style_whitelist: typing.List[str],
@@ -825,10 +838,14 @@ def get_snapshot(
         'params': params,
     }
     json = yield cmd_dict
+    return _decode_get_snapshot(json)
+
+
+@command_decoder('DOMSnapshot.captureSnapshot')
+def _decode_capture_snapshot(json: T_JSON_DICT) -> typing.Tuple[typing.List[DocumentSnapshot], typing.List[str]]:
     return (
-        [DOMNode.from_json(i) for i in json['domNodes']],
-        [LayoutTreeNode.from_json(i) for i in json['layoutTreeNodes']],
-        [ComputedStyle.from_json(i) for i in json['computedStyles']]
+        [DocumentSnapshot.from_json(i) for i in json['documents']],
+        [str(i) for i in json['strings']]
     )
 
 
@@ -870,7 +887,4 @@ def capture_snapshot(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        [DocumentSnapshot.from_json(i) for i in json['documents']],
-        [str(i) for i in json['strings']]
-    )
+    return _decode_capture_snapshot(json)
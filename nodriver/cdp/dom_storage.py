@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 class SerializedStorageKey(str):
@@ -49,10 +48,11 @@ class StorageId:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StorageId:
+        get = json.get
         return cls(
-            is_local_storage=bool(json['isLocalStorage']),
-            security_origin=str(json['securityOrigin']) if json.get('securityOrigin', None) is not None else None,
-            storage_key=SerializedStorageKey.from_json(json['storageKey']) if json.get('storageKey', None) is not None else None,
+            json['isLocalStorage'],
+            get('securityOrigin'),
+            SerializedStorageKey(v) if (v := get('storageKey')) is not None else None,
         )
 
 
@@ -106,6 +106,11 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('DOMStorage.getDOMStorageItems')
+def _decode_get_dom_storage_items(json: T_JSON_DICT) -> typing.List[Item]:
+    return [Item.from_json(i) for i in json['entries']]
+
+
 def get_dom_storage_items(
         storage_id: StorageId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Item]]:
@@ -120,7 +125,7 @@ def get_dom_storage_items(
         'params': params,
     }
     json = yield cmd_dict
-    return [Item.from_json(i) for i in json['entries']]
+    return _decode_get_dom_storage_items(json)
 
 
 def remove_dom_storage_item(
@@ -172,9 +177,9 @@ class DomStorageItemAdded:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomStorageItemAdded:
         return cls(
-            storage_id=StorageId.from_json(json['storageId']),
-            key=str(json['key']),
-            new_value=str(json['newValue'])
+            StorageId.from_json(json['storageId']),
+            json['key'],
+            json['newValue'],
         )
 
 
@@ -187,8 +192,8 @@ class DomStorageItemRemoved:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomStorageItemRemoved:
         return cls(
-            storage_id=StorageId.from_json(json['storageId']),
-            key=str(json['key'])
+            StorageId.from_json(json['storageId']),
+            json['key'],
         )
 
 
@@ -203,10 +208,10 @@ class DomStorageItemUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomStorageItemUpdated:
         return cls(
-            storage_id=StorageId.from_json(json['storageId']),
-            key=str(json['key']),
-            old_value=str(json['oldValue']),
-            new_value=str(json['newValue'])
+            StorageId.from_json(json['storageId']),
+            json['key'],
+            json['oldValue'],
+            json['newValue'],
         )
 
 
@@ -218,5 +223,5 @@ class DomStorageItemsCleared:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomStorageItemsCleared:
         return cls(
-            storage_id=StorageId.from_json(json['storageId'])
+            StorageId.from_json(json['storageId']),
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import dom
 from . import network
@@ -37,8 +36,8 @@ class ScreenOrientation:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreenOrientation:
         return cls(
-            type_=str(json['type']),
-            angle=int(json['angle']),
+            json['type'],
+            json['angle'],
         )
 
 
@@ -66,9 +65,9 @@ class DisplayFeature:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DisplayFeature:
         return cls(
-            orientation=str(json['orientation']),
-            offset=int(json['offset']),
-            mask_length=int(json['maskLength']),
+            json['orientation'],
+            json['offset'],
+            json['maskLength'],
         )
 
 
@@ -85,7 +84,7 @@ class DevicePosture:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DevicePosture:
         return cls(
-            type_=str(json['type']),
+            json['type'],
         )
 
 
@@ -104,8 +103,8 @@ class MediaFeature:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> MediaFeature:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            json['name'],
+            json['value'],
         )
 
 
@@ -125,7 +124,10 @@ class VirtualTimePolicy(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> VirtualTimePolicy:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -146,8 +148,8 @@ class UserAgentBrandVersion:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> UserAgentBrandVersion:
         return cls(
-            brand=str(json['brand']),
-            version=str(json['version']),
+            json['brand'],
+            json['version'],
         )
 
 
@@ -200,17 +202,18 @@ class UserAgentMetadata:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> UserAgentMetadata:
+        get = json.get
         return cls(
-            platform=str(json['platform']),
-            platform_version=str(json['platformVersion']),
-            architecture=str(json['architecture']),
-            model=str(json['model']),
-            mobile=bool(json['mobile']),
-            brands=[UserAgentBrandVersion.from_json(i) for i in json['brands']] if json.get('brands', None) is not None else None,
-            full_version_list=[UserAgentBrandVersion.from_json(i) for i in json['fullVersionList']] if json.get('fullVersionList', None) is not None else None,
-            full_version=str(json['fullVersion']) if json.get('fullVersion', None) is not None else None,
-            bitness=str(json['bitness']) if json.get('bitness', None) is not None else None,
-            wow64=bool(json['wow64']) if json.get('wow64', None) is not None else None,
+            json['platform'],
+            json['platformVersion'],
+            json['architecture'],
+            json['model'],
+            json['mobile'],
+            list(map(UserAgentBrandVersion.from_json, v)) if (v := get('brands')) is not None else None,
+            list(map(UserAgentBrandVersion.from_json, v)) if (v := get('fullVersionList')) is not None else None,
+            get('fullVersion'),
+            get('bitness'),
+            get('wow64'),
         )
 
 
@@ -233,7 +236,10 @@ class SensorType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SensorType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -256,10 +262,11 @@ class SensorMetadata:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SensorMetadata:
+        get = json.get
         return cls(
-            available=bool(json['available']) if json.get('available', None) is not None else None,
-            minimum_frequency=float(json['minimumFrequency']) if json.get('minimumFrequency', None) is not None else None,
-            maximum_frequency=float(json['maximumFrequency']) if json.get('maximumFrequency', None) is not None else None,
+            get('available'),
+            float(v) if (v := get('minimumFrequency')) is not None else None,
+            float(v) if (v := get('maximumFrequency')) is not None else None,
         )
 
 
@@ -275,7 +282,7 @@ class SensorReadingSingle:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SensorReadingSingle:
         return cls(
-            value=float(json['value']),
+            float(json['value']),
         )
 
 
@@ -297,9 +304,9 @@ class SensorReadingXYZ:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SensorReadingXYZ:
         return cls(
-            x=float(json['x']),
-            y=float(json['y']),
-            z=float(json['z']),
+            float(json['x']),
+            float(json['y']),
+            float(json['z']),
         )
 
 
@@ -324,10 +331,10 @@ class SensorReadingQuaternion:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SensorReadingQuaternion:
         return cls(
-            x=float(json['x']),
-            y=float(json['y']),
-            z=float(json['z']),
-            w=float(json['w']),
+            float(json['x']),
+            float(json['y']),
+            float(json['z']),
+            float(json['w']),
         )
 
 
@@ -351,10 +358,11 @@ class SensorReading:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SensorReading:
+        get = json.get
         return cls(
-            single=SensorReadingSingle.from_json(json['single']) if json.get('single', None) is not None else None,
-            xyz=SensorReadingXYZ.from_json(json['xyz']) if json.get('xyz', None) is not None else None,
-            quaternion=SensorReadingQuaternion.from_json(json['quaternion']) if json.get('quaternion', None) is not None else None,
+            SensorReadingSingle.from_json(v) if (v := get('single')) is not None else None,
+            SensorReadingXYZ.from_json(v) if (v := get('xyz')) is not None else None,
+            SensorReadingQuaternion.from_json(v) if (v := get('quaternion')) is not None else None,
         )
 
 
@@ -366,7 +374,10 @@ class PressureSource(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PressureSource:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class PressureState(enum.Enum):
@@ -380,7 +391,10 @@ class PressureState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PressureState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -395,8 +409,9 @@ class PressureMetadata:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PressureMetadata:
+        get = json.get
         return cls(
-            available=bool(json['available']) if json.get('available', None) is not None else None,
+            get('available'),
         )
 
 
@@ -412,7 +427,15 @@ class DisabledImageType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DisabledImageType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
+
+
+@command_decoder('Emulation.canEmulate')
+def _decode_can_emulate(json: T_JSON_DICT) -> bool:
+    return bool(json['result'])
 
 
 @deprecated(version="1.3")
@@ -428,7 +451,7 @@ def can_emulate() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
         'method': 'Emulation.canEmulate',
     }
     json = yield cmd_dict
-    return bool(json['result'])
+    return _decode_can_emulate(json)
 
 
 def clear_device_metrics_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -768,6 +791,11 @@ def set_geolocation_override(
     json = yield cmd_dict
 
 
+@command_decoder('Emulation.getOverriddenSensorInformation')
+def _decode_get_overridden_sensor_information(json: T_JSON_DICT) -> float:
+    return float(json['requestedSamplingFrequency'])
+
+
 def get_overridden_sensor_information(
         type_: SensorType
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,float]:
@@ -786,7 +814,7 @@ def get_overridden_sensor_information(
         'params': params,
     }
     json = yield cmd_dict
-    return float(json['requestedSamplingFrequency'])
+    return _decode_get_overridden_sensor_information(json)
 
 
 def set_sensor_override_enabled(
@@ -1004,6 +1032,11 @@ def set_touch_emulation_enabled(
     json = yield cmd_dict
 
 
+@command_decoder('Emulation.setVirtualTimePolicy')
+def _decode_set_virtual_time_policy(json: T_JSON_DICT) -> float:
+    return float(json['virtualTimeTicksBase'])
+
+
 def set_virtual_time_policy(
         policy: VirtualTimePolicy,
         budget: typing.Optional[float] = None,
@@ -1035,7 +1068,7 @@ def set_virtual_time_policy(
         'params': params,
     }
     json = yield cmd_dict
-    return float(json['virtualTimeTicksBase'])
+    return _decode_set_virtual_time_policy(json)
 
 
 def set_locale_override(
@@ -1201,6 +1234,4 @@ class VirtualTimeBudgetExpired:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VirtualTimeBudgetExpired:
-        return cls(
-
-        )
+        return cls()
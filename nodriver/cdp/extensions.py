@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 class StorageArea(enum.Enum):
@@ -26,7 +25,15 @@ class StorageArea(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StorageArea:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
+
+
+@command_decoder('Extensions.loadUnpacked')
+def _decode_load_unpacked(json: T_JSON_DICT) -> str:
+    return str(json['id'])
 
 
 def load_unpacked(
@@ -49,7 +56,12 @@ def load_unpacked(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['id'])
+    return _decode_load_unpacked(json)
+
+
+@command_decoder('Extensions.getStorageItems')
+def _decode_get_storage_items(json: T_JSON_DICT) -> dict:
+    return dict(json['data'])
 
 
 def get_storage_items(
@@ -76,7 +88,7 @@ def get_storage_items(
         'params': params,
     }
     json = yield cmd_dict
-    return dict(json['data'])
+    return _decode_get_storage_items(json)
 
 
 def remove_storage_items(
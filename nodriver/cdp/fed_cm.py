@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 class LoginState(enum.Enum):
@@ -25,7 +24,10 @@ class LoginState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> LoginState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class DialogType(enum.Enum):
@@ -42,7 +44,10 @@ class DialogType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DialogType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class DialogButton(enum.Enum):
@@ -58,7 +63,10 @@ class DialogButton(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DialogButton:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class AccountUrlType(enum.Enum):
@@ -73,7 +81,10 @@ class AccountUrlType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AccountUrlType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -120,17 +131,18 @@ class Account:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Account:
+        get = json.get
         return cls(
-            account_id=str(json['accountId']),
-            email=str(json['email']),
-            name=str(json['name']),
-            given_name=str(json['givenName']),
-            picture_url=str(json['pictureUrl']),
-            idp_config_url=str(json['idpConfigUrl']),
-            idp_login_url=str(json['idpLoginUrl']),
-            login_state=LoginState.from_json(json['loginState']),
-            terms_of_service_url=str(json['termsOfServiceUrl']) if json.get('termsOfServiceUrl', None) is not None else None,
-            privacy_policy_url=str(json['privacyPolicyUrl']) if json.get('privacyPolicyUrl', None) is not None else None,
+            json['accountId'],
+            json['email'],
+            json['name'],
+            json['givenName'],
+            json['pictureUrl'],
+            json['idpConfigUrl'],
+            json['idpLoginUrl'],
+            LoginState.from_json(json['loginState']),
+            get('termsOfServiceUrl'),
+            get('privacyPolicyUrl'),
         )
 
 
@@ -258,12 +270,13 @@ class DialogShown:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DialogShown:
+        get = json.get
         return cls(
-            dialog_id=str(json['dialogId']),
-            dialog_type=DialogType.from_json(json['dialogType']),
-            accounts=[Account.from_json(i) for i in json['accounts']],
-            title=str(json['title']),
-            subtitle=str(json['subtitle']) if json.get('subtitle', None) is not None else None
+            json['dialogId'],
+            DialogType.from_json(json['dialogType']),
+            list(map(Account.from_json, json['accounts'])),
+            json['title'],
+            get('subtitle'),
         )
 
 
@@ -279,5 +292,5 @@ class DialogClosed:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DialogClosed:
         return cls(
-            dialog_id=str(json['dialogId'])
+            json['dialogId'],
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import io
 from . import network
@@ -47,7 +46,10 @@ class RequestStage(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> RequestStage:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -74,10 +76,11 @@ class RequestPattern:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestPattern:
+        get = json.get
         return cls(
-            url_pattern=str(json['urlPattern']) if json.get('urlPattern', None) is not None else None,
-            resource_type=network.ResourceType.from_json(json['resourceType']) if json.get('resourceType', None) is not None else None,
-            request_stage=RequestStage.from_json(json['requestStage']) if json.get('requestStage', None) is not None else None,
+            get('urlPattern'),
+            network.ResourceType.from_json(v) if (v := get('resourceType')) is not None else None,
+            RequestStage.from_json(v) if (v := get('requestStage')) is not None else None,
         )
 
 
@@ -99,8 +102,8 @@ class HeaderEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> HeaderEntry:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            json['name'],
+            json['value'],
         )
 
 
@@ -132,11 +135,12 @@ class AuthChallenge:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthChallenge:
+        get = json.get
         return cls(
-            origin=str(json['origin']),
-            scheme=str(json['scheme']),
-            realm=str(json['realm']),
-            source=str(json['source']) if json.get('source', None) is not None else None,
+            json['origin'],
+            json['scheme'],
+            json['realm'],
+            get('source'),
         )
 
 
@@ -169,10 +173,11 @@ class AuthChallengeResponse:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthChallengeResponse:
+        get = json.get
         return cls(
-            response=str(json['response']),
-            username=str(json['username']) if json.get('username', None) is not None else None,
-            password=str(json['password']) if json.get('password', None) is not None else None,
+            json['response'],
+            get('username'),
+            get('password'),
         )
 
 
@@ -359,6 +364,14 @@ def continue_response(
     json = yield cmd_dict
 
 
+@command_decoder('Fetch.getResponseBody')
+def _decode_get_response_body(json: T_JSON_DICT) -> typing.Tuple[str, bool]:
+    return (
+        str(json['body']),
+        bool(json['base64Encoded'])
+    )
+
+
 def get_response_body(
         request_id: RequestId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, bool]]:
@@ -387,10 +400,12 @@ def get_response_body(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        str(json['body']),
-        bool(json['base64Encoded'])
-    )
+    return _decode_get_response_body(json)
+
+
+@command_decoder('Fetch.takeResponseBodyAsStream')
+def _decode_take_response_body_as_stream(json: T_JSON_DICT) -> io.StreamHandle:
+    return io.StreamHandle.from_json(json['stream'])
 
 
 def take_response_body_as_stream(
@@ -418,7 +433,7 @@ def take_response_body_as_stream(
         'params': params,
     }
     json = yield cmd_dict
-    return io.StreamHandle.from_json(json['stream'])
+    return _decode_take_response_body_as_stream(json)
 
 
 @event_class('Fetch.requestPaused')
@@ -462,17 +477,18 @@ class RequestPaused:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestPaused:
+        get = json.get
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            request=network.Request.from_json(json['request']),
-            frame_id=page.FrameId.from_json(json['frameId']),
-            resource_type=network.ResourceType.from_json(json['resourceType']),
-            response_error_reason=network.ErrorReason.from_json(json['responseErrorReason']) if json.get('responseErrorReason', None) is not None else None,
-            response_status_code=int(json['responseStatusCode']) if json.get('responseStatusCode', None) is not None else None,
-            response_status_text=str(json['responseStatusText']) if json.get('responseStatusText', None) is not None else None,
-            response_headers=[HeaderEntry.from_json(i) for i in json['responseHeaders']] if json.get('responseHeaders', None) is not None else None,
-            network_id=network.RequestId.from_json(json['networkId']) if json.get('networkId', None) is not None else None,
-            redirected_request_id=RequestId.from_json(json['redirectedRequestId']) if json.get('redirectedRequestId', None) is not None else None
+            RequestId(json['requestId']),
+            network.Request.from_json(json['request']),
+            page.FrameId(json['frameId']),
+            network.ResourceType.from_json(json['resourceType']),
+            network.ErrorReason.from_json(v) if (v := get('responseErrorReason')) is not None else None,
+            get('responseStatusCode'),
+            get('responseStatusText'),
+            list(map(HeaderEntry.from_json, v)) if (v := get('responseHeaders')) is not None else None,
+            network.RequestId(v) if (v := get('networkId')) is not None else None,
+            RequestId(v) if (v := get('redirectedRequestId')) is not None else None,
         )
 
 
@@ -499,9 +515,9 @@ class AuthRequired:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthRequired:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            request=network.Request.from_json(json['request']),
-            frame_id=page.FrameId.from_json(json['frameId']),
-            resource_type=network.ResourceType.from_json(json['resourceType']),
-            auth_challenge=AuthChallenge.from_json(json['authChallenge'])
+            RequestId(json['requestId']),
+            network.Request.from_json(json['request']),
+            page.FrameId(json['frameId']),
+            network.ResourceType.from_json(json['resourceType']),
+            AuthChallenge.from_json(json['authChallenge']),
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import network
 from . import storage
@@ -38,10 +37,10 @@ class File:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> File:
         return cls(
-            name=str(json['name']),
-            last_modified=network.TimeSinceEpoch.from_json(json['lastModified']),
-            size=float(json['size']),
-            type_=str(json['type']),
+            json['name'],
+            network.TimeSinceEpoch(json['lastModified']),
+            float(json['size']),
+            json['type'],
         )
 
 
@@ -64,9 +63,9 @@ class Directory:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Directory:
         return cls(
-            name=str(json['name']),
-            nested_directories=[str(i) for i in json['nestedDirectories']],
-            nested_files=[File.from_json(i) for i in json['nestedFiles']],
+            json['name'],
+            list(json['nestedDirectories']),
+            list(map(File.from_json, json['nestedFiles'])),
         )
 
 
@@ -91,13 +90,19 @@ class BucketFileSystemLocator:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BucketFileSystemLocator:
+        get = json.get
         return cls(
-            storage_key=storage.SerializedStorageKey.from_json(json['storageKey']),
-            path_components=[str(i) for i in json['pathComponents']],
-            bucket_name=str(json['bucketName']) if json.get('bucketName', None) is not None else None,
+            storage.SerializedStorageKey(json['storageKey']),
+            list(json['pathComponents']),
+            get('bucketName'),
         )
 
 
+@command_decoder('FileSystem.getDirectory')
+def _decode_get_directory(json: T_JSON_DICT) -> Directory:
+    return Directory.from_json(json['directory'])
+
+
 def get_directory(
         bucket_file_system_locator: BucketFileSystemLocator
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Directory]:
@@ -112,4 +117,4 @@ def get_directory(
         'params': params,
     }
     json = yield cmd_dict
-    return Directory.from_json(json['directory'])
+    return _decode_get_directory(json)
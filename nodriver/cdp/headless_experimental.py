@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 from deprecated.sphinx import deprecated # type: ignore
@@ -41,13 +40,22 @@ class ScreenshotParams:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreenshotParams:
+        get = json.get
         return cls(
-            format_=str(json['format']) if json.get('format', None) is not None else None,
-            quality=int(json['quality']) if json.get('quality', None) is not None else None,
-            optimize_for_speed=bool(json['optimizeForSpeed']) if json.get('optimizeForSpeed', None) is not None else None,
+            get('format'),
+            get('quality'),
+            get('optimizeForSpeed'),
         )
 
 
+@command_decoder('HeadlessExperimental.beginFrame')
+def _decode_begin_frame(json: T_JSON_DICT) -> typing.Tuple[bool, typing.Optional[str]]:
+    return (
+        bool(json['hasDamage']),
+        str(json['screenshotData']) if json.get('screenshotData', None) is not None else None
+    )
+
+
 def begin_frame(
         frame_time_ticks: typing.Optional[float] = None,
         interval: typing.Optional[float] = None,
@@ -83,10 +91,7 @@ def begin_frame(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        bool(json['hasDamage']),
-        str(json['screenshotData']) if json.get('screenshotData', None) is not None else None
-    )
+    return _decode_begin_frame(json)
 
 
 @deprecated(version="1.3")
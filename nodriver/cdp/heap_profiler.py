@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import runtime
 
@@ -57,10 +56,10 @@ class SamplingHeapProfileNode:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SamplingHeapProfileNode:
         return cls(
-            call_frame=runtime.CallFrame.from_json(json['callFrame']),
-            self_size=float(json['selfSize']),
-            id_=int(json['id']),
-            children=[SamplingHeapProfileNode.from_json(i) for i in json['children']],
+            runtime.CallFrame.from_json(json['callFrame']),
+            float(json['selfSize']),
+            json['id'],
+            list(map(SamplingHeapProfileNode.from_json, json['children'])),
         )
 
 
@@ -89,9 +88,9 @@ class SamplingHeapProfileSample:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SamplingHeapProfileSample:
         return cls(
-            size=float(json['size']),
-            node_id=int(json['nodeId']),
-            ordinal=float(json['ordinal']),
+            float(json['size']),
+            json['nodeId'],
+            float(json['ordinal']),
         )
 
 
@@ -113,8 +112,8 @@ class SamplingHeapProfile:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SamplingHeapProfile:
         return cls(
-            head=SamplingHeapProfileNode.from_json(json['head']),
-            samples=[SamplingHeapProfileSample.from_json(i) for i in json['samples']],
+            SamplingHeapProfileNode.from_json(json['head']),
+            list(map(SamplingHeapProfileSample.from_json, json['samples'])),
         )
 
 
@@ -160,6 +159,11 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('HeapProfiler.getHeapObjectId')
+def _decode_get_heap_object_id(json: T_JSON_DICT) -> HeapSnapshotObjectId:
+    return HeapSnapshotObjectId.from_json(json['heapSnapshotObjectId'])
+
+
 def get_heap_object_id(
         object_id: runtime.RemoteObjectId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,HeapSnapshotObjectId]:
@@ -174,7 +178,12 @@ def get_heap_object_id(
         'params': params,
     }
     json = yield cmd_dict
-    return HeapSnapshotObjectId.from_json(json['heapSnapshotObjectId'])
+    return _decode_get_heap_object_id(json)
+
+
+@command_decoder('HeapProfiler.getObjectByHeapObjectId')
+def _decode_get_object_by_heap_object_id(json: T_JSON_DICT) -> runtime.RemoteObject:
+    return runtime.RemoteObject.from_json(json['result'])
 
 
 def get_object_by_heap_object_id(
@@ -195,7 +204,12 @@ def get_object_by_heap_object_id(
         'params': params,
     }
     json = yield cmd_dict
-    return runtime.RemoteObject.from_json(json['result'])
+    return _decode_get_object_by_heap_object_id(json)
+
+
+@command_decoder('HeapProfiler.getSamplingProfile')
+def _decode_get_sampling_profile(json: T_JSON_DICT) -> SamplingHeapProfile:
+    return SamplingHeapProfile.from_json(json['profile'])
 
 
 def get_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingHeapProfile]:
@@ -208,7 +222,7 @@ def get_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingH
         'method': 'HeapProfiler.getSamplingProfile',
     }
     json = yield cmd_dict
-    return SamplingHeapProfile.from_json(json['profile'])
+    return _decode_get_sampling_profile(json)
 
 
 def start_sampling(
@@ -251,6 +265,11 @@ def start_tracking_heap_objects(
     json = yield cmd_dict
 
 
+@command_decoder('HeapProfiler.stopSampling')
+def _decode_stop_sampling(json: T_JSON_DICT) -> SamplingHeapProfile:
+    return SamplingHeapProfile.from_json(json['profile'])
+
+
 def stop_sampling() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingHeapProfile]:
     '''
 
@@ -261,7 +280,7 @@ def stop_sampling() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingHeapProf
         'method': 'HeapProfiler.stopSampling',
     }
     json = yield cmd_dict
-    return SamplingHeapProfile.from_json(json['profile'])
+    return _decode_stop_sampling(json)
 
 
 def stop_tracking_heap_objects(
@@ -328,7 +347,7 @@ class AddHeapSnapshotChunk:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AddHeapSnapshotChunk:
         return cls(
-            chunk=str(json['chunk'])
+            json['chunk'],
         )
 
 
@@ -346,7 +365,7 @@ class HeapStatsUpdate:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> HeapStatsUpdate:
         return cls(
-            stats_update=[int(i) for i in json['statsUpdate']]
+            list(json['statsUpdate']),
         )
 
 
@@ -364,8 +383,8 @@ class LastSeenObjectId:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LastSeenObjectId:
         return cls(
-            last_seen_object_id=int(json['lastSeenObjectId']),
-            timestamp=float(json['timestamp'])
+            json['lastSeenObjectId'],
+            float(json['timestamp']),
         )
 
 
@@ -378,10 +397,11 @@ class ReportHeapSnapshotProgress:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReportHeapSnapshotProgress:
+        get = json.get
         return cls(
-            done=int(json['done']),
-            total=int(json['total']),
-            finished=bool(json['finished']) if json.get('finished', None) is not None else None
+            json['done'],
+            json['total'],
+            get('finished'),
         )
 
 
@@ -392,6 +412,4 @@ class ResetProfiles:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResetProfiles:
-        return cls(
-
-        )
+        return cls()
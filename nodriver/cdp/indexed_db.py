@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import runtime
 from . import storage
@@ -40,9 +39,9 @@ class DatabaseWithObjectStores:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DatabaseWithObjectStores:
         return cls(
-            name=str(json['name']),
-            version=float(json['version']),
-            object_stores=[ObjectStore.from_json(i) for i in json['objectStores']],
+            json['name'],
+            float(json['version']),
+            list(map(ObjectStore.from_json, json['objectStores'])),
         )
 
 
@@ -74,10 +73,10 @@ class ObjectStore:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ObjectStore:
         return cls(
-            name=str(json['name']),
-            key_path=KeyPath.from_json(json['keyPath']),
-            auto_increment=bool(json['autoIncrement']),
-            indexes=[ObjectStoreIndex.from_json(i) for i in json['indexes']],
+            json['name'],
+            KeyPath.from_json(json['keyPath']),
+            json['autoIncrement'],
+            list(map(ObjectStoreIndex.from_json, json['indexes'])),
         )
 
 
@@ -109,10 +108,10 @@ class ObjectStoreIndex:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ObjectStoreIndex:
         return cls(
-            name=str(json['name']),
-            key_path=KeyPath.from_json(json['keyPath']),
-            unique=bool(json['unique']),
-            multi_entry=bool(json['multiEntry']),
+            json['name'],
+            KeyPath.from_json(json['keyPath']),
+            json['unique'],
+            json['multiEntry'],
         )
 
 
@@ -151,12 +150,13 @@ class Key:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Key:
+        get = json.get
         return cls(
-            type_=str(json['type']),
-            number=float(json['number']) if json.get('number', None) is not None else None,
-            string=str(json['string']) if json.get('string', None) is not None else None,
-            date=float(json['date']) if json.get('date', None) is not None else None,
-            array=[Key.from_json(i) for i in json['array']] if json.get('array', None) is not None else None,
+            json['type'],
+            float(v) if (v := get('number')) is not None else None,
+            get('string'),
+            float(v) if (v := get('date')) is not None else None,
+            list(map(Key.from_json, v)) if (v := get('array')) is not None else None,
         )
 
 
@@ -189,11 +189,12 @@ class KeyRange:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> KeyRange:
+        get = json.get
         return cls(
-            lower_open=bool(json['lowerOpen']),
-            upper_open=bool(json['upperOpen']),
-            lower=Key.from_json(json['lower']) if json.get('lower', None) is not None else None,
-            upper=Key.from_json(json['upper']) if json.get('upper', None) is not None else None,
+            json['lowerOpen'],
+            json['upperOpen'],
+            Key.from_json(v) if (v := get('lower')) is not None else None,
+            Key.from_json(v) if (v := get('upper')) is not None else None,
         )
 
 
@@ -221,9 +222,9 @@ class DataEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DataEntry:
         return cls(
-            key=runtime.RemoteObject.from_json(json['key']),
-            primary_key=runtime.RemoteObject.from_json(json['primaryKey']),
-            value=runtime.RemoteObject.from_json(json['value']),
+            runtime.RemoteObject.from_json(json['key']),
+            runtime.RemoteObject.from_json(json['primaryKey']),
+            runtime.RemoteObject.from_json(json['value']),
         )
 
 
@@ -252,10 +253,11 @@ class KeyPath:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> KeyPath:
+        get = json.get
         return cls(
-            type_=str(json['type']),
-            string=str(json['string']) if json.get('string', None) is not None else None,
-            array=[str(i) for i in json['array']] if json.get('array', None) is not None else None,
+            json['type'],
+            get('string'),
+            list(v) if (v := get('array')) is not None else None,
         )
 
 
@@ -375,6 +377,14 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('IndexedDB.requestData')
+def _decode_request_data(json: T_JSON_DICT) -> typing.Tuple[typing.List[DataEntry], bool]:
+    return (
+        [DataEntry.from_json(i) for i in json['objectStoreDataEntries']],
+        bool(json['hasMore'])
+    )
+
+
 def request_data(
         database_name: str,
         object_store_name: str,
@@ -422,9 +432,14 @@ def request_data(
         'params': params,
     }
     json = yield cmd_dict
+    return _decode_request_data(json)
+
+
+@command_decoder('IndexedDB.getMetadata')
+def _decode_get_metadata(json: T_JSON_DICT) -> typing.Tuple[float, float]:
     return (
-        [DataEntry.from_json(i) for i in json['objectStoreDataEntries']],
-        bool(json['hasMore'])
+        float(json['entriesCount']),
+        float(json['keyGeneratorValue'])
     )
 
 
@@ -462,10 +477,12 @@ def get_metadata(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        float(json['entriesCount']),
-        float(json['keyGeneratorValue'])
-    )
+    return _decode_get_metadata(json)
+
+
+@command_decoder('IndexedDB.requestDatabase')
+def _decode_request_database(json: T_JSON_DICT) -> DatabaseWithObjectStores:
+    return DatabaseWithObjectStores.from_json(json['databaseWithObjectStores'])
 
 
 def request_database(
@@ -496,7 +513,12 @@ def request_database(
         'params': params,
     }
     json = yield cmd_dict
-    return DatabaseWithObjectStores.from_json(json['databaseWithObjectStores'])
+    return _decode_request_database(json)
+
+
+@command_decoder('IndexedDB.requestDatabaseNames')
+def _decode_request_database_names(json: T_JSON_DICT) -> typing.List[str]:
+    return [str(i) for i in json['databaseNames']]
 
 
 def request_database_names(
@@ -524,4 +546,4 @@ def request_database_names(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['databaseNames']]
+    return _decode_request_database_names(json)
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 @dataclass
@@ -74,18 +73,19 @@ class TouchPoint:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TouchPoint:
+        get = json.get
         return cls(
-            x=float(json['x']),
-            y=float(json['y']),
-            radius_x=float(json['radiusX']) if json.get('radiusX', None) is not None else None,
-            radius_y=float(json['radiusY']) if json.get('radiusY', None) is not None else None,
-            rotation_angle=float(json['rotationAngle']) if json.get('rotationAngle', None) is not None else None,
-            force=float(json['force']) if json.get('force', None) is not None else None,
-            tangential_pressure=float(json['tangentialPressure']) if json.get('tangentialPressure', None) is not None else None,
-            tilt_x=float(json['tiltX']) if json.get('tiltX', None) is not None else None,
-            tilt_y=float(json['tiltY']) if json.get('tiltY', None) is not None else None,
-            twist=int(json['twist']) if json.get('twist', None) is not None else None,
-            id_=float(json['id']) if json.get('id', None) is not None else None,
+            float(json['x']),
+            float(json['y']),
+            float(v) if (v := get('radiusX')) is not None else None,
+            float(v) if (v := get('radiusY')) is not None else None,
+            float(v) if (v := get('rotationAngle')) is not None else None,
+            float(v) if (v := get('force')) is not None else None,
+            float(v) if (v := get('tangentialPressure')) is not None else None,
+            float(v) if (v := get('tiltX')) is not None else None,
+            float(v) if (v := get('tiltY')) is not None else None,
+            get('twist'),
+            float(v) if (v := get('id')) is not None else None,
         )
 
 
@@ -99,7 +99,10 @@ class GestureSourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> GestureSourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class MouseButton(enum.Enum):
@@ -115,7 +118,10 @@ class MouseButton(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> MouseButton:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class TimeSinceEpoch(float):
@@ -161,11 +167,12 @@ class DragDataItem:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DragDataItem:
+        get = json.get
         return cls(
-            mime_type=str(json['mimeType']),
-            data=str(json['data']),
-            title=str(json['title']) if json.get('title', None) is not None else None,
-            base_url=str(json['baseURL']) if json.get('baseURL', None) is not None else None,
+            json['mimeType'],
+            json['data'],
+            get('title'),
+            get('baseURL'),
         )
 
 
@@ -189,10 +196,11 @@ class DragData:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DragData:
+        get = json.get
         return cls(
-            items=[DragDataItem.from_json(i) for i in json['items']],
-            drag_operations_mask=int(json['dragOperationsMask']),
-            files=[str(i) for i in json['files']] if json.get('files', None) is not None else None,
+            list(map(DragDataItem.from_json, json['items'])),
+            json['dragOperationsMask'],
+            list(v) if (v := get('files')) is not None else None,
         )
 
 
@@ -697,5 +705,5 @@ class DragIntercepted:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DragIntercepted:
         return cls(
-            data=DragData.from_json(json['data'])
+            DragData.from_json(json['data']),
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -44,7 +43,7 @@ class Detached:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Detached:
         return cls(
-            reason=str(json['reason'])
+            json['reason'],
         )
 
 
@@ -58,9 +57,7 @@ class TargetCrashed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetCrashed:
-        return cls(
-
-        )
+        return cls()
 
 
 @event_class('Inspector.targetReloadedAfterCrash')
@@ -73,6 +70,4 @@ class TargetReloadedAfterCrash:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetReloadedAfterCrash:
-        return cls(
-
-        )
+        return cls()
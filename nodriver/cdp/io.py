@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import runtime
 
@@ -47,6 +46,15 @@ def close(
     json = yield cmd_dict
 
 
+@command_decoder('IO.read')
+def _decode_read(json: T_JSON_DICT) -> typing.Tuple[typing.Optional[bool], str, bool]:
+    return (
+        bool(json['base64Encoded']) if json.get('base64Encoded', None) is not None else None,
+        str(json['data']),
+        bool(json['eof'])
+    )
+
+
 def read(
         handle: StreamHandle,
         offset: typing.Optional[int] = None,
@@ -75,11 +83,12 @@ def read(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        bool(json['base64Encoded']) if json.get('base64Encoded', None) is not None else None,
-        str(json['data']),
-        bool(json['eof'])
-    )
+    return _decode_read(json)
+
+
+@command_decoder('IO.resolveBlob')
+def _decode_resolve_blob(json: T_JSON_DICT) -> str:
+    return str(json['uuid'])
 
 
 def resolve_blob(
@@ -98,4 +107,4 @@ def resolve_blob(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['uuid'])
+    return _decode_resolve_blob(json)
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import dom
 
@@ -64,8 +63,8 @@ class ScrollRect:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScrollRect:
         return cls(
-            rect=dom.Rect.from_json(json['rect']),
-            type_=str(json['type']),
+            dom.Rect.from_json(json['rect']),
+            json['type'],
         )
 
 
@@ -98,11 +97,12 @@ class StickyPositionConstraint:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StickyPositionConstraint:
+        get = json.get
         return cls(
-            sticky_box_rect=dom.Rect.from_json(json['stickyBoxRect']),
-            containing_block_rect=dom.Rect.from_json(json['containingBlockRect']),
-            nearest_layer_shifting_sticky_box=LayerId.from_json(json['nearestLayerShiftingStickyBox']) if json.get('nearestLayerShiftingStickyBox', None) is not None else None,
-            nearest_layer_shifting_containing_block=LayerId.from_json(json['nearestLayerShiftingContainingBlock']) if json.get('nearestLayerShiftingContainingBlock', None) is not None else None,
+            dom.Rect.from_json(json['stickyBoxRect']),
+            dom.Rect.from_json(json['containingBlockRect']),
+            LayerId(v) if (v := get('nearestLayerShiftingStickyBox')) is not None else None,
+            LayerId(v) if (v := get('nearestLayerShiftingContainingBlock')) is not None else None,
         )
 
 
@@ -130,9 +130,9 @@ class PictureTile:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PictureTile:
         return cls(
-            x=float(json['x']),
-            y=float(json['y']),
-            picture=str(json['picture']),
+            float(json['x']),
+            float(json['y']),
+            json['picture'],
         )
 
 
@@ -221,23 +221,24 @@ class Layer:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Layer:
+        get = json.get
         return cls(
-            layer_id=LayerId.from_json(json['layerId']),
-            offset_x=float(json['offsetX']),
-            offset_y=float(json['offsetY']),
-            width=float(json['width']),
-            height=float(json['height']),
-            paint_count=int(json['paintCount']),
-            draws_content=bool(json['drawsContent']),
-            parent_layer_id=LayerId.from_json(json['parentLayerId']) if json.get('parentLayerId', None) is not None else None,
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']) if json.get('backendNodeId', None) is not None else None,
-            transform=[float(i) for i in json['transform']] if json.get('transform', None) is not None else None,
-            anchor_x=float(json['anchorX']) if json.get('anchorX', None) is not None else None,
-            anchor_y=float(json['anchorY']) if json.get('anchorY', None) is not None else None,
-            anchor_z=float(json['anchorZ']) if json.get('anchorZ', None) is not None else None,
-            invisible=bool(json['invisible']) if json.get('invisible', None) is not None else None,
-            scroll_rects=[ScrollRect.from_json(i) for i in json['scrollRects']] if json.get('scrollRects', None) is not None else None,
-            sticky_position_constraint=StickyPositionConstraint.from_json(json['stickyPositionConstraint']) if json.get('stickyPositionConstraint', None) is not None else None,
+            LayerId(json['layerId']),
+            float(json['offsetX']),
+            float(json['offsetY']),
+            float(json['width']),
+            float(json['height']),
+            json['paintCount'],
+            json['drawsContent'],
+            LayerId(v) if (v := get('parentLayerId')) is not None else None,
+            dom.BackendNodeId(v) if (v := get('backendNodeId')) is not None else None,
+            list(map(float, v)) if (v := get('transform')) is not None else None,
+            float(v) if (v := get('anchorX')) is not None else None,
+            float(v) if (v := get('anchorY')) is not None else None,
+            float(v) if (v := get('anchorZ')) is not None else None,
+            get('invisible'),
+            list(map(ScrollRect.from_json, v)) if (v := get('scrollRects')) is not None else None,
+            StickyPositionConstraint.from_json(v) if (v := get('stickyPositionConstraint')) is not None else None,
         )
 
 
@@ -256,6 +257,14 @@ class PaintProfile(list):
         return 'PaintProfile({})'.format(super().__repr__())
 
 
+@command_decoder('LayerTree.compositingReasons')
+def _decode_compositing_reasons(json: T_JSON_DICT) -> typing.Tuple[typing.List[str], typing.List[str]]:
+    return (
+        [str(i) for i in json['compositingReasons']],
+        [str(i) for i in json['compositingReasonIds']]
+    )
+
+
 def compositing_reasons(
         layer_id: LayerId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[str], typing.List[str]]]:
@@ -275,10 +284,7 @@ def compositing_reasons(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        [str(i) for i in json['compositingReasons']],
-        [str(i) for i in json['compositingReasonIds']]
-    )
+    return _decode_compositing_reasons(json)
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -301,6 +307,11 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('LayerTree.loadSnapshot')
+def _decode_load_snapshot(json: T_JSON_DICT) -> SnapshotId:
+    return SnapshotId.from_json(json['snapshotId'])
+
+
 def load_snapshot(
         tiles: typing.List[PictureTile]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SnapshotId]:
@@ -317,6 +328,11 @@ def load_snapshot(
         'params': params,
     }
     json = yield cmd_dict
+    return _decode_load_snapshot(json)
+
+
+@command_decoder('LayerTree.makeSnapshot')
+def _decode_make_snapshot(json: T_JSON_DICT) -> SnapshotId:
     return SnapshotId.from_json(json['snapshotId'])
 
 
@@ -336,7 +352,12 @@ def make_snapshot(
         'params': params,
     }
     json = yield cmd_dict
-    return SnapshotId.from_json(json['snapshotId'])
+    return _decode_make_snapshot(json)
+
+
+@command_decoder('LayerTree.profileSnapshot')
+def _decode_profile_snapshot(json: T_JSON_DICT) -> typing.List[PaintProfile]:
+    return [PaintProfile.from_json(i) for i in json['timings']]
 
 
 def profile_snapshot(
@@ -365,7 +386,7 @@ def profile_snapshot(
         'params': params,
     }
     json = yield cmd_dict
-    return [PaintProfile.from_json(i) for i in json['timings']]
+    return _decode_profile_snapshot(json)
 
 
 def release_snapshot(
@@ -385,6 +406,11 @@ def release_snapshot(
     json = yield cmd_dict
 
 
+@command_decoder('LayerTree.replaySnapshot')
+def _decode_replay_snapshot(json: T_JSON_DICT) -> str:
+    return str(json['dataURL'])
+
+
 def replay_snapshot(
         snapshot_id: SnapshotId,
         from_step: typing.Optional[int] = None,
@@ -413,7 +439,12 @@ def replay_snapshot(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['dataURL'])
+    return _decode_replay_snapshot(json)
+
+
+@command_decoder('LayerTree.snapshotCommandLog')
+def _decode_snapshot_command_log(json: T_JSON_DICT) -> typing.List[dict]:
+    return [dict(i) for i in json['commandLog']]
 
 
 def snapshot_command_log(
@@ -432,7 +463,7 @@ def snapshot_command_log(
         'params': params,
     }
     json = yield cmd_dict
-    return [dict(i) for i in json['commandLog']]
+    return _decode_snapshot_command_log(json)
 
 
 @event_class('LayerTree.layerPainted')
@@ -446,8 +477,8 @@ class LayerPainted:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayerPainted:
         return cls(
-            layer_id=LayerId.from_json(json['layerId']),
-            clip=dom.Rect.from_json(json['clip'])
+            LayerId(json['layerId']),
+            dom.Rect.from_json(json['clip']),
         )
 
 
@@ -459,6 +490,7 @@ class LayerTreeDidChange:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayerTreeDidChange:
+        get = json.get
         return cls(
-            layers=[Layer.from_json(i) for i in json['layers']] if json.get('layers', None) is not None else None
+            list(map(Layer.from_json, v)) if (v := get('layers')) is not None else None,
         )
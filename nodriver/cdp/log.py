@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import network
 from . import runtime
@@ -76,18 +75,19 @@ class LogEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LogEntry:
+        get = json.get
         return cls(
-            source=str(json['source']),
-            level=str(json['level']),
-            text=str(json['text']),
-            timestamp=runtime.Timestamp.from_json(json['timestamp']),
-            category=str(json['category']) if json.get('category', None) is not None else None,
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            line_number=int(json['lineNumber']) if json.get('lineNumber', None) is not None else None,
-            stack_trace=runtime.StackTrace.from_json(json['stackTrace']) if json.get('stackTrace', None) is not None else None,
-            network_request_id=network.RequestId.from_json(json['networkRequestId']) if json.get('networkRequestId', None) is not None else None,
-            worker_id=str(json['workerId']) if json.get('workerId', None) is not None else None,
-            args=[runtime.RemoteObject.from_json(i) for i in json['args']] if json.get('args', None) is not None else None,
+            json['source'],
+            json['level'],
+            json['text'],
+            runtime.Timestamp(json['timestamp']),
+            get('category'),
+            get('url'),
+            get('lineNumber'),
+            runtime.StackTrace.from_json(v) if (v := get('stackTrace')) is not None else None,
+            network.RequestId(v) if (v := get('networkRequestId')) is not None else None,
+            get('workerId'),
+            list(map(runtime.RemoteObject.from_json, v)) if (v := get('args')) is not None else None,
         )
 
 
@@ -111,8 +111,8 @@ class ViolationSetting:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ViolationSetting:
         return cls(
-            name=str(json['name']),
-            threshold=float(json['threshold']),
+            json['name'],
+            float(json['threshold']),
         )
 
 
@@ -186,5 +186,5 @@ class EntryAdded:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> EntryAdded:
         return cls(
-            entry=LogEntry.from_json(json['entry'])
+            LogEntry.from_json(json['entry']),
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 class PlayerId(str):
@@ -67,8 +66,8 @@ class PlayerMessage:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerMessage:
         return cls(
-            level=str(json['level']),
-            message=str(json['message']),
+            json['level'],
+            json['message'],
         )
 
 
@@ -90,8 +89,8 @@ class PlayerProperty:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerProperty:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            json['name'],
+            json['value'],
         )
 
 
@@ -113,8 +112,8 @@ class PlayerEvent:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerEvent:
         return cls(
-            timestamp=Timestamp.from_json(json['timestamp']),
-            value=str(json['value']),
+            Timestamp(json['timestamp']),
+            json['value'],
         )
 
 
@@ -137,8 +136,8 @@ class PlayerErrorSourceLocation:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerErrorSourceLocation:
         return cls(
-            file=str(json['file']),
-            line=int(json['line']),
+            json['file'],
+            json['line'],
         )
 
 
@@ -175,11 +174,11 @@ class PlayerError:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerError:
         return cls(
-            error_type=str(json['errorType']),
-            code=int(json['code']),
-            stack=[PlayerErrorSourceLocation.from_json(i) for i in json['stack']],
-            cause=[PlayerError.from_json(i) for i in json['cause']],
-            data=dict(json['data']),
+            json['errorType'],
+            json['code'],
+            list(map(PlayerErrorSourceLocation.from_json, json['stack'])),
+            list(map(PlayerError.from_json, json['cause'])),
+            json['data'],
         )
 
 
@@ -216,8 +215,8 @@ class PlayerPropertiesChanged:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerPropertiesChanged:
         return cls(
-            player_id=PlayerId.from_json(json['playerId']),
-            properties=[PlayerProperty.from_json(i) for i in json['properties']]
+            PlayerId(json['playerId']),
+            list(map(PlayerProperty.from_json, json['properties'])),
         )
 
 
@@ -234,8 +233,8 @@ class PlayerEventsAdded:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerEventsAdded:
         return cls(
-            player_id=PlayerId.from_json(json['playerId']),
-            events=[PlayerEvent.from_json(i) for i in json['events']]
+            PlayerId(json['playerId']),
+            list(map(PlayerEvent.from_json, json['events'])),
         )
 
 
@@ -251,8 +250,8 @@ class PlayerMessagesLogged:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerMessagesLogged:
         return cls(
-            player_id=PlayerId.from_json(json['playerId']),
-            messages=[PlayerMessage.from_json(i) for i in json['messages']]
+            PlayerId(json['playerId']),
+            list(map(PlayerMessage.from_json, json['messages'])),
         )
 
 
@@ -268,8 +267,8 @@ class PlayerErrorsRaised:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayerErrorsRaised:
         return cls(
-            player_id=PlayerId.from_json(json['playerId']),
-            errors=[PlayerError.from_json(i) for i in json['errors']]
+            PlayerId(json['playerId']),
+            list(map(PlayerError.from_json, json['errors'])),
         )
 
 
@@ -286,5 +285,5 @@ class PlayersCreated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PlayersCreated:
         return cls(
-            players=[PlayerId.from_json(i) for i in json['players']]
+            list(map(PlayerId, json['players'])),
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 class PressureLevel(enum.Enum):
@@ -24,7 +23,10 @@ class PressureLevel(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PressureLevel:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -51,9 +53,9 @@ class SamplingProfileNode:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SamplingProfileNode:
         return cls(
-            size=float(json['size']),
-            total=float(json['total']),
-            stack=[str(i) for i in json['stack']],
+            float(json['size']),
+            float(json['total']),
+            list(json['stack']),
         )
 
 
@@ -75,8 +77,8 @@ class SamplingProfile:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SamplingProfile:
         return cls(
-            samples=[SamplingProfileNode.from_json(i) for i in json['samples']],
-            modules=[Module.from_json(i) for i in json['modules']],
+            list(map(SamplingProfileNode.from_json, json['samples'])),
+            list(map(Module.from_json, json['modules'])),
         )
 
 
@@ -109,10 +111,10 @@ class Module:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Module:
         return cls(
-            name=str(json['name']),
-            uuid=str(json['uuid']),
-            base_address=str(json['baseAddress']),
-            size=float(json['size']),
+            json['name'],
+            json['uuid'],
+            json['baseAddress'],
+            float(json['size']),
         )
 
 
@@ -137,11 +139,20 @@ class DOMCounter:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DOMCounter:
         return cls(
-            name=str(json['name']),
-            count=int(json['count']),
+            json['name'],
+            json['count'],
         )
 
 
+@command_decoder('Memory.getDOMCounters')
+def _decode_get_dom_counters(json: T_JSON_DICT) -> typing.Tuple[int, int, int]:
+    return (
+        int(json['documents']),
+        int(json['nodes']),
+        int(json['jsEventListeners'])
+    )
+
+
 def get_dom_counters() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[int, int, int]]:
     '''
     Retruns current DOM object counters.
@@ -156,11 +167,12 @@ def get_dom_counters() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[
         'method': 'Memory.getDOMCounters',
     }
     json = yield cmd_dict
-    return (
-        int(json['documents']),
-        int(json['nodes']),
-        int(json['jsEventListeners'])
-    )
+    return _decode_get_dom_counters(json)
+
+
+@command_decoder('Memory.getDOMCountersForLeakDetection')
+def _decode_get_dom_counters_for_leak_detection(json: T_JSON_DICT) -> typing.List[DOMCounter]:
+    return [DOMCounter.from_json(i) for i in json['counters']]
 
 
 def get_dom_counters_for_leak_detection() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[DOMCounter]]:
@@ -173,7 +185,7 @@ def get_dom_counters_for_leak_detection() -> typing.Generator[T_JSON_DICT,T_JSON
         'method': 'Memory.getDOMCountersForLeakDetection',
     }
     json = yield cmd_dict
-    return [DOMCounter.from_json(i) for i in json['counters']]
+    return _decode_get_dom_counters_for_leak_detection(json)
 
 
 def prepare_for_leak_detection() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -263,6 +275,11 @@ def stop_sampling() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('Memory.getAllTimeSamplingProfile')
+def _decode_get_all_time_sampling_profile(json: T_JSON_DICT) -> SamplingProfile:
+    return SamplingProfile.from_json(json['profile'])
+
+
 def get_all_time_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingProfile]:
     '''
     Retrieve native memory allocations profile
@@ -274,6 +291,11 @@ def get_all_time_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,
         'method': 'Memory.getAllTimeSamplingProfile',
     }
     json = yield cmd_dict
+    return _decode_get_all_time_sampling_profile(json)
+
+
+@command_decoder('Memory.getBrowserSamplingProfile')
+def _decode_get_browser_sampling_profile(json: T_JSON_DICT) -> SamplingProfile:
     return SamplingProfile.from_json(json['profile'])
 
 
@@ -288,6 +310,11 @@ def get_browser_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,S
         'method': 'Memory.getBrowserSamplingProfile',
     }
     json = yield cmd_dict
+    return _decode_get_browser_sampling_profile(json)
+
+
+@command_decoder('Memory.getSamplingProfile')
+def _decode_get_sampling_profile(json: T_JSON_DICT) -> SamplingProfile:
     return SamplingProfile.from_json(json['profile'])
 
 
@@ -302,4 +329,4 @@ def get_sampling_profile() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SamplingP
         'method': 'Memory.getSamplingProfile',
     }
     json = yield cmd_dict
-    return SamplingProfile.from_json(json['profile'])
+    return _decode_get_sampling_profile(json)
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import debugger
 from . import emulation
@@ -48,7 +47,10 @@ class ResourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ResourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class LoaderId(str):
@@ -122,7 +124,10 @@ class ErrorReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ErrorReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class TimeSinceEpoch(float):
@@ -189,7 +194,10 @@ class ConnectionType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ConnectionType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class CookieSameSite(enum.Enum):
@@ -206,7 +214,10 @@ class CookieSameSite(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieSameSite:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class CookiePriority(enum.Enum):
@@ -223,7 +234,10 @@ class CookiePriority(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookiePriority:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class CookieSourceScheme(enum.Enum):
@@ -241,7 +255,10 @@ class CookieSourceScheme(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieSourceScheme:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -342,28 +359,29 @@ class ResourceTiming:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResourceTiming:
+        get = json.get
         return cls(
-            request_time=float(json['requestTime']),
-            proxy_start=float(json['proxyStart']),
-            proxy_end=float(json['proxyEnd']),
-            dns_start=float(json['dnsStart']),
-            dns_end=float(json['dnsEnd']),
-            connect_start=float(json['connectStart']),
-            connect_end=float(json['connectEnd']),
-            ssl_start=float(json['sslStart']),
-            ssl_end=float(json['sslEnd']),
-            worker_start=float(json['workerStart']),
-            worker_ready=float(json['workerReady']),
-            worker_fetch_start=float(json['workerFetchStart']),
-            worker_respond_with_settled=float(json['workerRespondWithSettled']),
-            send_start=float(json['sendStart']),
-            send_end=float(json['sendEnd']),
-            push_start=float(json['pushStart']),
-            push_end=float(json['pushEnd']),
-            receive_headers_start=float(json['receiveHeadersStart']),
-            receive_headers_end=float(json['receiveHeadersEnd']),
-            worker_router_evaluation_start=float(json['workerRouterEvaluationStart']) if json.get('workerRouterEvaluationStart', None) is not None else None,
-            worker_cache_lookup_start=float(json['workerCacheLookupStart']) if json.get('workerCacheLookupStart', None) is not None else None,
+            float(json['requestTime']),
+            float(json['proxyStart']),
+            float(json['proxyEnd']),
+            float(json['dnsStart']),
+            float(json['dnsEnd']),
+            float(json['connectStart']),
+            float(json['connectEnd']),
+            float(json['sslStart']),
+            float(json['sslEnd']),
+            float(json['workerStart']),
+            float(json['workerReady']),
+            float(json['workerFetchStart']),
+            float(json['workerRespondWithSettled']),
+            float(json['sendStart']),
+            float(json['sendEnd']),
+            float(json['pushStart']),
+            float(json['pushEnd']),
+            float(json['receiveHeadersStart']),
+            float(json['receiveHeadersEnd']),
+            float(v) if (v := get('workerRouterEvaluationStart')) is not None else None,
+            float(v) if (v := get('workerCacheLookupStart')) is not None else None,
         )
 
 
@@ -382,7 +400,10 @@ class ResourcePriority(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ResourcePriority:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -400,8 +421,9 @@ class PostDataEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PostDataEntry:
+        get = json.get
         return cls(
-            bytes_=str(json['bytes']) if json.get('bytes', None) is not None else None,
+            get('bytes'),
         )
 
 
@@ -479,20 +501,21 @@ class Request:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Request:
+        get = json.get
         return cls(
-            url=str(json['url']),
-            method=str(json['method']),
-            headers=Headers.from_json(json['headers']),
-            initial_priority=ResourcePriority.from_json(json['initialPriority']),
-            referrer_policy=str(json['referrerPolicy']),
-            url_fragment=str(json['urlFragment']) if json.get('urlFragment', None) is not None else None,
-            post_data=str(json['postData']) if json.get('postData', None) is not None else None,
-            has_post_data=bool(json['hasPostData']) if json.get('hasPostData', None) is not None else None,
-            post_data_entries=[PostDataEntry.from_json(i) for i in json['postDataEntries']] if json.get('postDataEntries', None) is not None else None,
-            mixed_content_type=security.MixedContentType.from_json(json['mixedContentType']) if json.get('mixedContentType', None) is not None else None,
-            is_link_preload=bool(json['isLinkPreload']) if json.get('isLinkPreload', None) is not None else None,
-            trust_token_params=TrustTokenParams.from_json(json['trustTokenParams']) if json.get('trustTokenParams', None) is not None else None,
-            is_same_site=bool(json['isSameSite']) if json.get('isSameSite', None) is not None else None,
+            json['url'],
+            json['method'],
+            Headers(json['headers']),
+            ResourcePriority.from_json(json['initialPriority']),
+            json['referrerPolicy'],
+            get('urlFragment'),
+            get('postData'),
+            get('hasPostData'),
+            list(map(PostDataEntry.from_json, v)) if (v := get('postDataEntries')) is not None else None,
+            security.MixedContentType.from_json(v) if (v := get('mixedContentType')) is not None else None,
+            get('isLinkPreload'),
+            TrustTokenParams.from_json(v) if (v := get('trustTokenParams')) is not None else None,
+            get('isSameSite'),
         )
 
 
@@ -541,14 +564,14 @@ class SignedCertificateTimestamp:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedCertificateTimestamp:
         return cls(
-            status=str(json['status']),
-            origin=str(json['origin']),
-            log_description=str(json['logDescription']),
-            log_id=str(json['logId']),
-            timestamp=float(json['timestamp']),
-            hash_algorithm=str(json['hashAlgorithm']),
-            signature_algorithm=str(json['signatureAlgorithm']),
-            signature_data=str(json['signatureData']),
+            json['status'],
+            json['origin'],
+            json['logDescription'],
+            json['logId'],
+            float(json['timestamp']),
+            json['hashAlgorithm'],
+            json['signatureAlgorithm'],
+            json['signatureData'],
         )
 
 
@@ -628,22 +651,23 @@ class SecurityDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SecurityDetails:
+        get = json.get
         return cls(
-            protocol=str(json['protocol']),
-            key_exchange=str(json['keyExchange']),
-            cipher=str(json['cipher']),
-            certificate_id=security.CertificateId.from_json(json['certificateId']),
-            subject_name=str(json['subjectName']),
-            san_list=[str(i) for i in json['sanList']],
-            issuer=str(json['issuer']),
-            valid_from=TimeSinceEpoch.from_json(json['validFrom']),
-            valid_to=TimeSinceEpoch.from_json(json['validTo']),
-            signed_certificate_timestamp_list=[SignedCertificateTimestamp.from_json(i) for i in json['signedCertificateTimestampList']],
-            certificate_transparency_compliance=CertificateTransparencyCompliance.from_json(json['certificateTransparencyCompliance']),
-            encrypted_client_hello=bool(json['encryptedClientHello']),
-            key_exchange_group=str(json['keyExchangeGroup']) if json.get('keyExchangeGroup', None) is not None else None,
-            mac=str(json['mac']) if json.get('mac', None) is not None else None,
-            server_signature_algorithm=int(json['serverSignatureAlgorithm']) if json.get('serverSignatureAlgorithm', None) is not None else None,
+            json['protocol'],
+            json['keyExchange'],
+            json['cipher'],
+            security.CertificateId(json['certificateId']),
+            json['subjectName'],
+            list(json['sanList']),
+            json['issuer'],
+            TimeSinceEpoch(json['validFrom']),
+            TimeSinceEpoch(json['validTo']),
+            list(map(SignedCertificateTimestamp.from_json, json['signedCertificateTimestampList'])),
+            CertificateTransparencyCompliance.from_json(json['certificateTransparencyCompliance']),
+            json['encryptedClientHello'],
+            get('keyExchangeGroup'),
+            get('mac'),
+            get('serverSignatureAlgorithm'),
         )
 
 
@@ -660,7 +684,10 @@ class CertificateTransparencyCompliance(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CertificateTransparencyCompliance:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class BlockedReason(enum.Enum):
@@ -687,7 +714,10 @@ class BlockedReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BlockedReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class CorsError(enum.Enum):
@@ -734,7 +764,10 @@ class CorsError(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CorsError:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -752,8 +785,8 @@ class CorsErrorStatus:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CorsErrorStatus:
         return cls(
-            cors_error=CorsError.from_json(json['corsError']),
-            failed_parameter=str(json['failedParameter']),
+            CorsError.from_json(json['corsError']),
+            json['failedParameter'],
         )
 
 
@@ -771,7 +804,10 @@ class ServiceWorkerResponseSource(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceWorkerResponseSource:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -801,10 +837,11 @@ class TrustTokenParams:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TrustTokenParams:
+        get = json.get
         return cls(
-            operation=TrustTokenOperationType.from_json(json['operation']),
-            refresh_policy=str(json['refreshPolicy']),
-            issuers=[str(i) for i in json['issuers']] if json.get('issuers', None) is not None else None,
+            TrustTokenOperationType.from_json(json['operation']),
+            json['refreshPolicy'],
+            list(v) if (v := get('issuers')) is not None else None,
         )
 
 
@@ -818,7 +855,10 @@ class TrustTokenOperationType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> TrustTokenOperationType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class AlternateProtocolUsage(enum.Enum):
@@ -839,7 +879,10 @@ class AlternateProtocolUsage(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AlternateProtocolUsage:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class ServiceWorkerRouterSource(enum.Enum):
@@ -856,7 +899,10 @@ class ServiceWorkerRouterSource(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceWorkerRouterSource:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -884,10 +930,11 @@ class ServiceWorkerRouterInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerRouterInfo:
+        get = json.get
         return cls(
-            rule_id_matched=int(json['ruleIdMatched']) if json.get('ruleIdMatched', None) is not None else None,
-            matched_source_type=ServiceWorkerRouterSource.from_json(json['matchedSourceType']) if json.get('matchedSourceType', None) is not None else None,
-            actual_source_type=ServiceWorkerRouterSource.from_json(json['actualSourceType']) if json.get('actualSourceType', None) is not None else None,
+            get('ruleIdMatched'),
+            ServiceWorkerRouterSource.from_json(v) if (v := get('matchedSourceType')) is not None else None,
+            ServiceWorkerRouterSource.from_json(v) if (v := get('actualSourceType')) is not None else None,
         )
 
 
@@ -1030,34 +1077,35 @@ class Response:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Response:
+        get = json.get
         return cls(
-            url=str(json['url']),
-            status=int(json['status']),
-            status_text=str(json['statusText']),
-            headers=Headers.from_json(json['headers']),
-            mime_type=str(json['mimeType']),
-            charset=str(json['charset']),
-            connection_reused=bool(json['connectionReused']),
-            connection_id=float(json['connectionId']),
-            encoded_data_length=float(json['encodedDataLength']),
-            security_state=security.SecurityState.from_json(json['securityState']),
-            headers_text=str(json['headersText']) if json.get('headersText', None) is not None else None,
-            request_headers=Headers.from_json(json['requestHeaders']) if json.get('requestHeaders', None) is not None else None,
-            request_headers_text=str(json['requestHeadersText']) if json.get('requestHeadersText', None) is not None else None,
-            remote_ip_address=str(json['remoteIPAddress']) if json.get('remoteIPAddress', None) is not None else None,
-            remote_port=int(json['remotePort']) if json.get('remotePort', None) is not None else None,
-            from_disk_cache=bool(json['fromDiskCache']) if json.get('fromDiskCache', None) is not None else None,
-            from_service_worker=bool(json['fromServiceWorker']) if json.get('fromServiceWorker', None) is not None else None,
-            from_prefetch_cache=bool(json['fromPrefetchCache']) if json.get('fromPrefetchCache', None) is not None else None,
-            from_early_hints=bool(json['fromEarlyHints']) if json.get('fromEarlyHints', None) is not None else None,
-            service_worker_router_info=ServiceWorkerRouterInfo.from_json(json['serviceWorkerRouterInfo']) if json.get('serviceWorkerRouterInfo', None) is not None else None,
-            timing=ResourceTiming.from_json(json['timing']) if json.get('timing', None) is not None else None,
-            service_worker_response_source=ServiceWorkerResponseSource.from_json(json['serviceWorkerResponseSource']) if json.get('serviceWorkerResponseSource', None) is not None else None,
-            response_time=TimeSinceEpoch.from_json(json['responseTime']) if json.get('responseTime', None) is not None else None,
-            cache_storage_cache_name=str(json['cacheStorageCacheName']) if json.get('cacheStorageCacheName', None) is not None else None,
-            protocol=str(json['protocol']) if json.get('protocol', None) is not None else None,
-            alternate_protocol_usage=AlternateProtocolUsage.from_json(json['alternateProtocolUsage']) if json.get('alternateProtocolUsage', None) is not None else None,
-            security_details=SecurityDetails.from_json(json['securityDetails']) if json.get('securityDetails', None) is not None else None,
+            json['url'],
+            json['status'],
+            json['statusText'],
+            Headers(json['headers']),
+            json['mimeType'],
+            json['charset'],
+            json['connectionReused'],
+            float(json['connectionId']),
+            float(json['encodedDataLength']),
+            security.SecurityState.from_json(json['securityState']),
+            get('headersText'),
+            Headers(v) if (v := get('requestHeaders')) is not None else None,
+            get('requestHeadersText'),
+            get('remoteIPAddress'),
+            get('remotePort'),
+            get('fromDiskCache'),
+            get('fromServiceWorker'),
+            get('fromPrefetchCache'),
+            get('fromEarlyHints'),
+            ServiceWorkerRouterInfo.from_json(v) if (v := get('serviceWorkerRouterInfo')) is not None else None,
+            ResourceTiming.from_json(v) if (v := get('timing')) is not None else None,
+            ServiceWorkerResponseSource.from_json(v) if (v := get('serviceWorkerResponseSource')) is not None else None,
+            TimeSinceEpoch(v) if (v := get('responseTime')) is not None else None,
+            get('cacheStorageCacheName'),
+            get('protocol'),
+            AlternateProtocolUsage.from_json(v) if (v := get('alternateProtocolUsage')) is not None else None,
+            SecurityDetails.from_json(v) if (v := get('securityDetails')) is not None else None,
         )
 
 
@@ -1077,7 +1125,7 @@ class WebSocketRequest:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketRequest:
         return cls(
-            headers=Headers.from_json(json['headers']),
+            Headers(json['headers']),
         )
 
 
@@ -1119,13 +1167,14 @@ class WebSocketResponse:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketResponse:
+        get = json.get
         return cls(
-            status=int(json['status']),
-            status_text=str(json['statusText']),
-            headers=Headers.from_json(json['headers']),
-            headers_text=str(json['headersText']) if json.get('headersText', None) is not None else None,
-            request_headers=Headers.from_json(json['requestHeaders']) if json.get('requestHeaders', None) is not None else None,
-            request_headers_text=str(json['requestHeadersText']) if json.get('requestHeadersText', None) is not None else None,
+            json['status'],
+            json['statusText'],
+            Headers(json['headers']),
+            get('headersText'),
+            Headers(v) if (v := get('requestHeaders')) is not None else None,
+            get('requestHeadersText'),
         )
 
 
@@ -1155,9 +1204,9 @@ class WebSocketFrame:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketFrame:
         return cls(
-            opcode=float(json['opcode']),
-            mask=bool(json['mask']),
-            payload_data=str(json['payloadData']),
+            float(json['opcode']),
+            json['mask'],
+            json['payloadData'],
         )
 
 
@@ -1189,11 +1238,12 @@ class CachedResource:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CachedResource:
+        get = json.get
         return cls(
-            url=str(json['url']),
-            type_=ResourceType.from_json(json['type']),
-            body_size=float(json['bodySize']),
-            response=Response.from_json(json['response']) if json.get('response', None) is not None else None,
+            json['url'],
+            ResourceType.from_json(json['type']),
+            float(json['bodySize']),
+            Response.from_json(v) if (v := get('response')) is not None else None,
         )
 
 
@@ -1240,13 +1290,14 @@ class Initiator:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Initiator:
+        get = json.get
         return cls(
-            type_=str(json['type']),
-            stack=runtime.StackTrace.from_json(json['stack']) if json.get('stack', None) is not None else None,
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            line_number=float(json['lineNumber']) if json.get('lineNumber', None) is not None else None,
-            column_number=float(json['columnNumber']) if json.get('columnNumber', None) is not None else None,
-            request_id=RequestId.from_json(json['requestId']) if json.get('requestId', None) is not None else None,
+            json['type'],
+            runtime.StackTrace.from_json(v) if (v := get('stack')) is not None else None,
+            get('url'),
+            float(v) if (v := get('lineNumber')) is not None else None,
+            float(v) if (v := get('columnNumber')) is not None else None,
+            RequestId(v) if (v := get('requestId')) is not None else None,
         )
 
 
@@ -1272,8 +1323,8 @@ class CookiePartitionKey:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CookiePartitionKey:
         return cls(
-            top_level_site=str(json['topLevelSite']),
-            has_cross_site_ancestor=bool(json['hasCrossSiteAncestor']),
+            json['topLevelSite'],
+            json['hasCrossSiteAncestor'],
         )
 
 
@@ -1358,23 +1409,24 @@ class Cookie:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Cookie:
+        get = json.get
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
-            domain=str(json['domain']),
-            path=str(json['path']),
-            size=int(json['size']),
-            http_only=bool(json['httpOnly']),
-            secure=bool(json['secure']),
-            session=bool(json['session']),
-            priority=CookiePriority.from_json(json['priority']),
-            same_party=bool(json['sameParty']),
-            source_scheme=CookieSourceScheme.from_json(json['sourceScheme']),
-            source_port=int(json['sourcePort']),
-            expires=float(json['expires']) if json.get('expires', None) is not None else None,
-            same_site=CookieSameSite.from_json(json['sameSite']) if json.get('sameSite', None) is not None else None,
-            partition_key=CookiePartitionKey.from_json(json['partitionKey']) if json.get('partitionKey', None) is not None else None,
-            partition_key_opaque=bool(json['partitionKeyOpaque']) if json.get('partitionKeyOpaque', None) is not None else None,
+            json['name'],
+            json['value'],
+            json['domain'],
+            json['path'],
+            json['size'],
+            json['httpOnly'],
+            json['secure'],
+            json['session'],
+            CookiePriority.from_json(json['priority']),
+            json['sameParty'],
+            CookieSourceScheme.from_json(json['sourceScheme']),
+            json['sourcePort'],
+            float(v) if (v := get('expires')) is not None else None,
+            CookieSameSite.from_json(v) if (v := get('sameSite')) is not None else None,
+            CookiePartitionKey.from_json(v) if (v := get('partitionKey')) is not None else None,
+            get('partitionKeyOpaque'),
         )
 
 
@@ -1410,7 +1462,10 @@ class SetCookieBlockedReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SetCookieBlockedReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class CookieBlockedReason(enum.Enum):
@@ -1441,7 +1496,10 @@ class CookieBlockedReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieBlockedReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class CookieExemptionReason(enum.Enum):
@@ -1464,7 +1522,10 @@ class CookieExemptionReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieExemptionReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1494,10 +1555,11 @@ class BlockedSetCookieWithReason:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BlockedSetCookieWithReason:
+        get = json.get
         return cls(
-            blocked_reasons=[SetCookieBlockedReason.from_json(i) for i in json['blockedReasons']],
-            cookie_line=str(json['cookieLine']),
-            cookie=Cookie.from_json(json['cookie']) if json.get('cookie', None) is not None else None,
+            list(map(SetCookieBlockedReason.from_json, json['blockedReasons'])),
+            json['cookieLine'],
+            Cookie.from_json(v) if (v := get('cookie')) is not None else None,
         )
 
 
@@ -1526,9 +1588,9 @@ class ExemptedSetCookieWithReason:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExemptedSetCookieWithReason:
         return cls(
-            exemption_reason=CookieExemptionReason.from_json(json['exemptionReason']),
-            cookie_line=str(json['cookieLine']),
-            cookie=Cookie.from_json(json['cookie']),
+            CookieExemptionReason.from_json(json['exemptionReason']),
+            json['cookieLine'],
+            Cookie.from_json(json['cookie']),
         )
 
 
@@ -1558,10 +1620,11 @@ class AssociatedCookie:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AssociatedCookie:
+        get = json.get
         return cls(
-            cookie=Cookie.from_json(json['cookie']),
-            blocked_reasons=[CookieBlockedReason.from_json(i) for i in json['blockedReasons']],
-            exemption_reason=CookieExemptionReason.from_json(json['exemptionReason']) if json.get('exemptionReason', None) is not None else None,
+            Cookie.from_json(json['cookie']),
+            list(map(CookieBlockedReason.from_json, json['blockedReasons'])),
+            CookieExemptionReason.from_json(v) if (v := get('exemptionReason')) is not None else None,
         )
 
 
@@ -1647,21 +1710,22 @@ class CookieParam:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CookieParam:
+        get = json.get
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            domain=str(json['domain']) if json.get('domain', None) is not None else None,
-            path=str(json['path']) if json.get('path', None) is not None else None,
-            secure=bool(json['secure']) if json.get('secure', None) is not None else None,
-            http_only=bool(json['httpOnly']) if json.get('httpOnly', None) is not None else None,
-            same_site=CookieSameSite.from_json(json['sameSite']) if json.get('sameSite', None) is not None else None,
-            expires=TimeSinceEpoch.from_json(json['expires']) if json.get('expires', None) is not None else None,
-            priority=CookiePriority.from_json(json['priority']) if json.get('priority', None) is not None else None,
-            same_party=bool(json['sameParty']) if json.get('sameParty', None) is not None else None,
-            source_scheme=CookieSourceScheme.from_json(json['sourceScheme']) if json.get('sourceScheme', None) is not None else None,
-            source_port=int(json['sourcePort']) if json.get('sourcePort', None) is not None else None,
-            partition_key=CookiePartitionKey.from_json(json['partitionKey']) if json.get('partitionKey', None) is not None else None,
+            json['name'],
+            json['value'],
+            get('url'),
+            get('domain'),
+            get('path'),
+            get('secure'),
+            get('httpOnly'),
+            CookieSameSite.from_json(v) if (v := get('sameSite')) is not None else None,
+            TimeSinceEpoch(v) if (v := get('expires')) is not None else None,
+            CookiePriority.from_json(v) if (v := get('priority')) is not None else None,
+            get('sameParty'),
+            CookieSourceScheme.from_json(v) if (v := get('sourceScheme')) is not None else None,
+            get('sourcePort'),
+            CookiePartitionKey.from_json(v) if (v := get('partitionKey')) is not None else None,
         )
 
 
@@ -1693,11 +1757,12 @@ class AuthChallenge:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthChallenge:
+        get = json.get
         return cls(
-            origin=str(json['origin']),
-            scheme=str(json['scheme']),
-            realm=str(json['realm']),
-            source=str(json['source']) if json.get('source', None) is not None else None,
+            json['origin'],
+            json['scheme'],
+            json['realm'],
+            get('source'),
         )
 
 
@@ -1730,10 +1795,11 @@ class AuthChallengeResponse:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AuthChallengeResponse:
+        get = json.get
         return cls(
-            response=str(json['response']),
-            username=str(json['username']) if json.get('username', None) is not None else None,
-            password=str(json['password']) if json.get('password', None) is not None else None,
+            json['response'],
+            get('username'),
+            get('password'),
         )
 
 
@@ -1750,7 +1816,10 @@ class InterceptionStage(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InterceptionStage:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1780,10 +1849,11 @@ class RequestPattern:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestPattern:
+        get = json.get
         return cls(
-            url_pattern=str(json['urlPattern']) if json.get('urlPattern', None) is not None else None,
-            resource_type=ResourceType.from_json(json['resourceType']) if json.get('resourceType', None) is not None else None,
-            interception_stage=InterceptionStage.from_json(json['interceptionStage']) if json.get('interceptionStage', None) is not None else None,
+            get('urlPattern'),
+            ResourceType.from_json(v) if (v := get('resourceType')) is not None else None,
+            InterceptionStage.from_json(v) if (v := get('interceptionStage')) is not None else None,
         )
 
 
@@ -1838,16 +1908,17 @@ class SignedExchangeSignature:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedExchangeSignature:
+        get = json.get
         return cls(
-            label=str(json['label']),
-            signature=str(json['signature']),
-            integrity=str(json['integrity']),
-            validity_url=str(json['validityUrl']),
-            date=int(json['date']),
-            expires=int(json['expires']),
-            cert_url=str(json['certUrl']) if json.get('certUrl', None) is not None else None,
-            cert_sha256=str(json['certSha256']) if json.get('certSha256', None) is not None else None,
-            certificates=[str(i) for i in json['certificates']] if json.get('certificates', None) is not None else None,
+            json['label'],
+            json['signature'],
+            json['integrity'],
+            json['validityUrl'],
+            json['date'],
+            json['expires'],
+            get('certUrl'),
+            get('certSha256'),
+            list(v) if (v := get('certificates')) is not None else None,
         )
 
 
@@ -1884,11 +1955,11 @@ class SignedExchangeHeader:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedExchangeHeader:
         return cls(
-            request_url=str(json['requestUrl']),
-            response_code=int(json['responseCode']),
-            response_headers=Headers.from_json(json['responseHeaders']),
-            signatures=[SignedExchangeSignature.from_json(i) for i in json['signatures']],
-            header_integrity=str(json['headerIntegrity']),
+            json['requestUrl'],
+            json['responseCode'],
+            Headers(json['responseHeaders']),
+            list(map(SignedExchangeSignature.from_json, json['signatures'])),
+            json['headerIntegrity'],
         )
 
 
@@ -1908,7 +1979,10 @@ class SignedExchangeErrorField(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SignedExchangeErrorField:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1936,10 +2010,11 @@ class SignedExchangeError:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedExchangeError:
+        get = json.get
         return cls(
-            message=str(json['message']),
-            signature_index=int(json['signatureIndex']) if json.get('signatureIndex', None) is not None else None,
-            error_field=SignedExchangeErrorField.from_json(json['errorField']) if json.get('errorField', None) is not None else None,
+            json['message'],
+            get('signatureIndex'),
+            SignedExchangeErrorField.from_json(v) if (v := get('errorField')) is not None else None,
         )
 
 
@@ -1973,11 +2048,12 @@ class SignedExchangeInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedExchangeInfo:
+        get = json.get
         return cls(
-            outer_response=Response.from_json(json['outerResponse']),
-            header=SignedExchangeHeader.from_json(json['header']) if json.get('header', None) is not None else None,
-            security_details=SecurityDetails.from_json(json['securityDetails']) if json.get('securityDetails', None) is not None else None,
-            errors=[SignedExchangeError.from_json(i) for i in json['errors']] if json.get('errors', None) is not None else None,
+            Response.from_json(json['outerResponse']),
+            SignedExchangeHeader.from_json(v) if (v := get('header')) is not None else None,
+            SecurityDetails.from_json(v) if (v := get('securityDetails')) is not None else None,
+            list(map(SignedExchangeError.from_json, v)) if (v := get('errors')) is not None else None,
         )
 
 
@@ -1995,7 +2071,10 @@ class ContentEncoding(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContentEncoding:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class PrivateNetworkRequestPolicy(enum.Enum):
@@ -2010,7 +2089,10 @@ class PrivateNetworkRequestPolicy(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PrivateNetworkRequestPolicy:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class IPAddressSpace(enum.Enum):
@@ -2024,7 +2106,10 @@ class IPAddressSpace(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> IPAddressSpace:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -2042,7 +2127,7 @@ class ConnectTiming:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ConnectTiming:
         return cls(
-            request_time=float(json['requestTime']),
+            float(json['requestTime']),
         )
 
 
@@ -2064,9 +2149,9 @@ class ClientSecurityState:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ClientSecurityState:
         return cls(
-            initiator_is_secure_context=bool(json['initiatorIsSecureContext']),
-            initiator_ip_address_space=IPAddressSpace.from_json(json['initiatorIPAddressSpace']),
-            private_network_request_policy=PrivateNetworkRequestPolicy.from_json(json['privateNetworkRequestPolicy']),
+            json['initiatorIsSecureContext'],
+            IPAddressSpace.from_json(json['initiatorIPAddressSpace']),
+            PrivateNetworkRequestPolicy.from_json(json['privateNetworkRequestPolicy']),
         )
 
 
@@ -2084,7 +2169,10 @@ class CrossOriginOpenerPolicyValue(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CrossOriginOpenerPolicyValue:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -2109,11 +2197,12 @@ class CrossOriginOpenerPolicyStatus:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CrossOriginOpenerPolicyStatus:
+        get = json.get
         return cls(
-            value=CrossOriginOpenerPolicyValue.from_json(json['value']),
-            report_only_value=CrossOriginOpenerPolicyValue.from_json(json['reportOnlyValue']),
-            reporting_endpoint=str(json['reportingEndpoint']) if json.get('reportingEndpoint', None) is not None else None,
-            report_only_reporting_endpoint=str(json['reportOnlyReportingEndpoint']) if json.get('reportOnlyReportingEndpoint', None) is not None else None,
+            CrossOriginOpenerPolicyValue.from_json(json['value']),
+            CrossOriginOpenerPolicyValue.from_json(json['reportOnlyValue']),
+            get('reportingEndpoint'),
+            get('reportOnlyReportingEndpoint'),
         )
 
 
@@ -2127,7 +2216,10 @@ class CrossOriginEmbedderPolicyValue(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CrossOriginEmbedderPolicyValue:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -2152,11 +2244,12 @@ class CrossOriginEmbedderPolicyStatus:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CrossOriginEmbedderPolicyStatus:
+        get = json.get
         return cls(
-            value=CrossOriginEmbedderPolicyValue.from_json(json['value']),
-            report_only_value=CrossOriginEmbedderPolicyValue.from_json(json['reportOnlyValue']),
-            reporting_endpoint=str(json['reportingEndpoint']) if json.get('reportingEndpoint', None) is not None else None,
-            report_only_reporting_endpoint=str(json['reportOnlyReportingEndpoint']) if json.get('reportOnlyReportingEndpoint', None) is not None else None,
+            CrossOriginEmbedderPolicyValue.from_json(json['value']),
+            CrossOriginEmbedderPolicyValue.from_json(json['reportOnlyValue']),
+            get('reportingEndpoint'),
+            get('reportOnlyReportingEndpoint'),
         )
 
 
@@ -2169,7 +2262,10 @@ class ContentSecurityPolicySource(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContentSecurityPolicySource:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -2190,9 +2286,9 @@ class ContentSecurityPolicyStatus:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContentSecurityPolicyStatus:
         return cls(
-            effective_directives=str(json['effectiveDirectives']),
-            is_enforced=bool(json['isEnforced']),
-            source=ContentSecurityPolicySource.from_json(json['source']),
+            json['effectiveDirectives'],
+            json['isEnforced'],
+            ContentSecurityPolicySource.from_json(json['source']),
         )
 
 
@@ -2216,10 +2312,11 @@ class SecurityIsolationStatus:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SecurityIsolationStatus:
+        get = json.get
         return cls(
-            coop=CrossOriginOpenerPolicyStatus.from_json(json['coop']) if json.get('coop', None) is not None else None,
-            coep=CrossOriginEmbedderPolicyStatus.from_json(json['coep']) if json.get('coep', None) is not None else None,
-            csp=[ContentSecurityPolicyStatus.from_json(i) for i in json['csp']] if json.get('csp', None) is not None else None,
+            CrossOriginOpenerPolicyStatus.from_json(v) if (v := get('coop')) is not None else None,
+            CrossOriginEmbedderPolicyStatus.from_json(v) if (v := get('coep')) is not None else None,
+            list(map(ContentSecurityPolicyStatus.from_json, v)) if (v := get('csp')) is not None else None,
         )
 
 
@@ -2237,7 +2334,10 @@ class ReportStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ReportStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class ReportId(str):
@@ -2297,15 +2397,15 @@ class ReportingApiReport:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReportingApiReport:
         return cls(
-            id_=ReportId.from_json(json['id']),
-            initiator_url=str(json['initiatorUrl']),
-            destination=str(json['destination']),
-            type_=str(json['type']),
-            timestamp=TimeSinceEpoch.from_json(json['timestamp']),
-            depth=int(json['depth']),
-            completed_attempts=int(json['completedAttempts']),
-            body=dict(json['body']),
-            status=ReportStatus.from_json(json['status']),
+            ReportId(json['id']),
+            json['initiatorUrl'],
+            json['destination'],
+            json['type'],
+            TimeSinceEpoch(json['timestamp']),
+            json['depth'],
+            json['completedAttempts'],
+            json['body'],
+            ReportStatus.from_json(json['status']),
         )
 
 
@@ -2326,8 +2426,8 @@ class ReportingApiEndpoint:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReportingApiEndpoint:
         return cls(
-            url=str(json['url']),
-            group_name=str(json['groupName']),
+            json['url'],
+            json['groupName'],
         )
 
 
@@ -2368,13 +2468,14 @@ class LoadNetworkResourcePageResult:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadNetworkResourcePageResult:
+        get = json.get
         return cls(
-            success=bool(json['success']),
-            net_error=float(json['netError']) if json.get('netError', None) is not None else None,
-            net_error_name=str(json['netErrorName']) if json.get('netErrorName', None) is not None else None,
-            http_status_code=float(json['httpStatusCode']) if json.get('httpStatusCode', None) is not None else None,
-            stream=io.StreamHandle.from_json(json['stream']) if json.get('stream', None) is not None else None,
-            headers=Headers.from_json(json['headers']) if json.get('headers', None) is not None else None,
+            json['success'],
+            float(v) if (v := get('netError')) is not None else None,
+            get('netErrorName'),
+            float(v) if (v := get('httpStatusCode')) is not None else None,
+            io.StreamHandle(v) if (v := get('stream')) is not None else None,
+            Headers(v) if (v := get('headers')) is not None else None,
         )
 
 
@@ -2397,8 +2498,8 @@ class LoadNetworkResourceOptions:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadNetworkResourceOptions:
         return cls(
-            disable_cache=bool(json['disableCache']),
-            include_credentials=bool(json['includeCredentials']),
+            json['disableCache'],
+            json['includeCredentials'],
         )
 
 
@@ -2433,6 +2534,11 @@ def clear_accepted_encodings_override() -> typing.Generator[T_JSON_DICT,T_JSON_D
     json = yield cmd_dict
 
 
+@command_decoder('Network.canClearBrowserCache')
+def _decode_can_clear_browser_cache(json: T_JSON_DICT) -> bool:
+    return bool(json['result'])
+
+
 @deprecated(version="1.3")
 def can_clear_browser_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
     '''
@@ -2446,6 +2552,11 @@ def can_clear_browser_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
         'method': 'Network.canClearBrowserCache',
     }
     json = yield cmd_dict
+    return _decode_can_clear_browser_cache(json)
+
+
+@command_decoder('Network.canClearBrowserCookies')
+def _decode_can_clear_browser_cookies(json: T_JSON_DICT) -> bool:
     return bool(json['result'])
 
 
@@ -2462,6 +2573,11 @@ def can_clear_browser_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool
         'method': 'Network.canClearBrowserCookies',
     }
     json = yield cmd_dict
+    return _decode_can_clear_browser_cookies(json)
+
+
+@command_decoder('Network.canEmulateNetworkConditions')
+def _decode_can_emulate_network_conditions(json: T_JSON_DICT) -> bool:
     return bool(json['result'])
 
 
@@ -2478,7 +2594,7 @@ def can_emulate_network_conditions() -> typing.Generator[T_JSON_DICT,T_JSON_DICT
         'method': 'Network.canEmulateNetworkConditions',
     }
     json = yield cmd_dict
-    return bool(json['result'])
+    return _decode_can_emulate_network_conditions(json)
 
 
 def clear_browser_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2666,6 +2782,11 @@ def enable(
     json = yield cmd_dict
 
 
+@command_decoder('Network.getAllCookies')
+def _decode_get_all_cookies(json: T_JSON_DICT) -> typing.List[Cookie]:
+    return [Cookie.from_json(i) for i in json['cookies']]
+
+
 @deprecated(version="1.3")
 def get_all_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Cookie]]:
     '''
@@ -2681,7 +2802,12 @@ def get_all_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Co
         'method': 'Network.getAllCookies',
     }
     json = yield cmd_dict
-    return [Cookie.from_json(i) for i in json['cookies']]
+    return _decode_get_all_cookies(json)
+
+
+@command_decoder('Network.getCertificate')
+def _decode_get_certificate(json: T_JSON_DICT) -> typing.List[str]:
+    return [str(i) for i in json['tableNames']]
 
 
 def get_certificate(
@@ -2702,7 +2828,12 @@ def get_certificate(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['tableNames']]
+    return _decode_get_certificate(json)
+
+
+@command_decoder('Network.getCookies')
+def _decode_get_cookies(json: T_JSON_DICT) -> typing.List[Cookie]:
+    return [Cookie.from_json(i) for i in json['cookies']]
 
 
 def get_cookies(
@@ -2723,7 +2854,15 @@ def get_cookies(
         'params': params,
     }
     json = yield cmd_dict
-    return [Cookie.from_json(i) for i in json['cookies']]
+    return _decode_get_cookies(json)
+
+
+@command_decoder('Network.getResponseBody')
+def _decode_get_response_body(json: T_JSON_DICT) -> typing.Tuple[str, bool]:
+    return (
+        str(json['body']),
+        bool(json['base64Encoded'])
+    )
 
 
 def get_response_body(
@@ -2745,10 +2884,12 @@ def get_response_body(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        str(json['body']),
-        bool(json['base64Encoded'])
-    )
+    return _decode_get_response_body(json)
+
+
+@command_decoder('Network.getRequestPostData')
+def _decode_get_request_post_data(json: T_JSON_DICT) -> str:
+    return str(json['postData'])
 
 
 def get_request_post_data(
@@ -2767,7 +2908,15 @@ def get_request_post_data(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['postData'])
+    return _decode_get_request_post_data(json)
+
+
+@command_decoder('Network.getResponseBodyForInterception')
+def _decode_get_response_body_for_interception(json: T_JSON_DICT) -> typing.Tuple[str, bool]:
+    return (
+        str(json['body']),
+        bool(json['base64Encoded'])
+    )
 
 
 def get_response_body_for_interception(
@@ -2791,10 +2940,12 @@ def get_response_body_for_interception(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        str(json['body']),
-        bool(json['base64Encoded'])
-    )
+    return _decode_get_response_body_for_interception(json)
+
+
+@command_decoder('Network.takeResponseBodyForInterceptionAsStream')
+def _decode_take_response_body_for_interception_as_stream(json: T_JSON_DICT) -> io.StreamHandle:
+    return io.StreamHandle.from_json(json['stream'])
 
 
 def take_response_body_for_interception_as_stream(
@@ -2818,7 +2969,7 @@ def take_response_body_for_interception_as_stream(
         'params': params,
     }
     json = yield cmd_dict
-    return io.StreamHandle.from_json(json['stream'])
+    return _decode_take_response_body_for_interception_as_stream(json)
 
 
 def replay_xhr(
@@ -2842,6 +2993,11 @@ def replay_xhr(
     json = yield cmd_dict
 
 
+@command_decoder('Network.searchInResponseBody')
+def _decode_search_in_response_body(json: T_JSON_DICT) -> typing.List[debugger.SearchMatch]:
+    return [debugger.SearchMatch.from_json(i) for i in json['result']]
+
+
 def search_in_response_body(
         request_id: RequestId,
         query: str,
@@ -2871,7 +3027,7 @@ def search_in_response_body(
         'params': params,
     }
     json = yield cmd_dict
-    return [debugger.SearchMatch.from_json(i) for i in json['result']]
+    return _decode_search_in_response_body(json)
 
 
 def set_blocked_ur_ls(
@@ -2927,6 +3083,11 @@ def set_cache_disabled(
     json = yield cmd_dict
 
 
+@command_decoder('Network.setCookie')
+def _decode_set_cookie(json: T_JSON_DICT) -> bool:
+    return bool(json['success'])
+
+
 def set_cookie(
         name: str,
         value: str,
@@ -2994,7 +3155,7 @@ def set_cookie(
         'params': params,
     }
     json = yield cmd_dict
-    return bool(json['success'])
+    return _decode_set_cookie(json)
 
 
 def set_cookies(
@@ -3102,6 +3263,11 @@ def set_user_agent_override(
     json = yield cmd_dict
 
 
+@command_decoder('Network.streamResourceContent')
+def _decode_stream_resource_content(json: T_JSON_DICT) -> str:
+    return str(json['bufferedData'])
+
+
 def stream_resource_content(
         request_id: RequestId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
@@ -3121,7 +3287,12 @@ def stream_resource_content(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['bufferedData'])
+    return _decode_stream_resource_content(json)
+
+
+@command_decoder('Network.getSecurityIsolationStatus')
+def _decode_get_security_isolation_status(json: T_JSON_DICT) -> SecurityIsolationStatus:
+    return SecurityIsolationStatus.from_json(json['status'])
 
 
 def get_security_isolation_status(
@@ -3143,7 +3314,7 @@ def get_security_isolation_status(
         'params': params,
     }
     json = yield cmd_dict
-    return SecurityIsolationStatus.from_json(json['status'])
+    return _decode_get_security_isolation_status(json)
 
 
 def enable_reporting_api(
@@ -3166,6 +3337,11 @@ def enable_reporting_api(
     json = yield cmd_dict
 
 
+@command_decoder('Network.loadNetworkResource')
+def _decode_load_network_resource(json: T_JSON_DICT) -> LoadNetworkResourcePageResult:
+    return LoadNetworkResourcePageResult.from_json(json['resource'])
+
+
 def load_network_resource(
         url: str,
         options: LoadNetworkResourceOptions,
@@ -3191,7 +3367,7 @@ def load_network_resource(
         'params': params,
     }
     json = yield cmd_dict
-    return LoadNetworkResourcePageResult.from_json(json['resource'])
+    return _decode_load_network_resource(json)
 
 
 @event_class('Network.dataReceived')
@@ -3213,12 +3389,13 @@ class DataReceived:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DataReceived:
+        get = json.get
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            data_length=int(json['dataLength']),
-            encoded_data_length=int(json['encodedDataLength']),
-            data=str(json['data']) if json.get('data', None) is not None else None
+            RequestId(json['requestId']),
+            MonotonicTime(json['timestamp']),
+            json['dataLength'],
+            json['encodedDataLength'],
+            get('data'),
         )
 
 
@@ -3242,11 +3419,11 @@ class EventSourceMessageReceived:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> EventSourceMessageReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            event_name=str(json['eventName']),
-            event_id=str(json['eventId']),
-            data=str(json['data'])
+            RequestId(json['requestId']),
+            MonotonicTime(json['timestamp']),
+            json['eventName'],
+            json['eventId'],
+            json['data'],
         )
 
 
@@ -3273,14 +3450,15 @@ class LoadingFailed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadingFailed:
+        get = json.get
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            type_=ResourceType.from_json(json['type']),
-            error_text=str(json['errorText']),
-            canceled=bool(json['canceled']) if json.get('canceled', None) is not None else None,
-            blocked_reason=BlockedReason.from_json(json['blockedReason']) if json.get('blockedReason', None) is not None else None,
-            cors_error_status=CorsErrorStatus.from_json(json['corsErrorStatus']) if json.get('corsErrorStatus', None) is not None else None
+            RequestId(json['requestId']),
+            MonotonicTime(json['timestamp']),
+            ResourceType.from_json(json['type']),
+            json['errorText'],
+            get('canceled'),
+            BlockedReason.from_json(v) if (v := get('blockedReason')) is not None else None,
+            CorsErrorStatus.from_json(v) if (v := get('corsErrorStatus')) is not None else None,
         )
 
 
@@ -3300,9 +3478,9 @@ class LoadingFinished:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadingFinished:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            encoded_data_length=float(json['encodedDataLength'])
+            RequestId(json['requestId']),
+            MonotonicTime(json['timestamp']),
+            float(json['encodedDataLength']),
         )
 
 
@@ -3351,19 +3529,20 @@ class RequestIntercepted:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestIntercepted:
+        get = json.get
         return cls(
-            interception_id=InterceptionId.from_json(json['interceptionId']),
-            request=Request.from_json(json['request']),
-            frame_id=page.FrameId.from_json(json['frameId']),
-            resource_type=ResourceType.from_json(json['resourceType']),
-            is_navigation_request=bool(json['isNavigationRequest']),
-            is_download=bool(json['isDownload']) if json.get('isDownload', None) is not None else None,
-            redirect_url=str(json['redirectUrl']) if json.get('redirectUrl', None) is not None else None,
-            auth_challenge=AuthChallenge.from_json(json['authChallenge']) if json.get('authChallenge', None) is not None else None,
-            response_error_reason=ErrorReason.from_json(json['responseErrorReason']) if json.get('responseErrorReason', None) is not None else None,
-            response_status_code=int(json['responseStatusCode']) if json.get('responseStatusCode', None) is not None else None,
-            response_headers=Headers.from_json(json['responseHeaders']) if json.get('responseHeaders', None) is not None else None,
-            request_id=RequestId.from_json(json['requestId']) if json.get('requestId', None) is not None else None
+            InterceptionId(json['interceptionId']),
+            Request.from_json(json['request']),
+            page.FrameId(json['frameId']),
+            ResourceType.from_json(json['resourceType']),
+            json['isNavigationRequest'],
+            get('isDownload'),
+            get('redirectUrl'),
+            AuthChallenge.from_json(v) if (v := get('authChallenge')) is not None else None,
+            ErrorReason.from_json(v) if (v := get('responseErrorReason')) is not None else None,
+            get('responseStatusCode'),
+            Headers(v) if (v := get('responseHeaders')) is not None else None,
+            RequestId(v) if (v := get('requestId')) is not None else None,
         )
 
 
@@ -3379,7 +3558,7 @@ class RequestServedFromCache:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestServedFromCache:
         return cls(
-            request_id=RequestId.from_json(json['requestId'])
+            RequestId(json['requestId']),
         )
 
 
@@ -3418,19 +3597,20 @@ class RequestWillBeSent:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestWillBeSent:
+        get = json.get
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            loader_id=LoaderId.from_json(json['loaderId']),
-            document_url=str(json['documentURL']),
-            request=Request.from_json(json['request']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            wall_time=TimeSinceEpoch.from_json(json['wallTime']),
-            initiator=Initiator.from_json(json['initiator']),
-            redirect_has_extra_info=bool(json['redirectHasExtraInfo']),
-            redirect_response=Response.from_json(json['redirectResponse']) if json.get('redirectResponse', None) is not None else None,
-            type_=ResourceType.from_json(json['type']) if json.get('type', None) is not None else None,
-            frame_id=page.FrameId.from_json(json['frameId']) if json.get('frameId', None) is not None else None,
-            has_user_gesture=bool(json['hasUserGesture']) if json.get('hasUserGesture', None) is not None else None
+            RequestId(json['requestId']),
+            LoaderId(json['loaderId']),
+            json['documentURL'],
+            Request.from_json(json['request']),
+            MonotonicTime(json['timestamp']),
+            TimeSinceEpoch(json['wallTime']),
+            Initiator.from_json(json['initiator']),
+            json['redirectHasExtraInfo'],
+            Response.from_json(v) if (v := get('redirectResponse')) is not None else None,
+            ResourceType.from_json(v) if (v := get('type')) is not None else None,
+            page.FrameId(v) if (v := get('frameId')) is not None else None,
+            get('hasUserGesture'),
         )
 
 
@@ -3452,9 +3632,9 @@ class ResourceChangedPriority:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResourceChangedPriority:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            new_priority=ResourcePriority.from_json(json['newPriority']),
-            timestamp=MonotonicTime.from_json(json['timestamp'])
+            RequestId(json['requestId']),
+            ResourcePriority.from_json(json['newPriority']),
+            MonotonicTime(json['timestamp']),
         )
 
 
@@ -3474,8 +3654,8 @@ class SignedExchangeReceived:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SignedExchangeReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            info=SignedExchangeInfo.from_json(json['info'])
+            RequestId(json['requestId']),
+            SignedExchangeInfo.from_json(json['info']),
         )
 
 
@@ -3503,14 +3683,15 @@ class ResponseReceived:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResponseReceived:
+        get = json.get
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            loader_id=LoaderId.from_json(json['loaderId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            type_=ResourceType.from_json(json['type']),
-            response=Response.from_json(json['response']),
-            has_extra_info=bool(json['hasExtraInfo']),
-            frame_id=page.FrameId.from_json(json['frameId']) if json.get('frameId', None) is not None else None
+            RequestId(json['requestId']),
+            LoaderId(json['loaderId']),
+            MonotonicTime(json['timestamp']),
+            ResourceType.from_json(json['type']),
+            Response.from_json(json['response']),
+            json['hasExtraInfo'],
+            page.FrameId(v) if (v := get('frameId')) is not None else None,
         )
 
 
@@ -3528,8 +3709,8 @@ class WebSocketClosed:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketClosed:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp'])
+            RequestId(json['requestId']),
+            MonotonicTime(json['timestamp']),
         )
 
 
@@ -3548,10 +3729,11 @@ class WebSocketCreated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketCreated:
+        get = json.get
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            url=str(json['url']),
-            initiator=Initiator.from_json(json['initiator']) if json.get('initiator', None) is not None else None
+            RequestId(json['requestId']),
+            json['url'],
+            Initiator.from_json(v) if (v := get('initiator')) is not None else None,
         )
 
 
@@ -3571,9 +3753,9 @@ class WebSocketFrameError:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketFrameError:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            error_message=str(json['errorMessage'])
+            RequestId(json['requestId']),
+            MonotonicTime(json['timestamp']),
+            json['errorMessage'],
         )
 
 
@@ -3593,9 +3775,9 @@ class WebSocketFrameReceived:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketFrameReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            response=WebSocketFrame.from_json(json['response'])
+            RequestId(json['requestId']),
+            MonotonicTime(json['timestamp']),
+            WebSocketFrame.from_json(json['response']),
         )
 
 
@@ -3615,9 +3797,9 @@ class WebSocketFrameSent:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketFrameSent:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            response=WebSocketFrame.from_json(json['response'])
+            RequestId(json['requestId']),
+            MonotonicTime(json['timestamp']),
+            WebSocketFrame.from_json(json['response']),
         )
 
 
@@ -3637,9 +3819,9 @@ class WebSocketHandshakeResponseReceived:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketHandshakeResponseReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            response=WebSocketResponse.from_json(json['response'])
+            RequestId(json['requestId']),
+            MonotonicTime(json['timestamp']),
+            WebSocketResponse.from_json(json['response']),
         )
 
 
@@ -3661,10 +3843,10 @@ class WebSocketWillSendHandshakeRequest:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebSocketWillSendHandshakeRequest:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            wall_time=TimeSinceEpoch.from_json(json['wallTime']),
-            request=WebSocketRequest.from_json(json['request'])
+            RequestId(json['requestId']),
+            MonotonicTime(json['timestamp']),
+            TimeSinceEpoch(json['wallTime']),
+            WebSocketRequest.from_json(json['request']),
         )
 
 
@@ -3685,11 +3867,12 @@ class WebTransportCreated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebTransportCreated:
+        get = json.get
         return cls(
-            transport_id=RequestId.from_json(json['transportId']),
-            url=str(json['url']),
-            timestamp=MonotonicTime.from_json(json['timestamp']),
-            initiator=Initiator.from_json(json['initiator']) if json.get('initiator', None) is not None else None
+            RequestId(json['transportId']),
+            json['url'],
+            MonotonicTime(json['timestamp']),
+            Initiator.from_json(v) if (v := get('initiator')) is not None else None,
         )
 
 
@@ -3707,8 +3890,8 @@ class WebTransportConnectionEstablished:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebTransportConnectionEstablished:
         return cls(
-            transport_id=RequestId.from_json(json['transportId']),
-            timestamp=MonotonicTime.from_json(json['timestamp'])
+            RequestId(json['transportId']),
+            MonotonicTime(json['timestamp']),
         )
 
 
@@ -3726,8 +3909,8 @@ class WebTransportClosed:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebTransportClosed:
         return cls(
-            transport_id=RequestId.from_json(json['transportId']),
-            timestamp=MonotonicTime.from_json(json['timestamp'])
+            RequestId(json['transportId']),
+            MonotonicTime(json['timestamp']),
         )
 
 
@@ -3758,13 +3941,14 @@ class RequestWillBeSentExtraInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RequestWillBeSentExtraInfo:
+        get = json.get
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            associated_cookies=[AssociatedCookie.from_json(i) for i in json['associatedCookies']],
-            headers=Headers.from_json(json['headers']),
-            connect_timing=ConnectTiming.from_json(json['connectTiming']),
-            client_security_state=ClientSecurityState.from_json(json['clientSecurityState']) if json.get('clientSecurityState', None) is not None else None,
-            site_has_cookie_in_other_partition=bool(json['siteHasCookieInOtherPartition']) if json.get('siteHasCookieInOtherPartition', None) is not None else None
+            RequestId(json['requestId']),
+            list(map(AssociatedCookie.from_json, json['associatedCookies'])),
+            Headers(json['headers']),
+            ConnectTiming.from_json(json['connectTiming']),
+            ClientSecurityState.from_json(v) if (v := get('clientSecurityState')) is not None else None,
+            get('siteHasCookieInOtherPartition'),
         )
 
 
@@ -3807,16 +3991,17 @@ class ResponseReceivedExtraInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResponseReceivedExtraInfo:
+        get = json.get
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            blocked_cookies=[BlockedSetCookieWithReason.from_json(i) for i in json['blockedCookies']],
-            headers=Headers.from_json(json['headers']),
-            resource_ip_address_space=IPAddressSpace.from_json(json['resourceIPAddressSpace']),
-            status_code=int(json['statusCode']),
-            headers_text=str(json['headersText']) if json.get('headersText', None) is not None else None,
-            cookie_partition_key=CookiePartitionKey.from_json(json['cookiePartitionKey']) if json.get('cookiePartitionKey', None) is not None else None,
-            cookie_partition_key_opaque=bool(json['cookiePartitionKeyOpaque']) if json.get('cookiePartitionKeyOpaque', None) is not None else None,
-            exempted_cookies=[ExemptedSetCookieWithReason.from_json(i) for i in json['exemptedCookies']] if json.get('exemptedCookies', None) is not None else None
+            RequestId(json['requestId']),
+            list(map(BlockedSetCookieWithReason.from_json, json['blockedCookies'])),
+            Headers(json['headers']),
+            IPAddressSpace.from_json(json['resourceIPAddressSpace']),
+            json['statusCode'],
+            get('headersText'),
+            CookiePartitionKey.from_json(v) if (v := get('cookiePartitionKey')) is not None else None,
+            get('cookiePartitionKeyOpaque'),
+            list(map(ExemptedSetCookieWithReason.from_json, v)) if (v := get('exemptedCookies')) is not None else None,
         )
 
 
@@ -3838,8 +4023,8 @@ class ResponseReceivedEarlyHints:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ResponseReceivedEarlyHints:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            headers=Headers.from_json(json['headers'])
+            RequestId(json['requestId']),
+            Headers(json['headers']),
         )
 
 
@@ -3870,13 +4055,14 @@ class TrustTokenOperationDone:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TrustTokenOperationDone:
+        get = json.get
         return cls(
-            status=str(json['status']),
-            type_=TrustTokenOperationType.from_json(json['type']),
-            request_id=RequestId.from_json(json['requestId']),
-            top_level_origin=str(json['topLevelOrigin']) if json.get('topLevelOrigin', None) is not None else None,
-            issuer_origin=str(json['issuerOrigin']) if json.get('issuerOrigin', None) is not None else None,
-            issued_token_count=int(json['issuedTokenCount']) if json.get('issuedTokenCount', None) is not None else None
+            json['status'],
+            TrustTokenOperationType.from_json(json['type']),
+            RequestId(json['requestId']),
+            get('topLevelOrigin'),
+            get('issuerOrigin'),
+            get('issuedTokenCount'),
         )
 
 
@@ -3892,9 +4078,7 @@ class PolicyUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PolicyUpdated:
-        return cls(
-
-        )
+        return cls()
 
 
 @event_class('Network.subresourceWebBundleMetadataReceived')
@@ -3914,8 +4098,8 @@ class SubresourceWebBundleMetadataReceived:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SubresourceWebBundleMetadataReceived:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            urls=[str(i) for i in json['urls']]
+            RequestId(json['requestId']),
+            list(json['urls']),
         )
 
 
@@ -3935,8 +4119,8 @@ class SubresourceWebBundleMetadataError:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SubresourceWebBundleMetadataError:
         return cls(
-            request_id=RequestId.from_json(json['requestId']),
-            error_message=str(json['errorMessage'])
+            RequestId(json['requestId']),
+            json['errorMessage'],
         )
 
 
@@ -3960,10 +4144,11 @@ class SubresourceWebBundleInnerResponseParsed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SubresourceWebBundleInnerResponseParsed:
+        get = json.get
         return cls(
-            inner_request_id=RequestId.from_json(json['innerRequestId']),
-            inner_request_url=str(json['innerRequestURL']),
-            bundle_request_id=RequestId.from_json(json['bundleRequestId']) if json.get('bundleRequestId', None) is not None else None
+            RequestId(json['innerRequestId']),
+            json['innerRequestURL'],
+            RequestId(v) if (v := get('bundleRequestId')) is not None else None,
         )
 
 
@@ -3988,11 +4173,12 @@ class SubresourceWebBundleInnerResponseError:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SubresourceWebBundleInnerResponseError:
+        get = json.get
         return cls(
-            inner_request_id=RequestId.from_json(json['innerRequestId']),
-            inner_request_url=str(json['innerRequestURL']),
-            error_message=str(json['errorMessage']),
-            bundle_request_id=RequestId.from_json(json['bundleRequestId']) if json.get('bundleRequestId', None) is not None else None
+            RequestId(json['innerRequestId']),
+            json['innerRequestURL'],
+            json['errorMessage'],
+            RequestId(v) if (v := get('bundleRequestId')) is not None else None,
         )
 
 
@@ -4010,7 +4196,7 @@ class ReportingApiReportAdded:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReportingApiReportAdded:
         return cls(
-            report=ReportingApiReport.from_json(json['report'])
+            ReportingApiReport.from_json(json['report']),
         )
 
 
@@ -4027,7 +4213,7 @@ class ReportingApiReportUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReportingApiReportUpdated:
         return cls(
-            report=ReportingApiReport.from_json(json['report'])
+            ReportingApiReport.from_json(json['report']),
         )
 
 
@@ -4046,6 +4232,6 @@ class ReportingApiEndpointsChangedForOrigin:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReportingApiEndpointsChangedForOrigin:
         return cls(
-            origin=str(json['origin']),
-            endpoints=[ReportingApiEndpoint.from_json(i) for i in json['endpoints']]
+            json['origin'],
+            list(map(ReportingApiEndpoint.from_json, json['endpoints'])),
         )
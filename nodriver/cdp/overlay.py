@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import dom
 from . import page
@@ -37,8 +36,8 @@ class SourceOrderConfig:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SourceOrderConfig:
         return cls(
-            parent_outline_color=dom.RGBA.from_json(json['parentOutlineColor']),
-            child_outline_color=dom.RGBA.from_json(json['childOutlineColor']),
+            dom.RGBA.from_json(json['parentOutlineColor']),
+            dom.RGBA.from_json(json['childOutlineColor']),
         )
 
 
@@ -153,27 +152,28 @@ class GridHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> GridHighlightConfig:
+        get = json.get
         return cls(
-            show_grid_extension_lines=bool(json['showGridExtensionLines']) if json.get('showGridExtensionLines', None) is not None else None,
-            show_positive_line_numbers=bool(json['showPositiveLineNumbers']) if json.get('showPositiveLineNumbers', None) is not None else None,
-            show_negative_line_numbers=bool(json['showNegativeLineNumbers']) if json.get('showNegativeLineNumbers', None) is not None else None,
-            show_area_names=bool(json['showAreaNames']) if json.get('showAreaNames', None) is not None else None,
-            show_line_names=bool(json['showLineNames']) if json.get('showLineNames', None) is not None else None,
-            show_track_sizes=bool(json['showTrackSizes']) if json.get('showTrackSizes', None) is not None else None,
-            grid_border_color=dom.RGBA.from_json(json['gridBorderColor']) if json.get('gridBorderColor', None) is not None else None,
-            cell_border_color=dom.RGBA.from_json(json['cellBorderColor']) if json.get('cellBorderColor', None) is not None else None,
-            row_line_color=dom.RGBA.from_json(json['rowLineColor']) if json.get('rowLineColor', None) is not None else None,
-            column_line_color=dom.RGBA.from_json(json['columnLineColor']) if json.get('columnLineColor', None) is not None else None,
-            grid_border_dash=bool(json['gridBorderDash']) if json.get('gridBorderDash', None) is not None else None,
-            cell_border_dash=bool(json['cellBorderDash']) if json.get('cellBorderDash', None) is not None else None,
-            row_line_dash=bool(json['rowLineDash']) if json.get('rowLineDash', None) is not None else None,
-            column_line_dash=bool(json['columnLineDash']) if json.get('columnLineDash', None) is not None else None,
-            row_gap_color=dom.RGBA.from_json(json['rowGapColor']) if json.get('rowGapColor', None) is not None else None,
-            row_hatch_color=dom.RGBA.from_json(json['rowHatchColor']) if json.get('rowHatchColor', None) is not None else None,
-            column_gap_color=dom.RGBA.from_json(json['columnGapColor']) if json.get('columnGapColor', None) is not None else None,
-            column_hatch_color=dom.RGBA.from_json(json['columnHatchColor']) if json.get('columnHatchColor', None) is not None else None,
-            area_border_color=dom.RGBA.from_json(json['areaBorderColor']) if json.get('areaBorderColor', None) is not None else None,
-            grid_background_color=dom.RGBA.from_json(json['gridBackgroundColor']) if json.get('gridBackgroundColor', None) is not None else None,
+            get('showGridExtensionLines'),
+            get('showPositiveLineNumbers'),
+            get('showNegativeLineNumbers'),
+            get('showAreaNames'),
+            get('showLineNames'),
+            get('showTrackSizes'),
+            dom.RGBA.from_json(v) if (v := get('gridBorderColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('cellBorderColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('rowLineColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('columnLineColor')) is not None else None,
+            get('gridBorderDash'),
+            get('cellBorderDash'),
+            get('rowLineDash'),
+            get('columnLineDash'),
+            dom.RGBA.from_json(v) if (v := get('rowGapColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('rowHatchColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('columnGapColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('columnHatchColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('areaBorderColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('gridBackgroundColor')) is not None else None,
         )
 
 
@@ -228,15 +228,16 @@ class FlexContainerHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FlexContainerHighlightConfig:
+        get = json.get
         return cls(
-            container_border=LineStyle.from_json(json['containerBorder']) if json.get('containerBorder', None) is not None else None,
-            line_separator=LineStyle.from_json(json['lineSeparator']) if json.get('lineSeparator', None) is not None else None,
-            item_separator=LineStyle.from_json(json['itemSeparator']) if json.get('itemSeparator', None) is not None else None,
-            main_distributed_space=BoxStyle.from_json(json['mainDistributedSpace']) if json.get('mainDistributedSpace', None) is not None else None,
-            cross_distributed_space=BoxStyle.from_json(json['crossDistributedSpace']) if json.get('crossDistributedSpace', None) is not None else None,
-            row_gap_space=BoxStyle.from_json(json['rowGapSpace']) if json.get('rowGapSpace', None) is not None else None,
-            column_gap_space=BoxStyle.from_json(json['columnGapSpace']) if json.get('columnGapSpace', None) is not None else None,
-            cross_alignment=LineStyle.from_json(json['crossAlignment']) if json.get('crossAlignment', None) is not None else None,
+            LineStyle.from_json(v) if (v := get('containerBorder')) is not None else None,
+            LineStyle.from_json(v) if (v := get('lineSeparator')) is not None else None,
+            LineStyle.from_json(v) if (v := get('itemSeparator')) is not None else None,
+            BoxStyle.from_json(v) if (v := get('mainDistributedSpace')) is not None else None,
+            BoxStyle.from_json(v) if (v := get('crossDistributedSpace')) is not None else None,
+            BoxStyle.from_json(v) if (v := get('rowGapSpace')) is not None else None,
+            BoxStyle.from_json(v) if (v := get('columnGapSpace')) is not None else None,
+            LineStyle.from_json(v) if (v := get('crossAlignment')) is not None else None,
         )
 
 
@@ -266,10 +267,11 @@ class FlexItemHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FlexItemHighlightConfig:
+        get = json.get
         return cls(
-            base_size_box=BoxStyle.from_json(json['baseSizeBox']) if json.get('baseSizeBox', None) is not None else None,
-            base_size_border=LineStyle.from_json(json['baseSizeBorder']) if json.get('baseSizeBorder', None) is not None else None,
-            flexibility_arrow=LineStyle.from_json(json['flexibilityArrow']) if json.get('flexibilityArrow', None) is not None else None,
+            BoxStyle.from_json(v) if (v := get('baseSizeBox')) is not None else None,
+            LineStyle.from_json(v) if (v := get('baseSizeBorder')) is not None else None,
+            LineStyle.from_json(v) if (v := get('flexibilityArrow')) is not None else None,
         )
 
 
@@ -294,9 +296,10 @@ class LineStyle:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LineStyle:
+        get = json.get
         return cls(
-            color=dom.RGBA.from_json(json['color']) if json.get('color', None) is not None else None,
-            pattern=str(json['pattern']) if json.get('pattern', None) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('color')) is not None else None,
+            get('pattern'),
         )
 
 
@@ -321,9 +324,10 @@ class BoxStyle:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BoxStyle:
+        get = json.get
         return cls(
-            fill_color=dom.RGBA.from_json(json['fillColor']) if json.get('fillColor', None) is not None else None,
-            hatch_color=dom.RGBA.from_json(json['hatchColor']) if json.get('hatchColor', None) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('fillColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('hatchColor')) is not None else None,
         )
 
 
@@ -337,7 +341,10 @@ class ContrastAlgorithm(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContrastAlgorithm:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -446,26 +453,27 @@ class HighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> HighlightConfig:
+        get = json.get
         return cls(
-            show_info=bool(json['showInfo']) if json.get('showInfo', None) is not None else None,
-            show_styles=bool(json['showStyles']) if json.get('showStyles', None) is not None else None,
-            show_rulers=bool(json['showRulers']) if json.get('showRulers', None) is not None else None,
-            show_accessibility_info=bool(json['showAccessibilityInfo']) if json.get('showAccessibilityInfo', None) is not None else None,
-            show_extension_lines=bool(json['showExtensionLines']) if json.get('showExtensionLines', None) is not None else None,
-            content_color=dom.RGBA.from_json(json['contentColor']) if json.get('contentColor', None) is not None else None,
-            padding_color=dom.RGBA.from_json(json['paddingColor']) if json.get('paddingColor', None) is not None else None,
-            border_color=dom.RGBA.from_json(json['borderColor']) if json.get('borderColor', None) is not None else None,
-            margin_color=dom.RGBA.from_json(json['marginColor']) if json.get('marginColor', None) is not None else None,
-            event_target_color=dom.RGBA.from_json(json['eventTargetColor']) if json.get('eventTargetColor', None) is not None else None,
-            shape_color=dom.RGBA.from_json(json['shapeColor']) if json.get('shapeColor', None) is not None else None,
-            shape_margin_color=dom.RGBA.from_json(json['shapeMarginColor']) if json.get('shapeMarginColor', None) is not None else None,
-            css_grid_color=dom.RGBA.from_json(json['cssGridColor']) if json.get('cssGridColor', None) is not None else None,
-            color_format=ColorFormat.from_json(json['colorFormat']) if json.get('colorFormat', None) is not None else None,
-            grid_highlight_config=GridHighlightConfig.from_json(json['gridHighlightConfig']) if json.get('gridHighlightConfig', None) is not None else None,
-            flex_container_highlight_config=FlexContainerHighlightConfig.from_json(json['flexContainerHighlightConfig']) if json.get('flexContainerHighlightConfig', None) is not None else None,
-            flex_item_highlight_config=FlexItemHighlightConfig.from_json(json['flexItemHighlightConfig']) if json.get('flexItemHighlightConfig', None) is not None else None,
-            contrast_algorithm=ContrastAlgorithm.from_json(json['contrastAlgorithm']) if json.get('contrastAlgorithm', None) is not None else None,
-            container_query_container_highlight_config=ContainerQueryContainerHighlightConfig.from_json(json['containerQueryContainerHighlightConfig']) if json.get('containerQueryContainerHighlightConfig', None) is not None else None,
+            get('showInfo'),
+            get('showStyles'),
+            get('showRulers'),
+            get('showAccessibilityInfo'),
+            get('showExtensionLines'),
+            dom.RGBA.from_json(v) if (v := get('contentColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('paddingColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('borderColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('marginColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('eventTargetColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('shapeColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('shapeMarginColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('cssGridColor')) is not None else None,
+            ColorFormat.from_json(v) if (v := get('colorFormat')) is not None else None,
+            GridHighlightConfig.from_json(v) if (v := get('gridHighlightConfig')) is not None else None,
+            FlexContainerHighlightConfig.from_json(v) if (v := get('flexContainerHighlightConfig')) is not None else None,
+            FlexItemHighlightConfig.from_json(v) if (v := get('flexItemHighlightConfig')) is not None else None,
+            ContrastAlgorithm.from_json(v) if (v := get('contrastAlgorithm')) is not None else None,
+            ContainerQueryContainerHighlightConfig.from_json(v) if (v := get('containerQueryContainerHighlightConfig')) is not None else None,
         )
 
 
@@ -480,7 +488,10 @@ class ColorFormat(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ColorFormat:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -503,8 +514,8 @@ class GridNodeHighlightConfig:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> GridNodeHighlightConfig:
         return cls(
-            grid_highlight_config=GridHighlightConfig.from_json(json['gridHighlightConfig']),
-            node_id=dom.NodeId.from_json(json['nodeId']),
+            GridHighlightConfig.from_json(json['gridHighlightConfig']),
+            dom.NodeId(json['nodeId']),
         )
 
 
@@ -525,8 +536,8 @@ class FlexNodeHighlightConfig:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FlexNodeHighlightConfig:
         return cls(
-            flex_container_highlight_config=FlexContainerHighlightConfig.from_json(json['flexContainerHighlightConfig']),
-            node_id=dom.NodeId.from_json(json['nodeId']),
+            FlexContainerHighlightConfig.from_json(json['flexContainerHighlightConfig']),
+            dom.NodeId(json['nodeId']),
         )
 
 
@@ -558,11 +569,12 @@ class ScrollSnapContainerHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScrollSnapContainerHighlightConfig:
+        get = json.get
         return cls(
-            snapport_border=LineStyle.from_json(json['snapportBorder']) if json.get('snapportBorder', None) is not None else None,
-            snap_area_border=LineStyle.from_json(json['snapAreaBorder']) if json.get('snapAreaBorder', None) is not None else None,
-            scroll_margin_color=dom.RGBA.from_json(json['scrollMarginColor']) if json.get('scrollMarginColor', None) is not None else None,
-            scroll_padding_color=dom.RGBA.from_json(json['scrollPaddingColor']) if json.get('scrollPaddingColor', None) is not None else None,
+            LineStyle.from_json(v) if (v := get('snapportBorder')) is not None else None,
+            LineStyle.from_json(v) if (v := get('snapAreaBorder')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('scrollMarginColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('scrollPaddingColor')) is not None else None,
         )
 
 
@@ -583,8 +595,8 @@ class ScrollSnapHighlightConfig:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScrollSnapHighlightConfig:
         return cls(
-            scroll_snap_container_highlight_config=ScrollSnapContainerHighlightConfig.from_json(json['scrollSnapContainerHighlightConfig']),
-            node_id=dom.NodeId.from_json(json['nodeId']),
+            ScrollSnapContainerHighlightConfig.from_json(json['scrollSnapContainerHighlightConfig']),
+            dom.NodeId(json['nodeId']),
         )
 
 
@@ -613,10 +625,11 @@ class HingeConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> HingeConfig:
+        get = json.get
         return cls(
-            rect=dom.Rect.from_json(json['rect']),
-            content_color=dom.RGBA.from_json(json['contentColor']) if json.get('contentColor', None) is not None else None,
-            outline_color=dom.RGBA.from_json(json['outlineColor']) if json.get('outlineColor', None) is not None else None,
+            dom.Rect.from_json(json['rect']),
+            dom.RGBA.from_json(v) if (v := get('contentColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('outlineColor')) is not None else None,
         )
 
 
@@ -644,9 +657,9 @@ class WindowControlsOverlayConfig:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WindowControlsOverlayConfig:
         return cls(
-            show_css=bool(json['showCSS']),
-            selected_platform=str(json['selectedPlatform']),
-            theme_color=str(json['themeColor']),
+            json['showCSS'],
+            json['selectedPlatform'],
+            json['themeColor'],
         )
 
 
@@ -667,8 +680,8 @@ class ContainerQueryHighlightConfig:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContainerQueryHighlightConfig:
         return cls(
-            container_query_container_highlight_config=ContainerQueryContainerHighlightConfig.from_json(json['containerQueryContainerHighlightConfig']),
-            node_id=dom.NodeId.from_json(json['nodeId']),
+            ContainerQueryContainerHighlightConfig.from_json(json['containerQueryContainerHighlightConfig']),
+            dom.NodeId(json['nodeId']),
         )
 
 
@@ -690,9 +703,10 @@ class ContainerQueryContainerHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContainerQueryContainerHighlightConfig:
+        get = json.get
         return cls(
-            container_border=LineStyle.from_json(json['containerBorder']) if json.get('containerBorder', None) is not None else None,
-            descendant_border=LineStyle.from_json(json['descendantBorder']) if json.get('descendantBorder', None) is not None else None,
+            LineStyle.from_json(v) if (v := get('containerBorder')) is not None else None,
+            LineStyle.from_json(v) if (v := get('descendantBorder')) is not None else None,
         )
 
 
@@ -713,8 +727,8 @@ class IsolatedElementHighlightConfig:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IsolatedElementHighlightConfig:
         return cls(
-            isolation_mode_highlight_config=IsolationModeHighlightConfig.from_json(json['isolationModeHighlightConfig']),
-            node_id=dom.NodeId.from_json(json['nodeId']),
+            IsolationModeHighlightConfig.from_json(json['isolationModeHighlightConfig']),
+            dom.NodeId(json['nodeId']),
         )
 
 
@@ -741,10 +755,11 @@ class IsolationModeHighlightConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IsolationModeHighlightConfig:
+        get = json.get
         return cls(
-            resizer_color=dom.RGBA.from_json(json['resizerColor']) if json.get('resizerColor', None) is not None else None,
-            resizer_handle_color=dom.RGBA.from_json(json['resizerHandleColor']) if json.get('resizerHandleColor', None) is not None else None,
-            mask_color=dom.RGBA.from_json(json['maskColor']) if json.get('maskColor', None) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('resizerColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('resizerHandleColor')) is not None else None,
+            dom.RGBA.from_json(v) if (v := get('maskColor')) is not None else None,
         )
 
 
@@ -760,7 +775,10 @@ class InspectMode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InspectMode:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -783,6 +801,11 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('Overlay.getHighlightObjectForTest')
+def _decode_get_highlight_object_for_test(json: T_JSON_DICT) -> dict:
+    return dict(json['highlight'])
+
+
 def get_highlight_object_for_test(
         node_id: dom.NodeId,
         include_distance: typing.Optional[bool] = None,
@@ -815,7 +838,12 @@ def get_highlight_object_for_test(
         'params': params,
     }
     json = yield cmd_dict
-    return dict(json['highlight'])
+    return _decode_get_highlight_object_for_test(json)
+
+
+@command_decoder('Overlay.getGridHighlightObjectsForTest')
+def _decode_get_grid_highlight_objects_for_test(json: T_JSON_DICT) -> dict:
+    return dict(json['highlights'])
 
 
 def get_grid_highlight_objects_for_test(
@@ -834,7 +862,12 @@ def get_grid_highlight_objects_for_test(
         'params': params,
     }
     json = yield cmd_dict
-    return dict(json['highlights'])
+    return _decode_get_grid_highlight_objects_for_test(json)
+
+
+@command_decoder('Overlay.getSourceOrderHighlightObjectForTest')
+def _decode_get_source_order_highlight_object_for_test(json: T_JSON_DICT) -> dict:
+    return dict(json['highlight'])
 
 
 def get_source_order_highlight_object_for_test(
@@ -853,7 +886,7 @@ def get_source_order_highlight_object_for_test(
         'params': params,
     }
     json = yield cmd_dict
-    return dict(json['highlight'])
+    return _decode_get_source_order_highlight_object_for_test(json)
 
 
 def hide_highlight() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1345,7 +1378,7 @@ class InspectNodeRequested:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InspectNodeRequested:
         return cls(
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId'])
+            dom.BackendNodeId(json['backendNodeId']),
         )
 
 
@@ -1360,7 +1393,7 @@ class NodeHighlightRequested:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodeHighlightRequested:
         return cls(
-            node_id=dom.NodeId.from_json(json['nodeId'])
+            dom.NodeId(json['nodeId']),
         )
 
 
@@ -1376,7 +1409,7 @@ class ScreenshotRequested:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreenshotRequested:
         return cls(
-            viewport=page.Viewport.from_json(json['viewport'])
+            page.Viewport.from_json(json['viewport']),
         )
 
 
@@ -1390,6 +1423,4 @@ class InspectModeCanceled:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InspectModeCanceled:
-        return cls(
-
-        )
+        return cls()
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import debugger
 from . import dom
@@ -48,7 +47,10 @@ class AdFrameType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AdFrameType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class AdFrameExplanation(enum.Enum):
@@ -61,7 +63,10 @@ class AdFrameExplanation(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AdFrameExplanation:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -82,9 +87,10 @@ class AdFrameStatus:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AdFrameStatus:
+        get = json.get
         return cls(
-            ad_frame_type=AdFrameType.from_json(json['adFrameType']),
-            explanations=[AdFrameExplanation.from_json(i) for i in json['explanations']] if json.get('explanations', None) is not None else None,
+            AdFrameType.from_json(json['adFrameType']),
+            list(map(AdFrameExplanation.from_json, v)) if (v := get('explanations')) is not None else None,
         )
 
 
@@ -110,8 +116,8 @@ class AdScriptId:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AdScriptId:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            debugger_id=runtime.UniqueDebuggerId.from_json(json['debuggerId']),
+            runtime.ScriptId(json['scriptId']),
+            runtime.UniqueDebuggerId(json['debuggerId']),
         )
 
 
@@ -129,7 +135,10 @@ class SecureContextType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SecureContextType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class CrossOriginIsolatedContextType(enum.Enum):
@@ -145,7 +154,10 @@ class CrossOriginIsolatedContextType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CrossOriginIsolatedContextType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class GatedAPIFeatures(enum.Enum):
@@ -159,7 +171,10 @@ class GatedAPIFeatures(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> GatedAPIFeatures:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class PermissionsPolicyFeature(enum.Enum):
@@ -267,7 +282,10 @@ class PermissionsPolicyFeature(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PermissionsPolicyFeature:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class PermissionsPolicyBlockReason(enum.Enum):
@@ -284,7 +302,10 @@ class PermissionsPolicyBlockReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PermissionsPolicyBlockReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -302,8 +323,8 @@ class PermissionsPolicyBlockLocator:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PermissionsPolicyBlockLocator:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            block_reason=PermissionsPolicyBlockReason.from_json(json['blockReason']),
+            FrameId(json['frameId']),
+            PermissionsPolicyBlockReason.from_json(json['blockReason']),
         )
 
 
@@ -325,10 +346,11 @@ class PermissionsPolicyFeatureState:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PermissionsPolicyFeatureState:
+        get = json.get
         return cls(
-            feature=PermissionsPolicyFeature.from_json(json['feature']),
-            allowed=bool(json['allowed']),
-            locator=PermissionsPolicyBlockLocator.from_json(json['locator']) if json.get('locator', None) is not None else None,
+            PermissionsPolicyFeature.from_json(json['feature']),
+            json['allowed'],
+            PermissionsPolicyBlockLocator.from_json(v) if (v := get('locator')) is not None else None,
         )
 
 
@@ -355,7 +377,10 @@ class OriginTrialTokenStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> OriginTrialTokenStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class OriginTrialStatus(enum.Enum):
@@ -372,7 +397,10 @@ class OriginTrialStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> OriginTrialStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class OriginTrialUsageRestriction(enum.Enum):
@@ -384,7 +412,10 @@ class OriginTrialUsageRestriction(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> OriginTrialUsageRestriction:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -414,12 +445,12 @@ class OriginTrialToken:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> OriginTrialToken:
         return cls(
-            origin=str(json['origin']),
-            match_sub_domains=bool(json['matchSubDomains']),
-            trial_name=str(json['trialName']),
-            expiry_time=network.TimeSinceEpoch.from_json(json['expiryTime']),
-            is_third_party=bool(json['isThirdParty']),
-            usage_restriction=OriginTrialUsageRestriction.from_json(json['usageRestriction']),
+            json['origin'],
+            json['matchSubDomains'],
+            json['trialName'],
+            network.TimeSinceEpoch(json['expiryTime']),
+            json['isThirdParty'],
+            OriginTrialUsageRestriction.from_json(json['usageRestriction']),
         )
 
 
@@ -443,10 +474,11 @@ class OriginTrialTokenWithStatus:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> OriginTrialTokenWithStatus:
+        get = json.get
         return cls(
-            raw_token_text=str(json['rawTokenText']),
-            status=OriginTrialTokenStatus.from_json(json['status']),
-            parsed_token=OriginTrialToken.from_json(json['parsedToken']) if json.get('parsedToken', None) is not None else None,
+            json['rawTokenText'],
+            OriginTrialTokenStatus.from_json(json['status']),
+            OriginTrialToken.from_json(v) if (v := get('parsedToken')) is not None else None,
         )
 
 
@@ -468,9 +500,9 @@ class OriginTrial:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> OriginTrial:
         return cls(
-            trial_name=str(json['trialName']),
-            status=OriginTrialStatus.from_json(json['status']),
-            tokens_with_status=[OriginTrialTokenWithStatus.from_json(i) for i in json['tokensWithStatus']],
+            json['trialName'],
+            OriginTrialStatus.from_json(json['status']),
+            list(map(OriginTrialTokenWithStatus.from_json, json['tokensWithStatus'])),
         )
 
 
@@ -549,21 +581,22 @@ class Frame:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Frame:
+        get = json.get
         return cls(
-            id_=FrameId.from_json(json['id']),
-            loader_id=network.LoaderId.from_json(json['loaderId']),
-            url=str(json['url']),
-            domain_and_registry=str(json['domainAndRegistry']),
-            security_origin=str(json['securityOrigin']),
-            mime_type=str(json['mimeType']),
-            secure_context_type=SecureContextType.from_json(json['secureContextType']),
-            cross_origin_isolated_context_type=CrossOriginIsolatedContextType.from_json(json['crossOriginIsolatedContextType']),
-            gated_api_features=[GatedAPIFeatures.from_json(i) for i in json['gatedAPIFeatures']],
-            parent_id=FrameId.from_json(json['parentId']) if json.get('parentId', None) is not None else None,
-            name=str(json['name']) if json.get('name', None) is not None else None,
-            url_fragment=str(json['urlFragment']) if json.get('urlFragment', None) is not None else None,
-            unreachable_url=str(json['unreachableUrl']) if json.get('unreachableUrl', None) is not None else None,
-            ad_frame_status=AdFrameStatus.from_json(json['adFrameStatus']) if json.get('adFrameStatus', None) is not None else None,
+            FrameId(json['id']),
+            network.LoaderId(json['loaderId']),
+            json['url'],
+            json['domainAndRegistry'],
+            json['securityOrigin'],
+            json['mimeType'],
+            SecureContextType.from_json(json['secureContextType']),
+            CrossOriginIsolatedContextType.from_json(json['crossOriginIsolatedContextType']),
+            list(map(GatedAPIFeatures.from_json, json['gatedAPIFeatures'])),
+            FrameId(v) if (v := get('parentId')) is not None else None,
+            get('name'),
+            get('urlFragment'),
+            get('unreachableUrl'),
+            AdFrameStatus.from_json(v) if (v := get('adFrameStatus')) is not None else None,
         )
 
 
@@ -610,14 +643,15 @@ class FrameResource:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameResource:
+        get = json.get
         return cls(
-            url=str(json['url']),
-            type_=network.ResourceType.from_json(json['type']),
-            mime_type=str(json['mimeType']),
-            last_modified=network.TimeSinceEpoch.from_json(json['lastModified']) if json.get('lastModified', None) is not None else None,
-            content_size=float(json['contentSize']) if json.get('contentSize', None) is not None else None,
-            failed=bool(json['failed']) if json.get('failed', None) is not None else None,
-            canceled=bool(json['canceled']) if json.get('canceled', None) is not None else None,
+            json['url'],
+            network.ResourceType.from_json(json['type']),
+            json['mimeType'],
+            network.TimeSinceEpoch(v) if (v := get('lastModified')) is not None else None,
+            float(v) if (v := get('contentSize')) is not None else None,
+            get('failed'),
+            get('canceled'),
         )
 
 
@@ -645,10 +679,11 @@ class FrameResourceTree:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameResourceTree:
+        get = json.get
         return cls(
-            frame=Frame.from_json(json['frame']),
-            resources=[FrameResource.from_json(i) for i in json['resources']],
-            child_frames=[FrameResourceTree.from_json(i) for i in json['childFrames']] if json.get('childFrames', None) is not None else None,
+            Frame.from_json(json['frame']),
+            list(map(FrameResource.from_json, json['resources'])),
+            list(map(FrameResourceTree.from_json, v)) if (v := get('childFrames')) is not None else None,
         )
 
 
@@ -672,9 +707,10 @@ class FrameTree:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameTree:
+        get = json.get
         return cls(
-            frame=Frame.from_json(json['frame']),
-            child_frames=[FrameTree.from_json(i) for i in json['childFrames']] if json.get('childFrames', None) is not None else None,
+            Frame.from_json(json['frame']),
+            list(map(FrameTree.from_json, v)) if (v := get('childFrames')) is not None else None,
         )
 
 
@@ -716,7 +752,10 @@ class TransitionType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> TransitionType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -751,11 +790,11 @@ class NavigationEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NavigationEntry:
         return cls(
-            id_=int(json['id']),
-            url=str(json['url']),
-            user_typed_url=str(json['userTypedURL']),
-            title=str(json['title']),
-            transition_type=TransitionType.from_json(json['transitionType']),
+            json['id'],
+            json['url'],
+            json['userTypedURL'],
+            json['title'],
+            TransitionType.from_json(json['transitionType']),
         )
 
 
@@ -799,14 +838,15 @@ class ScreencastFrameMetadata:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreencastFrameMetadata:
+        get = json.get
         return cls(
-            offset_top=float(json['offsetTop']),
-            page_scale_factor=float(json['pageScaleFactor']),
-            device_width=float(json['deviceWidth']),
-            device_height=float(json['deviceHeight']),
-            scroll_offset_x=float(json['scrollOffsetX']),
-            scroll_offset_y=float(json['scrollOffsetY']),
-            timestamp=network.TimeSinceEpoch.from_json(json['timestamp']) if json.get('timestamp', None) is not None else None,
+            float(json['offsetTop']),
+            float(json['pageScaleFactor']),
+            float(json['deviceWidth']),
+            float(json['deviceHeight']),
+            float(json['scrollOffsetX']),
+            float(json['scrollOffsetY']),
+            network.TimeSinceEpoch(v) if (v := get('timestamp')) is not None else None,
         )
 
 
@@ -824,7 +864,10 @@ class DialogType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DialogType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -855,10 +898,10 @@ class AppManifestError:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AppManifestError:
         return cls(
-            message=str(json['message']),
-            critical=int(json['critical']),
-            line=int(json['line']),
-            column=int(json['column']),
+            json['message'],
+            json['critical'],
+            json['line'],
+            json['column'],
         )
 
 
@@ -878,7 +921,7 @@ class AppManifestParsedProperties:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AppManifestParsedProperties:
         return cls(
-            scope=str(json['scope']),
+            json['scope'],
         )
 
 
@@ -910,10 +953,10 @@ class LayoutViewport:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayoutViewport:
         return cls(
-            page_x=int(json['pageX']),
-            page_y=int(json['pageY']),
-            client_width=int(json['clientWidth']),
-            client_height=int(json['clientHeight']),
+            json['pageX'],
+            json['pageY'],
+            json['clientWidth'],
+            json['clientHeight'],
         )
 
 
@@ -961,15 +1004,16 @@ class VisualViewport:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VisualViewport:
+        get = json.get
         return cls(
-            offset_x=float(json['offsetX']),
-            offset_y=float(json['offsetY']),
-            page_x=float(json['pageX']),
-            page_y=float(json['pageY']),
-            client_width=float(json['clientWidth']),
-            client_height=float(json['clientHeight']),
-            scale=float(json['scale']),
-            zoom=float(json['zoom']) if json.get('zoom', None) is not None else None,
+            float(json['offsetX']),
+            float(json['offsetY']),
+            float(json['pageX']),
+            float(json['pageY']),
+            float(json['clientWidth']),
+            float(json['clientHeight']),
+            float(json['scale']),
+            float(v) if (v := get('zoom')) is not None else None,
         )
 
 
@@ -1005,11 +1049,11 @@ class Viewport:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Viewport:
         return cls(
-            x=float(json['x']),
-            y=float(json['y']),
-            width=float(json['width']),
-            height=float(json['height']),
-            scale=float(json['scale']),
+            float(json['x']),
+            float(json['y']),
+            float(json['width']),
+            float(json['height']),
+            float(json['scale']),
         )
 
 
@@ -1059,14 +1103,15 @@ class FontFamilies:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FontFamilies:
+        get = json.get
         return cls(
-            standard=str(json['standard']) if json.get('standard', None) is not None else None,
-            fixed=str(json['fixed']) if json.get('fixed', None) is not None else None,
-            serif=str(json['serif']) if json.get('serif', None) is not None else None,
-            sans_serif=str(json['sansSerif']) if json.get('sansSerif', None) is not None else None,
-            cursive=str(json['cursive']) if json.get('cursive', None) is not None else None,
-            fantasy=str(json['fantasy']) if json.get('fantasy', None) is not None else None,
-            math=str(json['math']) if json.get('math', None) is not None else None,
+            get('standard'),
+            get('fixed'),
+            get('serif'),
+            get('sansSerif'),
+            get('cursive'),
+            get('fantasy'),
+            get('math'),
         )
 
 
@@ -1090,8 +1135,8 @@ class ScriptFontFamilies:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptFontFamilies:
         return cls(
-            script=str(json['script']),
-            font_families=FontFamilies.from_json(json['fontFamilies']),
+            json['script'],
+            FontFamilies.from_json(json['fontFamilies']),
         )
 
 
@@ -1116,9 +1161,10 @@ class FontSizes:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FontSizes:
+        get = json.get
         return cls(
-            standard=int(json['standard']) if json.get('standard', None) is not None else None,
-            fixed=int(json['fixed']) if json.get('fixed', None) is not None else None,
+            get('standard'),
+            get('fixed'),
         )
 
 
@@ -1139,7 +1185,10 @@ class ClientNavigationReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ClientNavigationReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class ClientNavigationDisposition(enum.Enum):
@@ -1153,7 +1202,10 @@ class ClientNavigationDisposition(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ClientNavigationDisposition:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1173,8 +1225,8 @@ class InstallabilityErrorArgument:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InstallabilityErrorArgument:
         return cls(
-            name=str(json['name']),
-            value=str(json['value']),
+            json['name'],
+            json['value'],
         )
 
 
@@ -1198,8 +1250,8 @@ class InstallabilityError:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InstallabilityError:
         return cls(
-            error_id=str(json['errorId']),
-            error_arguments=[InstallabilityErrorArgument.from_json(i) for i in json['errorArguments']],
+            json['errorId'],
+            list(map(InstallabilityErrorArgument.from_json, json['errorArguments'])),
         )
 
 
@@ -1221,7 +1273,10 @@ class ReferrerPolicy(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ReferrerPolicy:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1245,9 +1300,10 @@ class CompilationCacheParams:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CompilationCacheParams:
+        get = json.get
         return cls(
-            url=str(json['url']),
-            eager=bool(json['eager']) if json.get('eager', None) is not None else None,
+            json['url'],
+            get('eager'),
         )
 
 
@@ -1267,9 +1323,10 @@ class FileFilter:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FileFilter:
+        get = json.get
         return cls(
-            name=str(json['name']) if json.get('name', None) is not None else None,
-            accepts=[str(i) for i in json['accepts']] if json.get('accepts', None) is not None else None,
+            get('name'),
+            list(v) if (v := get('accepts')) is not None else None,
         )
 
 
@@ -1301,12 +1358,13 @@ class FileHandler:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FileHandler:
+        get = json.get
         return cls(
-            action=str(json['action']),
-            name=str(json['name']),
-            launch_type=str(json['launchType']),
-            icons=[ImageResource.from_json(i) for i in json['icons']] if json.get('icons', None) is not None else None,
-            accepts=[FileFilter.from_json(i) for i in json['accepts']] if json.get('accepts', None) is not None else None,
+            json['action'],
+            json['name'],
+            json['launchType'],
+            list(map(ImageResource.from_json, v)) if (v := get('icons')) is not None else None,
+            list(map(FileFilter.from_json, v)) if (v := get('accepts')) is not None else None,
         )
 
 
@@ -1334,10 +1392,11 @@ class ImageResource:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ImageResource:
+        get = json.get
         return cls(
-            url=str(json['url']),
-            sizes=str(json['sizes']) if json.get('sizes', None) is not None else None,
-            type_=str(json['type']) if json.get('type', None) is not None else None,
+            json['url'],
+            get('sizes'),
+            get('type'),
         )
 
 
@@ -1353,7 +1412,7 @@ class LaunchHandler:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LaunchHandler:
         return cls(
-            client_mode=str(json['clientMode']),
+            json['clientMode'],
         )
 
 
@@ -1372,8 +1431,8 @@ class ProtocolHandler:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ProtocolHandler:
         return cls(
-            protocol=str(json['protocol']),
-            url=str(json['url']),
+            json['protocol'],
+            json['url'],
         )
 
 
@@ -1392,9 +1451,10 @@ class RelatedApplication:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RelatedApplication:
+        get = json.get
         return cls(
-            url=str(json['url']),
-            id_=str(json['id']) if json.get('id', None) is not None else None,
+            json['url'],
+            get('id'),
         )
 
 
@@ -1415,8 +1475,8 @@ class ScopeExtension:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScopeExtension:
         return cls(
-            origin=str(json['origin']),
-            has_origin_wildcard=bool(json['hasOriginWildcard']),
+            json['origin'],
+            json['hasOriginWildcard'],
         )
 
 
@@ -1438,10 +1498,11 @@ class Screenshot:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Screenshot:
+        get = json.get
         return cls(
-            image=ImageResource.from_json(json['image']),
-            form_factor=str(json['formFactor']),
-            label=str(json['label']) if json.get('label', None) is not None else None,
+            ImageResource.from_json(json['image']),
+            json['formFactor'],
+            get('label'),
         )
 
 
@@ -1479,14 +1540,15 @@ class ShareTarget:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ShareTarget:
+        get = json.get
         return cls(
-            action=str(json['action']),
-            method=str(json['method']),
-            enctype=str(json['enctype']),
-            title=str(json['title']) if json.get('title', None) is not None else None,
-            text=str(json['text']) if json.get('text', None) is not None else None,
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            files=[FileFilter.from_json(i) for i in json['files']] if json.get('files', None) is not None else None,
+            json['action'],
+            json['method'],
+            json['enctype'],
+            get('title'),
+            get('text'),
+            get('url'),
+            list(map(FileFilter.from_json, v)) if (v := get('files')) is not None else None,
         )
 
 
@@ -1505,8 +1567,8 @@ class Shortcut:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Shortcut:
         return cls(
-            name=str(json['name']),
-            url=str(json['url']),
+            json['name'],
+            json['url'],
         )
 
 
@@ -1620,30 +1682,31 @@ class WebAppManifest:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WebAppManifest:
-        return cls(
-            background_color=str(json['backgroundColor']) if json.get('backgroundColor', None) is not None else None,
-            description=str(json['description']) if json.get('description', None) is not None else None,
-            dir_=str(json['dir']) if json.get('dir', None) is not None else None,
-            display=str(json['display']) if json.get('display', None) is not None else None,
-            display_overrides=[str(i) for i in json['displayOverrides']] if json.get('displayOverrides', None) is not None else None,
-            file_handlers=[FileHandler.from_json(i) for i in json['fileHandlers']] if json.get('fileHandlers', None) is not None else None,
-            icons=[ImageResource.from_json(i) for i in json['icons']] if json.get('icons', None) is not None else None,
-            id_=str(json['id']) if json.get('id', None) is not None else None,
-            lang=str(json['lang']) if json.get('lang', None) is not None else None,
-            launch_handler=LaunchHandler.from_json(json['launchHandler']) if json.get('launchHandler', None) is not None else None,
-            name=str(json['name']) if json.get('name', None) is not None else None,
-            orientation=str(json['orientation']) if json.get('orientation', None) is not None else None,
-            prefer_related_applications=bool(json['preferRelatedApplications']) if json.get('preferRelatedApplications', None) is not None else None,
-            protocol_handlers=[ProtocolHandler.from_json(i) for i in json['protocolHandlers']] if json.get('protocolHandlers', None) is not None else None,
-            related_applications=[RelatedApplication.from_json(i) for i in json['relatedApplications']] if json.get('relatedApplications', None) is not None else None,
-            scope=str(json['scope']) if json.get('scope', None) is not None else None,
-            scope_extensions=[ScopeExtension.from_json(i) for i in json['scopeExtensions']] if json.get('scopeExtensions', None) is not None else None,
-            screenshots=[Screenshot.from_json(i) for i in json['screenshots']] if json.get('screenshots', None) is not None else None,
-            share_target=ShareTarget.from_json(json['shareTarget']) if json.get('shareTarget', None) is not None else None,
-            short_name=str(json['shortName']) if json.get('shortName', None) is not None else None,
-            shortcuts=[Shortcut.from_json(i) for i in json['shortcuts']] if json.get('shortcuts', None) is not None else None,
-            start_url=str(json['startUrl']) if json.get('startUrl', None) is not None else None,
-            theme_color=str(json['themeColor']) if json.get('themeColor', None) is not None else None,
+        get = json.get
+        return cls(
+            get('backgroundColor'),
+            get('description'),
+            get('dir'),
+            get('display'),
+            list(v) if (v := get('displayOverrides')) is not None else None,
+            list(map(FileHandler.from_json, v)) if (v := get('fileHandlers')) is not None else None,
+            list(map(ImageResource.from_json, v)) if (v := get('icons')) is not None else None,
+            get('id'),
+            get('lang'),
+            LaunchHandler.from_json(v) if (v := get('launchHandler')) is not None else None,
+            get('name'),
+            get('orientation'),
+            get('preferRelatedApplications'),
+            list(map(ProtocolHandler.from_json, v)) if (v := get('protocolHandlers')) is not None else None,
+            list(map(RelatedApplication.from_json, v)) if (v := get('relatedApplications')) is not None else None,
+            get('scope'),
+            list(map(ScopeExtension.from_json, v)) if (v := get('scopeExtensions')) is not None else None,
+            list(map(Screenshot.from_json, v)) if (v := get('screenshots')) is not None else None,
+            ShareTarget.from_json(v) if (v := get('shareTarget')) is not None else None,
+            get('shortName'),
+            list(map(Shortcut.from_json, v)) if (v := get('shortcuts')) is not None else None,
+            get('startUrl'),
+            get('themeColor'),
         )
 
 
@@ -1661,7 +1724,10 @@ class AutoResponseMode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AutoResponseMode:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class NavigationType(enum.Enum):
@@ -1676,7 +1742,10 @@ class NavigationType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> NavigationType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class BackForwardCacheNotRestoredReason(enum.Enum):
@@ -1828,7 +1897,10 @@ class BackForwardCacheNotRestoredReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BackForwardCacheNotRestoredReason:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class BackForwardCacheNotRestoredReasonType(enum.Enum):
@@ -1844,7 +1916,10 @@ class BackForwardCacheNotRestoredReasonType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BackForwardCacheNotRestoredReasonType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1873,11 +1948,12 @@ class BackForwardCacheBlockingDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackForwardCacheBlockingDetails:
+        get = json.get
         return cls(
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            function=str(json['function']) if json.get('function', None) is not None else None,
+            json['lineNumber'],
+            json['columnNumber'],
+            get('url'),
+            get('function'),
         )
 
 
@@ -1908,11 +1984,12 @@ class BackForwardCacheNotRestoredExplanation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackForwardCacheNotRestoredExplanation:
+        get = json.get
         return cls(
-            type_=BackForwardCacheNotRestoredReasonType.from_json(json['type']),
-            reason=BackForwardCacheNotRestoredReason.from_json(json['reason']),
-            context=str(json['context']) if json.get('context', None) is not None else None,
-            details=[BackForwardCacheBlockingDetails.from_json(i) for i in json['details']] if json.get('details', None) is not None else None,
+            BackForwardCacheNotRestoredReasonType.from_json(json['type']),
+            BackForwardCacheNotRestoredReason.from_json(json['reason']),
+            get('context'),
+            list(map(BackForwardCacheBlockingDetails.from_json, v)) if (v := get('details')) is not None else None,
         )
 
 
@@ -1937,12 +2014,17 @@ class BackForwardCacheNotRestoredExplanationTree:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackForwardCacheNotRestoredExplanationTree:
         return cls(
-            url=str(json['url']),
-            explanations=[BackForwardCacheNotRestoredExplanation.from_json(i) for i in json['explanations']],
-            children=[BackForwardCacheNotRestoredExplanationTree.from_json(i) for i in json['children']],
+            json['url'],
+            list(map(BackForwardCacheNotRestoredExplanation.from_json, json['explanations'])),
+            list(map(BackForwardCacheNotRestoredExplanationTree.from_json, json['children'])),
         )
 
 
+@command_decoder('Page.addScriptToEvaluateOnLoad')
+def _decode_add_script_to_evaluate_on_load(json: T_JSON_DICT) -> ScriptIdentifier:
+    return ScriptIdentifier.from_json(json['identifier'])
+
+
 @deprecated(version="1.3")
 def add_script_to_evaluate_on_load(
         script_source: str
@@ -1964,6 +2046,11 @@ def add_script_to_evaluate_on_load(
         'params': params,
     }
     json = yield cmd_dict
+    return _decode_add_script_to_evaluate_on_load(json)
+
+
+@command_decoder('Page.addScriptToEvaluateOnNewDocument')
+def _decode_add_script_to_evaluate_on_new_document(json: T_JSON_DICT) -> ScriptIdentifier:
     return ScriptIdentifier.from_json(json['identifier'])
 
 
@@ -1995,7 +2082,7 @@ def add_script_to_evaluate_on_new_document(
         'params': params,
     }
     json = yield cmd_dict
-    return ScriptIdentifier.from_json(json['identifier'])
+    return _decode_add_script_to_evaluate_on_new_document(json)
 
 
 def bring_to_front() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2008,6 +2095,11 @@ def bring_to_front() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('Page.captureScreenshot')
+def _decode_capture_screenshot(json: T_JSON_DICT) -> str:
+    return str(json['data'])
+
+
 def capture_screenshot(
         format_: typing.Optional[str] = None,
         quality: typing.Optional[int] = None,
@@ -2045,6 +2137,11 @@ def capture_screenshot(
         'params': params,
     }
     json = yield cmd_dict
+    return _decode_capture_screenshot(json)
+
+
+@command_decoder('Page.captureSnapshot')
+def _decode_capture_snapshot(json: T_JSON_DICT) -> str:
     return str(json['data'])
 
 
@@ -2068,7 +2165,7 @@ def capture_snapshot(
         'params': params,
     }
     json = yield cmd_dict
-    return str(json['data'])
+    return _decode_capture_snapshot(json)
 
 
 @deprecated(version="1.3")
@@ -2114,6 +2211,11 @@ def clear_geolocation_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Non
     json = yield cmd_dict
 
 
+@command_decoder('Page.createIsolatedWorld')
+def _decode_create_isolated_world(json: T_JSON_DICT) -> runtime.ExecutionContextId:
+    return runtime.ExecutionContextId.from_json(json['executionContextId'])
+
+
 def create_isolated_world(
         frame_id: FrameId,
         world_name: typing.Optional[str] = None,
@@ -2138,7 +2240,7 @@ def create_isolated_world(
         'params': params,
     }
     json = yield cmd_dict
-    return runtime.ExecutionContextId.from_json(json['executionContextId'])
+    return _decode_create_isolated_world(json)
 
 
 @deprecated(version="1.3")
@@ -2186,6 +2288,17 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('Page.getAppManifest')
+def _decode_get_app_manifest(json: T_JSON_DICT) -> typing.Tuple[str, typing.List[AppManifestError], typing.Optional[str], typing.Optional[AppManifestParsedProperties], WebAppManifest]:
+    return (
+        str(json['url']),
+        [AppManifestError.from_json(i) for i in json['errors']],
+        str(json['data']) if json.get('data', None) is not None else None,
+        AppManifestParsedProperties.from_json(json['parsed']) if json.get('parsed', None) is not None else None,
+        WebAppManifest.from_json(json['manifest'])
+    )
+
+
 def get_app_manifest(
         manifest_id: typing.Optional[str] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, typing.List[AppManifestError], typing.Optional[str], typing.Optional[AppManifestParsedProperties], WebAppManifest]]:
@@ -2213,13 +2326,12 @@ def get_app_manifest(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        str(json['url']),
-        [AppManifestError.from_json(i) for i in json['errors']],
-        str(json['data']) if json.get('data', None) is not None else None,
-        AppManifestParsedProperties.from_json(json['parsed']) if json.get('parsed', None) is not None else None,
-        WebAppManifest.from_json(json['manifest'])
-    )
+    return _decode_get_app_manifest(json)
+
+
+@command_decoder('Page.getInstallabilityErrors')
+def _decode_get_installability_errors(json: T_JSON_DICT) -> typing.List[InstallabilityError]:
+    return [InstallabilityError.from_json(i) for i in json['installabilityErrors']]
 
 
 def get_installability_errors() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[InstallabilityError]]:
@@ -2234,7 +2346,12 @@ def get_installability_errors() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typi
         'method': 'Page.getInstallabilityErrors',
     }
     json = yield cmd_dict
-    return [InstallabilityError.from_json(i) for i in json['installabilityErrors']]
+    return _decode_get_installability_errors(json)
+
+
+@command_decoder('Page.getManifestIcons')
+def _decode_get_manifest_icons(json: T_JSON_DICT) -> typing.Optional[str]:
+    return str(json['primaryIcon']) if json.get('primaryIcon', None) is not None else None
 
 
 @deprecated(version="1.3")
@@ -2252,7 +2369,15 @@ def get_manifest_icons() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Opti
         'method': 'Page.getManifestIcons',
     }
     json = yield cmd_dict
-    return str(json['primaryIcon']) if json.get('primaryIcon', None) is not None else None
+    return _decode_get_manifest_icons(json)
+
+
+@command_decoder('Page.getAppId')
+def _decode_get_app_id(json: T_JSON_DICT) -> typing.Tuple[typing.Optional[str], typing.Optional[str]]:
+    return (
+        str(json['appId']) if json.get('appId', None) is not None else None,
+        str(json['recommendedId']) if json.get('recommendedId', None) is not None else None
+    )
 
 
 def get_app_id() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[str], typing.Optional[str]]]:
@@ -2271,10 +2396,12 @@ def get_app_id() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing
         'method': 'Page.getAppId',
     }
     json = yield cmd_dict
-    return (
-        str(json['appId']) if json.get('appId', None) is not None else None,
-        str(json['recommendedId']) if json.get('recommendedId', None) is not None else None
-    )
+    return _decode_get_app_id(json)
+
+
+@command_decoder('Page.getAdScriptId')
+def _decode_get_ad_script_id(json: T_JSON_DICT) -> typing.Optional[AdScriptId]:
+    return AdScriptId.from_json(json['adScriptId']) if json.get('adScriptId', None) is not None else None
 
 
 def get_ad_script_id(
@@ -2295,7 +2422,12 @@ def get_ad_script_id(
         'params': params,
     }
     json = yield cmd_dict
-    return AdScriptId.from_json(json['adScriptId']) if json.get('adScriptId', None) is not None else None
+    return _decode_get_ad_script_id(json)
+
+
+@command_decoder('Page.getFrameTree')
+def _decode_get_frame_tree(json: T_JSON_DICT) -> FrameTree:
+    return FrameTree.from_json(json['frameTree'])
 
 
 def get_frame_tree() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,FrameTree]:
@@ -2308,7 +2440,19 @@ def get_frame_tree() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,FrameTree]:
         'method': 'Page.getFrameTree',
     }
     json = yield cmd_dict
-    return FrameTree.from_json(json['frameTree'])
+    return _decode_get_frame_tree(json)
+
+
+@command_decoder('Page.getLayoutMetrics')
+def _decode_get_layout_metrics(json: T_JSON_DICT) -> typing.Tuple[LayoutViewport, VisualViewport, dom.Rect, LayoutViewport, VisualViewport, dom.Rect]:
+    return (
+        LayoutViewport.from_json(json['layoutViewport']),
+        VisualViewport.from_json(json['visualViewport']),
+        dom.Rect.from_json(json['contentSize']),
+        LayoutViewport.from_json(json['cssLayoutViewport']),
+        VisualViewport.from_json(json['cssVisualViewport']),
+        dom.Rect.from_json(json['cssContentSize'])
+    )
 
 
 def get_layout_metrics() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[LayoutViewport, VisualViewport, dom.Rect, LayoutViewport, VisualViewport, dom.Rect]]:
@@ -2328,13 +2472,14 @@ def get_layout_metrics() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tupl
         'method': 'Page.getLayoutMetrics',
     }
     json = yield cmd_dict
+    return _decode_get_layout_metrics(json)
+
+
+@command_decoder('Page.getNavigationHistory')
+def _decode_get_navigation_history(json: T_JSON_DICT) -> typing.Tuple[int, typing.List[NavigationEntry]]:
     return (
-        LayoutViewport.from_json(json['layoutViewport']),
-        VisualViewport.from_json(json['visualViewport']),
-        dom.Rect.from_json(json['contentSize']),
-        LayoutViewport.from_json(json['cssLayoutViewport']),
-        VisualViewport.from_json(json['cssVisualViewport']),
-        dom.Rect.from_json(json['cssContentSize'])
+        int(json['currentIndex']),
+        [NavigationEntry.from_json(i) for i in json['entries']]
     )
 
 
@@ -2351,10 +2496,7 @@ def get_navigation_history() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.
         'method': 'Page.getNavigationHistory',
     }
     json = yield cmd_dict
-    return (
-        int(json['currentIndex']),
-        [NavigationEntry.from_json(i) for i in json['entries']]
-    )
+    return _decode_get_navigation_history(json)
 
 
 def reset_navigation_history() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2367,6 +2509,14 @@ def reset_navigation_history() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]
     json = yield cmd_dict
 
 
+@command_decoder('Page.getResourceContent')
+def _decode_get_resource_content(json: T_JSON_DICT) -> typing.Tuple[str, bool]:
+    return (
+        str(json['content']),
+        bool(json['base64Encoded'])
+    )
+
+
 def get_resource_content(
         frame_id: FrameId,
         url: str
@@ -2391,10 +2541,12 @@ def get_resource_content(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        str(json['content']),
-        bool(json['base64Encoded'])
-    )
+    return _decode_get_resource_content(json)
+
+
+@command_decoder('Page.getResourceTree')
+def _decode_get_resource_tree(json: T_JSON_DICT) -> FrameResourceTree:
+    return FrameResourceTree.from_json(json['frameTree'])
 
 
 def get_resource_tree() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,FrameResourceTree]:
@@ -2409,7 +2561,7 @@ def get_resource_tree() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,FrameResourc
         'method': 'Page.getResourceTree',
     }
     json = yield cmd_dict
-    return FrameResourceTree.from_json(json['frameTree'])
+    return _decode_get_resource_tree(json)
 
 
 def handle_java_script_dialog(
@@ -2433,6 +2585,15 @@ def handle_java_script_dialog(
     json = yield cmd_dict
 
 
+@command_decoder('Page.navigate')
+def _decode_navigate(json: T_JSON_DICT) -> typing.Tuple[FrameId, typing.Optional[network.LoaderId], typing.Optional[str]]:
+    return (
+        FrameId.from_json(json['frameId']),
+        network.LoaderId.from_json(json['loaderId']) if json.get('loaderId', None) is not None else None,
+        str(json['errorText']) if json.get('errorText', None) is not None else None
+    )
+
+
 def navigate(
         url: str,
         referrer: typing.Optional[str] = None,
@@ -2469,11 +2630,7 @@ def navigate(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        FrameId.from_json(json['frameId']),
-        network.LoaderId.from_json(json['loaderId']) if json.get('loaderId', None) is not None else None,
-        str(json['errorText']) if json.get('errorText', None) is not None else None
-    )
+    return _decode_navigate(json)
 
 
 def navigate_to_history_entry(
@@ -2493,6 +2650,14 @@ def navigate_to_history_entry(
     json = yield cmd_dict
 
 
+@command_decoder('Page.printToPDF')
+def _decode_print_to_pdf(json: T_JSON_DICT) -> typing.Tuple[str, typing.Optional[io.StreamHandle]]:
+    return (
+        str(json['data']),
+        io.StreamHandle.from_json(json['stream']) if json.get('stream', None) is not None else None
+    )
+
+
 def print_to_pdf(
         landscape: typing.Optional[bool] = None,
         display_header_footer: typing.Optional[bool] = None,
@@ -2577,10 +2742,7 @@ def print_to_pdf(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        str(json['data']),
-        io.StreamHandle.from_json(json['stream']) if json.get('stream', None) is not None else None
-    )
+    return _decode_print_to_pdf(json)
 
 
 def reload(
@@ -2667,6 +2829,11 @@ def screencast_frame_ack(
     json = yield cmd_dict
 
 
+@command_decoder('Page.searchInResource')
+def _decode_search_in_resource(json: T_JSON_DICT) -> typing.List[debugger.SearchMatch]:
+    return [debugger.SearchMatch.from_json(i) for i in json['result']]
+
+
 def search_in_resource(
         frame_id: FrameId,
         url: str,
@@ -2699,7 +2866,7 @@ def search_in_resource(
         'params': params,
     }
     json = yield cmd_dict
-    return [debugger.SearchMatch.from_json(i) for i in json['result']]
+    return _decode_search_in_resource(json)
 
 
 def set_ad_blocking_enabled(
@@ -2738,6 +2905,11 @@ def set_bypass_csp(
     json = yield cmd_dict
 
 
+@command_decoder('Page.getPermissionsPolicyState')
+def _decode_get_permissions_policy_state(json: T_JSON_DICT) -> typing.List[PermissionsPolicyFeatureState]:
+    return [PermissionsPolicyFeatureState.from_json(i) for i in json['states']]
+
+
 def get_permissions_policy_state(
         frame_id: FrameId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[PermissionsPolicyFeatureState]]:
@@ -2756,7 +2928,12 @@ def get_permissions_policy_state(
         'params': params,
     }
     json = yield cmd_dict
-    return [PermissionsPolicyFeatureState.from_json(i) for i in json['states']]
+    return _decode_get_permissions_policy_state(json)
+
+
+@command_decoder('Page.getOriginTrials')
+def _decode_get_origin_trials(json: T_JSON_DICT) -> typing.List[OriginTrial]:
+    return [OriginTrial.from_json(i) for i in json['originTrials']]
 
 
 def get_origin_trials(
@@ -2777,7 +2954,7 @@ def get_origin_trials(
         'params': params,
     }
     json = yield cmd_dict
-    return [OriginTrial.from_json(i) for i in json['originTrials']]
+    return _decode_get_origin_trials(json)
 
 
 @deprecated(version="1.3")
@@ -3321,7 +3498,7 @@ class DomContentEventFired:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DomContentEventFired:
         return cls(
-            timestamp=network.MonotonicTime.from_json(json['timestamp'])
+            network.MonotonicTime(json['timestamp']),
         )
 
 
@@ -3340,10 +3517,11 @@ class FileChooserOpened:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FileChooserOpened:
+        get = json.get
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            mode=str(json['mode']),
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']) if json.get('backendNodeId', None) is not None else None
+            FrameId(json['frameId']),
+            json['mode'],
+            dom.BackendNodeId(v) if (v := get('backendNodeId')) is not None else None,
         )
 
 
@@ -3362,10 +3540,11 @@ class FrameAttached:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameAttached:
+        get = json.get
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            parent_frame_id=FrameId.from_json(json['parentFrameId']),
-            stack=runtime.StackTrace.from_json(json['stack']) if json.get('stack', None) is not None else None
+            FrameId(json['frameId']),
+            FrameId(json['parentFrameId']),
+            runtime.StackTrace.from_json(v) if (v := get('stack')) is not None else None,
         )
 
 
@@ -3382,7 +3561,7 @@ class FrameClearedScheduledNavigation:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameClearedScheduledNavigation:
         return cls(
-            frame_id=FrameId.from_json(json['frameId'])
+            FrameId(json['frameId']),
         )
 
 
@@ -3399,8 +3578,8 @@ class FrameDetached:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameDetached:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            reason=str(json['reason'])
+            FrameId(json['frameId']),
+            json['reason'],
         )
 
 
@@ -3419,7 +3598,7 @@ class FrameSubtreeWillBeDetached:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameSubtreeWillBeDetached:
         return cls(
-            frame_id=FrameId.from_json(json['frameId'])
+            FrameId(json['frameId']),
         )
 
 
@@ -3436,8 +3615,8 @@ class FrameNavigated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameNavigated:
         return cls(
-            frame=Frame.from_json(json['frame']),
-            type_=NavigationType.from_json(json['type'])
+            Frame.from_json(json['frame']),
+            NavigationType.from_json(json['type']),
         )
 
 
@@ -3455,7 +3634,7 @@ class DocumentOpened:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DocumentOpened:
         return cls(
-            frame=Frame.from_json(json['frame'])
+            Frame.from_json(json['frame']),
         )
 
 
@@ -3471,9 +3650,7 @@ class FrameResized:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameResized:
-        return cls(
-
-        )
+        return cls()
 
 
 @event_class('Page.frameRequestedNavigation')
@@ -3497,10 +3674,10 @@ class FrameRequestedNavigation:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameRequestedNavigation:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            reason=ClientNavigationReason.from_json(json['reason']),
-            url=str(json['url']),
-            disposition=ClientNavigationDisposition.from_json(json['disposition'])
+            FrameId(json['frameId']),
+            ClientNavigationReason.from_json(json['reason']),
+            json['url'],
+            ClientNavigationDisposition.from_json(json['disposition']),
         )
 
 
@@ -3524,10 +3701,10 @@ class FrameScheduledNavigation:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameScheduledNavigation:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            delay=float(json['delay']),
-            reason=ClientNavigationReason.from_json(json['reason']),
-            url=str(json['url'])
+            FrameId(json['frameId']),
+            float(json['delay']),
+            ClientNavigationReason.from_json(json['reason']),
+            json['url'],
         )
 
 
@@ -3545,7 +3722,7 @@ class FrameStartedLoading:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameStartedLoading:
         return cls(
-            frame_id=FrameId.from_json(json['frameId'])
+            FrameId(json['frameId']),
         )
 
 
@@ -3563,7 +3740,7 @@ class FrameStoppedLoading:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FrameStoppedLoading:
         return cls(
-            frame_id=FrameId.from_json(json['frameId'])
+            FrameId(json['frameId']),
         )
 
 
@@ -3589,10 +3766,10 @@ class DownloadWillBegin:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DownloadWillBegin:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            guid=str(json['guid']),
-            url=str(json['url']),
-            suggested_filename=str(json['suggestedFilename'])
+            FrameId(json['frameId']),
+            json['guid'],
+            json['url'],
+            json['suggestedFilename'],
         )
 
 
@@ -3618,10 +3795,10 @@ class DownloadProgress:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DownloadProgress:
         return cls(
-            guid=str(json['guid']),
-            total_bytes=float(json['totalBytes']),
-            received_bytes=float(json['receivedBytes']),
-            state=str(json['state'])
+            json['guid'],
+            float(json['totalBytes']),
+            float(json['receivedBytes']),
+            json['state'],
         )
 
 
@@ -3635,9 +3812,7 @@ class InterstitialHidden:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InterstitialHidden:
-        return cls(
-
-        )
+        return cls()
 
 
 @event_class('Page.interstitialShown')
@@ -3650,9 +3825,7 @@ class InterstitialShown:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InterstitialShown:
-        return cls(
-
-        )
+        return cls()
 
 
 @event_class('Page.javascriptDialogClosed')
@@ -3670,8 +3843,8 @@ class JavascriptDialogClosed:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> JavascriptDialogClosed:
         return cls(
-            result=bool(json['result']),
-            user_input=str(json['userInput'])
+            json['result'],
+            json['userInput'],
         )
 
 
@@ -3697,12 +3870,13 @@ class JavascriptDialogOpening:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> JavascriptDialogOpening:
+        get = json.get
         return cls(
-            url=str(json['url']),
-            message=str(json['message']),
-            type_=DialogType.from_json(json['type']),
-            has_browser_handler=bool(json['hasBrowserHandler']),
-            default_prompt=str(json['defaultPrompt']) if json.get('defaultPrompt', None) is not None else None
+            json['url'],
+            json['message'],
+            DialogType.from_json(json['type']),
+            json['hasBrowserHandler'],
+            get('defaultPrompt'),
         )
 
 
@@ -3723,10 +3897,10 @@ class LifecycleEvent:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LifecycleEvent:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            loader_id=network.LoaderId.from_json(json['loaderId']),
-            name=str(json['name']),
-            timestamp=network.MonotonicTime.from_json(json['timestamp'])
+            FrameId(json['frameId']),
+            network.LoaderId(json['loaderId']),
+            json['name'],
+            network.MonotonicTime(json['timestamp']),
         )
 
 
@@ -3752,11 +3926,12 @@ class BackForwardCacheNotUsed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BackForwardCacheNotUsed:
+        get = json.get
         return cls(
-            loader_id=network.LoaderId.from_json(json['loaderId']),
-            frame_id=FrameId.from_json(json['frameId']),
-            not_restored_explanations=[BackForwardCacheNotRestoredExplanation.from_json(i) for i in json['notRestoredExplanations']],
-            not_restored_explanations_tree=BackForwardCacheNotRestoredExplanationTree.from_json(json['notRestoredExplanationsTree']) if json.get('notRestoredExplanationsTree', None) is not None else None
+            network.LoaderId(json['loaderId']),
+            FrameId(json['frameId']),
+            list(map(BackForwardCacheNotRestoredExplanation.from_json, json['notRestoredExplanations'])),
+            BackForwardCacheNotRestoredExplanationTree.from_json(v) if (v := get('notRestoredExplanationsTree')) is not None else None,
         )
 
 
@@ -3768,7 +3943,7 @@ class LoadEventFired:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LoadEventFired:
         return cls(
-            timestamp=network.MonotonicTime.from_json(json['timestamp'])
+            network.MonotonicTime(json['timestamp']),
         )
 
 
@@ -3790,9 +3965,9 @@ class NavigatedWithinDocument:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NavigatedWithinDocument:
         return cls(
-            frame_id=FrameId.from_json(json['frameId']),
-            url=str(json['url']),
-            navigation_type=str(json['navigationType'])
+            FrameId(json['frameId']),
+            json['url'],
+            json['navigationType'],
         )
 
 
@@ -3814,9 +3989,9 @@ class ScreencastFrame:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreencastFrame:
         return cls(
-            data=str(json['data']),
-            metadata=ScreencastFrameMetadata.from_json(json['metadata']),
-            session_id=int(json['sessionId'])
+            json['data'],
+            ScreencastFrameMetadata.from_json(json['metadata']),
+            json['sessionId'],
         )
 
 
@@ -3834,7 +4009,7 @@ class ScreencastVisibilityChanged:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScreencastVisibilityChanged:
         return cls(
-            visible=bool(json['visible'])
+            json['visible'],
         )
 
 
@@ -3857,10 +4032,10 @@ class WindowOpen:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WindowOpen:
         return cls(
-            url=str(json['url']),
-            window_name=str(json['windowName']),
-            window_features=[str(i) for i in json['windowFeatures']],
-            user_gesture=bool(json['userGesture'])
+            json['url'],
+            json['windowName'],
+            list(json['windowFeatures']),
+            json['userGesture'],
         )
 
 
@@ -3880,6 +4055,6 @@ class CompilationCacheProduced:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CompilationCacheProduced:
         return cls(
-            url=str(json['url']),
-            data=str(json['data'])
+            json['url'],
+            json['data'],
         )
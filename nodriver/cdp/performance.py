@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 from deprecated.sphinx import deprecated # type: ignore
@@ -35,8 +34,8 @@ class Metric:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Metric:
         return cls(
-            name=str(json['name']),
-            value=float(json['value']),
+            json['name'],
+            float(json['value']),
         )
 
 
@@ -92,6 +91,11 @@ def set_time_domain(
     json = yield cmd_dict
 
 
+@command_decoder('Performance.getMetrics')
+def _decode_get_metrics(json: T_JSON_DICT) -> typing.List[Metric]:
+    return [Metric.from_json(i) for i in json['metrics']]
+
+
 def get_metrics() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Metric]]:
     '''
     Retrieve current values of run-time metrics.
@@ -102,7 +106,7 @@ def get_metrics() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Metric
         'method': 'Performance.getMetrics',
     }
     json = yield cmd_dict
-    return [Metric.from_json(i) for i in json['metrics']]
+    return _decode_get_metrics(json)
 
 
 @event_class('Performance.metrics')
@@ -119,6 +123,6 @@ class Metrics:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Metrics:
         return cls(
-            metrics=[Metric.from_json(i) for i in json['metrics']],
-            title=str(json['title'])
+            list(map(Metric.from_json, json['metrics'])),
+            json['title'],
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import dom
 from . import network
@@ -51,13 +50,14 @@ class LargestContentfulPaint:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LargestContentfulPaint:
+        get = json.get
         return cls(
-            render_time=network.TimeSinceEpoch.from_json(json['renderTime']),
-            load_time=network.TimeSinceEpoch.from_json(json['loadTime']),
-            size=float(json['size']),
-            element_id=str(json['elementId']) if json.get('elementId', None) is not None else None,
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            node_id=dom.BackendNodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None,
+            network.TimeSinceEpoch(json['renderTime']),
+            network.TimeSinceEpoch(json['loadTime']),
+            float(json['size']),
+            get('elementId'),
+            get('url'),
+            dom.BackendNodeId(v) if (v := get('nodeId')) is not None else None,
         )
 
 
@@ -79,10 +79,11 @@ class LayoutShiftAttribution:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayoutShiftAttribution:
+        get = json.get
         return cls(
-            previous_rect=dom.Rect.from_json(json['previousRect']),
-            current_rect=dom.Rect.from_json(json['currentRect']),
-            node_id=dom.BackendNodeId.from_json(json['nodeId']) if json.get('nodeId', None) is not None else None,
+            dom.Rect.from_json(json['previousRect']),
+            dom.Rect.from_json(json['currentRect']),
+            dom.BackendNodeId(v) if (v := get('nodeId')) is not None else None,
         )
 
 
@@ -111,10 +112,10 @@ class LayoutShift:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> LayoutShift:
         return cls(
-            value=float(json['value']),
-            had_recent_input=bool(json['hadRecentInput']),
-            last_input_time=network.TimeSinceEpoch.from_json(json['lastInputTime']),
-            sources=[LayoutShiftAttribution.from_json(i) for i in json['sources']],
+            float(json['value']),
+            json['hadRecentInput'],
+            network.TimeSinceEpoch(json['lastInputTime']),
+            list(map(LayoutShiftAttribution.from_json, json['sources'])),
         )
 
 
@@ -156,14 +157,15 @@ class TimelineEvent:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TimelineEvent:
+        get = json.get
         return cls(
-            frame_id=page.FrameId.from_json(json['frameId']),
-            type_=str(json['type']),
-            name=str(json['name']),
-            time=network.TimeSinceEpoch.from_json(json['time']),
-            duration=float(json['duration']) if json.get('duration', None) is not None else None,
-            lcp_details=LargestContentfulPaint.from_json(json['lcpDetails']) if json.get('lcpDetails', None) is not None else None,
-            layout_shift_details=LayoutShift.from_json(json['layoutShiftDetails']) if json.get('layoutShiftDetails', None) is not None else None,
+            page.FrameId(json['frameId']),
+            json['type'],
+            json['name'],
+            network.TimeSinceEpoch(json['time']),
+            float(v) if (v := get('duration')) is not None else None,
+            LargestContentfulPaint.from_json(v) if (v := get('lcpDetails')) is not None else None,
+            LayoutShift.from_json(v) if (v := get('layoutShiftDetails')) is not None else None,
         )
 
 
@@ -196,5 +198,5 @@ class TimelineEventAdded:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TimelineEventAdded:
         return cls(
-            event=TimelineEvent.from_json(json['event'])
+            TimelineEvent.from_json(json['event']),
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import dom
 from . import network
@@ -92,15 +91,16 @@ class RuleSet:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RuleSet:
+        get = json.get
         return cls(
-            id_=RuleSetId.from_json(json['id']),
-            loader_id=network.LoaderId.from_json(json['loaderId']),
-            source_text=str(json['sourceText']),
-            backend_node_id=dom.BackendNodeId.from_json(json['backendNodeId']) if json.get('backendNodeId', None) is not None else None,
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            request_id=network.RequestId.from_json(json['requestId']) if json.get('requestId', None) is not None else None,
-            error_type=RuleSetErrorType.from_json(json['errorType']) if json.get('errorType', None) is not None else None,
-            error_message=str(json['errorMessage']) if json.get('errorMessage', None) is not None else None,
+            RuleSetId(json['id']),
+            network.LoaderId(json['loaderId']),
+            json['sourceText'],
+            dom.BackendNodeId(v) if (v := get('backendNodeId')) is not None else None,
+            get('url'),
+            network.RequestId(v) if (v := get('requestId')) is not None else None,
+            RuleSetErrorType.from_json(v) if (v := get('errorType')) is not None else None,
+            get('errorMessage'),
         )
 
 
@@ -113,7 +113,10 @@ class RuleSetErrorType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> RuleSetErrorType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class SpeculationAction(enum.Enum):
@@ -130,7 +133,10 @@ class SpeculationAction(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SpeculationAction:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class SpeculationTargetHint(enum.Enum):
@@ -146,7 +152,10 @@ class SpeculationTargetHint(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SpeculationTargetHint:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -178,11 +187,12 @@ class PreloadingAttemptKey:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PreloadingAttemptKey:
+        get = json.get
         return cls(
-            loader_id=network.LoaderId.from_json(json['loaderId']),
-            action=SpeculationAction.from_json(json['action']),
-            url=str(json['url']),
-            target_hint=SpeculationTargetHint.from_json(json['targetHint']) if json.get('targetHint', None) is not None else None,
+            network.LoaderId(json['loaderId']),
+            SpeculationAction.from_json(json['action']),
+            json['url'],
+            SpeculationTargetHint.from_json(v) if (v := get('targetHint')) is not None else None,
         )
 
 
@@ -211,9 +221,9 @@ class PreloadingAttemptSource:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PreloadingAttemptSource:
         return cls(
-            key=PreloadingAttemptKey.from_json(json['key']),
-            rule_set_ids=[RuleSetId.from_json(i) for i in json['ruleSetIds']],
-            node_ids=[dom.BackendNodeId.from_json(i) for i in json['nodeIds']],
+            PreloadingAttemptKey.from_json(json['key']),
+            list(map(RuleSetId, json['ruleSetIds'])),
+            list(map(dom.BackendNodeId, json['nodeIds'])),
         )
 
 
@@ -300,7 +310,10 @@ class PrerenderFinalStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PrerenderFinalStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class PreloadingStatus(enum.Enum):
@@ -320,7 +333,10 @@ class PreloadingStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PreloadingStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class PrefetchStatus(enum.Enum):
@@ -364,7 +380,10 @@ class PrefetchStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PrefetchStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -389,10 +408,11 @@ class PrerenderMismatchedHeaders:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PrerenderMismatchedHeaders:
+        get = json.get
         return cls(
-            header_name=str(json['headerName']),
-            initial_value=str(json['initialValue']) if json.get('initialValue', None) is not None else None,
-            activation_value=str(json['activationValue']) if json.get('activationValue', None) is not None else None,
+            json['headerName'],
+            get('initialValue'),
+            get('activationValue'),
         )
 
 
@@ -423,7 +443,7 @@ class RuleSetUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RuleSetUpdated:
         return cls(
-            rule_set=RuleSet.from_json(json['ruleSet'])
+            RuleSet.from_json(json['ruleSet']),
         )
 
 
@@ -435,7 +455,7 @@ class RuleSetRemoved:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RuleSetRemoved:
         return cls(
-            id_=RuleSetId.from_json(json['id'])
+            RuleSetId(json['id']),
         )
 
 
@@ -454,11 +474,11 @@ class PreloadEnabledStateUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PreloadEnabledStateUpdated:
         return cls(
-            disabled_by_preference=bool(json['disabledByPreference']),
-            disabled_by_data_saver=bool(json['disabledByDataSaver']),
-            disabled_by_battery_saver=bool(json['disabledByBatterySaver']),
-            disabled_by_holdback_prefetch_speculation_rules=bool(json['disabledByHoldbackPrefetchSpeculationRules']),
-            disabled_by_holdback_prerender_speculation_rules=bool(json['disabledByHoldbackPrerenderSpeculationRules'])
+            json['disabledByPreference'],
+            json['disabledByDataSaver'],
+            json['disabledByBatterySaver'],
+            json['disabledByHoldbackPrefetchSpeculationRules'],
+            json['disabledByHoldbackPrerenderSpeculationRules'],
         )
 
 
@@ -479,12 +499,12 @@ class PrefetchStatusUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PrefetchStatusUpdated:
         return cls(
-            key=PreloadingAttemptKey.from_json(json['key']),
-            initiating_frame_id=page.FrameId.from_json(json['initiatingFrameId']),
-            prefetch_url=str(json['prefetchUrl']),
-            status=PreloadingStatus.from_json(json['status']),
-            prefetch_status=PrefetchStatus.from_json(json['prefetchStatus']),
-            request_id=network.RequestId.from_json(json['requestId'])
+            PreloadingAttemptKey.from_json(json['key']),
+            page.FrameId(json['initiatingFrameId']),
+            json['prefetchUrl'],
+            PreloadingStatus.from_json(json['status']),
+            PrefetchStatus.from_json(json['prefetchStatus']),
+            network.RequestId(json['requestId']),
         )
 
 
@@ -504,12 +524,13 @@ class PrerenderStatusUpdated:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PrerenderStatusUpdated:
+        get = json.get
         return cls(
-            key=PreloadingAttemptKey.from_json(json['key']),
-            status=PreloadingStatus.from_json(json['status']),
-            prerender_status=PrerenderFinalStatus.from_json(json['prerenderStatus']) if json.get('prerenderStatus', None) is not None else None,
-            disallowed_mojo_interface=str(json['disallowedMojoInterface']) if json.get('disallowedMojoInterface', None) is not None else None,
-            mismatched_headers=[PrerenderMismatchedHeaders.from_json(i) for i in json['mismatchedHeaders']] if json.get('mismatchedHeaders', None) is not None else None
+            PreloadingAttemptKey.from_json(json['key']),
+            PreloadingStatus.from_json(json['status']),
+            PrerenderFinalStatus.from_json(v) if (v := get('prerenderStatus')) is not None else None,
+            get('disallowedMojoInterface'),
+            list(map(PrerenderMismatchedHeaders.from_json, v)) if (v := get('mismatchedHeaders')) is not None else None,
         )
 
 
@@ -525,6 +546,6 @@ class PreloadingAttemptSourcesUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PreloadingAttemptSourcesUpdated:
         return cls(
-            loader_id=network.LoaderId.from_json(json['loaderId']),
-            preloading_attempt_sources=[PreloadingAttemptSource.from_json(i) for i in json['preloadingAttemptSources']]
+            network.LoaderId(json['loaderId']),
+            list(map(PreloadingAttemptSource.from_json, json['preloadingAttemptSources'])),
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import debugger
 from . import runtime
@@ -55,13 +54,14 @@ class ProfileNode:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ProfileNode:
+        get = json.get
         return cls(
-            id_=int(json['id']),
-            call_frame=runtime.CallFrame.from_json(json['callFrame']),
-            hit_count=int(json['hitCount']) if json.get('hitCount', None) is not None else None,
-            children=[int(i) for i in json['children']] if json.get('children', None) is not None else None,
-            deopt_reason=str(json['deoptReason']) if json.get('deoptReason', None) is not None else None,
-            position_ticks=[PositionTickInfo.from_json(i) for i in json['positionTicks']] if json.get('positionTicks', None) is not None else None,
+            json['id'],
+            runtime.CallFrame.from_json(json['callFrame']),
+            get('hitCount'),
+            list(v) if (v := get('children')) is not None else None,
+            get('deoptReason'),
+            list(map(PositionTickInfo.from_json, v)) if (v := get('positionTicks')) is not None else None,
         )
 
 
@@ -99,12 +99,13 @@ class Profile:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Profile:
+        get = json.get
         return cls(
-            nodes=[ProfileNode.from_json(i) for i in json['nodes']],
-            start_time=float(json['startTime']),
-            end_time=float(json['endTime']),
-            samples=[int(i) for i in json['samples']] if json.get('samples', None) is not None else None,
-            time_deltas=[int(i) for i in json['timeDeltas']] if json.get('timeDeltas', None) is not None else None,
+            list(map(ProfileNode.from_json, json['nodes'])),
+            float(json['startTime']),
+            float(json['endTime']),
+            list(v) if (v := get('samples')) is not None else None,
+            list(v) if (v := get('timeDeltas')) is not None else None,
         )
 
 
@@ -128,8 +129,8 @@ class PositionTickInfo:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PositionTickInfo:
         return cls(
-            line=int(json['line']),
-            ticks=int(json['ticks']),
+            json['line'],
+            json['ticks'],
         )
 
 
@@ -157,9 +158,9 @@ class CoverageRange:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CoverageRange:
         return cls(
-            start_offset=int(json['startOffset']),
-            end_offset=int(json['endOffset']),
-            count=int(json['count']),
+            json['startOffset'],
+            json['endOffset'],
+            json['count'],
         )
 
 
@@ -187,9 +188,9 @@ class FunctionCoverage:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FunctionCoverage:
         return cls(
-            function_name=str(json['functionName']),
-            ranges=[CoverageRange.from_json(i) for i in json['ranges']],
-            is_block_coverage=bool(json['isBlockCoverage']),
+            json['functionName'],
+            list(map(CoverageRange.from_json, json['ranges'])),
+            json['isBlockCoverage'],
         )
 
 
@@ -217,9 +218,9 @@ class ScriptCoverage:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ScriptCoverage:
         return cls(
-            script_id=runtime.ScriptId.from_json(json['scriptId']),
-            url=str(json['url']),
-            functions=[FunctionCoverage.from_json(i) for i in json['functions']],
+            runtime.ScriptId(json['scriptId']),
+            json['url'],
+            list(map(FunctionCoverage.from_json, json['functions'])),
         )
 
 
@@ -239,6 +240,11 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('Profiler.getBestEffortCoverage')
+def _decode_get_best_effort_coverage(json: T_JSON_DICT) -> typing.List[ScriptCoverage]:
+    return [ScriptCoverage.from_json(i) for i in json['result']]
+
+
 def get_best_effort_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[ScriptCoverage]]:
     '''
     Collect coverage data for the current isolate. The coverage data may be incomplete due to
@@ -250,7 +256,7 @@ def get_best_effort_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typin
         'method': 'Profiler.getBestEffortCoverage',
     }
     json = yield cmd_dict
-    return [ScriptCoverage.from_json(i) for i in json['result']]
+    return _decode_get_best_effort_coverage(json)
 
 
 def set_sampling_interval(
@@ -278,6 +284,11 @@ def start() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('Profiler.startPreciseCoverage')
+def _decode_start_precise_coverage(json: T_JSON_DICT) -> float:
+    return float(json['timestamp'])
+
+
 def start_precise_coverage(
         call_count: typing.Optional[bool] = None,
         detailed: typing.Optional[bool] = None,
@@ -305,7 +316,12 @@ def start_precise_coverage(
         'params': params,
     }
     json = yield cmd_dict
-    return float(json['timestamp'])
+    return _decode_start_precise_coverage(json)
+
+
+@command_decoder('Profiler.stop')
+def _decode_stop(json: T_JSON_DICT) -> Profile:
+    return Profile.from_json(json['profile'])
 
 
 def stop() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Profile]:
@@ -318,7 +334,7 @@ def stop() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Profile]:
         'method': 'Profiler.stop',
     }
     json = yield cmd_dict
-    return Profile.from_json(json['profile'])
+    return _decode_stop(json)
 
 
 def stop_precise_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -332,6 +348,14 @@ def stop_precise_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('Profiler.takePreciseCoverage')
+def _decode_take_precise_coverage(json: T_JSON_DICT) -> typing.Tuple[typing.List[ScriptCoverage], float]:
+    return (
+        [ScriptCoverage.from_json(i) for i in json['result']],
+        float(json['timestamp'])
+    )
+
+
 def take_precise_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[ScriptCoverage], float]]:
     '''
     Collect coverage data for the current isolate, and resets execution counters. Precise code
@@ -346,10 +370,7 @@ def take_precise_coverage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.T
         'method': 'Profiler.takePreciseCoverage',
     }
     json = yield cmd_dict
-    return (
-        [ScriptCoverage.from_json(i) for i in json['result']],
-        float(json['timestamp'])
-    )
+    return _decode_take_precise_coverage(json)
 
 
 @event_class('Profiler.consoleProfileFinished')
@@ -364,11 +385,12 @@ class ConsoleProfileFinished:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ConsoleProfileFinished:
+        get = json.get
         return cls(
-            id_=str(json['id']),
-            location=debugger.Location.from_json(json['location']),
-            profile=Profile.from_json(json['profile']),
-            title=str(json['title']) if json.get('title', None) is not None else None
+            json['id'],
+            debugger.Location.from_json(json['location']),
+            Profile.from_json(json['profile']),
+            get('title'),
         )
 
 
@@ -386,10 +408,11 @@ class ConsoleProfileStarted:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ConsoleProfileStarted:
+        get = json.get
         return cls(
-            id_=str(json['id']),
-            location=debugger.Location.from_json(json['location']),
-            title=str(json['title']) if json.get('title', None) is not None else None
+            json['id'],
+            debugger.Location.from_json(json['location']),
+            get('title'),
         )
 
 
@@ -414,7 +437,7 @@ class PreciseCoverageDeltaUpdate:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PreciseCoverageDeltaUpdate:
         return cls(
-            timestamp=float(json['timestamp']),
-            occasion=str(json['occasion']),
-            result=[ScriptCoverage.from_json(i) for i in json['result']]
+            float(json['timestamp']),
+            json['occasion'],
+            list(map(ScriptCoverage.from_json, json['result'])),
         )
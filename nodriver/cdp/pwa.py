@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import target
 
@@ -35,8 +34,8 @@ class FileHandlerAccept:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FileHandlerAccept:
         return cls(
-            media_type=str(json['mediaType']),
-            file_extensions=[str(i) for i in json['fileExtensions']],
+            json['mediaType'],
+            list(json['fileExtensions']),
         )
 
 
@@ -58,9 +57,9 @@ class FileHandler:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FileHandler:
         return cls(
-            action=str(json['action']),
-            accepts=[FileHandlerAccept.from_json(i) for i in json['accepts']],
-            display_name=str(json['displayName']),
+            json['action'],
+            list(map(FileHandlerAccept.from_json, json['accepts'])),
+            json['displayName'],
         )
 
 
@@ -76,7 +75,18 @@ class DisplayMode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DisplayMode:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
+
+
+@command_decoder('PWA.getOsAppState')
+def _decode_get_os_app_state(json: T_JSON_DICT) -> typing.Tuple[int, typing.List[FileHandler]]:
+    return (
+        int(json['badgeCount']),
+        [FileHandler.from_json(i) for i in json['fileHandlers']]
+    )
 
 
 def get_os_app_state(
@@ -98,10 +108,7 @@ def get_os_app_state(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        int(json['badgeCount']),
-        [FileHandler.from_json(i) for i in json['fileHandlers']]
-    )
+    return _decode_get_os_app_state(json)
 
 
 def install(
@@ -151,6 +158,11 @@ def uninstall(
     json = yield cmd_dict
 
 
+@command_decoder('PWA.launch')
+def _decode_launch(json: T_JSON_DICT) -> target.TargetID:
+    return target.TargetID.from_json(json['targetId'])
+
+
 def launch(
         manifest_id: str,
         url: typing.Optional[str] = None
@@ -173,7 +185,12 @@ def launch(
         'params': params,
     }
     json = yield cmd_dict
-    return target.TargetID.from_json(json['targetId'])
+    return _decode_launch(json)
+
+
+@command_decoder('PWA.launchFilesInApp')
+def _decode_launch_files_in_app(json: T_JSON_DICT) -> typing.List[target.TargetID]:
+    return [target.TargetID.from_json(i) for i in json['targetIds']]
 
 
 def launch_files_in_app(
@@ -207,7 +224,7 @@ def launch_files_in_app(
         'params': params,
     }
     json = yield cmd_dict
-    return [target.TargetID.from_json(i) for i in json['targetIds']]
+    return _decode_launch_files_in_app(json)
 
 
 def open_current_page_in_app(
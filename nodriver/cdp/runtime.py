@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 class ScriptId(str):
@@ -53,10 +52,11 @@ class SerializationOptions:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SerializationOptions:
+        get = json.get
         return cls(
-            serialization=str(json['serialization']),
-            max_depth=int(json['maxDepth']) if json.get('maxDepth', None) is not None else None,
-            additional_parameters=dict(json['additionalParameters']) if json.get('additionalParameters', None) is not None else None,
+            json['serialization'],
+            get('maxDepth'),
+            get('additionalParameters'),
         )
 
 
@@ -89,11 +89,12 @@ class DeepSerializedValue:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DeepSerializedValue:
+        get = json.get
         return cls(
-            type_=str(json['type']),
-            value=json['value'] if json.get('value', None) is not None else None,
-            object_id=str(json['objectId']) if json.get('objectId', None) is not None else None,
-            weak_local_object_reference=int(json['weakLocalObjectReference']) if json.get('weakLocalObjectReference', None) is not None else None,
+            json['type'],
+            get('value'),
+            get('objectId'),
+            get('weakLocalObjectReference'),
         )
 
 
@@ -190,17 +191,18 @@ class RemoteObject:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RemoteObject:
+        get = json.get
         return cls(
-            type_=str(json['type']),
-            subtype=str(json['subtype']) if json.get('subtype', None) is not None else None,
-            class_name=str(json['className']) if json.get('className', None) is not None else None,
-            value=json['value'] if json.get('value', None) is not None else None,
-            unserializable_value=UnserializableValue.from_json(json['unserializableValue']) if json.get('unserializableValue', None) is not None else None,
-            description=str(json['description']) if json.get('description', None) is not None else None,
-            deep_serialized_value=DeepSerializedValue.from_json(json['deepSerializedValue']) if json.get('deepSerializedValue', None) is not None else None,
-            object_id=RemoteObjectId.from_json(json['objectId']) if json.get('objectId', None) is not None else None,
-            preview=ObjectPreview.from_json(json['preview']) if json.get('preview', None) is not None else None,
-            custom_preview=CustomPreview.from_json(json['customPreview']) if json.get('customPreview', None) is not None else None,
+            json['type'],
+            get('subtype'),
+            get('className'),
+            get('value'),
+            UnserializableValue(v) if (v := get('unserializableValue')) is not None else None,
+            get('description'),
+            DeepSerializedValue.from_json(v) if (v := get('deepSerializedValue')) is not None else None,
+            RemoteObjectId(v) if (v := get('objectId')) is not None else None,
+            ObjectPreview.from_json(v) if (v := get('preview')) is not None else None,
+            CustomPreview.from_json(v) if (v := get('customPreview')) is not None else None,
         )
 
 
@@ -224,9 +226,10 @@ class CustomPreview:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CustomPreview:
+        get = json.get
         return cls(
-            header=str(json['header']),
-            body_getter_id=RemoteObjectId.from_json(json['bodyGetterId']) if json.get('bodyGetterId', None) is not None else None,
+            json['header'],
+            RemoteObjectId(v) if (v := get('bodyGetterId')) is not None else None,
         )
 
 
@@ -268,13 +271,14 @@ class ObjectPreview:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ObjectPreview:
+        get = json.get
         return cls(
-            type_=str(json['type']),
-            overflow=bool(json['overflow']),
-            properties=[PropertyPreview.from_json(i) for i in json['properties']],
-            subtype=str(json['subtype']) if json.get('subtype', None) is not None else None,
-            description=str(json['description']) if json.get('description', None) is not None else None,
-            entries=[EntryPreview.from_json(i) for i in json['entries']] if json.get('entries', None) is not None else None,
+            json['type'],
+            json['overflow'],
+            list(map(PropertyPreview.from_json, json['properties'])),
+            get('subtype'),
+            get('description'),
+            list(map(EntryPreview.from_json, v)) if (v := get('entries')) is not None else None,
         )
 
 
@@ -309,12 +313,13 @@ class PropertyPreview:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PropertyPreview:
+        get = json.get
         return cls(
-            name=str(json['name']),
-            type_=str(json['type']),
-            value=str(json['value']) if json.get('value', None) is not None else None,
-            value_preview=ObjectPreview.from_json(json['valuePreview']) if json.get('valuePreview', None) is not None else None,
-            subtype=str(json['subtype']) if json.get('subtype', None) is not None else None,
+            json['name'],
+            json['type'],
+            get('value'),
+            ObjectPreview.from_json(v) if (v := get('valuePreview')) is not None else None,
+            get('subtype'),
         )
 
 
@@ -335,9 +340,10 @@ class EntryPreview:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> EntryPreview:
+        get = json.get
         return cls(
-            value=ObjectPreview.from_json(json['value']),
-            key=ObjectPreview.from_json(json['key']) if json.get('key', None) is not None else None,
+            ObjectPreview.from_json(json['value']),
+            ObjectPreview.from_json(v) if (v := get('key')) is not None else None,
         )
 
 
@@ -403,17 +409,18 @@ class PropertyDescriptor:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PropertyDescriptor:
+        get = json.get
         return cls(
-            name=str(json['name']),
-            configurable=bool(json['configurable']),
-            enumerable=bool(json['enumerable']),
-            value=RemoteObject.from_json(json['value']) if json.get('value', None) is not None else None,
-            writable=bool(json['writable']) if json.get('writable', None) is not None else None,
-            get=RemoteObject.from_json(json['get']) if json.get('get', None) is not None else None,
-            set_=RemoteObject.from_json(json['set']) if json.get('set', None) is not None else None,
-            was_thrown=bool(json['wasThrown']) if json.get('wasThrown', None) is not None else None,
-            is_own=bool(json['isOwn']) if json.get('isOwn', None) is not None else None,
-            symbol=RemoteObject.from_json(json['symbol']) if json.get('symbol', None) is not None else None,
+            json['name'],
+            json['configurable'],
+            json['enumerable'],
+            RemoteObject.from_json(v) if (v := get('value')) is not None else None,
+            get('writable'),
+            RemoteObject.from_json(v) if (v := get('get')) is not None else None,
+            RemoteObject.from_json(v) if (v := get('set')) is not None else None,
+            get('wasThrown'),
+            get('isOwn'),
+            RemoteObject.from_json(v) if (v := get('symbol')) is not None else None,
         )
 
 
@@ -437,9 +444,10 @@ class InternalPropertyDescriptor:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InternalPropertyDescriptor:
+        get = json.get
         return cls(
-            name=str(json['name']),
-            value=RemoteObject.from_json(json['value']) if json.get('value', None) is not None else None,
+            json['name'],
+            RemoteObject.from_json(v) if (v := get('value')) is not None else None,
         )
 
 
@@ -475,11 +483,12 @@ class PrivatePropertyDescriptor:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> PrivatePropertyDescriptor:
+        get = json.get
         return cls(
-            name=str(json['name']),
-            value=RemoteObject.from_json(json['value']) if json.get('value', None) is not None else None,
-            get=RemoteObject.from_json(json['get']) if json.get('get', None) is not None else None,
-            set_=RemoteObject.from_json(json['set']) if json.get('set', None) is not None else None,
+            json['name'],
+            RemoteObject.from_json(v) if (v := get('value')) is not None else None,
+            RemoteObject.from_json(v) if (v := get('get')) is not None else None,
+            RemoteObject.from_json(v) if (v := get('set')) is not None else None,
         )
 
 
@@ -510,10 +519,11 @@ class CallArgument:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CallArgument:
+        get = json.get
         return cls(
-            value=json['value'] if json.get('value', None) is not None else None,
-            unserializable_value=UnserializableValue.from_json(json['unserializableValue']) if json.get('unserializableValue', None) is not None else None,
-            object_id=RemoteObjectId.from_json(json['objectId']) if json.get('objectId', None) is not None else None,
+            get('value'),
+            UnserializableValue(v) if (v := get('unserializableValue')) is not None else None,
+            RemoteObjectId(v) if (v := get('objectId')) is not None else None,
         )
 
 
@@ -567,12 +577,13 @@ class ExecutionContextDescription:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExecutionContextDescription:
+        get = json.get
         return cls(
-            id_=ExecutionContextId.from_json(json['id']),
-            origin=str(json['origin']),
-            name=str(json['name']),
-            unique_id=str(json['uniqueId']),
-            aux_data=dict(json['auxData']) if json.get('auxData', None) is not None else None,
+            ExecutionContextId(json['id']),
+            json['origin'],
+            json['name'],
+            json['uniqueId'],
+            get('auxData'),
         )
 
 
@@ -636,17 +647,18 @@ class ExceptionDetails:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExceptionDetails:
+        get = json.get
         return cls(
-            exception_id=int(json['exceptionId']),
-            text=str(json['text']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
-            script_id=ScriptId.from_json(json['scriptId']) if json.get('scriptId', None) is not None else None,
-            url=str(json['url']) if json.get('url', None) is not None else None,
-            stack_trace=StackTrace.from_json(json['stackTrace']) if json.get('stackTrace', None) is not None else None,
-            exception=RemoteObject.from_json(json['exception']) if json.get('exception', None) is not None else None,
-            execution_context_id=ExecutionContextId.from_json(json['executionContextId']) if json.get('executionContextId', None) is not None else None,
-            exception_meta_data=dict(json['exceptionMetaData']) if json.get('exceptionMetaData', None) is not None else None,
+            json['exceptionId'],
+            json['text'],
+            json['lineNumber'],
+            json['columnNumber'],
+            ScriptId(v) if (v := get('scriptId')) is not None else None,
+            get('url'),
+            StackTrace.from_json(v) if (v := get('stackTrace')) is not None else None,
+            RemoteObject.from_json(v) if (v := get('exception')) is not None else None,
+            ExecutionContextId(v) if (v := get('executionContextId')) is not None else None,
+            get('exceptionMetaData'),
         )
 
 
@@ -712,11 +724,11 @@ class CallFrame:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CallFrame:
         return cls(
-            function_name=str(json['functionName']),
-            script_id=ScriptId.from_json(json['scriptId']),
-            url=str(json['url']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
+            json['functionName'],
+            ScriptId(json['scriptId']),
+            json['url'],
+            json['lineNumber'],
+            json['columnNumber'],
         )
 
 
@@ -751,11 +763,12 @@ class StackTrace:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StackTrace:
+        get = json.get
         return cls(
-            call_frames=[CallFrame.from_json(i) for i in json['callFrames']],
-            description=str(json['description']) if json.get('description', None) is not None else None,
-            parent=StackTrace.from_json(json['parent']) if json.get('parent', None) is not None else None,
-            parent_id=StackTraceId.from_json(json['parentId']) if json.get('parentId', None) is not None else None,
+            list(map(CallFrame.from_json, json['callFrames'])),
+            get('description'),
+            StackTrace.from_json(v) if (v := get('parent')) is not None else None,
+            StackTraceId.from_json(v) if (v := get('parentId')) is not None else None,
         )
 
 
@@ -793,12 +806,21 @@ class StackTraceId:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StackTraceId:
+        get = json.get
         return cls(
-            id_=str(json['id']),
-            debugger_id=UniqueDebuggerId.from_json(json['debuggerId']) if json.get('debuggerId', None) is not None else None,
+            json['id'],
+            UniqueDebuggerId(v) if (v := get('debuggerId')) is not None else None,
         )
 
 
+@command_decoder('Runtime.awaitPromise')
+def _decode_await_promise(json: T_JSON_DICT) -> typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]:
+    return (
+        RemoteObject.from_json(json['result']),
+        ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
+    )
+
+
 def await_promise(
         promise_object_id: RemoteObjectId,
         return_by_value: typing.Optional[bool] = None,
@@ -826,6 +848,11 @@ def await_promise(
         'params': params,
     }
     json = yield cmd_dict
+    return _decode_await_promise(json)
+
+
+@command_decoder('Runtime.callFunctionOn')
+def _decode_call_function_on(json: T_JSON_DICT) -> typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]:
     return (
         RemoteObject.from_json(json['result']),
         ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
@@ -900,8 +927,13 @@ def call_function_on(
         'params': params,
     }
     json = yield cmd_dict
+    return _decode_call_function_on(json)
+
+
+@command_decoder('Runtime.compileScript')
+def _decode_compile_script(json: T_JSON_DICT) -> typing.Tuple[typing.Optional[ScriptId], typing.Optional[ExceptionDetails]]:
     return (
-        RemoteObject.from_json(json['result']),
+        ScriptId.from_json(json['scriptId']) if json.get('scriptId', None) is not None else None,
         ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
     )
 
@@ -935,10 +967,7 @@ def compile_script(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        ScriptId.from_json(json['scriptId']) if json.get('scriptId', None) is not None else None,
-        ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
-    )
+    return _decode_compile_script(json)
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -973,6 +1002,14 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('Runtime.evaluate')
+def _decode_evaluate(json: T_JSON_DICT) -> typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]:
+    return (
+        RemoteObject.from_json(json['result']),
+        ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
+    )
+
+
 def evaluate(
         expression: str,
         object_group: typing.Optional[str] = None,
@@ -1052,10 +1089,12 @@ def evaluate(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        RemoteObject.from_json(json['result']),
-        ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
-    )
+    return _decode_evaluate(json)
+
+
+@command_decoder('Runtime.getIsolateId')
+def _decode_get_isolate_id(json: T_JSON_DICT) -> str:
+    return str(json['id'])
 
 
 def get_isolate_id() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
@@ -1070,7 +1109,15 @@ def get_isolate_id() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
         'method': 'Runtime.getIsolateId',
     }
     json = yield cmd_dict
-    return str(json['id'])
+    return _decode_get_isolate_id(json)
+
+
+@command_decoder('Runtime.getHeapUsage')
+def _decode_get_heap_usage(json: T_JSON_DICT) -> typing.Tuple[float, float]:
+    return (
+        float(json['usedSize']),
+        float(json['totalSize'])
+    )
 
 
 def get_heap_usage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[float, float]]:
@@ -1089,9 +1136,16 @@ def get_heap_usage() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[fl
         'method': 'Runtime.getHeapUsage',
     }
     json = yield cmd_dict
+    return _decode_get_heap_usage(json)
+
+
+@command_decoder('Runtime.getProperties')
+def _decode_get_properties(json: T_JSON_DICT) -> typing.Tuple[typing.List[PropertyDescriptor], typing.Optional[typing.List[InternalPropertyDescriptor]], typing.Optional[typing.List[PrivatePropertyDescriptor]], typing.Optional[ExceptionDetails]]:
     return (
-        float(json['usedSize']),
-        float(json['totalSize'])
+        [PropertyDescriptor.from_json(i) for i in json['result']],
+        [InternalPropertyDescriptor.from_json(i) for i in json['internalProperties']] if json.get('internalProperties', None) is not None else None,
+        [PrivatePropertyDescriptor.from_json(i) for i in json['privateProperties']] if json.get('privateProperties', None) is not None else None,
+        ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
     )
 
 
@@ -1133,12 +1187,12 @@ def get_properties(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        [PropertyDescriptor.from_json(i) for i in json['result']],
-        [InternalPropertyDescriptor.from_json(i) for i in json['internalProperties']] if json.get('internalProperties', None) is not None else None,
-        [PrivatePropertyDescriptor.from_json(i) for i in json['privateProperties']] if json.get('privateProperties', None) is not None else None,
-        ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
-    )
+    return _decode_get_properties(json)
+
+
+@command_decoder('Runtime.globalLexicalScopeNames')
+def _decode_global_lexical_scope_names(json: T_JSON_DICT) -> typing.List[str]:
+    return [str(i) for i in json['names']]
 
 
 def global_lexical_scope_names(
@@ -1158,7 +1212,12 @@ def global_lexical_scope_names(
         'params': params,
     }
     json = yield cmd_dict
-    return [str(i) for i in json['names']]
+    return _decode_global_lexical_scope_names(json)
+
+
+@command_decoder('Runtime.queryObjects')
+def _decode_query_objects(json: T_JSON_DICT) -> RemoteObject:
+    return RemoteObject.from_json(json['objects'])
 
 
 def query_objects(
@@ -1179,7 +1238,7 @@ def query_objects(
         'params': params,
     }
     json = yield cmd_dict
-    return RemoteObject.from_json(json['objects'])
+    return _decode_query_objects(json)
 
 
 def release_object(
@@ -1226,6 +1285,14 @@ def run_if_waiting_for_debugger() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,No
     json = yield cmd_dict
 
 
+@command_decoder('Runtime.runScript')
+def _decode_run_script(json: T_JSON_DICT) -> typing.Tuple[RemoteObject, typing.Optional[ExceptionDetails]]:
+    return (
+        RemoteObject.from_json(json['result']),
+        ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
+    )
+
+
 def run_script(
         script_id: ScriptId,
         execution_context_id: typing.Optional[ExecutionContextId] = None,
@@ -1273,10 +1340,7 @@ def run_script(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        RemoteObject.from_json(json['result']),
-        ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
-    )
+    return _decode_run_script(json)
 
 
 def set_async_call_stack_depth(
@@ -1395,6 +1459,11 @@ def remove_binding(
     json = yield cmd_dict
 
 
+@command_decoder('Runtime.getExceptionDetails')
+def _decode_get_exception_details(json: T_JSON_DICT) -> typing.Optional[ExceptionDetails]:
+    return ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
+
+
 def get_exception_details(
         error_object_id: RemoteObjectId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Optional[ExceptionDetails]]:
@@ -1417,7 +1486,7 @@ def get_exception_details(
         'params': params,
     }
     json = yield cmd_dict
-    return ExceptionDetails.from_json(json['exceptionDetails']) if json.get('exceptionDetails', None) is not None else None
+    return _decode_get_exception_details(json)
 
 
 @event_class('Runtime.bindingCalled')
@@ -1436,9 +1505,9 @@ class BindingCalled:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BindingCalled:
         return cls(
-            name=str(json['name']),
-            payload=str(json['payload']),
-            execution_context_id=ExecutionContextId.from_json(json['executionContextId'])
+            json['name'],
+            json['payload'],
+            ExecutionContextId(json['executionContextId']),
         )
 
 
@@ -1467,13 +1536,14 @@ class ConsoleAPICalled:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ConsoleAPICalled:
+        get = json.get
         return cls(
-            type_=str(json['type']),
-            args=[RemoteObject.from_json(i) for i in json['args']],
-            execution_context_id=ExecutionContextId.from_json(json['executionContextId']),
-            timestamp=Timestamp.from_json(json['timestamp']),
-            stack_trace=StackTrace.from_json(json['stackTrace']) if json.get('stackTrace', None) is not None else None,
-            context=str(json['context']) if json.get('context', None) is not None else None
+            json['type'],
+            list(map(RemoteObject.from_json, json['args'])),
+            ExecutionContextId(json['executionContextId']),
+            Timestamp(json['timestamp']),
+            StackTrace.from_json(v) if (v := get('stackTrace')) is not None else None,
+            get('context'),
         )
 
 
@@ -1491,8 +1561,8 @@ class ExceptionRevoked:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExceptionRevoked:
         return cls(
-            reason=str(json['reason']),
-            exception_id=int(json['exceptionId'])
+            json['reason'],
+            json['exceptionId'],
         )
 
 
@@ -1509,8 +1579,8 @@ class ExceptionThrown:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExceptionThrown:
         return cls(
-            timestamp=Timestamp.from_json(json['timestamp']),
-            exception_details=ExceptionDetails.from_json(json['exceptionDetails'])
+            Timestamp(json['timestamp']),
+            ExceptionDetails.from_json(json['exceptionDetails']),
         )
 
 
@@ -1526,7 +1596,7 @@ class ExecutionContextCreated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExecutionContextCreated:
         return cls(
-            context=ExecutionContextDescription.from_json(json['context'])
+            ExecutionContextDescription.from_json(json['context']),
         )
 
 
@@ -1544,8 +1614,8 @@ class ExecutionContextDestroyed:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExecutionContextDestroyed:
         return cls(
-            execution_context_id=ExecutionContextId.from_json(json['executionContextId']),
-            execution_context_unique_id=str(json['executionContextUniqueId'])
+            ExecutionContextId(json['executionContextId']),
+            json['executionContextUniqueId'],
         )
 
 
@@ -1559,9 +1629,7 @@ class ExecutionContextsCleared:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ExecutionContextsCleared:
-        return cls(
-
-        )
+        return cls()
 
 
 @event_class('Runtime.inspectRequested')
@@ -1578,8 +1646,9 @@ class InspectRequested:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InspectRequested:
+        get = json.get
         return cls(
-            object_=RemoteObject.from_json(json['object']),
-            hints=dict(json['hints']),
-            execution_context_id=ExecutionContextId.from_json(json['executionContextId']) if json.get('executionContextId', None) is not None else None
+            RemoteObject.from_json(json['object']),
+            json['hints'],
+            ExecutionContextId(v) if (v := get('executionContextId')) is not None else None,
         )
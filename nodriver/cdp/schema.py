@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 @dataclass
@@ -32,11 +31,16 @@ class Domain:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Domain:
         return cls(
-            name=str(json['name']),
-            version=str(json['version']),
+            json['name'],
+            json['version'],
         )
 
 
+@command_decoder('Schema.getDomains')
+def _decode_get_domains(json: T_JSON_DICT) -> typing.List[Domain]:
+    return [Domain.from_json(i) for i in json['domains']]
+
+
 def get_domains() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Domain]]:
     '''
     Returns supported domains.
@@ -47,4 +51,4 @@ def get_domains() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Domain
         'method': 'Schema.getDomains',
     }
     json = yield cmd_dict
-    return [Domain.from_json(i) for i in json['domains']]
+    return _decode_get_domains(json)
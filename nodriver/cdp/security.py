@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import network
 from deprecated.sphinx import deprecated # type: ignore
@@ -44,7 +43,10 @@ class MixedContentType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> MixedContentType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class SecurityState(enum.Enum):
@@ -63,7 +65,10 @@ class SecurityState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SecurityState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -152,25 +157,26 @@ class CertificateSecurityState:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CertificateSecurityState:
+        get = json.get
         return cls(
-            protocol=str(json['protocol']),
-            key_exchange=str(json['keyExchange']),
-            cipher=str(json['cipher']),
-            certificate=[str(i) for i in json['certificate']],
-            subject_name=str(json['subjectName']),
-            issuer=str(json['issuer']),
-            valid_from=network.TimeSinceEpoch.from_json(json['validFrom']),
-            valid_to=network.TimeSinceEpoch.from_json(json['validTo']),
-            certificate_has_weak_signature=bool(json['certificateHasWeakSignature']),
-            certificate_has_sha1_signature=bool(json['certificateHasSha1Signature']),
-            modern_ssl=bool(json['modernSSL']),
-            obsolete_ssl_protocol=bool(json['obsoleteSslProtocol']),
-            obsolete_ssl_key_exchange=bool(json['obsoleteSslKeyExchange']),
-            obsolete_ssl_cipher=bool(json['obsoleteSslCipher']),
-            obsolete_ssl_signature=bool(json['obsoleteSslSignature']),
-            key_exchange_group=str(json['keyExchangeGroup']) if json.get('keyExchangeGroup', None) is not None else None,
-            mac=str(json['mac']) if json.get('mac', None) is not None else None,
-            certificate_network_error=str(json['certificateNetworkError']) if json.get('certificateNetworkError', None) is not None else None,
+            json['protocol'],
+            json['keyExchange'],
+            json['cipher'],
+            list(json['certificate']),
+            json['subjectName'],
+            json['issuer'],
+            network.TimeSinceEpoch(json['validFrom']),
+            network.TimeSinceEpoch(json['validTo']),
+            json['certificateHasWeakSignature'],
+            json['certificateHasSha1Signature'],
+            json['modernSSL'],
+            json['obsoleteSslProtocol'],
+            json['obsoleteSslKeyExchange'],
+            json['obsoleteSslCipher'],
+            json['obsoleteSslSignature'],
+            get('keyExchangeGroup'),
+            get('mac'),
+            get('certificateNetworkError'),
         )
 
 
@@ -183,7 +189,10 @@ class SafetyTipStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SafetyTipStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -203,9 +212,10 @@ class SafetyTipInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SafetyTipInfo:
+        get = json.get
         return cls(
-            safety_tip_status=SafetyTipStatus.from_json(json['safetyTipStatus']),
-            safe_url=str(json['safeUrl']) if json.get('safeUrl', None) is not None else None,
+            SafetyTipStatus.from_json(json['safetyTipStatus']),
+            get('safeUrl'),
         )
 
 
@@ -238,11 +248,12 @@ class VisibleSecurityState:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VisibleSecurityState:
+        get = json.get
         return cls(
-            security_state=SecurityState.from_json(json['securityState']),
-            security_state_issue_ids=[str(i) for i in json['securityStateIssueIds']],
-            certificate_security_state=CertificateSecurityState.from_json(json['certificateSecurityState']) if json.get('certificateSecurityState', None) is not None else None,
-            safety_tip_info=SafetyTipInfo.from_json(json['safetyTipInfo']) if json.get('safetyTipInfo', None) is not None else None,
+            SecurityState.from_json(json['securityState']),
+            list(json['securityStateIssueIds']),
+            CertificateSecurityState.from_json(v) if (v := get('certificateSecurityState')) is not None else None,
+            SafetyTipInfo.from_json(v) if (v := get('safetyTipInfo')) is not None else None,
         )
 
 
@@ -286,14 +297,15 @@ class SecurityStateExplanation:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SecurityStateExplanation:
+        get = json.get
         return cls(
-            security_state=SecurityState.from_json(json['securityState']),
-            title=str(json['title']),
-            summary=str(json['summary']),
-            description=str(json['description']),
-            mixed_content_type=MixedContentType.from_json(json['mixedContentType']),
-            certificate=[str(i) for i in json['certificate']],
-            recommendations=[str(i) for i in json['recommendations']] if json.get('recommendations', None) is not None else None,
+            SecurityState.from_json(json['securityState']),
+            json['title'],
+            json['summary'],
+            json['description'],
+            MixedContentType.from_json(json['mixedContentType']),
+            list(json['certificate']),
+            list(v) if (v := get('recommendations')) is not None else None,
         )
 
 
@@ -337,13 +349,13 @@ class InsecureContentStatus:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InsecureContentStatus:
         return cls(
-            ran_mixed_content=bool(json['ranMixedContent']),
-            displayed_mixed_content=bool(json['displayedMixedContent']),
-            contained_mixed_form=bool(json['containedMixedForm']),
-            ran_content_with_cert_errors=bool(json['ranContentWithCertErrors']),
-            displayed_content_with_cert_errors=bool(json['displayedContentWithCertErrors']),
-            ran_insecure_content_style=SecurityState.from_json(json['ranInsecureContentStyle']),
-            displayed_insecure_content_style=SecurityState.from_json(json['displayedInsecureContentStyle']),
+            json['ranMixedContent'],
+            json['displayedMixedContent'],
+            json['containedMixedForm'],
+            json['ranContentWithCertErrors'],
+            json['displayedContentWithCertErrors'],
+            SecurityState.from_json(json['ranInsecureContentStyle']),
+            SecurityState.from_json(json['displayedInsecureContentStyle']),
         )
 
 
@@ -360,7 +372,10 @@ class CertificateErrorAction(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CertificateErrorAction:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -464,9 +479,9 @@ class CertificateError:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CertificateError:
         return cls(
-            event_id=int(json['eventId']),
-            error_type=str(json['errorType']),
-            request_url=str(json['requestURL'])
+            json['eventId'],
+            json['errorType'],
+            json['requestURL'],
         )
 
 
@@ -484,7 +499,7 @@ class VisibleSecurityStateChanged:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VisibleSecurityStateChanged:
         return cls(
-            visible_security_state=VisibleSecurityState.from_json(json['visibleSecurityState'])
+            VisibleSecurityState.from_json(json['visibleSecurityState']),
         )
 
 
@@ -509,10 +524,11 @@ class SecurityStateChanged:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SecurityStateChanged:
+        get = json.get
         return cls(
-            security_state=SecurityState.from_json(json['securityState']),
-            scheme_is_cryptographic=bool(json['schemeIsCryptographic']),
-            explanations=[SecurityStateExplanation.from_json(i) for i in json['explanations']],
-            insecure_content_status=InsecureContentStatus.from_json(json['insecureContentStatus']),
-            summary=str(json['summary']) if json.get('summary', None) is not None else None
+            SecurityState.from_json(json['securityState']),
+            json['schemeIsCryptographic'],
+            list(map(SecurityStateExplanation.from_json, json['explanations'])),
+            InsecureContentStatus.from_json(json['insecureContentStatus']),
+            get('summary'),
         )
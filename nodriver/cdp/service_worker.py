@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import target
 
@@ -47,9 +46,9 @@ class ServiceWorkerRegistration:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerRegistration:
         return cls(
-            registration_id=RegistrationID.from_json(json['registrationId']),
-            scope_url=str(json['scopeURL']),
-            is_deleted=bool(json['isDeleted']),
+            RegistrationID(json['registrationId']),
+            json['scopeURL'],
+            json['isDeleted'],
         )
 
 
@@ -64,7 +63,10 @@ class ServiceWorkerVersionRunningStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceWorkerVersionRunningStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class ServiceWorkerVersionStatus(enum.Enum):
@@ -80,7 +82,10 @@ class ServiceWorkerVersionStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceWorkerVersionStatus:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -132,17 +137,18 @@ class ServiceWorkerVersion:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerVersion:
+        get = json.get
         return cls(
-            version_id=str(json['versionId']),
-            registration_id=RegistrationID.from_json(json['registrationId']),
-            script_url=str(json['scriptURL']),
-            running_status=ServiceWorkerVersionRunningStatus.from_json(json['runningStatus']),
-            status=ServiceWorkerVersionStatus.from_json(json['status']),
-            script_last_modified=float(json['scriptLastModified']) if json.get('scriptLastModified', None) is not None else None,
-            script_response_time=float(json['scriptResponseTime']) if json.get('scriptResponseTime', None) is not None else None,
-            controlled_clients=[target.TargetID.from_json(i) for i in json['controlledClients']] if json.get('controlledClients', None) is not None else None,
-            target_id=target.TargetID.from_json(json['targetId']) if json.get('targetId', None) is not None else None,
-            router_rules=str(json['routerRules']) if json.get('routerRules', None) is not None else None,
+            json['versionId'],
+            RegistrationID(json['registrationId']),
+            json['scriptURL'],
+            ServiceWorkerVersionRunningStatus.from_json(json['runningStatus']),
+            ServiceWorkerVersionStatus.from_json(json['status']),
+            float(v) if (v := get('scriptLastModified')) is not None else None,
+            float(v) if (v := get('scriptResponseTime')) is not None else None,
+            list(map(target.TargetID, v)) if (v := get('controlledClients')) is not None else None,
+            target.TargetID(v) if (v := get('targetId')) is not None else None,
+            get('routerRules'),
         )
 
 
@@ -176,12 +182,12 @@ class ServiceWorkerErrorMessage:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ServiceWorkerErrorMessage:
         return cls(
-            error_message=str(json['errorMessage']),
-            registration_id=RegistrationID.from_json(json['registrationId']),
-            version_id=str(json['versionId']),
-            source_url=str(json['sourceURL']),
-            line_number=int(json['lineNumber']),
-            column_number=int(json['columnNumber']),
+            json['errorMessage'],
+            RegistrationID(json['registrationId']),
+            json['versionId'],
+            json['sourceURL'],
+            json['lineNumber'],
+            json['columnNumber'],
         )
 
 
@@ -388,7 +394,7 @@ class WorkerErrorReported:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WorkerErrorReported:
         return cls(
-            error_message=ServiceWorkerErrorMessage.from_json(json['errorMessage'])
+            ServiceWorkerErrorMessage.from_json(json['errorMessage']),
         )
 
 
@@ -400,7 +406,7 @@ class WorkerRegistrationUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WorkerRegistrationUpdated:
         return cls(
-            registrations=[ServiceWorkerRegistration.from_json(i) for i in json['registrations']]
+            list(map(ServiceWorkerRegistration.from_json, json['registrations'])),
         )
 
 
@@ -412,5 +418,5 @@ class WorkerVersionUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> WorkerVersionUpdated:
         return cls(
-            versions=[ServiceWorkerVersion.from_json(i) for i in json['versions']]
+            list(map(ServiceWorkerVersion.from_json, json['versions'])),
         )
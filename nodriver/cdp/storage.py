@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import browser
 from . import network
@@ -52,7 +51,10 @@ class StorageType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StorageType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -75,8 +77,8 @@ class UsageForType:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> UsageForType:
         return cls(
-            storage_type=StorageType.from_json(json['storageType']),
-            usage=float(json['usage']),
+            StorageType.from_json(json['storageType']),
+            float(json['usage']),
         )
 
 
@@ -99,8 +101,8 @@ class TrustTokens:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TrustTokens:
         return cls(
-            issuer_origin=str(json['issuerOrigin']),
-            count=float(json['count']),
+            json['issuerOrigin'],
+            float(json['count']),
         )
 
 
@@ -140,7 +142,10 @@ class InterestGroupAccessType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InterestGroupAccessType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class InterestGroupAuctionEventType(enum.Enum):
@@ -155,7 +160,10 @@ class InterestGroupAuctionEventType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InterestGroupAuctionEventType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class InterestGroupAuctionFetchType(enum.Enum):
@@ -173,7 +181,10 @@ class InterestGroupAuctionFetchType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InterestGroupAuctionFetchType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class SharedStorageAccessType(enum.Enum):
@@ -207,7 +218,10 @@ class SharedStorageAccessType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SharedStorageAccessType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -228,8 +242,8 @@ class SharedStorageEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedStorageEntry:
         return cls(
-            key=str(json['key']),
-            value=str(json['value']),
+            json['key'],
+            json['value'],
         )
 
 
@@ -262,10 +276,10 @@ class SharedStorageMetadata:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedStorageMetadata:
         return cls(
-            creation_time=network.TimeSinceEpoch.from_json(json['creationTime']),
-            length=int(json['length']),
-            remaining_budget=float(json['remainingBudget']),
-            bytes_used=int(json['bytesUsed']),
+            network.TimeSinceEpoch(json['creationTime']),
+            json['length'],
+            float(json['remainingBudget']),
+            json['bytesUsed'],
         )
 
 
@@ -287,8 +301,8 @@ class SharedStorageReportingMetadata:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedStorageReportingMetadata:
         return cls(
-            event_type=str(json['eventType']),
-            reporting_url=str(json['reportingUrl']),
+            json['eventType'],
+            json['reportingUrl'],
         )
 
 
@@ -312,8 +326,8 @@ class SharedStorageUrlWithMetadata:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedStorageUrlWithMetadata:
         return cls(
-            url=str(json['url']),
-            reporting_metadata=[SharedStorageReportingMetadata.from_json(i) for i in json['reportingMetadata']],
+            json['url'],
+            list(map(SharedStorageReportingMetadata.from_json, json['reportingMetadata'])),
         )
 
 
@@ -389,14 +403,15 @@ class SharedStorageAccessParams:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedStorageAccessParams:
+        get = json.get
         return cls(
-            script_source_url=str(json['scriptSourceUrl']) if json.get('scriptSourceUrl', None) is not None else None,
-            operation_name=str(json['operationName']) if json.get('operationName', None) is not None else None,
-            serialized_data=str(json['serializedData']) if json.get('serializedData', None) is not None else None,
-            urls_with_metadata=[SharedStorageUrlWithMetadata.from_json(i) for i in json['urlsWithMetadata']] if json.get('urlsWithMetadata', None) is not None else None,
-            key=str(json['key']) if json.get('key', None) is not None else None,
-            value=str(json['value']) if json.get('value', None) is not None else None,
-            ignore_if_present=bool(json['ignoreIfPresent']) if json.get('ignoreIfPresent', None) is not None else None,
+            get('scriptSourceUrl'),
+            get('operationName'),
+            get('serializedData'),
+            list(map(SharedStorageUrlWithMetadata.from_json, v)) if (v := get('urlsWithMetadata')) is not None else None,
+            get('key'),
+            get('value'),
+            get('ignoreIfPresent'),
         )
 
 
@@ -409,7 +424,10 @@ class StorageBucketsDurability(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StorageBucketsDurability:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -428,9 +446,10 @@ class StorageBucket:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StorageBucket:
+        get = json.get
         return cls(
-            storage_key=SerializedStorageKey.from_json(json['storageKey']),
-            name=str(json['name']) if json.get('name', None) is not None else None,
+            SerializedStorageKey(json['storageKey']),
+            get('name'),
         )
 
 
@@ -462,12 +481,12 @@ class StorageBucketInfo:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StorageBucketInfo:
         return cls(
-            bucket=StorageBucket.from_json(json['bucket']),
-            id_=str(json['id']),
-            expiration=network.TimeSinceEpoch.from_json(json['expiration']),
-            quota=float(json['quota']),
-            persistent=bool(json['persistent']),
-            durability=StorageBucketsDurability.from_json(json['durability']),
+            StorageBucket.from_json(json['bucket']),
+            json['id'],
+            network.TimeSinceEpoch(json['expiration']),
+            float(json['quota']),
+            json['persistent'],
+            StorageBucketsDurability.from_json(json['durability']),
         )
 
 
@@ -480,7 +499,10 @@ class AttributionReportingSourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingSourceType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class UnsignedInt64AsBase10(str):
@@ -534,8 +556,8 @@ class AttributionReportingFilterDataEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingFilterDataEntry:
         return cls(
-            key=str(json['key']),
-            values=[str(i) for i in json['values']],
+            json['key'],
+            list(json['values']),
         )
 
 
@@ -555,9 +577,10 @@ class AttributionReportingFilterConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingFilterConfig:
+        get = json.get
         return cls(
-            filter_values=[AttributionReportingFilterDataEntry.from_json(i) for i in json['filterValues']],
-            lookback_window=int(json['lookbackWindow']) if json.get('lookbackWindow', None) is not None else None,
+            list(map(AttributionReportingFilterDataEntry.from_json, json['filterValues'])),
+            get('lookbackWindow'),
         )
 
 
@@ -576,8 +599,8 @@ class AttributionReportingFilterPair:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingFilterPair:
         return cls(
-            filters=[AttributionReportingFilterConfig.from_json(i) for i in json['filters']],
-            not_filters=[AttributionReportingFilterConfig.from_json(i) for i in json['notFilters']],
+            list(map(AttributionReportingFilterConfig.from_json, json['filters'])),
+            list(map(AttributionReportingFilterConfig.from_json, json['notFilters'])),
         )
 
 
@@ -596,8 +619,8 @@ class AttributionReportingAggregationKeysEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregationKeysEntry:
         return cls(
-            key=str(json['key']),
-            value=UnsignedInt128AsBase16.from_json(json['value']),
+            json['key'],
+            UnsignedInt128AsBase16(json['value']),
         )
 
 
@@ -618,8 +641,8 @@ class AttributionReportingEventReportWindows:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingEventReportWindows:
         return cls(
-            start=int(json['start']),
-            ends=[int(i) for i in json['ends']],
+            json['start'],
+            list(json['ends']),
         )
 
 
@@ -640,8 +663,8 @@ class AttributionReportingTriggerSpec:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingTriggerSpec:
         return cls(
-            trigger_data=[float(i) for i in json['triggerData']],
-            event_report_windows=AttributionReportingEventReportWindows.from_json(json['eventReportWindows']),
+            list(map(float, json['triggerData'])),
+            AttributionReportingEventReportWindows.from_json(json['eventReportWindows']),
         )
 
 
@@ -654,7 +677,10 @@ class AttributionReportingTriggerDataMatching(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingTriggerDataMatching:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -677,9 +703,9 @@ class AttributionReportingAggregatableDebugReportingData:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregatableDebugReportingData:
         return cls(
-            key_piece=UnsignedInt128AsBase16.from_json(json['keyPiece']),
-            value=float(json['value']),
-            types=[str(i) for i in json['types']],
+            UnsignedInt128AsBase16(json['keyPiece']),
+            float(json['value']),
+            list(json['types']),
         )
 
 
@@ -707,11 +733,12 @@ class AttributionReportingAggregatableDebugReportingConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregatableDebugReportingConfig:
+        get = json.get
         return cls(
-            key_piece=UnsignedInt128AsBase16.from_json(json['keyPiece']),
-            debug_data=[AttributionReportingAggregatableDebugReportingData.from_json(i) for i in json['debugData']],
-            budget=float(json['budget']) if json.get('budget', None) is not None else None,
-            aggregation_coordinator_origin=str(json['aggregationCoordinatorOrigin']) if json.get('aggregationCoordinatorOrigin', None) is not None else None,
+            UnsignedInt128AsBase16(json['keyPiece']),
+            list(map(AttributionReportingAggregatableDebugReportingData.from_json, json['debugData'])),
+            float(v) if (v := get('budget')) is not None else None,
+            get('aggregationCoordinatorOrigin'),
         )
 
 
@@ -735,9 +762,9 @@ class AttributionScopesData:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionScopesData:
         return cls(
-            values=[str(i) for i in json['values']],
-            limit=float(json['limit']),
-            max_event_states=float(json['maxEventStates']),
+            list(json['values']),
+            float(json['limit']),
+            float(json['maxEventStates']),
         )
 
 
@@ -807,25 +834,26 @@ class AttributionReportingSourceRegistration:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingSourceRegistration:
+        get = json.get
         return cls(
-            time=network.TimeSinceEpoch.from_json(json['time']),
-            expiry=int(json['expiry']),
-            trigger_specs=[AttributionReportingTriggerSpec.from_json(i) for i in json['triggerSpecs']],
-            aggregatable_report_window=int(json['aggregatableReportWindow']),
-            type_=AttributionReportingSourceType.from_json(json['type']),
-            source_origin=str(json['sourceOrigin']),
-            reporting_origin=str(json['reportingOrigin']),
-            destination_sites=[str(i) for i in json['destinationSites']],
-            event_id=UnsignedInt64AsBase10.from_json(json['eventId']),
-            priority=SignedInt64AsBase10.from_json(json['priority']),
-            filter_data=[AttributionReportingFilterDataEntry.from_json(i) for i in json['filterData']],
-            aggregation_keys=[AttributionReportingAggregationKeysEntry.from_json(i) for i in json['aggregationKeys']],
-            trigger_data_matching=AttributionReportingTriggerDataMatching.from_json(json['triggerDataMatching']),
-            destination_limit_priority=SignedInt64AsBase10.from_json(json['destinationLimitPriority']),
-            aggregatable_debug_reporting_config=AttributionReportingAggregatableDebugReportingConfig.from_json(json['aggregatableDebugReportingConfig']),
-            max_event_level_reports=int(json['maxEventLevelReports']),
-            debug_key=UnsignedInt64AsBase10.from_json(json['debugKey']) if json.get('debugKey', None) is not None else None,
-            scopes_data=AttributionScopesData.from_json(json['scopesData']) if json.get('scopesData', None) is not None else None,
+            network.TimeSinceEpoch(json['time']),
+            json['expiry'],
+            list(map(AttributionReportingTriggerSpec.from_json, json['triggerSpecs'])),
+            json['aggregatableReportWindow'],
+            AttributionReportingSourceType.from_json(json['type']),
+            json['sourceOrigin'],
+            json['reportingOrigin'],
+            list(json['destinationSites']),
+            UnsignedInt64AsBase10(json['eventId']),
+            SignedInt64AsBase10(json['priority']),
+            list(map(AttributionReportingFilterDataEntry.from_json, json['filterData'])),
+            list(map(AttributionReportingAggregationKeysEntry.from_json, json['aggregationKeys'])),
+            AttributionReportingTriggerDataMatching.from_json(json['triggerDataMatching']),
+            SignedInt64AsBase10(json['destinationLimitPriority']),
+            AttributionReportingAggregatableDebugReportingConfig.from_json(json['aggregatableDebugReportingConfig']),
+            json['maxEventLevelReports'],
+            UnsignedInt64AsBase10(v) if (v := get('debugKey')) is not None else None,
+            AttributionScopesData.from_json(v) if (v := get('scopesData')) is not None else None,
         )
 
 
@@ -852,7 +880,10 @@ class AttributionReportingSourceRegistrationResult(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingSourceRegistrationResult:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class AttributionReportingSourceRegistrationTimeConfig(enum.Enum):
@@ -864,7 +895,10 @@ class AttributionReportingSourceRegistrationTimeConfig(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingSourceRegistrationTimeConfig:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -887,9 +921,9 @@ class AttributionReportingAggregatableValueDictEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregatableValueDictEntry:
         return cls(
-            key=str(json['key']),
-            value=float(json['value']),
-            filtering_id=UnsignedInt64AsBase10.from_json(json['filteringId']),
+            json['key'],
+            float(json['value']),
+            UnsignedInt64AsBase10(json['filteringId']),
         )
 
 
@@ -908,8 +942,8 @@ class AttributionReportingAggregatableValueEntry:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregatableValueEntry:
         return cls(
-            values=[AttributionReportingAggregatableValueDictEntry.from_json(i) for i in json['values']],
-            filters=AttributionReportingFilterPair.from_json(json['filters']),
+            list(map(AttributionReportingAggregatableValueDictEntry.from_json, json['values'])),
+            AttributionReportingFilterPair.from_json(json['filters']),
         )
 
 
@@ -934,11 +968,12 @@ class AttributionReportingEventTriggerData:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingEventTriggerData:
+        get = json.get
         return cls(
-            data=UnsignedInt64AsBase10.from_json(json['data']),
-            priority=SignedInt64AsBase10.from_json(json['priority']),
-            filters=AttributionReportingFilterPair.from_json(json['filters']),
-            dedup_key=UnsignedInt64AsBase10.from_json(json['dedupKey']) if json.get('dedupKey', None) is not None else None,
+            UnsignedInt64AsBase10(json['data']),
+            SignedInt64AsBase10(json['priority']),
+            AttributionReportingFilterPair.from_json(json['filters']),
+            UnsignedInt64AsBase10(v) if (v := get('dedupKey')) is not None else None,
         )
 
 
@@ -960,9 +995,9 @@ class AttributionReportingAggregatableTriggerData:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregatableTriggerData:
         return cls(
-            key_piece=UnsignedInt128AsBase16.from_json(json['keyPiece']),
-            source_keys=[str(i) for i in json['sourceKeys']],
-            filters=AttributionReportingFilterPair.from_json(json['filters']),
+            UnsignedInt128AsBase16(json['keyPiece']),
+            list(json['sourceKeys']),
+            AttributionReportingFilterPair.from_json(json['filters']),
         )
 
 
@@ -981,9 +1016,10 @@ class AttributionReportingAggregatableDedupKey:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingAggregatableDedupKey:
+        get = json.get
         return cls(
-            filters=AttributionReportingFilterPair.from_json(json['filters']),
-            dedup_key=UnsignedInt64AsBase10.from_json(json['dedupKey']) if json.get('dedupKey', None) is not None else None,
+            AttributionReportingFilterPair.from_json(json['filters']),
+            UnsignedInt64AsBase10(v) if (v := get('dedupKey')) is not None else None,
         )
 
 
@@ -1037,20 +1073,21 @@ class AttributionReportingTriggerRegistration:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingTriggerRegistration:
+        get = json.get
         return cls(
-            filters=AttributionReportingFilterPair.from_json(json['filters']),
-            aggregatable_dedup_keys=[AttributionReportingAggregatableDedupKey.from_json(i) for i in json['aggregatableDedupKeys']],
-            event_trigger_data=[AttributionReportingEventTriggerData.from_json(i) for i in json['eventTriggerData']],
-            aggregatable_trigger_data=[AttributionReportingAggregatableTriggerData.from_json(i) for i in json['aggregatableTriggerData']],
-            aggregatable_values=[AttributionReportingAggregatableValueEntry.from_json(i) for i in json['aggregatableValues']],
-            aggregatable_filtering_id_max_bytes=int(json['aggregatableFilteringIdMaxBytes']),
-            debug_reporting=bool(json['debugReporting']),
-            source_registration_time_config=AttributionReportingSourceRegistrationTimeConfig.from_json(json['sourceRegistrationTimeConfig']),
-            aggregatable_debug_reporting_config=AttributionReportingAggregatableDebugReportingConfig.from_json(json['aggregatableDebugReportingConfig']),
-            scopes=[str(i) for i in json['scopes']],
-            debug_key=UnsignedInt64AsBase10.from_json(json['debugKey']) if json.get('debugKey', None) is not None else None,
-            aggregation_coordinator_origin=str(json['aggregationCoordinatorOrigin']) if json.get('aggregationCoordinatorOrigin', None) is not None else None,
-            trigger_context_id=str(json['triggerContextId']) if json.get('triggerContextId', None) is not None else None,
+            AttributionReportingFilterPair.from_json(json['filters']),
+            list(map(AttributionReportingAggregatableDedupKey.from_json, json['aggregatableDedupKeys'])),
+            list(map(AttributionReportingEventTriggerData.from_json, json['eventTriggerData'])),
+            list(map(AttributionReportingAggregatableTriggerData.from_json, json['aggregatableTriggerData'])),
+            list(map(AttributionReportingAggregatableValueEntry.from_json, json['aggregatableValues'])),
+            json['aggregatableFilteringIdMaxBytes'],
+            json['debugReporting'],
+            AttributionReportingSourceRegistrationTimeConfig.from_json(json['sourceRegistrationTimeConfig']),
+            AttributionReportingAggregatableDebugReportingConfig.from_json(json['aggregatableDebugReportingConfig']),
+            list(json['scopes']),
+            UnsignedInt64AsBase10(v) if (v := get('debugKey')) is not None else None,
+            get('aggregationCoordinatorOrigin'),
+            get('triggerContextId'),
         )
 
 
@@ -1080,7 +1117,10 @@ class AttributionReportingEventLevelResult(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingEventLevelResult:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class AttributionReportingAggregatableResult(enum.Enum):
@@ -1105,7 +1145,10 @@ class AttributionReportingAggregatableResult(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingAggregatableResult:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -1132,12 +1175,17 @@ class RelatedWebsiteSet:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RelatedWebsiteSet:
         return cls(
-            primary_sites=[str(i) for i in json['primarySites']],
-            associated_sites=[str(i) for i in json['associatedSites']],
-            service_sites=[str(i) for i in json['serviceSites']],
+            list(json['primarySites']),
+            list(json['associatedSites']),
+            list(json['serviceSites']),
         )
 
 
+@command_decoder('Storage.getStorageKeyForFrame')
+def _decode_get_storage_key_for_frame(json: T_JSON_DICT) -> SerializedStorageKey:
+    return SerializedStorageKey.from_json(json['storageKey'])
+
+
 def get_storage_key_for_frame(
         frame_id: page.FrameId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SerializedStorageKey]:
@@ -1154,7 +1202,7 @@ def get_storage_key_for_frame(
         'params': params,
     }
     json = yield cmd_dict
-    return SerializedStorageKey.from_json(json['storageKey'])
+    return _decode_get_storage_key_for_frame(json)
 
 
 def clear_data_for_origin(
@@ -1197,6 +1245,11 @@ def clear_data_for_storage_key(
     json = yield cmd_dict
 
 
+@command_decoder('Storage.getCookies')
+def _decode_get_cookies(json: T_JSON_DICT) -> typing.List[network.Cookie]:
+    return [network.Cookie.from_json(i) for i in json['cookies']]
+
+
 def get_cookies(
         browser_context_id: typing.Optional[browser.BrowserContextID] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[network.Cookie]]:
@@ -1214,7 +1267,7 @@ def get_cookies(
         'params': params,
     }
     json = yield cmd_dict
-    return [network.Cookie.from_json(i) for i in json['cookies']]
+    return _decode_get_cookies(json)
 
 
 def set_cookies(
@@ -1256,6 +1309,16 @@ def clear_cookies(
     json = yield cmd_dict
 
 
+@command_decoder('Storage.getUsageAndQuota')
+def _decode_get_usage_and_quota(json: T_JSON_DICT) -> typing.Tuple[float, float, bool, typing.List[UsageForType]]:
+    return (
+        float(json['usage']),
+        float(json['quota']),
+        bool(json['overrideActive']),
+        [UsageForType.from_json(i) for i in json['usageBreakdown']]
+    )
+
+
 def get_usage_and_quota(
         origin: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[float, float, bool, typing.List[UsageForType]]]:
@@ -1277,12 +1340,7 @@ def get_usage_and_quota(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        float(json['usage']),
-        float(json['quota']),
-        bool(json['overrideActive']),
-        [UsageForType.from_json(i) for i in json['usageBreakdown']]
-    )
+    return _decode_get_usage_and_quota(json)
 
 
 def override_quota_for_origin(
@@ -1444,6 +1502,11 @@ def untrack_indexed_db_for_storage_key(
     json = yield cmd_dict
 
 
+@command_decoder('Storage.getTrustTokens')
+def _decode_get_trust_tokens(json: T_JSON_DICT) -> typing.List[TrustTokens]:
+    return [TrustTokens.from_json(i) for i in json['tokens']]
+
+
 def get_trust_tokens() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[TrustTokens]]:
     '''
     Returns the number of stored Trust Tokens per issuer for the
@@ -1457,7 +1520,12 @@ def get_trust_tokens() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[T
         'method': 'Storage.getTrustTokens',
     }
     json = yield cmd_dict
-    return [TrustTokens.from_json(i) for i in json['tokens']]
+    return _decode_get_trust_tokens(json)
+
+
+@command_decoder('Storage.clearTrustTokens')
+def _decode_clear_trust_tokens(json: T_JSON_DICT) -> bool:
+    return bool(json['didDeleteTokens'])
 
 
 def clear_trust_tokens(
@@ -1479,7 +1547,12 @@ def clear_trust_tokens(
         'params': params,
     }
     json = yield cmd_dict
-    return bool(json['didDeleteTokens'])
+    return _decode_clear_trust_tokens(json)
+
+
+@command_decoder('Storage.getInterestGroupDetails')
+def _decode_get_interest_group_details(json: T_JSON_DICT) -> dict:
+    return dict(json['details'])
 
 
 def get_interest_group_details(
@@ -1503,7 +1576,7 @@ def get_interest_group_details(
         'params': params,
     }
     json = yield cmd_dict
-    return dict(json['details'])
+    return _decode_get_interest_group_details(json)
 
 
 def set_interest_group_tracking(
@@ -1545,6 +1618,11 @@ def set_interest_group_auction_tracking(
     json = yield cmd_dict
 
 
+@command_decoder('Storage.getSharedStorageMetadata')
+def _decode_get_shared_storage_metadata(json: T_JSON_DICT) -> SharedStorageMetadata:
+    return SharedStorageMetadata.from_json(json['metadata'])
+
+
 def get_shared_storage_metadata(
         owner_origin: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SharedStorageMetadata]:
@@ -1563,7 +1641,12 @@ def get_shared_storage_metadata(
         'params': params,
     }
     json = yield cmd_dict
-    return SharedStorageMetadata.from_json(json['metadata'])
+    return _decode_get_shared_storage_metadata(json)
+
+
+@command_decoder('Storage.getSharedStorageEntries')
+def _decode_get_shared_storage_entries(json: T_JSON_DICT) -> typing.List[SharedStorageEntry]:
+    return [SharedStorageEntry.from_json(i) for i in json['entries']]
 
 
 def get_shared_storage_entries(
@@ -1584,7 +1667,7 @@ def get_shared_storage_entries(
         'params': params,
     }
     json = yield cmd_dict
-    return [SharedStorageEntry.from_json(i) for i in json['entries']]
+    return _decode_get_shared_storage_entries(json)
 
 
 def set_shared_storage_entry(
@@ -1736,6 +1819,11 @@ def delete_storage_bucket(
     json = yield cmd_dict
 
 
+@command_decoder('Storage.runBounceTrackingMitigations')
+def _decode_run_bounce_tracking_mitigations(json: T_JSON_DICT) -> typing.List[str]:
+    return [str(i) for i in json['deletedSites']]
+
+
 def run_bounce_tracking_mitigations() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
     '''
     Deletes state for sites identified as potential bounce trackers, immediately.
@@ -1748,7 +1836,7 @@ def run_bounce_tracking_mitigations() -> typing.Generator[T_JSON_DICT,T_JSON_DIC
         'method': 'Storage.runBounceTrackingMitigations',
     }
     json = yield cmd_dict
-    return [str(i) for i in json['deletedSites']]
+    return _decode_run_bounce_tracking_mitigations(json)
 
 
 def set_attribution_reporting_local_testing_mode(
@@ -1789,6 +1877,11 @@ def set_attribution_reporting_tracking(
     json = yield cmd_dict
 
 
+@command_decoder('Storage.sendPendingAttributionReports')
+def _decode_send_pending_attribution_reports(json: T_JSON_DICT) -> int:
+    return int(json['numSent'])
+
+
 def send_pending_attribution_reports() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,int]:
     '''
     Sends all pending Attribution Reports immediately, regardless of their
@@ -1802,7 +1895,12 @@ def send_pending_attribution_reports() -> typing.Generator[T_JSON_DICT,T_JSON_DI
         'method': 'Storage.sendPendingAttributionReports',
     }
     json = yield cmd_dict
-    return int(json['numSent'])
+    return _decode_send_pending_attribution_reports(json)
+
+
+@command_decoder('Storage.getRelatedWebsiteSets')
+def _decode_get_related_website_sets(json: T_JSON_DICT) -> typing.List[RelatedWebsiteSet]:
+    return [RelatedWebsiteSet.from_json(i) for i in json['sets']]
 
 
 def get_related_website_sets() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[RelatedWebsiteSet]]:
@@ -1818,7 +1916,7 @@ def get_related_website_sets() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typin
         'method': 'Storage.getRelatedWebsiteSets',
     }
     json = yield cmd_dict
-    return [RelatedWebsiteSet.from_json(i) for i in json['sets']]
+    return _decode_get_related_website_sets(json)
 
 
 @event_class('Storage.cacheStorageContentUpdated')
@@ -1839,10 +1937,10 @@ class CacheStorageContentUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CacheStorageContentUpdated:
         return cls(
-            origin=str(json['origin']),
-            storage_key=str(json['storageKey']),
-            bucket_id=str(json['bucketId']),
-            cache_name=str(json['cacheName'])
+            json['origin'],
+            json['storageKey'],
+            json['bucketId'],
+            json['cacheName'],
         )
 
 
@@ -1862,9 +1960,9 @@ class CacheStorageListUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CacheStorageListUpdated:
         return cls(
-            origin=str(json['origin']),
-            storage_key=str(json['storageKey']),
-            bucket_id=str(json['bucketId'])
+            json['origin'],
+            json['storageKey'],
+            json['bucketId'],
         )
 
 
@@ -1888,11 +1986,11 @@ class IndexedDBContentUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IndexedDBContentUpdated:
         return cls(
-            origin=str(json['origin']),
-            storage_key=str(json['storageKey']),
-            bucket_id=str(json['bucketId']),
-            database_name=str(json['databaseName']),
-            object_store_name=str(json['objectStoreName'])
+            json['origin'],
+            json['storageKey'],
+            json['bucketId'],
+            json['databaseName'],
+            json['objectStoreName'],
         )
 
 
@@ -1912,9 +2010,9 @@ class IndexedDBListUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> IndexedDBListUpdated:
         return cls(
-            origin=str(json['origin']),
-            storage_key=str(json['storageKey']),
-            bucket_id=str(json['bucketId'])
+            json['origin'],
+            json['storageKey'],
+            json['bucketId'],
         )
 
 
@@ -1940,15 +2038,16 @@ class InterestGroupAccessed:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InterestGroupAccessed:
+        get = json.get
         return cls(
-            access_time=network.TimeSinceEpoch.from_json(json['accessTime']),
-            type_=InterestGroupAccessType.from_json(json['type']),
-            owner_origin=str(json['ownerOrigin']),
-            name=str(json['name']),
-            component_seller_origin=str(json['componentSellerOrigin']) if json.get('componentSellerOrigin', None) is not None else None,
-            bid=float(json['bid']) if json.get('bid', None) is not None else None,
-            bid_currency=str(json['bidCurrency']) if json.get('bidCurrency', None) is not None else None,
-            unique_auction_id=InterestGroupAuctionId.from_json(json['uniqueAuctionId']) if json.get('uniqueAuctionId', None) is not None else None
+            network.TimeSinceEpoch(json['accessTime']),
+            InterestGroupAccessType.from_json(json['type']),
+            json['ownerOrigin'],
+            json['name'],
+            get('componentSellerOrigin'),
+            float(v) if (v := get('bid')) is not None else None,
+            get('bidCurrency'),
+            InterestGroupAuctionId(v) if (v := get('uniqueAuctionId')) is not None else None,
         )
 
 
@@ -1969,12 +2068,13 @@ class InterestGroupAuctionEventOccurred:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InterestGroupAuctionEventOccurred:
+        get = json.get
         return cls(
-            event_time=network.TimeSinceEpoch.from_json(json['eventTime']),
-            type_=InterestGroupAuctionEventType.from_json(json['type']),
-            unique_auction_id=InterestGroupAuctionId.from_json(json['uniqueAuctionId']),
-            parent_auction_id=InterestGroupAuctionId.from_json(json['parentAuctionId']) if json.get('parentAuctionId', None) is not None else None,
-            auction_config=dict(json['auctionConfig']) if json.get('auctionConfig', None) is not None else None
+            network.TimeSinceEpoch(json['eventTime']),
+            InterestGroupAuctionEventType.from_json(json['type']),
+            InterestGroupAuctionId(json['uniqueAuctionId']),
+            InterestGroupAuctionId(v) if (v := get('parentAuctionId')) is not None else None,
+            get('auctionConfig'),
         )
 
 
@@ -1997,9 +2097,9 @@ class InterestGroupAuctionNetworkRequestCreated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> InterestGroupAuctionNetworkRequestCreated:
         return cls(
-            type_=InterestGroupAuctionFetchType.from_json(json['type']),
-            request_id=network.RequestId.from_json(json['requestId']),
-            auctions=[InterestGroupAuctionId.from_json(i) for i in json['auctions']]
+            InterestGroupAuctionFetchType.from_json(json['type']),
+            network.RequestId(json['requestId']),
+            list(map(InterestGroupAuctionId, json['auctions'])),
         )
 
 
@@ -2025,11 +2125,11 @@ class SharedStorageAccessed:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> SharedStorageAccessed:
         return cls(
-            access_time=network.TimeSinceEpoch.from_json(json['accessTime']),
-            type_=SharedStorageAccessType.from_json(json['type']),
-            main_frame_id=page.FrameId.from_json(json['mainFrameId']),
-            owner_origin=str(json['ownerOrigin']),
-            params=SharedStorageAccessParams.from_json(json['params'])
+            network.TimeSinceEpoch(json['accessTime']),
+            SharedStorageAccessType.from_json(json['type']),
+            page.FrameId(json['mainFrameId']),
+            json['ownerOrigin'],
+            SharedStorageAccessParams.from_json(json['params']),
         )
 
 
@@ -2041,7 +2141,7 @@ class StorageBucketCreatedOrUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StorageBucketCreatedOrUpdated:
         return cls(
-            bucket_info=StorageBucketInfo.from_json(json['bucketInfo'])
+            StorageBucketInfo.from_json(json['bucketInfo']),
         )
 
 
@@ -2053,7 +2153,7 @@ class StorageBucketDeleted:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> StorageBucketDeleted:
         return cls(
-            bucket_id=str(json['bucketId'])
+            json['bucketId'],
         )
 
 
@@ -2071,8 +2171,8 @@ class AttributionReportingSourceRegistered:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingSourceRegistered:
         return cls(
-            registration=AttributionReportingSourceRegistration.from_json(json['registration']),
-            result=AttributionReportingSourceRegistrationResult.from_json(json['result'])
+            AttributionReportingSourceRegistration.from_json(json['registration']),
+            AttributionReportingSourceRegistrationResult.from_json(json['result']),
         )
 
 
@@ -2091,7 +2191,7 @@ class AttributionReportingTriggerRegistered:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttributionReportingTriggerRegistered:
         return cls(
-            registration=AttributionReportingTriggerRegistration.from_json(json['registration']),
-            event_level=AttributionReportingEventLevelResult.from_json(json['eventLevel']),
-            aggregatable=AttributionReportingAggregatableResult.from_json(json['aggregatable'])
+            AttributionReportingTriggerRegistration.from_json(json['registration']),
+            AttributionReportingEventLevelResult.from_json(json['eventLevel']),
+            AttributionReportingAggregatableResult.from_json(json['aggregatable']),
         )
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 @dataclass
@@ -57,15 +56,16 @@ class GPUDevice:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> GPUDevice:
+        get = json.get
         return cls(
-            vendor_id=float(json['vendorId']),
-            device_id=float(json['deviceId']),
-            vendor_string=str(json['vendorString']),
-            device_string=str(json['deviceString']),
-            driver_vendor=str(json['driverVendor']),
-            driver_version=str(json['driverVersion']),
-            sub_sys_id=float(json['subSysId']) if json.get('subSysId', None) is not None else None,
-            revision=float(json['revision']) if json.get('revision', None) is not None else None,
+            float(json['vendorId']),
+            float(json['deviceId']),
+            json['vendorString'],
+            json['deviceString'],
+            json['driverVendor'],
+            json['driverVersion'],
+            float(v) if (v := get('subSysId')) is not None else None,
+            float(v) if (v := get('revision')) is not None else None,
         )
 
 
@@ -89,8 +89,8 @@ class Size:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Size:
         return cls(
-            width=int(json['width']),
-            height=int(json['height']),
+            json['width'],
+            json['height'],
         )
 
 
@@ -119,9 +119,9 @@ class VideoDecodeAcceleratorCapability:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VideoDecodeAcceleratorCapability:
         return cls(
-            profile=str(json['profile']),
-            max_resolution=Size.from_json(json['maxResolution']),
-            min_resolution=Size.from_json(json['minResolution']),
+            json['profile'],
+            Size.from_json(json['maxResolution']),
+            Size.from_json(json['minResolution']),
         )
 
 
@@ -155,10 +155,10 @@ class VideoEncodeAcceleratorCapability:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VideoEncodeAcceleratorCapability:
         return cls(
-            profile=str(json['profile']),
-            max_resolution=Size.from_json(json['maxResolution']),
-            max_framerate_numerator=int(json['maxFramerateNumerator']),
-            max_framerate_denominator=int(json['maxFramerateDenominator']),
+            json['profile'],
+            Size.from_json(json['maxResolution']),
+            json['maxFramerateNumerator'],
+            json['maxFramerateDenominator'],
         )
 
 
@@ -175,7 +175,10 @@ class SubsamplingFormat(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SubsamplingFormat:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class ImageType(enum.Enum):
@@ -191,7 +194,10 @@ class ImageType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ImageType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -223,10 +229,10 @@ class ImageDecodeAcceleratorCapability:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ImageDecodeAcceleratorCapability:
         return cls(
-            image_type=ImageType.from_json(json['imageType']),
-            max_dimensions=Size.from_json(json['maxDimensions']),
-            min_dimensions=Size.from_json(json['minDimensions']),
-            subsamplings=[SubsamplingFormat.from_json(i) for i in json['subsamplings']],
+            ImageType.from_json(json['imageType']),
+            Size.from_json(json['maxDimensions']),
+            Size.from_json(json['minDimensions']),
+            list(map(SubsamplingFormat.from_json, json['subsamplings'])),
         )
 
 
@@ -271,14 +277,15 @@ class GPUInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> GPUInfo:
+        get = json.get
         return cls(
-            devices=[GPUDevice.from_json(i) for i in json['devices']],
-            driver_bug_workarounds=[str(i) for i in json['driverBugWorkarounds']],
-            video_decoding=[VideoDecodeAcceleratorCapability.from_json(i) for i in json['videoDecoding']],
-            video_encoding=[VideoEncodeAcceleratorCapability.from_json(i) for i in json['videoEncoding']],
-            image_decoding=[ImageDecodeAcceleratorCapability.from_json(i) for i in json['imageDecoding']],
-            aux_attributes=dict(json['auxAttributes']) if json.get('auxAttributes', None) is not None else None,
-            feature_status=dict(json['featureStatus']) if json.get('featureStatus', None) is not None else None,
+            list(map(GPUDevice.from_json, json['devices'])),
+            list(json['driverBugWorkarounds']),
+            list(map(VideoDecodeAcceleratorCapability.from_json, json['videoDecoding'])),
+            list(map(VideoEncodeAcceleratorCapability.from_json, json['videoEncoding'])),
+            list(map(ImageDecodeAcceleratorCapability.from_json, json['imageDecoding'])),
+            get('auxAttributes'),
+            get('featureStatus'),
         )
 
 
@@ -307,12 +314,22 @@ class ProcessInfo:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ProcessInfo:
         return cls(
-            type_=str(json['type']),
-            id_=int(json['id']),
-            cpu_time=float(json['cpuTime']),
+            json['type'],
+            json['id'],
+            float(json['cpuTime']),
         )
 
 
+@command_decoder('SystemInfo.getInfo')
+def _decode_get_info(json: T_JSON_DICT) -> typing.Tuple[GPUInfo, str, str, str]:
+    return (
+        GPUInfo.from_json(json['gpu']),
+        str(json['modelName']),
+        str(json['modelVersion']),
+        str(json['commandLine'])
+    )
+
+
 def get_info() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[GPUInfo, str, str, str]]:
     '''
     Returns information about the system.
@@ -328,12 +345,12 @@ def get_info() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[GPUInfo,
         'method': 'SystemInfo.getInfo',
     }
     json = yield cmd_dict
-    return (
-        GPUInfo.from_json(json['gpu']),
-        str(json['modelName']),
-        str(json['modelVersion']),
-        str(json['commandLine'])
-    )
+    return _decode_get_info(json)
+
+
+@command_decoder('SystemInfo.getFeatureState')
+def _decode_get_feature_state(json: T_JSON_DICT) -> bool:
+    return bool(json['featureEnabled'])
 
 
 def get_feature_state(
@@ -352,7 +369,12 @@ def get_feature_state(
         'params': params,
     }
     json = yield cmd_dict
-    return bool(json['featureEnabled'])
+    return _decode_get_feature_state(json)
+
+
+@command_decoder('SystemInfo.getProcessInfo')
+def _decode_get_process_info(json: T_JSON_DICT) -> typing.List[ProcessInfo]:
+    return [ProcessInfo.from_json(i) for i in json['processInfo']]
 
 
 def get_process_info() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[ProcessInfo]]:
@@ -365,4 +387,4 @@ def get_process_info() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[P
         'method': 'SystemInfo.getProcessInfo',
     }
     json = yield cmd_dict
-    return [ProcessInfo.from_json(i) for i in json['processInfo']]
+    return _decode_get_process_info(json)
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import browser
 from . import page
@@ -92,17 +91,18 @@ class TargetInfo:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetInfo:
+        get = json.get
         return cls(
-            target_id=TargetID.from_json(json['targetId']),
-            type_=str(json['type']),
-            title=str(json['title']),
-            url=str(json['url']),
-            attached=bool(json['attached']),
-            can_access_opener=bool(json['canAccessOpener']),
-            opener_id=TargetID.from_json(json['openerId']) if json.get('openerId', None) is not None else None,
-            opener_frame_id=page.FrameId.from_json(json['openerFrameId']) if json.get('openerFrameId', None) is not None else None,
-            browser_context_id=browser.BrowserContextID.from_json(json['browserContextId']) if json.get('browserContextId', None) is not None else None,
-            subtype=str(json['subtype']) if json.get('subtype', None) is not None else None,
+            TargetID(json['targetId']),
+            json['type'],
+            json['title'],
+            json['url'],
+            json['attached'],
+            json['canAccessOpener'],
+            TargetID(v) if (v := get('openerId')) is not None else None,
+            page.FrameId(v) if (v := get('openerFrameId')) is not None else None,
+            browser.BrowserContextID(v) if (v := get('browserContextId')) is not None else None,
+            get('subtype'),
         )
 
 
@@ -127,9 +127,10 @@ class FilterEntry:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> FilterEntry:
+        get = json.get
         return cls(
-            exclude=bool(json['exclude']) if json.get('exclude', None) is not None else None,
-            type_=str(json['type']) if json.get('type', None) is not None else None,
+            get('exclude'),
+            get('type'),
         )
 
 
@@ -168,8 +169,8 @@ class RemoteLocation:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> RemoteLocation:
         return cls(
-            host=str(json['host']),
-            port=int(json['port']),
+            json['host'],
+            json['port'],
         )
 
 
@@ -190,6 +191,11 @@ def activate_target(
     json = yield cmd_dict
 
 
+@command_decoder('Target.attachToTarget')
+def _decode_attach_to_target(json: T_JSON_DICT) -> SessionID:
+    return SessionID.from_json(json['sessionId'])
+
+
 def attach_to_target(
         target_id: TargetID,
         flatten: typing.Optional[bool] = None
@@ -210,6 +216,11 @@ def attach_to_target(
         'params': params,
     }
     json = yield cmd_dict
+    return _decode_attach_to_target(json)
+
+
+@command_decoder('Target.attachToBrowserTarget')
+def _decode_attach_to_browser_target(json: T_JSON_DICT) -> SessionID:
     return SessionID.from_json(json['sessionId'])
 
 
@@ -225,7 +236,12 @@ def attach_to_browser_target() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Sessi
         'method': 'Target.attachToBrowserTarget',
     }
     json = yield cmd_dict
-    return SessionID.from_json(json['sessionId'])
+    return _decode_attach_to_browser_target(json)
+
+
+@command_decoder('Target.closeTarget')
+def _decode_close_target(json: T_JSON_DICT) -> bool:
+    return bool(json['success'])
 
 
 def close_target(
@@ -244,7 +260,7 @@ def close_target(
         'params': params,
     }
     json = yield cmd_dict
-    return bool(json['success'])
+    return _decode_close_target(json)
 
 
 def expose_dev_tools_protocol(
@@ -277,6 +293,11 @@ def expose_dev_tools_protocol(
     json = yield cmd_dict
 
 
+@command_decoder('Target.createBrowserContext')
+def _decode_create_browser_context(json: T_JSON_DICT) -> browser.BrowserContextID:
+    return browser.BrowserContextID.from_json(json['browserContextId'])
+
+
 def create_browser_context(
         dispose_on_detach: typing.Optional[bool] = None,
         proxy_server: typing.Optional[str] = None,
@@ -307,7 +328,12 @@ def create_browser_context(
         'params': params,
     }
     json = yield cmd_dict
-    return browser.BrowserContextID.from_json(json['browserContextId'])
+    return _decode_create_browser_context(json)
+
+
+@command_decoder('Target.getBrowserContexts')
+def _decode_get_browser_contexts(json: T_JSON_DICT) -> typing.List[browser.BrowserContextID]:
+    return [browser.BrowserContextID.from_json(i) for i in json['browserContextIds']]
 
 
 def get_browser_contexts() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[browser.BrowserContextID]]:
@@ -320,7 +346,12 @@ def get_browser_contexts() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Li
         'method': 'Target.getBrowserContexts',
     }
     json = yield cmd_dict
-    return [browser.BrowserContextID.from_json(i) for i in json['browserContextIds']]
+    return _decode_get_browser_contexts(json)
+
+
+@command_decoder('Target.createTarget')
+def _decode_create_target(json: T_JSON_DICT) -> TargetID:
+    return TargetID.from_json(json['targetId'])
 
 
 def create_target(
@@ -367,7 +398,7 @@ def create_target(
         'params': params,
     }
     json = yield cmd_dict
-    return TargetID.from_json(json['targetId'])
+    return _decode_create_target(json)
 
 
 def detach_from_target(
@@ -410,6 +441,11 @@ def dispose_browser_context(
     json = yield cmd_dict
 
 
+@command_decoder('Target.getTargetInfo')
+def _decode_get_target_info(json: T_JSON_DICT) -> TargetInfo:
+    return TargetInfo.from_json(json['targetInfo'])
+
+
 def get_target_info(
         target_id: typing.Optional[TargetID] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,TargetInfo]:
@@ -429,7 +465,12 @@ def get_target_info(
         'params': params,
     }
     json = yield cmd_dict
-    return TargetInfo.from_json(json['targetInfo'])
+    return _decode_get_target_info(json)
+
+
+@command_decoder('Target.getTargets')
+def _decode_get_targets(json: T_JSON_DICT) -> typing.List[TargetInfo]:
+    return [TargetInfo.from_json(i) for i in json['targetInfos']]
 
 
 def get_targets(
@@ -449,7 +490,7 @@ def get_targets(
         'params': params,
     }
     json = yield cmd_dict
-    return [TargetInfo.from_json(i) for i in json['targetInfos']]
+    return _decode_get_targets(json)
 
 
 @deprecated(version="1.3")
@@ -602,9 +643,9 @@ class AttachedToTarget:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AttachedToTarget:
         return cls(
-            session_id=SessionID.from_json(json['sessionId']),
-            target_info=TargetInfo.from_json(json['targetInfo']),
-            waiting_for_debugger=bool(json['waitingForDebugger'])
+            SessionID(json['sessionId']),
+            TargetInfo.from_json(json['targetInfo']),
+            json['waitingForDebugger'],
         )
 
 
@@ -624,9 +665,10 @@ class DetachedFromTarget:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DetachedFromTarget:
+        get = json.get
         return cls(
-            session_id=SessionID.from_json(json['sessionId']),
-            target_id=TargetID.from_json(json['targetId']) if json.get('targetId', None) is not None else None
+            SessionID(json['sessionId']),
+            TargetID(v) if (v := get('targetId')) is not None else None,
         )
 
 
@@ -645,10 +687,11 @@ class ReceivedMessageFromTarget:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ReceivedMessageFromTarget:
+        get = json.get
         return cls(
-            session_id=SessionID.from_json(json['sessionId']),
-            message=str(json['message']),
-            target_id=TargetID.from_json(json['targetId']) if json.get('targetId', None) is not None else None
+            SessionID(json['sessionId']),
+            json['message'],
+            TargetID(v) if (v := get('targetId')) is not None else None,
         )
 
 
@@ -663,7 +706,7 @@ class TargetCreated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetCreated:
         return cls(
-            target_info=TargetInfo.from_json(json['targetInfo'])
+            TargetInfo.from_json(json['targetInfo']),
         )
 
 
@@ -678,7 +721,7 @@ class TargetDestroyed:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetDestroyed:
         return cls(
-            target_id=TargetID.from_json(json['targetId'])
+            TargetID(json['targetId']),
         )
 
 
@@ -697,9 +740,9 @@ class TargetCrashed:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetCrashed:
         return cls(
-            target_id=TargetID.from_json(json['targetId']),
-            status=str(json['status']),
-            error_code=int(json['errorCode'])
+            TargetID(json['targetId']),
+            json['status'],
+            json['errorCode'],
         )
 
 
@@ -715,5 +758,5 @@ class TargetInfoChanged:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TargetInfoChanged:
         return cls(
-            target_info=TargetInfo.from_json(json['targetInfo'])
+            TargetInfo.from_json(json['targetInfo']),
         )
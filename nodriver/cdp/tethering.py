@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 def bind(
@@ -60,6 +59,6 @@ class Accepted:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Accepted:
         return cls(
-            port=int(json['port']),
-            connection_id=str(json['connectionId'])
+            json['port'],
+            json['connectionId'],
         )
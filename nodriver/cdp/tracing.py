@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 from . import io
 
@@ -83,16 +82,17 @@ class TraceConfig:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TraceConfig:
+        get = json.get
         return cls(
-            record_mode=str(json['recordMode']) if json.get('recordMode', None) is not None else None,
-            trace_buffer_size_in_kb=float(json['traceBufferSizeInKb']) if json.get('traceBufferSizeInKb', None) is not None else None,
-            enable_sampling=bool(json['enableSampling']) if json.get('enableSampling', None) is not None else None,
-            enable_systrace=bool(json['enableSystrace']) if json.get('enableSystrace', None) is not None else None,
-            enable_argument_filter=bool(json['enableArgumentFilter']) if json.get('enableArgumentFilter', None) is not None else None,
-            included_categories=[str(i) for i in json['includedCategories']] if json.get('includedCategories', None) is not None else None,
-            excluded_categories=[str(i) for i in json['excludedCategories']] if json.get('excludedCategories', None) is not None else None,
-            synthetic_delays=[str(i) for i in json['syntheticDelays']] if json.get('syntheticDelays', None) is not None else None,
-            memory_dump_config=MemoryDumpConfig.from_json(json['memoryDumpConfig']) if json.get('memoryDumpConfig', None) is not None else None,
+            get('recordMode'),
+            float(v) if (v := get('traceBufferSizeInKb')) is not None else None,
+            get('enableSampling'),
+            get('enableSystrace'),
+            get('enableArgumentFilter'),
+            list(v) if (v := get('includedCategories')) is not None else None,
+            list(v) if (v := get('excludedCategories')) is not None else None,
+            list(v) if (v := get('syntheticDelays')) is not None else None,
+            MemoryDumpConfig(v) if (v := get('memoryDumpConfig')) is not None else None,
         )
 
 
@@ -109,7 +109,10 @@ class StreamFormat(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StreamFormat:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class StreamCompression(enum.Enum):
@@ -124,7 +127,10 @@ class StreamCompression(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StreamCompression:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class MemoryDumpLevelOfDetail(enum.Enum):
@@ -142,7 +148,10 @@ class MemoryDumpLevelOfDetail(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> MemoryDumpLevelOfDetail:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class TracingBackend(enum.Enum):
@@ -162,7 +171,10 @@ class TracingBackend(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> TracingBackend:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 def end() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -175,6 +187,11 @@ def end() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('Tracing.getCategories')
+def _decode_get_categories(json: T_JSON_DICT) -> typing.List[str]:
+    return [str(i) for i in json['categories']]
+
+
 def get_categories() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
     '''
     Gets supported tracing categories.
@@ -187,7 +204,7 @@ def get_categories() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str
         'method': 'Tracing.getCategories',
     }
     json = yield cmd_dict
-    return [str(i) for i in json['categories']]
+    return _decode_get_categories(json)
 
 
 def record_clock_sync_marker(
@@ -209,6 +226,14 @@ def record_clock_sync_marker(
     json = yield cmd_dict
 
 
+@command_decoder('Tracing.requestMemoryDump')
+def _decode_request_memory_dump(json: T_JSON_DICT) -> typing.Tuple[str, bool]:
+    return (
+        str(json['dumpGuid']),
+        bool(json['success'])
+    )
+
+
 def request_memory_dump(
         deterministic: typing.Optional[bool] = None,
         level_of_detail: typing.Optional[MemoryDumpLevelOfDetail] = None
@@ -235,10 +260,7 @@ def request_memory_dump(
         'params': params,
     }
     json = yield cmd_dict
-    return (
-        str(json['dumpGuid']),
-        bool(json['success'])
-    )
+    return _decode_request_memory_dump(json)
 
 
 def start(
@@ -310,10 +332,11 @@ class BufferUsage:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BufferUsage:
+        get = json.get
         return cls(
-            percent_full=float(json['percentFull']) if json.get('percentFull', None) is not None else None,
-            event_count=float(json['eventCount']) if json.get('eventCount', None) is not None else None,
-            value=float(json['value']) if json.get('value', None) is not None else None
+            float(v) if (v := get('percentFull')) is not None else None,
+            float(v) if (v := get('eventCount')) is not None else None,
+            float(v) if (v := get('value')) is not None else None,
         )
 
 
@@ -331,7 +354,7 @@ class DataCollected:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> DataCollected:
         return cls(
-            value=[dict(i) for i in json['value']]
+            list(json['value']),
         )
 
 
@@ -354,9 +377,10 @@ class TracingComplete:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> TracingComplete:
+        get = json.get
         return cls(
-            data_loss_occurred=bool(json['dataLossOccurred']),
-            stream=io.StreamHandle.from_json(json['stream']) if json.get('stream', None) is not None else None,
-            trace_format=StreamFormat.from_json(json['traceFormat']) if json.get('traceFormat', None) is not None else None,
-            stream_compression=StreamCompression.from_json(json['streamCompression']) if json.get('streamCompression', None) is not None else None
+            json['dataLossOccurred'],
+            io.StreamHandle(v) if (v := get('stream')) is not None else None,
+            StreamFormat.from_json(v) if (v := get('traceFormat')) is not None else None,
+            StreamCompression.from_json(v) if (v := get('streamCompression')) is not None else None,
         )
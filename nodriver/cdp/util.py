@@ -1,8 +1,108 @@
 
+import dataclasses
+import importlib
+import sys
+import types
 import typing
 
 T_JSON_DICT = typing.Dict[str, typing.Any]
 _event_parsers = dict()
+_command_decoders = dict()
+
+#: the generated types get __slots__ (python 3.10+), which saves a lot of memory
+#: on large results, eg: the DOM.Node tree of a big page
+SLOTS = sys.version_info >= (3, 10)
+
+#: whether the package was generated with lazy decoding (generate_cdp.py --lazy),
+#: see lazy_fields()
+LAZY = False
+
+
+def dataclass(cls):
+    ''' A decorator that turns a generated class into a (slotted) dataclass. '''
+    if not SLOTS:
+        return dataclasses.dataclass(cls)
+    cls = dataclasses.dataclass(cls, slots=True)
+    cls.__setstate__ = _setstate
+    return cls
+
+
+def _setstate(self, state):
+    # also accepts the state of instances pickled before the types were slotted
+    if isinstance(state, tuple):
+        state = {**(state[0] or {}), **(state[1] or {})}
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
+
+
+class Lazy:
+    ''' A JSON value which is decoded when the field holding it is first accessed. '''
+    __slots__ = ('decode', 'json')
+
+    def __init__(self, decode: typing.Callable[[typing.Any], typing.Any], json: typing.Any):
+        self.decode = decode
+        self.json = json
+
+    def value(self) -> typing.Any:
+        return self.decode(self.json)
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.json)
+
+
+class LazyList(Lazy):
+    ''' A JSON array of which each item is decoded when the field holding it is first accessed. '''
+    __slots__ = ()
+
+    def value(self) -> typing.List[typing.Any]:
+        return list(map(self.decode, self.json))
+
+
+class _LazyField:
+    # replaces the (slot) attribute of a field, and decodes a Lazy value on first access
+    __slots__ = ('name', 'slot')
+
+    def __init__(self, name, slot):
+        self.name = name
+        self.slot = slot
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        if self.slot is not None:
+            value = self.slot.__get__(obj, owner)
+        else:
+            try:
+                value = obj.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+        if isinstance(value, Lazy):
+            value = value.value()
+            self.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        if self.slot is not None:
+            self.slot.__set__(obj, value)
+        else:
+            obj.__dict__[self.name] = value
+
+
+def lazy_fields(*names):
+    '''
+    A decorator for a generated dataclass, which makes the given fields decode a
+    :py:class:`Lazy` value on first access. The decoded value replaces the JSON value,
+    so it is decoded once. The fields keep their names and types.
+    '''
+    def decorate(cls):
+        for name in names:
+            slot = cls.__dict__.get(name)
+            if not isinstance(slot, types.MemberDescriptorType):
+                # not slotted, the value is stored in the instance dict
+                slot = None
+            setattr(cls, name, _LazyField(name, slot))
+        return cls
+    return decorate
 
 
 def event_class(method):
@@ -13,6 +113,95 @@ def event_class(method):
     return decorate
 
 
+def command_decoder(method):
+    ''' A decorator that registers a function as the decoder of the result of a command. '''
+    def decorate(fn):
+        _command_decoders[method] = fn
+        return fn
+    return decorate
+
+
+def _no_result(json: T_JSON_DICT) -> None:
+    return None
+
+
+def _raw_result(json: T_JSON_DICT) -> T_JSON_DICT:
+    return json
+
+
+class Command:
+    '''
+    A CDP command, as an alternative to the generators returned by the command functions.
+    A command can be sent any number of times, and its message is serialized only once,
+    so the params must not be changed after it has been sent.
+
+    :param method: the CDP method name, eg: 'DOM.getDocument'
+    :param params: the parameters of the command
+    :param decode: function which turns the JSON result into the return value.
+        when None, the JSON result is returned as is.
+    '''
+    __slots__ = ('method', 'params', 'decode', 'encoded')
+
+    def __init__(
+            self,
+            method: str,
+            params: typing.Optional[T_JSON_DICT] = None,
+            decode: typing.Optional[typing.Callable[[T_JSON_DICT], typing.Any]] = None
+        ):
+        self.method = method
+        self.params = params if params is not None else {}
+        self.decode = decode if decode is not None else _raw_result
+        #: the serialized message without its id, cached by the sender
+        self.encoded = None
+
+    @classmethod
+    def of(cls, cmd: typing.Generator) -> 'Command':
+        '''
+        Create a command from the generator returned by a command function of this package,
+        eg: ``Command.of(dom.get_document(-1, True))``.
+        '''
+        cmd_dict = next(cmd)
+        cmd.close()
+        method = cmd_dict['method']
+        return cls(method, cmd_dict.get('params'), _command_decoders.get(method, _no_result))
+
+    def __iter__(self):
+        ''' Drive the command like a generator returned by a command function. '''
+        json = yield {'method': self.method, 'params': self.params}
+        return self.decode(json)
+
+    def __repr__(self):
+        return 'Command({!r}, {!r})'.format(self.method, self.params)
+
+
+def load_domain(method: str) -> None:
+    ''' Import the module of the domain of a CDP method name, which registers its events. '''
+    from . import DOMAINS
+    module = DOMAINS.get(method.partition('.')[0])
+    if module is not None:
+        importlib.import_module('.' + module, __package__)
+
+
+def event_parser(method: str, load: bool = True) -> typing.Optional[type]:
+    '''
+    Get the event class for a CDP method name, or None if it is unknown.
+    When load is False, the domain module is not imported, so None is returned
+    for the events of domains which were not imported yet as well.
+    '''
+    try:
+        return _event_parsers[method]
+    except KeyError:
+        if not load:
+            return None
+        # the domain module may not have been imported yet
+        load_domain(method)
+        # unknown methods are remembered as well, so they are looked up only once
+        return _event_parsers.setdefault(method, None)
+
+
 def parse_json_event(json: T_JSON_DICT) -> typing.Any:
     ''' Parse a JSON dictionary into a CDP event. '''
-    return _event_parsers[json['method']].from_json(json['params'])
+    parser = event_parser(json['method'])
+    if parser is None:
+        raise KeyError(json['method'])
+    return parser.from_json(json['params'])
@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 class GraphObjectId(str):
@@ -39,7 +38,10 @@ class ContextType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContextType:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class ContextState(enum.Enum):
@@ -56,7 +58,10 @@ class ContextState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContextState:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class NodeType(str):
@@ -87,7 +92,10 @@ class ChannelCountMode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ChannelCountMode:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class ChannelInterpretation(enum.Enum):
@@ -102,7 +110,10 @@ class ChannelInterpretation(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ChannelInterpretation:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class ParamType(str):
@@ -132,7 +143,10 @@ class AutomationRate(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AutomationRate:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -165,10 +179,10 @@ class ContextRealtimeData:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContextRealtimeData:
         return cls(
-            current_time=float(json['currentTime']),
-            render_capacity=float(json['renderCapacity']),
-            callback_interval_mean=float(json['callbackIntervalMean']),
-            callback_interval_variance=float(json['callbackIntervalVariance']),
+            float(json['currentTime']),
+            float(json['renderCapacity']),
+            float(json['callbackIntervalMean']),
+            float(json['callbackIntervalVariance']),
         )
 
 
@@ -208,14 +222,15 @@ class BaseAudioContext:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> BaseAudioContext:
+        get = json.get
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            context_type=ContextType.from_json(json['contextType']),
-            context_state=ContextState.from_json(json['contextState']),
-            callback_buffer_size=float(json['callbackBufferSize']),
-            max_output_channel_count=float(json['maxOutputChannelCount']),
-            sample_rate=float(json['sampleRate']),
-            realtime_data=ContextRealtimeData.from_json(json['realtimeData']) if json.get('realtimeData', None) is not None else None,
+            GraphObjectId(json['contextId']),
+            ContextType.from_json(json['contextType']),
+            ContextState.from_json(json['contextState']),
+            float(json['callbackBufferSize']),
+            float(json['maxOutputChannelCount']),
+            float(json['sampleRate']),
+            ContextRealtimeData.from_json(v) if (v := get('realtimeData')) is not None else None,
         )
 
 
@@ -237,8 +252,8 @@ class AudioListener:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioListener:
         return cls(
-            listener_id=GraphObjectId.from_json(json['listenerId']),
-            context_id=GraphObjectId.from_json(json['contextId']),
+            GraphObjectId(json['listenerId']),
+            GraphObjectId(json['contextId']),
         )
 
 
@@ -278,14 +293,14 @@ class AudioNode:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioNode:
         return cls(
-            node_id=GraphObjectId.from_json(json['nodeId']),
-            context_id=GraphObjectId.from_json(json['contextId']),
-            node_type=NodeType.from_json(json['nodeType']),
-            number_of_inputs=float(json['numberOfInputs']),
-            number_of_outputs=float(json['numberOfOutputs']),
-            channel_count=float(json['channelCount']),
-            channel_count_mode=ChannelCountMode.from_json(json['channelCountMode']),
-            channel_interpretation=ChannelInterpretation.from_json(json['channelInterpretation']),
+            GraphObjectId(json['nodeId']),
+            GraphObjectId(json['contextId']),
+            NodeType(json['nodeType']),
+            float(json['numberOfInputs']),
+            float(json['numberOfOutputs']),
+            float(json['channelCount']),
+            ChannelCountMode.from_json(json['channelCountMode']),
+            ChannelInterpretation.from_json(json['channelInterpretation']),
         )
 
 
@@ -325,14 +340,14 @@ class AudioParam:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioParam:
         return cls(
-            param_id=GraphObjectId.from_json(json['paramId']),
-            node_id=GraphObjectId.from_json(json['nodeId']),
-            context_id=GraphObjectId.from_json(json['contextId']),
-            param_type=ParamType.from_json(json['paramType']),
-            rate=AutomationRate.from_json(json['rate']),
-            default_value=float(json['defaultValue']),
-            min_value=float(json['minValue']),
-            max_value=float(json['maxValue']),
+            GraphObjectId(json['paramId']),
+            GraphObjectId(json['nodeId']),
+            GraphObjectId(json['contextId']),
+            ParamType(json['paramType']),
+            AutomationRate.from_json(json['rate']),
+            float(json['defaultValue']),
+            float(json['minValue']),
+            float(json['maxValue']),
         )
 
 
@@ -356,6 +371,11 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('WebAudio.getRealtimeData')
+def _decode_get_realtime_data(json: T_JSON_DICT) -> ContextRealtimeData:
+    return ContextRealtimeData.from_json(json['realtimeData'])
+
+
 def get_realtime_data(
         context_id: GraphObjectId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,ContextRealtimeData]:
@@ -372,7 +392,7 @@ def get_realtime_data(
         'params': params,
     }
     json = yield cmd_dict
-    return ContextRealtimeData.from_json(json['realtimeData'])
+    return _decode_get_realtime_data(json)
 
 
 @event_class('WebAudio.contextCreated')
@@ -386,7 +406,7 @@ class ContextCreated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContextCreated:
         return cls(
-            context=BaseAudioContext.from_json(json['context'])
+            BaseAudioContext.from_json(json['context']),
         )
 
 
@@ -401,7 +421,7 @@ class ContextWillBeDestroyed:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContextWillBeDestroyed:
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId'])
+            GraphObjectId(json['contextId']),
         )
 
 
@@ -416,7 +436,7 @@ class ContextChanged:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> ContextChanged:
         return cls(
-            context=BaseAudioContext.from_json(json['context'])
+            BaseAudioContext.from_json(json['context']),
         )
 
 
@@ -431,7 +451,7 @@ class AudioListenerCreated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioListenerCreated:
         return cls(
-            listener=AudioListener.from_json(json['listener'])
+            AudioListener.from_json(json['listener']),
         )
 
 
@@ -447,8 +467,8 @@ class AudioListenerWillBeDestroyed:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioListenerWillBeDestroyed:
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            listener_id=GraphObjectId.from_json(json['listenerId'])
+            GraphObjectId(json['contextId']),
+            GraphObjectId(json['listenerId']),
         )
 
 
@@ -463,7 +483,7 @@ class AudioNodeCreated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioNodeCreated:
         return cls(
-            node=AudioNode.from_json(json['node'])
+            AudioNode.from_json(json['node']),
         )
 
 
@@ -479,8 +499,8 @@ class AudioNodeWillBeDestroyed:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioNodeWillBeDestroyed:
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            node_id=GraphObjectId.from_json(json['nodeId'])
+            GraphObjectId(json['contextId']),
+            GraphObjectId(json['nodeId']),
         )
 
 
@@ -495,7 +515,7 @@ class AudioParamCreated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioParamCreated:
         return cls(
-            param=AudioParam.from_json(json['param'])
+            AudioParam.from_json(json['param']),
         )
 
 
@@ -512,9 +532,9 @@ class AudioParamWillBeDestroyed:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> AudioParamWillBeDestroyed:
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            node_id=GraphObjectId.from_json(json['nodeId']),
-            param_id=GraphObjectId.from_json(json['paramId'])
+            GraphObjectId(json['contextId']),
+            GraphObjectId(json['nodeId']),
+            GraphObjectId(json['paramId']),
         )
 
 
@@ -532,12 +552,13 @@ class NodesConnected:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodesConnected:
+        get = json.get
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            source_id=GraphObjectId.from_json(json['sourceId']),
-            destination_id=GraphObjectId.from_json(json['destinationId']),
-            source_output_index=float(json['sourceOutputIndex']) if json.get('sourceOutputIndex', None) is not None else None,
-            destination_input_index=float(json['destinationInputIndex']) if json.get('destinationInputIndex', None) is not None else None
+            GraphObjectId(json['contextId']),
+            GraphObjectId(json['sourceId']),
+            GraphObjectId(json['destinationId']),
+            float(v) if (v := get('sourceOutputIndex')) is not None else None,
+            float(v) if (v := get('destinationInputIndex')) is not None else None,
         )
 
 
@@ -555,12 +576,13 @@ class NodesDisconnected:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodesDisconnected:
+        get = json.get
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            source_id=GraphObjectId.from_json(json['sourceId']),
-            destination_id=GraphObjectId.from_json(json['destinationId']),
-            source_output_index=float(json['sourceOutputIndex']) if json.get('sourceOutputIndex', None) is not None else None,
-            destination_input_index=float(json['destinationInputIndex']) if json.get('destinationInputIndex', None) is not None else None
+            GraphObjectId(json['contextId']),
+            GraphObjectId(json['sourceId']),
+            GraphObjectId(json['destinationId']),
+            float(v) if (v := get('sourceOutputIndex')) is not None else None,
+            float(v) if (v := get('destinationInputIndex')) is not None else None,
         )
 
 
@@ -577,11 +599,12 @@ class NodeParamConnected:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodeParamConnected:
+        get = json.get
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            source_id=GraphObjectId.from_json(json['sourceId']),
-            destination_id=GraphObjectId.from_json(json['destinationId']),
-            source_output_index=float(json['sourceOutputIndex']) if json.get('sourceOutputIndex', None) is not None else None
+            GraphObjectId(json['contextId']),
+            GraphObjectId(json['sourceId']),
+            GraphObjectId(json['destinationId']),
+            float(v) if (v := get('sourceOutputIndex')) is not None else None,
         )
 
 
@@ -598,9 +621,10 @@ class NodeParamDisconnected:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> NodeParamDisconnected:
+        get = json.get
         return cls(
-            context_id=GraphObjectId.from_json(json['contextId']),
-            source_id=GraphObjectId.from_json(json['sourceId']),
-            destination_id=GraphObjectId.from_json(json['destinationId']),
-            source_output_index=float(json['sourceOutputIndex']) if json.get('sourceOutputIndex', None) is not None else None
+            GraphObjectId(json['contextId']),
+            GraphObjectId(json['sourceId']),
+            GraphObjectId(json['destinationId']),
+            float(v) if (v := get('sourceOutputIndex')) is not None else None,
         )
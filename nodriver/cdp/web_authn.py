@@ -8,8 +8,7 @@
 from __future__ import annotations
 import enum
 import typing
-from dataclasses import dataclass
-from .util import event_class, T_JSON_DICT
+from .util import command_decoder, dataclass, event_class, T_JSON_DICT
 
 
 class AuthenticatorId(str):
@@ -33,7 +32,10 @@ class AuthenticatorProtocol(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AuthenticatorProtocol:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class Ctap2Version(enum.Enum):
@@ -45,7 +47,10 @@ class Ctap2Version(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> Ctap2Version:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 class AuthenticatorTransport(enum.Enum):
@@ -60,7 +65,10 @@ class AuthenticatorTransport(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AuthenticatorTransport:
-        return cls(json)
+        try:
+            return cls._value2member_map_[json]
+        except KeyError:
+            return cls(json)
 
 
 @dataclass
@@ -146,20 +154,21 @@ class VirtualAuthenticatorOptions:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> VirtualAuthenticatorOptions:
+        get = json.get
         return cls(
-            protocol=AuthenticatorProtocol.from_json(json['protocol']),
-            transport=AuthenticatorTransport.from_json(json['transport']),
-            ctap2_version=Ctap2Version.from_json(json['ctap2Version']) if json.get('ctap2Version', None) is not None else None,
-            has_resident_key=bool(json['hasResidentKey']) if json.get('hasResidentKey', None) is not None else None,
-            has_user_verification=bool(json['hasUserVerification']) if json.get('hasUserVerification', None) is not None else None,
-            has_large_blob=bool(json['hasLargeBlob']) if json.get('hasLargeBlob', None) is not None else None,
-            has_cred_blob=bool(json['hasCredBlob']) if json.get('hasCredBlob', None) is not None else None,
-            has_min_pin_length=bool(json['hasMinPinLength']) if json.get('hasMinPinLength', None) is not None else None,
-            has_prf=bool(json['hasPrf']) if json.get('hasPrf', None) is not None else None,
-            automatic_presence_simulation=bool(json['automaticPresenceSimulation']) if json.get('automaticPresenceSimulation', None) is not None else None,
-            is_user_verified=bool(json['isUserVerified']) if json.get('isUserVerified', None) is not None else None,
-            default_backup_eligibility=bool(json['defaultBackupEligibility']) if json.get('defaultBackupEligibility', None) is not None else None,
-            default_backup_state=bool(json['defaultBackupState']) if json.get('defaultBackupState', None) is not None else None,
+            AuthenticatorProtocol.from_json(json['protocol']),
+            AuthenticatorTransport.from_json(json['transport']),
+            Ctap2Version.from_json(v) if (v := get('ctap2Version')) is not None else None,
+            get('hasResidentKey'),
+            get('hasUserVerification'),
+            get('hasLargeBlob'),
+            get('hasCredBlob'),
+            get('hasMinPinLength'),
+            get('hasPrf'),
+            get('automaticPresenceSimulation'),
+            get('isUserVerified'),
+            get('defaultBackupEligibility'),
+            get('defaultBackupState'),
         )
 
 
@@ -232,18 +241,19 @@ class Credential:
 
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> Credential:
+        get = json.get
         return cls(
-            credential_id=str(json['credentialId']),
-            is_resident_credential=bool(json['isResidentCredential']),
-            private_key=str(json['privateKey']),
-            sign_count=int(json['signCount']),
-            rp_id=str(json['rpId']) if json.get('rpId', None) is not None else None,
-            user_handle=str(json['userHandle']) if json.get('userHandle', None) is not None else None,
-            large_blob=str(json['largeBlob']) if json.get('largeBlob', None) is not None else None,
-            backup_eligibility=bool(json['backupEligibility']) if json.get('backupEligibility', None) is not None else None,
-            backup_state=bool(json['backupState']) if json.get('backupState', None) is not None else None,
-            user_name=str(json['userName']) if json.get('userName', None) is not None else None,
-            user_display_name=str(json['userDisplayName']) if json.get('userDisplayName', None) is not None else None,
+            json['credentialId'],
+            json['isResidentCredential'],
+            json['privateKey'],
+            json['signCount'],
+            get('rpId'),
+            get('userHandle'),
+            get('largeBlob'),
+            get('backupEligibility'),
+            get('backupState'),
+            get('userName'),
+            get('userDisplayName'),
         )
 
 
@@ -276,6 +286,11 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+@command_decoder('WebAuthn.addVirtualAuthenticator')
+def _decode_add_virtual_authenticator(json: T_JSON_DICT) -> AuthenticatorId:
+    return AuthenticatorId.from_json(json['authenticatorId'])
+
+
 def add_virtual_authenticator(
         options: VirtualAuthenticatorOptions
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,AuthenticatorId]:
@@ -292,7 +307,7 @@ def add_virtual_authenticator(
         'params': params,
     }
     json = yield cmd_dict
-    return AuthenticatorId.from_json(json['authenticatorId'])
+    return _decode_add_virtual_authenticator(json)
 
 
 def set_response_override_bits(
@@ -361,6 +376,11 @@ def add_credential(
     json = yield cmd_dict
 
 
+@command_decoder('WebAuthn.getCredential')
+def _decode_get_credential(json: T_JSON_DICT) -> Credential:
+    return Credential.from_json(json['credential'])
+
+
 def get_credential(
         authenticator_id: AuthenticatorId,
         credential_id: str
@@ -381,7 +401,12 @@ def get_credential(
         'params': params,
     }
     json = yield cmd_dict
-    return Credential.from_json(json['credential'])
+    return _decode_get_credential(json)
+
+
+@command_decoder('WebAuthn.getCredentials')
+def _decode_get_credentials(json: T_JSON_DICT) -> typing.List[Credential]:
+    return [Credential.from_json(i) for i in json['credentials']]
 
 
 def get_credentials(
@@ -400,7 +425,7 @@ def get_credentials(
         'params': params,
     }
     json = yield cmd_dict
-    return [Credential.from_json(i) for i in json['credentials']]
+    return _decode_get_credentials(json)
 
 
 def remove_credential(
@@ -523,8 +548,8 @@ class CredentialAdded:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CredentialAdded:
         return cls(
-            authenticator_id=AuthenticatorId.from_json(json['authenticatorId']),
-            credential=Credential.from_json(json['credential'])
+            AuthenticatorId(json['authenticatorId']),
+            Credential.from_json(json['credential']),
         )
 
 
@@ -541,8 +566,8 @@ class CredentialDeleted:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CredentialDeleted:
         return cls(
-            authenticator_id=AuthenticatorId.from_json(json['authenticatorId']),
-            credential_id=str(json['credentialId'])
+            AuthenticatorId(json['authenticatorId']),
+            json['credentialId'],
         )
 
 
@@ -559,8 +584,8 @@ class CredentialUpdated:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CredentialUpdated:
         return cls(
-            authenticator_id=AuthenticatorId.from_json(json['authenticatorId']),
-            credential=Credential.from_json(json['credential'])
+            AuthenticatorId(json['authenticatorId']),
+            Credential.from_json(json['credential']),
         )
 
 
@@ -576,6 +601,6 @@ class CredentialAsserted:
     @classmethod
     def from_json(cls, json: T_JSON_DICT) -> CredentialAsserted:
         return cls(
-            authenticator_id=AuthenticatorId.from_json(json['authenticatorId']),
-            credential=Credential.from_json(json['credential'])
+            AuthenticatorId(json['authenticatorId']),
+            Credential.from_json(json['credential']),
         )
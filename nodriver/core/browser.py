@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import atexit
+import functools
 import json
 import logging
 import os
@@ -19,7 +20,9 @@ from . import util
 from . import tab
 from ._contradict import ContraDict
 from .config import PathLike, Config, is_posix
-from .connection import Connection
+from .connection import Connection, PipeTransport
+from .metrics import to_prometheus
+from .recorder import Recorder, Replay
 
 logger = logging.getLogger(__name__)
 
@@ -118,12 +121,26 @@ class Browser:
         self._keep_user_data_dir = None
         self._is_updating = asyncio.Event()
         self.connection: Connection = None
+        # see Config.record and Config.replay
+        self._recorder: Recorder = None
+        self._replay: Replay = None
         logger.debug("Session object initialized: %s" % vars(self))
 
     @property
     def websocket_url(self):
         return self.info.webSocketDebuggerUrl
 
+    def _target_url(self, target_id: cdp.target.TargetID, type_: str = "page") -> str:
+        """
+        the websocket url of a target. when the browser is controlled through pipes there is no
+        port to connect to, tabs use sessions on the pipe, so the url only names the target.
+
+        :meta private:
+        """
+        if self.config.use_pipe:
+            return f"pipe://{type_}/{target_id}"
+        return f"ws://{self.config.host}:{self.config.port}/devtools/{type_}/{target_id}"
+
     @property
     def main_tab(self) -> tab.Tab:
         """returns the target which was launched with the browser"""
@@ -137,6 +154,26 @@ class Browser:
         tabs = filter(lambda item: item.type_ == "page", self.targets)
         return list(tabs)
 
+    def metrics(self, prometheus: bool = False) -> Union[dict, str]:
+        """
+        metrics about the cdp traffic of the browser connection and all targets together.
+        see :py:meth:`Connection.metrics`
+
+        :param prometheus: when True, returns the metrics in the prometheus text format,
+                           labeled per target instead of summed up.
+        :type prometheus: bool
+        :return: dict, or str when prometheus is True
+        """
+        connections = [self.connection, *self.targets] if self.connection else self.targets
+        for connection in connections:
+            connection._metrics.in_flight = len(connection.mapper)
+        if prometheus:
+            return to_prometheus((c._metric_labels, c._metrics) for c in connections)
+        if not connections:
+            return {}
+        first, *others = [c._metrics for c in connections]
+        return first.merge(others).to_dict()
+
     @property
     def cookies(self) -> CookieJar:
         if not self._cookies:
@@ -200,11 +237,8 @@ class Browser:
             from .tab import Tab
 
             new_target = Tab(
-                (
-                    f"ws://{self.config.host}:{self.config.port}"
-                    f"/devtools/{target_info.type_ or 'page'}"  # all types are 'page' internally in chrome apparently
-                    f"/{target_info.target_id}"
-                ),
+                # all types are 'page' internally in chrome apparently
+                self._target_url(target_info.target_id, target_info.type_ or "page"),
                 target=target_info,
                 browser=self,
             )
@@ -224,7 +258,11 @@ class Browser:
             self.targets.remove(current_tab)
 
     async def get(
-        self, url="chrome://welcome", new_tab: bool = False, new_window: bool = False
+        self,
+        url="chrome://welcome",
+        new_tab: bool = False,
+        new_window: bool = False,
+        wait_until: str = None,
     ) -> tab.Tab:
         """top level get. utilizes the first tab to retrieve given url.
 
@@ -235,13 +273,20 @@ class Browser:
         :param url: the url to navigate to
         :param new_tab: open new tab
         :param new_window:  open new window
+        :param wait_until: wait for "networkidle0", "networkidle2", "load" or "domcontentloaded"
+            instead of a fixed sleep. see :py:meth:`Tab.wait`
+        :raises asyncio.TimeoutError: when the wait_until condition was not met within 30 seconds
         :return: Page
         """
         if new_tab or new_window:
-            # creat new target using the browser session
+            # creat new target using the browser session.
+            # when waiting for a condition, the tab starts blank, so the tracker
+            # can be started before navigating to the url
             target_id = await self.connection.send(
                 cdp.target.create_target(
-                    url, new_window=new_window, enable_begin_frame_control=True
+                    "about:blank" if wait_until else url,
+                    new_window=new_window,
+                    enable_begin_frame_control=True,
                 )
             )
             # get the connection matching the new target_id from our inventory
@@ -252,17 +297,25 @@ class Browser:
                 )
             )
             connection.browser = self
+            if wait_until:
+                return await connection.get(url, wait_until=wait_until)
 
         else:
             # first tab from browser.tabs
             connection: tab.Tab = next(
                 filter(lambda item: item.type_ == "page", self.targets)
             )
+            if wait_until:
+                # start tracking before navigating, so no request is missed
+                await connection.network_idle.start()
             # use the tab to navigate to new url
             frame_id, loader_id, *_ = await connection.send(cdp.page.navigate(url))
             # update the frame_id on the tab
             connection.frame_id = frame_id
             connection.browser = self
+            if wait_until:
+                await connection._wait_until(wait_until, loader_id=loader_id)
+                return connection
 
         await connection.sleep(0.25)
         return connection
@@ -280,10 +333,23 @@ class Browser:
             return
 
         # self.config.update(kwargs)
+        if self.config.replay:
+            await self._start_replay()
+            await self._discover_targets()
+            return
+
         connect_existing = False
         if self.config.host is not None and self.config.port is not None:
             connect_existing = True
+            self.config.use_pipe = False
+        elif self.config.use_pipe and is_posix:
+            # controlled through pipes, no port needed.
+            # the pipe only carries the browser connection, so tabs use sessions on it
+            self.config.flatten_sessions = True
         else:
+            if self.config.use_pipe:
+                logger.warning("use_pipe is not supported on this platform, using a websocket")
+                self.config.use_pipe = False
             self.config.host = "127.0.0.1"
             self.config.port = util.free_port()
 
@@ -320,6 +386,15 @@ class Browser:
         logger.info(
             "starting\n\texecutable :%s\n\narguments:\n%s", exe, "\n\t".join(params)
         )
+        pipe_kwargs = {}
+        if self.config.use_pipe:
+            # the browser reads commands from fd 3 and writes to fd 4
+            browser_read, write_fd = os.pipe()
+            read_fd, browser_write = os.pipe()
+            pipe_kwargs = dict(
+                pass_fds=(3, 4),
+                preexec_fn=functools.partial(_remap_pipe_fds, browser_read, browser_write),
+            )
         if not connect_existing:
             self._process: asyncio.subprocess.Process = (
                 await asyncio.create_subprocess_exec(
@@ -331,38 +406,33 @@ class Browser:
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.PIPE,
                     close_fds=is_posix,
+                    **pipe_kwargs,
                 )
             )
             self._process_pid = self._process.pid
-
-        self._http = HTTPApi((self.config.host, self.config.port))
         util.get_registered_instances().add(self)
-        await asyncio.sleep(0.25)
-        for _ in range(5):
-            try:
-                self.info = ContraDict(await self._http.get("version"), silent=True)
-            except (Exception,):
-                if _ == 4:
-                    logger.debug("could not start", exc_info=True)
-                await self.sleep(0.5)
-            else:
-                break
 
-        if not self.info:
-            raise Exception(
-                (
-                    """
-                ---------------------
-                Failed to connect to browser
-                ---------------------
-                One of the causes could be when you are running as root.
-                In that case you need to pass no_sandbox=True 
-                """
-                )
+        if self.config.use_pipe:
+            os.close(browser_read)
+            os.close(browser_write)
+            await self._start_pipe(read_fd, write_fd)
+        else:
+            await self._start_websocket()
+
+        if self.config.record:
+            self._recorder = Recorder(self.config.record)
+            self._recorder.record_info(
+                self.info, flatten_sessions=self.config.flatten_sessions
             )
+            self.connection._recorder = self._recorder
+        await self._discover_targets()
 
-        self.connection = Connection(self.info.webSocketDebuggerUrl, _owner=self)
+    async def _discover_targets(self):
+        """
+        enables target discovery, and fetches the current targets
 
+        :meta private:
+        """
         if self.config.autodiscover_targets:
             logger.info("enabling autodiscover targets")
 
@@ -396,6 +466,89 @@ class Browser:
         # self.connection.handlers[cdp.inspector.Detached] = [self.stop]
         # return self
 
+    async def _start_replay(self):
+        """
+        sets up the connection to play back a recorded session (see Config.replay)
+
+        :meta private:
+        """
+        replay = self.config.replay
+        self._replay = replay if isinstance(replay, Replay) else Replay(replay)
+        # the replay has to send the same commands over the same connections as the recording
+        self.config.flatten_sessions = self._replay.info.get("flatten_sessions", False)
+        self.config.host = self.config.host or "127.0.0.1"
+        self.config.port = self.config.port or 0
+        self.info = ContraDict(self._replay.info, silent=True)
+        self.connection = Connection("replay://", _owner=self)
+
+    async def _start_websocket(self):
+        """
+        waits for the browser to serve its devtools http api, and sets up the websocket connection
+
+        :meta private:
+        """
+        self._http = HTTPApi((self.config.host, self.config.port))
+        await asyncio.sleep(0.25)
+        for _ in range(5):
+            try:
+                self.info = ContraDict(await self._http.get("version"), silent=True)
+            except (Exception,):
+                if _ == 4:
+                    logger.debug("could not start", exc_info=True)
+                await self.sleep(0.5)
+            else:
+                break
+
+        if not self.info:
+            raise Exception(
+                (
+                    """
+                ---------------------
+                Failed to connect to browser
+                ---------------------
+                One of the causes could be when you are running as root.
+                In that case you need to pass no_sandbox=True 
+                """
+                )
+            )
+
+        self.connection = Connection(self.info.webSocketDebuggerUrl, _owner=self)
+
+    async def _start_pipe(self, read_fd: int, write_fd: int):
+        """
+        sets up the connection over the pipes of a browser started with --remote-debugging-pipe
+
+        :meta private:
+        """
+        self.connection = Connection(
+            "pipe://", _owner=self, transport=PipeTransport(read_fd, write_fd)
+        )
+        version = await self.connection.send(cdp.browser.get_version())
+        if not version:
+            raise Exception(
+                (
+                    """
+                ---------------------
+                Failed to connect to browser
+                ---------------------
+                One of the causes could be when you are running as root.
+                In that case you need to pass no_sandbox=True 
+                """
+                )
+            )
+        protocol_version, product, revision, user_agent, js_version = version
+        self.info = ContraDict(
+            {
+                "Browser": product,
+                "Protocol-Version": protocol_version,
+                "User-Agent": user_agent,
+                "V8-Version": js_version,
+                "WebKit-Version": revision,
+                "webSocketDebuggerUrl": None,
+            },
+            silent=True,
+        )
+
     async def grant_all_permissions(self):
         """
         grant permissions for:
@@ -502,17 +655,15 @@ class Browser:
             for existing_tab in self.targets:
                 existing_target = existing_tab.target
                 if existing_target.target_id == t.target_id:
-                    existing_tab.target.__dict__.update(t.__dict__)
+                    for name, value in util.cdp_fields(t).items():
+                        setattr(existing_target, name, value)
                     break
             else:
 
                 self.targets.append(
                     Connection(
-                        (
-                            f"ws://{self.config.host}:{self.config.port}"
-                            f"/devtools/page"  # all types are 'page' somehow
-                            f"/{t.target_id}"
-                        ),
+                        # all types are 'page' somehow
+                        self._target_url(t.target_id),
                         target=t,
                         _owner=self,
                     )
@@ -565,6 +716,8 @@ class Browser:
                     logger.debug("closed the connection using asyncio.run()")
                 except Exception:
                     pass
+        if self._recorder:
+            self._recorder.close()
 
         for _ in range(3):
             try:
@@ -613,6 +766,24 @@ class Browser:
         pass
 
 
+def _remap_pipe_fds(browser_read: int, browser_write: int):
+    """
+    runs in the child process before the browser is executed:
+    puts the pipe ends at the fds where the browser expects them (3 and 4)
+
+    :meta private:
+    """
+    # posix only, as is the pipe mode
+    import fcntl
+
+    # move both above 4 first: os.dup() may return 3 or 4, which the first dup2() below
+    # would overwrite before it was moved
+    browser_read = fcntl.fcntl(browser_read, fcntl.F_DUPFD, 5)
+    browser_write = fcntl.fcntl(browser_write, fcntl.F_DUPFD, 5)
+    os.dup2(browser_read, 3)
+    os.dup2(browser_write, 4)
+
+
 class CookieJar:
     def __init__(self, browser: Browser):
         self._browser = browser
@@ -715,7 +886,7 @@ class CookieJar:
         cookies = await self.get_all(requests_cookie_format=False)
         included_cookies = []
         for cookie in cookies:
-            for match in pattern.finditer(str(cookie.__dict__)):
+            for match in pattern.finditer(str(util.cdp_fields(cookie))):
                 logger.debug(
                     "saved cookie for matching pattern '%s' => (%s: %s)",
                     pattern.pattern,
@@ -759,7 +930,7 @@ class CookieJar:
         else:
             connection = self._browser.connection
         for cookie in cookies:
-            for match in pattern.finditer(str(cookie.__dict__)):
+            for match in pattern.finditer(str(util.cdp_fields(cookie))):
                 included_cookies.append(cookie)
                 logger.debug(
                     "loaded cookie for matching pattern '%s' => (%s: %s)",
@@ -65,6 +65,25 @@ class Config:
         :param expert: when set to True, enabled "expert" mode.
                This conveys, the inclusion of parameters: --disable-web-security ----disable-site-isolation-trials,
                as well as some scripts and patching useful for debugging (for example, ensuring shadow-root is always in "open" mode)
+        :param flatten_sessions: when set to True, tabs don't open a websocket connection of their own, but are
+               attached (using flattened sessions) to the browser connection, so all traffic shares a single websocket.
+               this saves a lot of file descriptors and cpu when running hundreds of tabs.
+        :param command_timeout: default timeout in seconds for a cdp command sent by a tab or the browser.
+               when the browser does not answer in time, a :py:class:`CommandTimeoutError` is raised.
+               None (default) waits forever.
+        :param reconnect: when set to True (or a :py:class:`ReconnectPolicy` instance), a lost connection is
+               reconnected with exponential backoff, and the enabled domains and init scripts are restored.
+               commands which were waiting for an answer raise a :py:class:`ConnectionClosedError`, so they
+               can be retried. when False (default), those commands return None.
+        :param use_pipe: when set to True, a locally launched browser is controlled through pipes
+               (--remote-debugging-pipe) instead of a websocket. no tcp port and http handshake are needed,
+               which starts faster and has less overhead per message. implies flatten_sessions.
+               not available on windows, or when connecting to an existing browser (host and port).
+               since the browser does not serve http then, Tab.inspector_url is not available either.
+        :param record: path of a file to record all cdp traffic to (jsonl, see :py:mod:`nodriver.core.recorder`).
+        :param replay: path of a recorded file. instead of launching a browser, the session is played back
+               from the recording, so the python side can be profiled and benchmarked without a browser.
+               pass a :py:class:`~nodriver.core.recorder.Replay` instance to replay with the recorded timing.
 
         :param kwargs:
 
@@ -86,7 +105,8 @@ class Config:
         else:
             self.user_data_dir = user_data_dir
 
-        if not browser_executable_path:
+        if not browser_executable_path and not (host and port) and not kwargs.get("replay"):
+            # connecting to a running browser, or replaying a session, does not need an executable
             browser_executable_path = find_chrome_executable()
 
         self._browser_args = browser_args
@@ -105,6 +125,12 @@ class Config:
             self.sandbox = False
 
         self.autodiscover_targets = True
+        self.flatten_sessions = False
+        self.command_timeout = None
+        self.reconnect = False
+        self.use_pipe = False
+        self.record = None
+        self.replay = None
         self.lang = lang
 
         # other keyword args will be accessible by attribute
@@ -197,6 +223,8 @@ class Config:
             args.append("--remote-debugging-host=%s" % self.host)
         if self.port:
             args.append("--remote-debugging-port=%s" % self.port)
+        elif self.use_pipe:
+            args.append("--remote-debugging-pipe")
         return args
 
     def add_argument(self, arg: str):
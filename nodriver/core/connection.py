@@ -8,7 +8,9 @@ import itertools
 import json
 import logging
 import sys
+import time
 import types
+import typing
 from asyncio import iscoroutine, iscoroutinefunction
 from typing import (
     Generator,
@@ -17,22 +19,32 @@ from typing import (
     Callable,
     Any,
     TypeVar,
+    Iterable,
+    List,
+    Optional,
+    Dict,
 )
 
 import websockets
 from websockets.protocol import State
 
 from . import util
+from .metrics import Metrics, to_prometheus
 from .. import cdp
 
+if typing.TYPE_CHECKING:
+    from .browser import Browser
+    from .recorder import Recorder
+
+    # not at runtime, since it would import the target and browser domains
+    TargetType = Union[cdp.target.TargetInfo, cdp.target.TargetID]
+
 T = TypeVar("T")
 
 GLOBAL_DELAY = 0.005
 MAX_SIZE: int = 2**28
 PING_TIMEOUT: int = 900  # 15 minutes
 
-TargetType = Union[cdp.target.TargetInfo, cdp.target.TargetID]
-
 logger = logging.getLogger("uc.connection")
 
 
@@ -69,26 +81,174 @@ class ProtocolException(Exception):
         return f"{self.message} [code: {self.code}]" if self.code else f"{self.message}"
 
 
+class CommandTimeoutError(ProtocolException, asyncio.TimeoutError):
+    """the browser did not answer a command in time"""
+
+
+class ConnectionClosedError(ProtocolException):
+    """the connection was closed or lost before the command was answered"""
+
+
 class SettingClassVarNotAllowedException(PermissionError):
     pass
 
 
+class JSONCodec:
+    """
+    (de)serializes the messages on the wire, using the json module from the standard library.
+
+    faster codecs are used automatically when they are installed (see :py:func:`get_codec`).
+    a codec's loads() accepts both str and bytes, so frames can be decoded without converting them to str first.
+    dumps() may return str or bytes, both are sent as text frames.
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> Union[str, bytes]:
+        return json.dumps(obj)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} [{self.name}]>"
+
+
+class OrjsonCodec(JSONCodec):
+    """codec using orjson"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self.loads = orjson.loads
+        self.dumps = orjson.dumps
+
+
+class MsgspecCodec(JSONCodec):
+    """codec using msgspec"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self.loads = msgspec.json.Decoder().decode
+        self.dumps = msgspec.json.Encoder().encode
+
+
+class ReconnectPolicy:
+    """
+    opt-in policy for restoring a connection which got lost (see Config.reconnect).
+
+    when the connection is lost, the commands which were waiting for an answer fail with a
+    :py:class:`ConnectionClosedError`, so you can retry them (when it is safe to do so).
+    the next command reconnects, retrying with exponential backoff:
+    initial_delay, initial_delay * factor, ... up to max_delay, for at most max_attempts attempts.
+
+    after reconnecting, the domains which were enabled and the scripts which were added
+    using cdp.page.add_script_to_evaluate_on_new_document are restored.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        initial_delay: float = 0.25,
+        max_delay: float = 10.0,
+        factor: float = 2.0,
+    ):
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.factor = factor
+
+    def delays(self) -> Generator[float, None, None]:
+        """the delays before each attempt"""
+        delay = 0
+        for _ in range(self.max_attempts):
+            yield delay
+            delay = min(max(delay * self.factor, self.initial_delay), self.max_delay)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} [attempts: {self.max_attempts}]"
+            f" [delay: {self.initial_delay}..{self.max_delay}s x{self.factor}]>"
+        )
+
+
+def _raw_command(method: str, params: dict = None) -> cdp.util.Command:
+    """
+    a cdp command for given method and params, which returns the raw result
+
+    :meta private:
+    """
+    return cdp.util.Command(method, params)
+
+
+CODECS = {
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+    JSONCodec.name: JSONCodec,
+}
+"""available codecs, in order of preference"""
+
+_default_codec: JSONCodec = None
+
+
+def get_codec(name: Union[str, JSONCodec] = None) -> JSONCodec:
+    """
+    get a codec by name ("orjson", "msgspec" or "json").
+    when no name is given, the fastest codec which is installed is returned.
+
+    to use a specific codec for a connection, set ``connection.codec = get_codec("json")``
+
+    :param name: name of the codec, or a codec instance
+    :type name: str
+    :return:
+    :rtype: JSONCodec
+    """
+    global _default_codec
+    if isinstance(name, JSONCodec):
+        return name
+    if name:
+        return CODECS[name]()
+    if not _default_codec:
+        for codec_cls in CODECS.values():
+            try:
+                _default_codec = codec_cls()
+                break
+            except ImportError:
+                continue
+        logger.debug("using %s codec", _default_codec.name)
+    return _default_codec
+
+
 class Transaction(asyncio.Future):
     __cdp_obj__: Generator = None
+    command: cdp.util.Command = None
 
     method: str = None
     params: dict = None
 
     id: int = None
+    session_id: str = None
+    sent_at: float = None
 
-    def __init__(self, cdp_obj: Generator):
+    def __init__(self, cdp_obj: Union[Generator, cdp.util.Command]):
         """
-        :param cdp_obj:
+        :param cdp_obj: the generator created by a cdp method, or a cdp.util.Command
         """
         super().__init__()
-        self.__cdp_obj__ = cdp_obj
         self.connection = None
 
+        if isinstance(cdp_obj, cdp.util.Command):
+            self.command = cdp_obj
+            self.method = cdp_obj.method
+            self.params = cdp_obj.params
+            return
+
+        self.__cdp_obj__ = cdp_obj
         self.method, *params = next(self.__cdp_obj__).values()
         if params:
             params = params.pop()
@@ -96,7 +256,30 @@ class Transaction(asyncio.Future):
 
     @property
     def message(self):
-        return json.dumps({"method": self.method, "params": self.params, "id": self.id})
+        codec = self.connection.codec if self.connection else get_codec()
+        command = self.command
+        if command is not None and self.params is command.params:
+            # the method and params of a command are serialized once, only the id
+            # (and session) are added for every send
+            prefix = command.encoded
+            if prefix is None:
+                prefix = codec.dumps({"method": command.method, "params": command.params})
+                if isinstance(prefix, str):
+                    prefix = prefix.encode()
+                prefix = command.encoded = prefix.rstrip()[:-1]
+            if self.session_id:
+                return b'%s,"id":%d,"sessionId":"%s"}' % (
+                    prefix,
+                    self.id,
+                    self.session_id.encode(),
+                )
+            return b'%s,"id":%d}' % (prefix, self.id)
+        message = {"method": self.method, "params": self.params, "id": self.id}
+        if self.session_id:
+            # flattened session mode: the browser connection routes
+            # the command to the target attached under this session
+            message["sessionId"] = self.session_id
+        return codec.dumps(message)
 
     @property
     def has_exception(self):
@@ -119,6 +302,8 @@ class Transaction(asyncio.Future):
         if "error" in response:
             # set exception and bail out
             return self.set_exception(ProtocolException(response["error"]))
+        if self.command is not None:
+            return self.set_result(self.command.decode(response["result"]))
         try:
             # try to parse the result according to the py cdp docs.
             self.__cdp_obj__.send(response["result"])
@@ -167,6 +352,47 @@ class EventTransaction(Transaction):
         return fmt
 
 
+class RawEvent:
+    """
+    an event which is not parsed, the params are kept as they came in.
+
+    events for which no cdp class exists (eg: a newer protocol version than the one nodriver was generated from)
+    are delivered as RawEvent. to receive these, add a handler for the RawEvent type:
+
+    .. code-block::
+
+        tab.add_handler(RawEvent, lambda event: print(event.method, event.params))
+
+    any event can be received raw as well, by adding a handler for its method name. this skips
+    the decoding into cdp classes, which is faster when only a few fields are needed:
+
+    .. code-block::
+
+        tab.add_handler("Network.responseReceived", lambda event: print(event.params["response"]["url"]))
+    """
+
+    __slots__ = ("method", "params")
+
+    def __init__(self, method: str, params: dict = None):
+        self.method = method
+        self.params = params or {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(method={self.method!r}, params={self.params!r})"
+
+
+def _raw_event_module(method: Any) -> Optional[types.ModuleType]:
+    """
+    the cdp module of the domain of a raw event subscription (eg: "Network.responseReceived"), if any
+
+    :meta private:
+    """
+    if not isinstance(method, str):
+        return None
+    module = cdp.DOMAINS.get(method.partition(".")[0])
+    return getattr(cdp, module) if module else None
+
+
 class CantTouchThis(type):
     def __setattr__(cls, attr, value):
         """
@@ -186,9 +412,135 @@ class CantTouchThis(type):
         )
 
 
+class Transport:
+    """
+    carries the (encoded) cdp messages of a connection.
+    the default is :py:class:`WebSocketTransport`, for locally launched browsers
+    :py:class:`PipeTransport` can be used as well (see Config.use_pipe).
+    """
+
+    #: whether open() can be called again after the transport was closed
+    reopenable: bool = True
+
+    async def open(self):
+        raise NotImplementedError
+
+    async def send(self, message: Union[str, bytes]):
+        raise NotImplementedError
+
+    async def recv(self) -> bytes:
+        raise NotImplementedError
+
+    async def close(self):
+        raise NotImplementedError
+
+    @property
+    def closed(self) -> bool:
+        raise NotImplementedError
+
+
+class WebSocketTransport(Transport):
+    """transport over a websocket, which is (re)opened on open()"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.websocket: websockets.ClientConnection = None
+
+    async def open(self):
+        self.websocket = await websockets.connect(
+            self.url,
+            ping_timeout=PING_TIMEOUT,
+            max_size=MAX_SIZE,
+        )
+
+    async def send(self, message: Union[str, bytes]):
+        # encoded messages are bytes, but need to be sent as text frames
+        await self.websocket.send(message, text=True)
+
+    async def recv(self) -> bytes:
+        # frames are not decoded to str, the codec handles bytes directly
+        return await self.websocket.recv(decode=False)
+
+    async def close(self):
+        await self.websocket.close()
+
+    @property
+    def closed(self) -> bool:
+        return not self.websocket or self.websocket.state is State.CLOSED
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.url}>"
+
+
+class PipeTransport(Transport):
+    """
+    transport over the pipes of a browser started with --remote-debugging-pipe.
+    the browser reads from fd 3 and writes to fd 4, messages are separated by a NUL byte.
+    there is no tcp port or http handshake involved, so it starts faster and has less overhead per message.
+
+    this carries the browser connection only. tabs use sessions over this connection (see Config.flatten_sessions).
+    once closed, it can not be opened again (the browser is gone).
+
+    :param read_fd: our end of the pipe the browser writes to
+    :param write_fd: our end of the pipe the browser reads from
+    """
+
+    reopenable = False
+
+    def __init__(self, read_fd: int, write_fd: int):
+        self.read_fd = read_fd
+        self.write_fd = write_fd
+        self._reader: asyncio.StreamReader = None
+        self._writer: asyncio.StreamWriter = None
+        self._closed = False
+
+    async def open(self):
+        if self._closed:
+            raise ConnectionClosedError("the pipe to the browser is closed")
+        if self._reader:
+            return
+        loop = asyncio.get_running_loop()
+        self._reader = asyncio.StreamReader(limit=MAX_SIZE, loop=loop)
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(self._reader, loop=loop),
+            open(self.read_fd, "rb", buffering=0),
+        )
+        transport, protocol = await loop.connect_write_pipe(
+            asyncio.streams.FlowControlMixin, open(self.write_fd, "wb", buffering=0)
+        )
+        self._writer = asyncio.StreamWriter(transport, protocol, None, loop)
+
+    async def send(self, message: Union[str, bytes]):
+        if isinstance(message, str):
+            message = message.encode()
+        self._writer.write(message + b"\0")
+        await self._writer.drain()
+
+    async def recv(self) -> bytes:
+        try:
+            return (await self._reader.readuntil(b"\0"))[:-1]
+        except asyncio.IncompleteReadError:
+            self._closed = True
+            raise ConnectionClosedError("the browser closed the pipe")
+
+    async def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer:
+            self._writer.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed or self._reader is None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} [read fd: {self.read_fd}] [write fd: {self.write_fd}]>"
+
+
 class Connection(metaclass=CantTouchThis):
     attached: bool = None
-    websocket: websockets.WebSocketClientProtocol
+    transport: Transport
     _target: cdp.target.TargetInfo
 
     def __init__(
@@ -202,14 +554,58 @@ class Connection(metaclass=CantTouchThis):
         self._target = target
         self.__count__ = itertools.count(0)
         self._owner = _owner
+        self.codec: JSONCodec = get_codec()
         self.websocket_url: str = websocket_url
-        self.websocket = None
+        self.transport: Transport = None
         self.mapper = {}
         self.handlers = collections.defaultdict(list)
         self.recv_task = None
         self.enabled_domains = []
         self._last_result = []
         self.listener: Listener = None
+        # flattened session mode (see Config.flatten_sessions):
+        # session_id is set on tabs which are attached through the browser connection,
+        # sessions maps those session ids to their tabs (only used on the browser connection)
+        self.session_id: cdp.target.SessionID = None
+        self.sessions: dict[cdp.target.SessionID, Connection] = {}
+        self._attach_lock = asyncio.Lock()
+        # held while opening and preparing, so concurrent first commands
+        # don't start a listener each on the same websocket
+        self._open_lock = asyncio.Lock()
+        # held while writing a batch of commands, so they are not interleaved
+        # with commands from other coroutines (see send_many)
+        self._write_lock = asyncio.Lock()
+        # send() only (re)registers domains and prepares the connection when
+        # something changed, instead of on every call
+        self._handlers_changed = False
+        self._handler_types_seen = 0
+        self._prepared = False
+        self.dispatcher = EventDispatcher(self)
+        self._network_idle: NetworkIdleTracker = None
+        # default timeout for commands, see Config.command_timeout
+        self.command_timeout: Optional[float] = getattr(
+            getattr(_owner, "config", None), "command_timeout", None
+        )
+        # number of commands which timed out, and of answers which came in
+        # for commands nobody is waiting for anymore (timed out or cancelled)
+        self.timed_out_commands = 0
+        self.orphaned_responses = 0
+        reconnect = getattr(getattr(_owner, "config", None), "reconnect", None)
+        self.reconnect_policy: Optional[ReconnectPolicy] = (
+            ReconnectPolicy() if reconnect is True else reconnect or None
+        )
+        # state which is restored after reconnecting (see ReconnectPolicy):
+        # method => params of X.enable commands, and
+        # script identifier as returned to the user => (current identifier, params) of the init scripts
+        self._enable_commands: Dict[str, dict] = {}
+        self._init_scripts: Dict[str, tuple] = {}
+        self._metrics = Metrics()
+        # open event streams, which end when the connection is lost (see events())
+        self._streams: set = set()
+        # Target.getTargetInfo for this target, reused by update_target()
+        self._target_info_command: Optional[cdp.util.Command] = None
+        # records the traffic when Config.record is set (see nodriver.core.recorder)
+        self._recorder: Optional["Recorder"] = getattr(_owner, "_recorder", None)
         self.__dict__.update(**kwargs)
 
     @property
@@ -227,13 +623,77 @@ class Connection(metaclass=CantTouchThis):
 
     @property
     def closed(self):
-        if not self.websocket:
+        root = self._root
+        if root is not None:
+            return self.session_id is None or root.closed
+        if not self.transport:
             return True
-        return self.websocket.state is State.CLOSED
+        return self.transport.closed
+
+    @property
+    def websocket(self) -> Optional[websockets.ClientConnection]:
+        """the websocket, when the connection uses a websocket transport"""
+        return getattr(self.transport, "websocket", None)
+
+    @property
+    def _root(self) -> Union[Connection, None]:
+        """
+        the browser connection which carries the traffic of this connection,
+        when flattened sessions are enabled. None otherwise (or when this is the browser connection)
+
+        :meta private:
+        """
+        owner = self._owner
+        if owner is None or not getattr(owner, "config", None):
+            return None
+        if not getattr(owner.config, "flatten_sessions", False):
+            return None
+        root = getattr(owner, "connection", None)
+        if root is None or root is self:
+            return None
+        return root
+
+    @property
+    def _carries_sessions(self) -> bool:
+        """
+        whether this is the browser connection, carrying the sessions of tabs (see Config.flatten_sessions)
+
+        :meta private:
+        """
+        return self._root is None and bool(self.sessions)
+
+    @property
+    def _reopenable(self) -> bool:
+        """
+        whether the transport can be opened again after closing it (a pipe can not)
+
+        :meta private:
+        """
+        return self.transport is None or self.transport.reopenable
+
+    def _new_transport(self) -> Transport:
+        """
+        the transport for this connection: a websocket, or the recorded traffic when replaying
+
+        :meta private:
+        """
+        replay = getattr(self._owner, "_replay", None)
+        if replay is not None:
+            return replay.transport(self._metric_labels["target"])
+        return WebSocketTransport(self.websocket_url)
+
+    @property
+    def _writer(self) -> Connection:
+        """
+        the connection owning the websocket which is used to write our messages
+
+        :meta private:
+        """
+        return self._root or self
 
     def add_handler(
         self,
-        event_type_or_domain: Union[type, types.ModuleType],
+        event_type_or_domain: Union[type, types.ModuleType, str],
         handler: Union[Callable, Awaitable],
     ):
         """
@@ -242,6 +702,9 @@ class Connection(metaclass=CantTouchThis):
         if event_type_or_domain is a module instead of a type, it will find all available events and add
         the handler.
 
+        if event_type_or_domain is a method name (eg: "Network.responseReceived"), the handler receives
+        the events as :py:class:`RawEvent`, without decoding them into cdp classes.
+
         if you want to receive event updates (network traffic are also 'events') you can add handlers for those events.
         handlers can be regular callback functions or async coroutine functions (and also just lamba's).
         for example, you want to check the network traffic:
@@ -271,8 +734,145 @@ class Connection(metaclass=CantTouchThis):
                 if inspect.isbuiltin(obj):
                     continue
                 self.handlers[obj].append(handler)
+            self._handlers_changed = True
             return
         self.handlers[event_type_or_domain].append(handler)
+        self._handlers_changed = True
+
+    def remove_handler(
+        self,
+        event_type_or_domain: Union[type, types.ModuleType, str, None] = None,
+        handler: Union[Callable, Awaitable, None] = None,
+    ):
+        """
+        remove a handler which was added using :py:meth:`~add_handler`
+
+        when handler is not provided, all handlers for given event type (or domain) are removed.
+        when event_type_or_domain is not provided either, all handlers are removed.
+
+        domains which are no longer used by any handler are no longer tracked as enabled, so they
+        will be enabled again when a new handler needs them.
+
+        :param event_type_or_domain:
+        :type event_type_or_domain:
+        :param handler:
+        :type handler:
+        """
+        if event_type_or_domain is None:
+            event_types = list(self.handlers)
+        elif isinstance(event_type_or_domain, types.ModuleType):
+            event_types = [
+                event_type
+                for event_type in self.handlers
+                if getattr(event_type, "__module__", None)
+                == event_type_or_domain.__name__
+                or _raw_event_module(event_type) is event_type_or_domain
+            ]
+        else:
+            event_types = [event_type_or_domain]
+        for event_type in event_types:
+            if event_type not in self.handlers:
+                continue
+            if handler is None:
+                self.handlers[event_type].clear()
+            else:
+                while handler in self.handlers[event_type]:
+                    self.handlers[event_type].remove(handler)
+        self._handlers_changed = True
+
+    def events(
+        self,
+        *event_types: Union[type, types.ModuleType, str],
+        predicate: Callable[[Any], bool] = None,
+        maxsize: int = 1000,
+        policy: str = "drop-oldest",
+    ) -> EventStream:
+        """
+        an async iterator over the events of given type(s), as an alternative to callbacks.
+        the events are only received (and decoded) while the stream is open.
+
+        .. code-block::
+
+            async with tab.events(cdp.network.ResponseReceived, predicate=lambda e: e.type_ == "XHR") as stream:
+                await tab.get("https://example.com")
+                async for event in stream:
+                    print(event.response.url)
+
+        iterating without ``async with`` opens the stream as well, :py:meth:`EventStream.close` closes it.
+        the iteration ends when the stream is closed, or the connection is lost.
+
+        :param event_types: event classes (or domain modules), eg: cdp.network.ResponseReceived.
+            method names (eg: "Network.responseReceived") put :py:class:`RawEvent`'s in the stream
+        :param predicate: when given, only events for which predicate(event) is true are put in the stream
+        :param maxsize: max number of events waiting in the stream
+        :param policy: what to do when the stream is full, see :py:class:`EventDispatcher`:
+            "drop-oldest" (default), "coalesce" (only keeps the latest event) or "block"
+            (the listener waits until there is room, which also delays the events for other handlers)
+        :return: the stream
+        :rtype: EventStream
+        """
+        return EventStream(self, event_types, predicate, maxsize, policy)
+
+    def expect_event(
+        self,
+        event_type: Union[type, types.ModuleType, str],
+        predicate: Callable[[Any], bool] = None,
+        timeout: Optional[float] = 30,
+    ) -> asyncio.Future:
+        """
+        a future which resolves to the first event of given type (for which predicate(event) is true).
+        the event is waited for from the moment this is called, so call it before the action which
+        causes the event, and await it afterwards:
+
+        .. code-block::
+
+            response = tab.expect_event(cdp.network.ResponseReceived, lambda e: "/api/" in e.response.url)
+            await (await tab.select("button")).click()
+            print((await response).response.status)
+
+        :param event_type: the event class (or domain module), or a method name for a :py:class:`RawEvent`
+        :param predicate: when given, resolves to the first event for which predicate(event) is true
+        :param timeout: seconds to wait, after which the future raises asyncio.TimeoutError. None waits forever
+        :return: future resolving to the event
+        :rtype: asyncio.Future
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def on_event(event, connection=None):
+            if future.done():
+                return
+            try:
+                if predicate is None or predicate(event):
+                    future.set_result(event)
+            except Exception as e:
+                future.set_exception(e)
+
+        def on_timeout():
+            if not future.done():
+                future.set_exception(
+                    asyncio.TimeoutError(
+                        "no %s event within %s seconds"
+                        % (getattr(event_type, "__name__", event_type), timeout)
+                    )
+                )
+
+        def done(_):
+            self.remove_handler(event_type, on_event)
+            if timer:
+                timer.cancel()
+
+        timer = loop.call_later(timeout, on_timeout) if timeout is not None else None
+        self.add_handler(event_type, on_event)
+        future.add_done_callback(done)
+        if not self.closed and self._prepared:
+            # enables the domain, in case no other command is sent in the meantime.
+            # (a closed connection does so when it is opened by the next command)
+            registration = asyncio.ensure_future(self._ready())
+            registration.add_done_callback(
+                lambda task: task.cancelled() or task.exception()
+            )
+        return future
 
     async def aopen(self, **kw):
         """
@@ -280,39 +880,140 @@ class Connection(metaclass=CantTouchThis):
         :param kw:
         :return:
         """
+        root = self._root
+        if root is not None:
+            # flattened session mode: no websocket of our own, but a session
+            # on the browser connection
+            await self._attach(root)
+            if not self._prepared:
+                await self._prepare()
+            if self._needs_registration:
+                await self._register_handlers()
+            return
 
         if self.closed:
             try:
-                self.websocket = await websockets.connect(
-                    self.websocket_url,
-                    ping_timeout=PING_TIMEOUT,
-                    max_size=MAX_SIZE,
-                )
+                if self.transport is None:
+                    self.transport = self._new_transport()
+                await self.transport.open()
                 self.listener = Listener(self)
             except (Exception,) as e:
                 logger.debug("exception during opening of websocket : %s", e)
                 if self.listener:
                     self.listener.cancel()
                 raise
+            # a new websocket has nothing enabled or prepared yet
+            self.enabled_domains.clear()
+            self._handlers_changed = True
+            self._reset_prepared()
         if not self.listener or not self.listener.running:
             self.listener = Listener(self)
             logger.debug("\n✅  opened websocket connection to %s", self.websocket_url)
 
         # when a websocket connection is closed (either by error or on purpose)
         # and reconnected, the registered event listeners (if any), should be
-        # registered again, so the browser sends those events
-        await self._register_handlers()
+        # registered again, so the browser sends those events.
+        # prepared first, so the domains restored after reconnecting (with their params)
+        # are not enabled a second time by the registration
+        if not self._prepared:
+            await self._prepare()
+        if self._needs_registration:
+            await self._register_handlers()
+
+    async def _attach(self, root: Connection):
+        """
+        attaches to our target through the browser connection, using a flattened session.
+
+        :meta private:
+        """
+        async with self._attach_lock:
+            if root.closed or not root.listener or not root.listener.running:
+                async with root._open_lock:
+                    if root.closed or not root.listener or not root.listener.running:
+                        await root.aopen()
+            if self.session_id is None:
+                # not through root.send(), since a failure (eg: the target is gone already)
+                # concerns this target only, and should not close the browser connection
+                tx = root._new_transaction(
+                    cdp.target.attach_to_target(self.target_id, flatten=True)
+                )
+                try:
+                    await root._write(tx.message)
+                    self.session_id = await root._wait_transaction(tx)
+                except ConnectionClosedError:
+                    raise
+                except ProtocolException as e:
+                    raise ProtocolException(
+                        "could not attach to target %s: %s" % (self.target_id, e)
+                    ) from e
+                except Exception as e:
+                    root.mapper.pop(tx.id, None)
+                    raise ConnectionClosedError(
+                        "connection lost while attaching: %s" % e
+                    ) from e
+                root.sessions[self.session_id] = self
+                self.enabled_domains.clear()
+                self._handlers_changed = True
+                self._reset_prepared()
+                logger.debug(
+                    "attached to target %s using session %s",
+                    self.target_id,
+                    self.session_id,
+                )
+            # all sessions share the listener of the browser connection
+            self.listener = root.listener
 
     async def aclose(self):
         """
         closes the websocket connection. should not be called manually by users.
         """
-        if self.websocket and not self.closed:
+        root = self._root
+        if root is not None:
+            # flattened session mode: detach our session, but leave the
+            # browser connection open since it is shared
+            session_id, self.session_id = self.session_id, None
+            root.sessions.pop(session_id, None)
+            self.enabled_domains.clear()
+            self.dispatcher.cancel()
+            for stream in list(self._streams):
+                stream.close()
+            if session_id and not root.closed:
+                try:
+                    await root.send(
+                        cdp.target.detach_from_target(session_id=session_id),
+                        _is_update=True,
+                    )
+                except ProtocolException:
+                    logger.debug("could not detach session %s", session_id)
+            return
+        if self.transport and not self.closed:
             if self.listener and self.listener.running:
                 self.listener.cancel()
                 self.enabled_domains.clear()
-            await self.websocket.close()
+            await self.transport.close()
             logger.debug("\n❌ closed websocket connection to %s", self.websocket_url)
+            self._connection_lost(ConnectionClosedError("connection closed"))
+
+    def _connection_lost(self, exc: ConnectionClosedError):
+        """
+        fails the commands waiting for an answer, including those of the sessions
+        carried by this connection, since those sessions are gone as well.
+
+        :meta private:
+        """
+        for connection in [self, *self.sessions.values()]:
+            for tx in list(connection.mapper.values()):
+                if not tx.done():
+                    tx.set_exception(ConnectionClosedError(exc.message))
+            connection.mapper.clear()
+            if connection is not self:
+                connection.session_id = None
+                connection.enabled_domains.clear()
+            connection.dispatcher.cancel()
+            if not connection.reconnect_policy:
+                for stream in list(connection._streams):
+                    stream.close()
+        self.sessions.clear()
 
     async def sleep(self, t: Union[int, float] = 0.25):
         await self.update_target()
@@ -334,16 +1035,66 @@ class Connection(metaclass=CantTouchThis):
         """
         asyncio.ensure_future(self.send(cdp_obj))
 
-    async def wait(self, t: Union[int, float] = None):
+    @property
+    def network_idle(self) -> NetworkIdleTracker:
+        """
+        the tracker for requests in flight and page lifecycle, see :py:class:`NetworkIdleTracker`.
+        it starts tracking on first use.
+        """
+        if self._network_idle is None:
+            self._network_idle = NetworkIdleTracker(self)
+        return self._network_idle
+
+    def metrics(self, prometheus: bool = False) -> Union[dict, str]:
+        """
+        metrics about the traffic of this connection: the number of calls, errors, timeouts and
+        latency (time between sending and the answer) per cdp method, bytes in and out,
+        the number (and rate per second) of events per event type and the commands in flight.
+
+        .. code-block::
+
+            >>> tab.metrics()["commands"]["DOM.getDocument"]
+            {'calls': 3, 'errors': 0, 'timeouts': 0, 'latency': {'count': 3, 'sum': 0.0123, 'mean': 0.0041, ...}}
+
+        :param prometheus: when True, returns the metrics in the prometheus text format
+        :type prometheus: bool
+        :return: dict, or str when prometheus is True
+        """
+        self._metrics.in_flight = len(self.mapper)
+        if prometheus:
+            return to_prometheus([(self._metric_labels, self._metrics)])
+        return self._metrics.to_dict()
+
+    @property
+    def _metric_labels(self) -> Dict[str, str]:
+        """:meta private:"""
+        if self._target:
+            return {"target": self._target.target_id, "type": self._target.type_}
+        return {"target": "browser", "type": "browser"}
+
+    async def wait(self, t: Union[int, float] = None, until: str = None):
         """
         waits until the event listener reports idle (no new events received in certain timespan).
         when `t` is provided, ensures waiting for `t` seconds, no matter what.
 
+        when `until` is provided, waits for that condition instead, with `t` as timeout (defaults to 30 seconds):
+
+            - "networkidle0": no network requests in flight for 0.5 seconds
+            - "networkidle2": at most 2 network requests in flight for 0.5 seconds
+            - "load": the page's load event fired
+            - "domcontentloaded": the page's DOMContentLoaded event fired
+
         :param t:
         :type t:
+        :param until: "networkidle0", "networkidle2", "load" or "domcontentloaded"
+        :type until: str
+        :raises asyncio.TimeoutError: when `until` is given, and the condition was not met within `t` seconds
         :return:
         :rtype:
         """
+        if until:
+            await self._wait_until(until, timeout=30 if t is None else t)
+            return
         await self.update_target()
         loop = asyncio.get_running_loop()
         start_time = loop.time()
@@ -363,6 +1114,20 @@ class Connection(metaclass=CantTouchThis):
             # no listener created yet
             pass
 
+    async def _wait_until(
+        self, until: str, timeout: Optional[float] = 30, loader_id: str = None
+    ):
+        """
+        waits for a condition of :py:attr:`network_idle`
+
+        :raises asyncio.TimeoutError: when the condition was not met within timeout
+        :meta private:
+        """
+        if not await self.network_idle.wait(until, timeout, loader_id):
+            raise asyncio.TimeoutError(
+                "%s was not reached within %s seconds" % (until, timeout)
+            )
+
     def __getattr__(self, item):
         """:meta private:"""
         try:
@@ -390,63 +1155,355 @@ class Connection(metaclass=CantTouchThis):
         return self.wait().__await__()
 
     async def update_target(self):
-        target_info: cdp.target.TargetInfo = await self.send(
-            cdp.target.get_target_info(self.target_id), _is_update=True
-        )
+        command = self._target_info_command
+        if command is None or command.params.get("targetId") != self.target_id:
+            command = self._target_info_command = cdp.util.Command.of(
+                cdp.target.get_target_info(self.target_id)
+            )
+        target_info: cdp.target.TargetInfo = await self.send(command, _is_update=True)
         self.target = target_info
 
     async def send(
-        self, cdp_obj: Generator[dict[str, Any], dict[str, Any], Any], _is_update=False
+        self,
+        cdp_obj: Union[Generator[dict[str, Any], dict[str, Any], Any], cdp.util.Command],
+        _is_update=False,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         send a protocol command. the commands are made using any of the cdp.<domain>.<method>()'s
         and is used to send custom cdp commands as well.
 
-        :param cdp_obj: the generator object created by a cdp method
+        a generator can be sent only once. commands which are sent often can be made into a
+        :py:class:`cdp.util.Command`, which can be sent any number of times, and whose message is
+        serialized only once:
+
+        .. code-block::
+
+            get_document = cdp.util.Command.of(cdp.dom.get_document(-1, True))
+            doc = await tab.send(get_document)
 
-        :param _is_update: internal flag
-            prevents infinite loop by skipping the registeration of handlers
-            when multiple calls to connection.send() are made
+        :param cdp_obj: the generator object created by a cdp method, or a cdp.util.Command
+
+        :param _is_update: internal flag, kept for backwards compatibility.
+            domains are only (re)registered when handlers have changed (see :py:meth:`~add_handler`,
+            :py:meth:`~remove_handler`) or when the connection is (re)opened.
+        :param timeout: seconds to wait for the answer, after which a :py:class:`CommandTimeoutError` is raised.
+            defaults to :py:attr:`command_timeout` (see Config.command_timeout).
+            a timeout does not close the connection.
         :return:
         """
-        await self.aopen()
-        if self.closed:
+        if not await self._ready():
             return
-        if self._owner:
-            browser = self._owner
-            if browser.config:
-                if browser.config.expert:
-                    await self._prepare_expert()
-                if browser.config.headless:
-                    await self._prepare_headless()
-        if not self.listener or not self.listener.running:
-            self.listener = Listener(self)
         try:
-            tx = Transaction(cdp_obj)
-            tx.connection = self
-            if not self.mapper:
-                self.__count__ = itertools.count(0)
-            tx.id = next(self.__count__)
-            self.mapper.update({tx.id: tx})
-            if not _is_update:
-                await self._register_handlers()
-            await self.websocket.send(tx.message)
+            tx = self._new_transaction(cdp_obj)
             try:
-                return await tx
+                await self._write(tx.message)
+            except Exception as e:
+                self.mapper.pop(tx.id, None)
+                raise ConnectionClosedError(
+                    "connection lost while sending: %s" % e
+                ) from e
+            try:
+                return await self._wait_transaction(tx, timeout)
             except ProtocolException as e:
                 e.message += f"\ncommand:{tx.method}\nparams:{tx.params}"
                 raise e
+        except CommandTimeoutError:
+            raise
+        except ConnectionClosedError:
+            await self.aclose()
+            if self.reconnect_policy:
+                # the caller can decide to retry
+                raise
         except Exception:
+            if self._carries_sessions or not self._reopenable:
+                # an error answer to this command only. closing would detach the tabs
+                # which share this connection and fail their commands, or end a pipe for good
+                logger.debug("command failed", exc_info=True)
+                return
             await self.aclose()
 
-    #
+    async def send_raw(
+        self,
+        method: str,
+        params: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[dict]:
+        """
+        send a protocol command by method name, and return its result as it came in,
+        without decoding it into cdp classes. this is faster when only a few fields are needed:
+
+        .. code-block::
+
+            result = await tab.send_raw("Runtime.evaluate", {"expression": "document.title", "returnByValue": True})
+            print(result["result"]["value"])
+
+        uses the same ids, timeouts and metrics as :py:meth:`~send`.
+
+        :param method: the cdp method, eg: "Runtime.evaluate"
+        :param params: the parameters of the command
+        :param timeout: seconds to wait for the answer, see :py:meth:`~send`
+        :return: the result
+        """
+        return await self.send(cdp.util.Command(method, params), timeout=timeout)
+
+    async def send_many(
+        self,
+        cdp_objs: Iterable[
+            Union[Generator[dict[str, Any], dict[str, Any], Any], cdp.util.Command]
+        ],
+        return_exceptions: bool = False,
+        ordered: bool = True,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        send multiple protocol commands at once. all commands are written back-to-back,
+        and then awaited together, instead of waiting for a response before sending the next one.
+        this is much faster for bulk operations, like describing or getting the box model of many nodes.
+
+        .. code-block::
+
+            nodes = await tab.send_many(cdp.dom.describe_node(node_id=nid) for nid in node_ids)
+
+        :param cdp_objs: the generator objects created by cdp methods, or cdp.util.Command's
+        :type cdp_objs: Iterable[Union[Generator, cdp.util.Command]]
+        :param return_exceptions: when True, a failing command does not raise, but its exception is
+                                  returned in its place in the results.
+                                  when False (default), the first exception is raised, after all commands are done.
+        :type return_exceptions: bool
+        :param ordered: when True (default), the commands are written as one uninterrupted sequence,
+                        so commands sent by other tasks in the meantime cannot end up in between.
+                        since the browser handles the commands of a target in order, this guarantees the commands
+                        are executed in the given order, without anything else in between.
+        :type ordered: bool
+        :param timeout: seconds to wait for each answer, see :py:meth:`~send`
+        :type timeout: float
+        :return: the results, in the same order as the given commands. when the connection is lost while
+                 writing, like :py:meth:`~send`: None for every command, or a ConnectionClosedError is raised
+                 when a reconnect policy is set.
+        :rtype: list
+        """
+        cdp_objs = list(cdp_objs)
+        if not cdp_objs:
+            return []
+        if not await self._ready():
+            return [None] * len(cdp_objs)
+        txs = [self._new_transaction(cdp_obj) for cdp_obj in cdp_objs]
+        try:
+            if ordered:
+                await self._write(*(tx.message for tx in txs))
+            else:
+                for tx in txs:
+                    await self._write(tx.message)
+        except Exception as e:
+            # like send(): the connection is lost
+            logger.debug("exception during writing of commands: %s", e)
+            for tx in txs:
+                self.mapper.pop(tx.id, None)
+            await self.aclose()
+            if self.reconnect_policy:
+                # the caller can decide to retry
+                raise ConnectionClosedError(
+                    "connection lost while sending: %s" % e
+                ) from e
+            return [None] * len(txs)
+
+        results = await asyncio.gather(
+            *(self._wait_transaction(tx, timeout) for tx in txs),
+            return_exceptions=True,
+        )
+        for tx, result in zip(txs, results):
+            if isinstance(result, ProtocolException):
+                result.message += f"\ncommand:{tx.method}\nparams:{tx.params}"
+                if not return_exceptions:
+                    raise result
+            elif isinstance(result, BaseException) and not return_exceptions:
+                raise result
+        return results
+
+    async def _ready(self) -> bool:
+        """
+        makes sure the connection is open, prepared and has its domains registered.
+        when nothing changed since the previous command, this returns right away.
+
+        :return: False when the connection could not be opened
+        :meta private:
+        """
+        if self.closed or not self.listener or not self.listener.running:
+            async with self._open_lock:
+                # another command may have opened it while we waited
+                if self.closed or not self.listener or not self.listener.running:
+                    if self.reconnect_policy:
+                        await self._reconnect()
+                    else:
+                        await self.aopen()
+            if self.closed:
+                return False
+        if not self._prepared:
+            async with self._open_lock:
+                if not self._prepared:
+                    await self._prepare()
+        if self._needs_registration:
+            await self._register_handlers()
+        return True
+
+    async def _reconnect(self):
+        """
+        opens the connection, retrying according to the reconnect policy
+
+        :meta private:
+        """
+        error = None
+        for attempt, delay in enumerate(self.reconnect_policy.delays(), 1):
+            if delay:
+                await asyncio.sleep(delay)
+            try:
+                await self.aopen()
+                if not self.closed:
+                    if attempt > 1:
+                        logger.info("reconnected to %s (attempt %d)", self.websocket_url, attempt)
+                    return
+            except Exception as e:
+                error = e
+            logger.debug("reconnect attempt %d to %s failed: %s", attempt, self.websocket_url, error)
+        raise ConnectionClosedError(
+            "could not reconnect to %s after %d attempts: %s"
+            % (self.websocket_url, self.reconnect_policy.max_attempts, error)
+        )
+
+    def _track_state(self, tx: Transaction, result: Any):
+        """
+        keeps track of the enabled domains and init scripts, to restore them after reconnecting
+
+        :meta private:
+        """
+        method = tx.method
+        if method.endswith(".enable"):
+            self._enable_commands[method] = tx.params
+        elif method.endswith(".disable"):
+            self._enable_commands.pop(method[: -len("disable")] + "enable", None)
+        elif method == "Page.addScriptToEvaluateOnNewDocument":
+            self._init_scripts[result] = (result, tx.params)
+        elif method == "Page.removeScriptToEvaluateOnNewDocument":
+            identifier = tx.params.get("identifier")
+            for key, (current, _) in list(self._init_scripts.items()):
+                if identifier in (key, current):
+                    del self._init_scripts[key]
+
+    async def _restore_state(self):
+        """
+        enables the domains and adds the init scripts again, after reconnecting
+
+        :meta private:
+        """
+        for method, params in list(self._enable_commands.items()):
+            domain_mod = _raw_event_module(method)
+            if domain_mod is not None:
+                if domain_mod in self.enabled_domains:
+                    continue
+                # so _register_handlers does not enable it a second time
+                self.enabled_domains.append(domain_mod)
+            await self._send_oneshot(_raw_command(method, params))
+        for identifier, (_, params) in list(self._init_scripts.items()):
+            result = await self._send_oneshot(
+                _raw_command("Page.addScriptToEvaluateOnNewDocument", params)
+            )
+            if result:
+                self._init_scripts[identifier] = (result["identifier"], params)
+
+    async def _wait_transaction(self, tx: Transaction, timeout: Optional[float] = None):
+        """
+        waits for the answer to a transaction. when the timeout passes, or the waiting task gets cancelled,
+        the transaction is removed from the mapper, so a late answer is counted as orphaned.
+
+        :meta private:
+        """
+        if timeout is None:
+            timeout = self.command_timeout
+        try:
+            if timeout is None:
+                result = await tx
+                self._track_state(tx, result)
+                return result
+            try:
+                result = await asyncio.wait_for(tx, timeout)
+                self._track_state(tx, result)
+                return result
+            except asyncio.TimeoutError:
+                if tx.done() and not tx.cancelled():
+                    # answered right at the deadline
+                    return tx.result()
+                self.timed_out_commands += 1
+                self._metrics.command_timed_out(tx.method)
+                raise CommandTimeoutError(
+                    "no answer within %s seconds" % timeout
+                ) from None
+        finally:
+            self.mapper.pop(tx.id, None)
+
+    def _new_transaction(self, cdp_obj) -> Transaction:
+        """
+        creates a transaction for given command and registers it, so the listener can
+        find it when the response comes in
+
+        :meta private:
+        """
+        tx = Transaction(cdp_obj)
+        tx.connection = self
+        tx.session_id = self.session_id
+        if tx.method == "Page.removeScriptToEvaluateOnNewDocument":
+            # the script may have been added again after reconnecting, under a new identifier
+            script = self._init_scripts.get(tx.params.get("identifier"))
+            if script:
+                tx.params = dict(tx.params, identifier=script[0])
+        # ids are never reused, so a late answer to an abandoned command
+        # can not be mistaken for the answer to a newer one
+        tx.id = next(self.__count__)
+        tx.sent_at = time.perf_counter()
+        self._metrics.command_sent(tx.method)
+        self.mapper[tx.id] = tx
+        return tx
+
+    async def _write(self, *messages: str):
+        """
+        writes messages to the websocket (of the browser connection when using flattened sessions).
+        multiple messages are written as one uninterrupted sequence (see send_many)
+
+        :meta private:
+        """
+        writer = self._writer
+        async with writer._write_lock:
+            for message in messages:
+                await writer.transport.send(message)
+                self._metrics.sent(len(message))
+                if writer._recorder:
+                    writer._recorder.record(
+                        writer._metric_labels["target"], ">", message
+                    )
+
+    @property
+    def _needs_registration(self) -> bool:
+        """
+        whether handlers were added or removed since the last domain registration.
+        the length check catches handlers which were set directly on the handlers dict.
+
+        :meta private:
+        """
+        return self._handlers_changed or len(self.handlers) != self._handler_types_seen
+
     async def _register_handlers(self):
         """
         ensure that for current (event) handlers, the corresponding
         domain is enabled in the protocol.
 
         """
-        seen = []
+        for event_type in [k for k, v in self.handlers.items() if not v]:
+            self.handlers.pop(event_type)
+        # clear the flag before sending anything, since the enable() commands below
+        # go through send() as well
+        self._handlers_changed = False
+        self._handler_types_seen = len(self.handlers)
+        failed = False
         # save a copy of current enabled domains in a variable
         # domains will be removed from this variable
         # if it is still needed according to the set handlers
@@ -458,7 +1515,14 @@ class Connection(metaclass=CantTouchThis):
             if len(self.handlers[event_type]) == 0:
                 self.handlers.pop(event_type)
                 continue
-            if isinstance(event_type, type):
+            if event_type is RawEvent:
+                # not bound to a domain
+                continue
+            if isinstance(event_type, str):
+                domain_mod = _raw_event_module(event_type)
+                if domain_mod is None:
+                    continue
+            elif isinstance(event_type, type):
                 domain_mod = util.cdp_get_module(event_type.__module__)
             if domain_mod in self.enabled_domains:
                 # at this point, the domain is being used by a handler
@@ -480,6 +1544,7 @@ class Connection(metaclass=CantTouchThis):
 
                 except:  # noqa - as broad as possible, we don't want an error before the "actual" request is sent
                     logger.debug("", exc_info=True)
+                    failed = True
                     try:
                         self.enabled_domains.remove(domain_mod)
                     except:  # noqa
@@ -492,6 +1557,38 @@ class Connection(metaclass=CantTouchThis):
             # temp variable when we registered it or saw handlers for it.
             # items still present at this point are unused and need removal
             self.enabled_domains.remove(ed)
+        if failed:
+            # try again on the next command
+            self._handlers_changed = True
+
+    async def _prepare(self):
+        """
+        one-time preparation of the connection, according to the browser config
+
+        :meta private:
+        """
+        config = getattr(self._owner, "config", None)
+        if config:
+            if config.expert:
+                await self._prepare_expert()
+            if config.headless:
+                await self._prepare_headless()
+        if self.reconnect_policy:
+            await self._restore_state()
+        if self._network_idle is not None and self._network_idle.started:
+            # lifecycle events have to be enabled again for a new websocket or session
+            await self._send_oneshot(cdp.page.set_lifecycle_events_enabled(True))
+        self._prepared = True
+
+    def _reset_prepared(self):
+        """
+        scripts and overrides don't survive a new websocket or session, so prepare again
+
+        :meta private:
+        """
+        self._prepared = False
+        self._prep_expert_done = False
+        self._prep_headless_done = False
 
     async def _prepare_headless(self):
 
@@ -537,9 +1634,12 @@ class Connection(metaclass=CantTouchThis):
 
         tx = Transaction(cdp_obj)
         tx.connection = self
+        tx.session_id = self.session_id
         tx.id = -2
+        tx.sent_at = time.perf_counter()
+        self._metrics.command_sent(tx.method)
         self.mapper.update({tx.id: tx})
-        await self.websocket.send(tx.message)
+        await self._write(tx.message)
         try:
             # in try except since if browser connection sends this it reises an exception
             return await tx
@@ -547,11 +1647,642 @@ class Connection(metaclass=CantTouchThis):
             pass
 
 
+class EventHistory:
+    """
+    bounded buffer holding the most recent (handled) events, oldest first.
+
+    the size is limited by number of events (max_items) and optionally by the total size
+    of the raw messages in bytes (max_bytes). when either limit is exceeded, the oldest events are dropped.
+
+    retention can also be set per event type, for example to keep only the last
+    10 network events, and no console events at all:
+
+    .. code-block::
+
+        history = tab.listener.history
+        history.retain(cdp.network.ResponseReceived, 10)
+        history.retain(cdp.runtime.ConsoleAPICalled, 0)
+
+    """
+
+    def __init__(self, max_items: int = 1000, max_bytes: Optional[int] = None):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.per_type: Dict[type, int] = {}
+        self.nbytes = 0
+        self._size = 0
+        # entries are [event, size, alive]. entries removed because of a per type limit
+        # are only marked dead, and skipped/purged later
+        self._entries: collections.deque = collections.deque()
+        self._by_type: Dict[type, collections.deque] = {}
+
+    def retain(self, event_type: type, max_items: Optional[int]):
+        """
+        set the max number of events to keep for given type. 0 keeps none, None removes the limit.
+        """
+        if max_items is None:
+            self.per_type.pop(event_type, None)
+            self._by_type.pop(event_type, None)
+            return
+        self.per_type[event_type] = max_items
+        if event_type not in self._by_type:
+            self._by_type[event_type] = collections.deque(
+                e for e in self._entries if e[2] and type(e[0]) is event_type
+            )
+        self._trim_type(event_type)
+        self._compact()
+
+    def append(self, event: Any, size: int = 0):
+        event_type = type(event)
+        if self.per_type.get(event_type, 1) == 0:
+            return
+        entry = [event, size, True]
+        self._entries.append(entry)
+        self._size += 1
+        self.nbytes += size
+        if event_type in self._by_type:
+            self._by_type[event_type].append(entry)
+            self._trim_type(event_type)
+        while self._size and (
+            self._size > self.max_items
+            or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            self._drop(self._entries.popleft())
+        self._compact()
+
+    def clear(self):
+        self._entries.clear()
+        for entries in self._by_type.values():
+            entries.clear()
+        self._size = self.nbytes = 0
+
+    def _trim_type(self, event_type: type):
+        entries = self._by_type[event_type]
+        while entries and (len(entries) > self.per_type[event_type] or not entries[0][2]):
+            self._drop(entries.popleft())
+
+    def _drop(self, entry: list):
+        if entry[2]:
+            entry[2] = False
+            self._size -= 1
+            self.nbytes -= entry[1]
+
+    def _compact(self):
+        entries = self._entries
+        while entries and not entries[0][2]:
+            entries.popleft()
+        # dead entries in the middle are purged once they outnumber the live ones,
+        # which keeps the memory bounded
+        if len(entries) > 2 * self._size + 16:
+            self._entries = collections.deque(e for e in entries if e[2])
+
+    def __iter__(self):
+        return (e[0] for e in list(self._entries) if e[2])
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self._size} events, {self.nbytes} bytes>"
+
+
+class EventDispatcher:
+    """
+    runs the event handlers of a connection, so that slow handlers do not stall the listener.
+
+    regular (sync) callbacks are called directly by the listener, in the order the events come in.
+    coroutine callbacks are put in a queue per event type, and are run by a worker task per event type.
+    so events of the same type are always handled in order, while different event types are handled
+    concurrently, with at most `max_concurrency` handlers running at the same time.
+
+    raw events (see :py:class:`RawEvent`) are queued per method name instead, so raw events of
+    different methods never replace or drop each other.
+
+    when a queue is full (`max_queue` pending events), the policy for the event type decides what happens:
+
+        - "block": the listener waits until there is room in the queue (backpressure).
+          note: a handler which sends a command and waits for the answer can not make progress
+          while the listener is blocked, so use a large enough queue for such handlers.
+        - "drop-oldest": the oldest pending event is dropped.
+        - "coalesce": only the most recent event is kept pending, every new event replaces the pending one.
+          this is useful for events which only represent the latest state (eg: screencast frames).
+          this policy applies even if the queue is not full.
+
+    .. code-block::
+
+        tab.dispatcher.set_policy(cdp.page.ScreencastFrame, "coalesce")
+        tab.dispatcher.set_policy(cdp.network.DataReceived, "drop-oldest", max_queue=100)
+        tab.dispatcher.set_policy("Network.dataReceived", "drop-oldest", max_queue=100)
+        print(tab.dispatcher.stats())
+
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop-oldest"
+    COALESCE = "coalesce"
+    POLICIES = (BLOCK, DROP_OLDEST, COALESCE)
+
+    def __init__(
+        self,
+        connection: Connection,
+        max_concurrency: int = 16,
+        max_queue: int = 1000,
+        policy: str = BLOCK,
+    ):
+        if policy not in self.POLICIES:
+            raise ValueError("policy should be one of %s" % (self.POLICIES,))
+        self.connection = connection
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.policy = policy
+        # the queues, workers, room and stats are keyed by event type, or by method name for raw events
+        self.policies: Dict[Union[type, str], tuple] = {}
+        self._semaphore: asyncio.Semaphore = None
+        self._queues: Dict[Union[type, str], collections.deque] = {}
+        self._workers: Dict[Union[type, str], asyncio.Task] = {}
+        self._room: Dict[Union[type, str], asyncio.Event] = {}
+        self._stats: Dict[Union[type, str], Dict[str, int]] = {}
+
+    def set_policy(
+        self, event_type: Union[type, str], policy: str, max_queue: int = None
+    ):
+        """
+        set the overflow policy (and optionally the queue size) for given event type
+
+        :param event_type: the event class, eg: cdp.network.RequestWillBeSent,
+            or the method name of raw events, eg: "Network.requestWillBeSent"
+        :param policy: "block", "drop-oldest" or "coalesce"
+        :param max_queue: max number of pending events for this type. defaults to self.max_queue
+        """
+        if policy not in self.POLICIES:
+            raise ValueError("policy should be one of %s" % (self.POLICIES,))
+        self.policies[event_type] = (policy, max_queue)
+
+    async def dispatch(self, event: Any, callbacks: List[Callable]):
+        """
+        called by the listener for every event which has handlers.
+
+        :meta private:
+        """
+        coros = []
+        for callback in callbacks:
+            if iscoroutinefunction(callback) or iscoroutine(callback):
+                coros.append(callback)
+                continue
+            try:
+                try:
+                    callback(event, self.connection)
+                except TypeError:
+                    callback(event)
+            except Exception as e:
+                logger.warning(
+                    "exception in callback %s for event %s => %s",
+                    callback,
+                    event.__class__.__name__,
+                    e,
+                    exc_info=True,
+                )
+                raise
+        if coros:
+            await self._enqueue(event, coros)
+
+    async def _enqueue(self, event: Any, callbacks: List[Callable]):
+        event_type = event.method if isinstance(event, RawEvent) else type(event)
+        policy, max_queue = self.policies.get(event_type, (self.policy, None))
+        max_queue = max_queue or self.max_queue
+        queue = self._queues.get(event_type)
+        if queue is None:
+            queue = self._queues[event_type] = collections.deque()
+        stats = self._stats.get(event_type)
+        if stats is None:
+            stats = self._stats[event_type] = dict(
+                queued=0, handled=0, dropped=0, coalesced=0, blocked=0, max_depth=0
+            )
+        if policy == self.COALESCE and queue:
+            queue.pop()
+            stats["coalesced"] += 1
+        elif len(queue) >= max_queue:
+            if policy == self.DROP_OLDEST:
+                queue.popleft()
+                stats["dropped"] += 1
+            else:
+                stats["blocked"] += 1
+                room = self._room.get(event_type)
+                if room is None:
+                    room = self._room[event_type] = asyncio.Event()
+                while len(queue) >= max_queue:
+                    room.clear()
+                    await room.wait()
+        queue.append((event, callbacks))
+        stats["queued"] += 1
+        stats["max_depth"] = max(stats["max_depth"], len(queue))
+        if event_type not in self._workers:
+            self._workers[event_type] = asyncio.create_task(self._worker(event_type))
+
+    async def _worker(self, event_type: Union[type, str]):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        queue = self._queues[event_type]
+        stats = self._stats[event_type]
+        try:
+            while queue:
+                event, callbacks = queue.popleft()
+                room = self._room.get(event_type)
+                if room is not None:
+                    room.set()
+                async with self._semaphore:
+                    for callback in callbacks:
+                        try:
+                            try:
+                                await callback(event, self.connection)
+                            except TypeError:
+                                await callback(event)
+                        except asyncio.CancelledError:
+                            raise
+                        except Exception as e:
+                            logger.warning(
+                                "exception in callback %s for event %s => %s",
+                                callback,
+                                event.__class__.__name__,
+                                e,
+                                exc_info=True,
+                            )
+                stats["handled"] += 1
+        finally:
+            self._workers.pop(event_type, None)
+
+    @property
+    def depth(self) -> int:
+        """total number of pending events"""
+        return sum(map(len, self._queues.values()))
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        statistics per event type:
+
+            - depth: number of events currently pending
+            - max_depth: highest number of pending events seen
+            - queued: number of events queued
+            - handled: number of events for which the handlers completed
+            - dropped: events dropped by the "drop-oldest" policy
+            - coalesced: events replaced by a newer one by the "coalesce" policy
+            - blocked: number of times the listener had to wait for room in the queue
+
+        :return: dict of "domain.EventName" (or the method name of raw events) => stats
+        """
+        return {
+            self._name(event_type): dict(
+                depth=len(self._queues.get(event_type, ())), **stats
+            )
+            for event_type, stats in self._stats.items()
+        }
+
+    @staticmethod
+    def _name(event_type: Union[type, str]) -> str:
+        if isinstance(event_type, str):
+            return event_type
+        return "%s.%s" % (event_type.__module__.rsplit(".", 1)[-1], event_type.__name__)
+
+    def cancel(self):
+        """cancels the running handlers and drops all pending events"""
+        current = asyncio.current_task()
+        for task in list(self._workers.values()):
+            # a handler may close the connection itself, it is left to finish
+            if task is not current:
+                task.cancel()
+        for queue in self._queues.values():
+            queue.clear()
+        for room in self._room.values():
+            room.set()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} [pending: {self.depth}] [running: {len(self._workers)}]>"
+
+
+class EventStream:
+    """
+    async iterator over events of one or more types, backed by a bounded queue.
+    created by :py:meth:`Connection.events`.
+
+    :ivar dropped: number of events dropped (or replaced) because the stream was full
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        event_types: tuple,
+        predicate: Callable[[Any], bool] = None,
+        maxsize: int = 1000,
+        policy: str = EventDispatcher.DROP_OLDEST,
+    ):
+        if policy not in EventDispatcher.POLICIES:
+            raise ValueError("policy should be one of %s" % (EventDispatcher.POLICIES,))
+        if not event_types:
+            raise ValueError("provide at least one event type")
+        self.connection = connection
+        self.event_types = event_types
+        self.predicate = predicate
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.opened = False
+        self.closed = False
+        self._queue: collections.deque = collections.deque()
+        self._error: Exception = None
+        self._ready = asyncio.Event()
+        self._room = asyncio.Event()
+        # with the "block" policy, the handler is a coroutine function, so the dispatcher
+        # queues the events and applies its backpressure to the listener
+        self._handler = self._put_wait if policy == EventDispatcher.BLOCK else self._put
+
+    async def open(self) -> EventStream:
+        """adds the handlers, and makes sure the domains are enabled"""
+        if self.opened:
+            return self
+        self.opened = True
+        for event_type in self.event_types:
+            self.connection.add_handler(event_type, self._handler)
+        self.connection._streams.add(self)
+        await self.connection._ready()
+        return self
+
+    def close(self):
+        """removes the handlers. events already in the stream can still be read"""
+        if self.closed:
+            return
+        self.closed = True
+        for event_type in self.event_types:
+            self.connection.remove_handler(event_type, self._handler)
+        self.connection._streams.discard(self)
+        self._ready.set()
+        self._room.set()
+
+    async def get(self, timeout: Optional[float] = None):
+        """
+        the next event
+
+        :param timeout: seconds to wait, None waits forever
+        :raises asyncio.TimeoutError: when no event came in time
+        :raises StopAsyncIteration: when the stream is closed (and empty)
+        """
+        return await asyncio.wait_for(self.__anext__(), timeout)
+
+    def _matches(self, event) -> bool:
+        if self.predicate is None:
+            return True
+        try:
+            return self.predicate(event)
+        except Exception as e:
+            # the exception belongs to the consumer, not to the listener
+            self._error = e
+            self.close()
+            return False
+
+    def _put(self, event, connection=None):
+        if self.closed or not self._matches(event):
+            return
+        queue = self._queue
+        if self.policy == EventDispatcher.COALESCE and queue:
+            queue.pop()
+            self.dropped += 1
+        elif len(queue) >= self.maxsize:
+            queue.popleft()
+            self.dropped += 1
+        queue.append(event)
+        self._ready.set()
+
+    async def _put_wait(self, event, connection=None):
+        if self.closed or not self._matches(event):
+            return
+        while len(self._queue) >= self.maxsize and not self.closed:
+            self._room.clear()
+            await self._room.wait()
+        if not self.closed:
+            self._queue.append(event)
+            self._ready.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.opened:
+            await self.open()
+        while not self._queue:
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            if self.closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        event = self._queue.popleft()
+        self._room.set()
+        return event
+
+    async def __aenter__(self):
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return len(self._queue)
+
+    def __repr__(self):
+        names = ", ".join(getattr(t, "__name__", str(t)) for t in self.event_types)
+        state = "closed" if self.closed else "open" if self.opened else "new"
+        return (
+            f"<{self.__class__.__name__} [{names}] [{state}] [pending: {len(self._queue)}]"
+            f" [dropped: {self.dropped}]>"
+        )
+
+
+class NetworkIdleTracker:
+    """
+    keeps track of the network requests in flight and the page lifecycle of a tab,
+    so you can wait until the page is actually done loading instead of sleeping a fixed amount of time.
+
+    the conditions you can wait for:
+
+        - "networkidle0": no requests in flight for `idle_time` seconds
+        - "networkidle2": at most 2 requests in flight for `idle_time` seconds
+          (which tolerates long polling, websocket fallbacks, analytics beacons etc)
+        - "load": the load event of the main frame fired
+        - "domcontentloaded": the DOMContentLoaded event of the main frame fired
+
+    normally you would not use this directly, but through :py:meth:`Connection.wait`, :py:meth:`Tab.get`
+    or :py:meth:`Browser.get` :
+
+    .. code-block::
+
+        tab = await browser.get("https://example.com", wait_until="networkidle2")
+        await tab.wait(until="networkidle0")
+
+    """
+
+    CONDITIONS = ("networkidle0", "networkidle2", "load", "domcontentloaded")
+
+    def __init__(self, connection: Connection, idle_time: float = 0.5):
+        self.connection = connection
+        self.idle_time = idle_time
+        #: request id => time the request was sent
+        self.inflight: Dict[str, float] = {}
+        #: loader id of the main frame => lifecycle event names seen
+        self.lifecycle: Dict[str, set] = {}
+        self.loader_id: str = None
+        self.started = False
+        self._changed: asyncio.Event = None
+        # time since when the number of requests in flight is at most 0 / 2
+        self._below_since: Dict[int, Optional[float]] = {0: None, 2: None}
+
+    async def start(self):
+        """
+        start tracking. the handlers are added to the connection, and lifecycle events are enabled.
+        requests which were already in flight before the tracker started are not known.
+        """
+        if self.started:
+            return
+        self._changed = asyncio.Event()
+        self._update_below(asyncio.get_running_loop().time())
+        conn = self.connection
+        conn.add_handler(cdp.network.RequestWillBeSent, self._on_request)
+        conn.add_handler(cdp.network.LoadingFinished, self._on_request_done)
+        conn.add_handler(cdp.network.LoadingFailed, self._on_request_done)
+        conn.add_handler(cdp.page.LifecycleEvent, self._on_lifecycle)
+        await conn.send(cdp.page.set_lifecycle_events_enabled(True))
+        self.started = True
+
+    def stop(self):
+        """stop tracking, removes the handlers"""
+        if not self.started:
+            return
+        self.started = False
+        conn = self.connection
+        conn.remove_handler(cdp.network.RequestWillBeSent, self._on_request)
+        conn.remove_handler(cdp.network.LoadingFinished, self._on_request_done)
+        conn.remove_handler(cdp.network.LoadingFailed, self._on_request_done)
+        conn.remove_handler(cdp.page.LifecycleEvent, self._on_lifecycle)
+        self.inflight.clear()
+        self.lifecycle.clear()
+
+    async def wait(
+        self,
+        until: str = "networkidle0",
+        timeout: Optional[float] = 30,
+        loader_id: str = None,
+    ) -> bool:
+        """
+        waits until the condition is met.
+
+        :param until: "networkidle0", "networkidle2", "load" or "domcontentloaded"
+        :param timeout: max seconds to wait. None waits forever
+        :param loader_id: the loader id of a navigation (as returned by cdp.page.navigate).
+            when given, the condition has to be met for that navigation (and not by the previous page)
+        :return: True if the condition was met, False when the timeout passed
+        """
+        if until not in self.CONDITIONS:
+            raise ValueError("until should be one of %s" % (self.CONDITIONS,))
+        fresh = not self.started
+        await self.start()
+        if fresh and until in ("load", "domcontentloaded") and not loader_id:
+            # we have missed the lifecycle events of the current page
+            if await self._ready_state_reached(until):
+                return True
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        max_inflight = 2 if until == "networkidle2" else 0
+        lifecycle_name = dict(
+            networkidle0="networkIdle",
+            networkidle2="networkAlmostIdle",
+            load="load",
+            domcontentloaded="DOMContentLoaded",
+        )[until]
+        while True:
+            now = loop.time()
+            names = self.lifecycle.get(loader_id or self.loader_id, ())
+            if lifecycle_name in names:
+                return True
+            wait_for = None
+            if until.startswith("networkidle") and (not loader_id or names):
+                since = self._below_since[max_inflight]
+                if since is not None:
+                    if now - since >= self.idle_time:
+                        return True
+                    wait_for = self.idle_time - (now - since)
+            if deadline is not None:
+                if now >= deadline:
+                    return False
+                wait_for = min(wait_for or deadline - now, deadline - now)
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), wait_for)
+            except asyncio.TimeoutError:
+                pass
+
+    @property
+    def requests_in_flight(self) -> int:
+        return len(self.inflight)
+
+    async def _ready_state_reached(self, until: str) -> bool:
+        result = await self.connection.send(
+            cdp.runtime.evaluate("document.readyState", return_by_value=True)
+        )
+        if not result:
+            return False
+        state = result[0].value
+        if until == "load":
+            return state == "complete"
+        return state in ("interactive", "complete")
+
+    def _update_below(self, now: float):
+        count = len(self.inflight)
+        for threshold, since in self._below_since.items():
+            if count > threshold:
+                self._below_since[threshold] = None
+            elif since is None:
+                self._below_since[threshold] = now
+        if self._changed:
+            self._changed.set()
+
+    def _on_request(self, event: cdp.network.RequestWillBeSent):
+        # redirects reuse the request id
+        self.inflight[event.request_id] = float(event.timestamp)
+        self._update_below(asyncio.get_running_loop().time())
+
+    def _on_request_done(
+        self, event: Union[cdp.network.LoadingFinished, cdp.network.LoadingFailed]
+    ):
+        if self.inflight.pop(event.request_id, None) is not None:
+            self._update_below(asyncio.get_running_loop().time())
+
+    def _on_lifecycle(self, event: cdp.page.LifecycleEvent):
+        if event.frame_id != self.connection.target_id:
+            # only the main frame
+            return
+        if event.name == "init" or event.loader_id != self.loader_id:
+            if event.loader_id != self.loader_id:
+                # new navigation, forget the older ones
+                self.lifecycle = {
+                    k: v for k, v in self.lifecycle.items() if k == event.loader_id
+                }
+            self.loader_id = event.loader_id
+        self.lifecycle.setdefault(event.loader_id, set()).add(event.name)
+        if self._changed:
+            self._changed.set()
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} [in flight: {len(self.inflight)}]"
+            f" [lifecycle: {sorted(self.lifecycle.get(self.loader_id, ()))}]>"
+        )
+
+
 class Listener:
     def __init__(self, connection: Connection):
         self.connection = connection
-        self.history = collections.deque()
-        self.max_history = 1000
+        # the history is kept when the connection is reopened
+        previous = connection.listener
+        self.history: EventHistory = previous.history if previous else EventHistory()
         self.task: asyncio.Future = None
 
         # when in interactive mode, the loop is paused after each return
@@ -574,6 +2305,15 @@ class Listener:
     def run(self):
         self.task = asyncio.create_task(self.listener_loop())
 
+    @property
+    def max_history(self) -> int:
+        """max number of events kept in history"""
+        return self.history.max_items
+
+    @max_history.setter
+    def max_history(self, max_items: int):
+        self.history.max_items = max_items
+
     @property
     def time_before_considered_idle(self):
         return self._time_before_considered_idle
@@ -599,7 +2339,8 @@ class Listener:
         while True:
             try:
                 msg = await asyncio.wait_for(
-                    self.connection.websocket.recv(), self.time_before_considered_idle
+                    self.connection.transport.recv(),
+                    self.time_before_considered_idle,
                 )
             except asyncio.TimeoutError:
                 self.idle.set()
@@ -614,6 +2355,9 @@ class Listener:
                 logger.debug(
                     "connection listener exception while reading websocket:\n%s", e
                 )
+                self.connection._connection_lost(
+                    ConnectionClosedError("connection lost: %s" % e)
+                )
                 break
 
             if not self.running:
@@ -624,35 +2368,79 @@ class Listener:
             # since we are at this point, we are not "idle" anymore.
             self.idle.clear()
 
-            message = json.loads(msg)
+            if self.connection._recorder:
+                self.connection._recorder.record(
+                    self.connection._metric_labels["target"], "<", msg
+                )
+            message = self.connection.codec.loads(msg)
+            connection = self.connection
+            session_id = message.get("sessionId")
+            if session_id is not None:
+                # flattened session mode: the message belongs to one of the
+                # tabs which are attached through this connection
+                connection = self.connection.sessions.get(session_id)
+                if connection is None:
+                    logger.debug("message for unknown session %s", session_id)
+                    continue
+            elif message.get("method") == "Target.detachedFromTarget":
+                self._handle_detached(message["params"])
+            connection._metrics.received(len(msg), message.get("method"))
+
             if "id" in message:
                 # response to our command
-                if message["id"] in self.connection.mapper:
+                if message["id"] in connection.mapper:
                     # get the corresponding Transaction
 
                     # thanks to zxsleebu for discovering the memory leak
                     # pop to prevent memory leaks
-                    tx = self.connection.mapper.pop(message["id"])
+                    tx = connection.mapper.pop(message["id"])
                     logger.debug("got answer for %s (message_id:%d)", tx, message["id"])
 
                     # complete the transaction, which is a Future object
                     # and thus will return to anyone awaiting it.
-                    tx(**message)
+                    connection._metrics.command_done(
+                        tx.method, time.perf_counter() - tx.sent_at, "error" in message
+                    )
+                    if not tx.done():
+                        tx(**message)
                 else:
                     if message["id"] == -2:
-                        tx = self.connection.mapper.get(-2)
-                        if tx:
+                        tx = connection.mapper.get(-2)
+                        if tx and not tx.done():
                             tx(**message)
                         continue
+                    # nobody is waiting for this anymore (timed out or cancelled)
+                    connection.orphaned_responses += 1
+                    logger.debug("orphaned answer (message_id:%d)", message["id"])
             else:
-                # probably an event
+                # probably an event.
+                # the subscriptions are looked up by method name first, so events
+                # nobody listens to are never parsed.
+                method = message.get("method")
+                raw_callbacks = connection.handlers.get(method)
+                if raw_callbacks:
+                    # raw subscription, which skips the decoding
+                    event = RawEvent(method, message.get("params"))
+                    try:
+                        await connection.dispatcher.dispatch(event, raw_callbacks)
+                    except asyncio.CancelledError:
+                        break
+                # a subscribed event class has its domain imported already, so the domain
+                # is only imported here when unknown events are subscribed to (RawEvent)
+                event_type = cdp.util.event_parser(
+                    method, load=RawEvent in connection.handlers
+                ) or RawEvent
+                callbacks = connection.handlers.get(event_type)
+                if not callbacks:
+                    if raw_callbacks:
+                        self.history.append(event, len(msg))
+                    continue
                 try:
-                    event = cdp.util.parse_json_event(message)
-                    event_tx = EventTransaction(event)
-                    if not self.connection.mapper:
-                        self.connection.__count__ = itertools.count(0)
-                    event_tx.id = next(self.connection.__count__)
-                    self.connection.mapper[event_tx.id] = event_tx
+                    if event_type is RawEvent:
+                        event = RawEvent(method, message.get("params"))
+                    else:
+                        event = event_type.from_json(message.get("params", {}))
+                    self.history.append(event, len(msg))
                 except Exception as e:
                     logger.info(
                         "%s: %s  during parsing of json from event : %s"
@@ -660,43 +2448,34 @@ class Listener:
                         exc_info=True,
                     )
                     continue
-                except KeyError as e:
-                    logger.info("some lousy KeyError %s" % e, exc_info=True)
-                    continue
                 try:
-                    if type(event) in self.connection.handlers:
-                        callbacks = self.connection.handlers[type(event)]
-                    else:
-                        continue
-                    if not len(callbacks):
-                        continue
-                    for callback in callbacks:
-                        try:
-                            if iscoroutinefunction(callback) or iscoroutine(callback):
-                                try:
-                                    await callback(event, self.connection)
-                                except TypeError:
-                                    await callback(event)
-                            else:
-                                try:
-                                    callback(event, self.connection)
-                                except TypeError:
-                                    callback(event)
-                        except Exception as e:
-                            logger.warning(
-                                "exception in callback %s for event %s => %s",
-                                callback,
-                                event.__class__.__name__,
-                                e,
-                                exc_info=True,
-                            )
-                            raise
+                    await connection.dispatcher.dispatch(event, callbacks)
                 except asyncio.CancelledError:
                     break
                 except Exception:
                     raise
                 continue
 
+    def _handle_detached(self, params: dict):
+        """
+        a flattened session got detached (eg: target closed or crashed), so
+        the tab needs to attach again on next use, and pending commands will never be answered.
+        """
+        session = self.connection.sessions.pop(params.get("sessionId"), None)
+        if session is None:
+            return
+        session.session_id = None
+        session.enabled_domains.clear()
+        for tx in session.mapper.values():
+            if not tx.done():
+                tx.set_exception(
+                    ConnectionClosedError(
+                        "session detached from target %s" % session.target_id
+                    )
+                )
+        session.mapper.clear()
+        logger.debug("session detached from target %s", session.target_id)
+
     def __repr__(self):
         s_idle = "[idle]" if self.idle.is_set() else "[busy]"
         s_cache_length = f"[cache size: {len(self.history)}]"
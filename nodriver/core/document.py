@@ -0,0 +1,360 @@
+"""
+lookups in a document tree, as fetched with DOM.getDocument, and a mirror of the document
+of a tab, which is kept up to date using the DOM events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing
+from typing import Dict, List, Optional, Set
+
+from .. import cdp
+
+if typing.TYPE_CHECKING:
+    from .tab import Tab
+
+__all__ = ["DocumentIndex", "DomMirror"]
+
+logger = logging.getLogger(__name__)
+
+
+def _subnodes(node: cdp.dom.Node) -> List[cdp.dom.Node]:
+    """the children, shadow roots, pseudo elements, content document and template content of node"""
+    subnodes = []
+    for related in (node.children, node.shadow_roots, node.pseudo_elements):
+        if related:
+            subnodes.extend(related)
+    for related in (node.content_document, node.template_content):
+        if related is not None:
+            subnodes.append(related)
+    return subnodes
+
+
+class DocumentIndex:
+    """
+    index of a document tree (as returned by ``cdp.dom.get_document(-1, True)``), which is built
+    once and makes looking up a node by node id or backend node id, and the parent of a node,
+    a dict lookup instead of a walk through the tree.
+
+    the nodes of shadow roots, iframe content documents, template contents and pseudo elements
+    are indexed as well. the parent of a shadow root is its host, the parent of a content document
+    is its iframe.
+
+    elements created from a tree share the index of that tree, see :py:attr:`nodriver.Element.index`.
+
+    :param root: the root node of the tree, usually the document node
+    """
+
+    def __init__(self, root: cdp.dom.Node):
+        self.root = root
+        #: node id => node
+        self.nodes: Dict[cdp.dom.NodeId, cdp.dom.Node] = {}
+        #: backend node id => node
+        self.backend_nodes: Dict[cdp.dom.BackendNodeId, cdp.dom.Node] = {}
+        #: node id => parent node
+        self.parents: Dict[cdp.dom.NodeId, cdp.dom.Node] = {}
+        self.add(root)
+
+    def add(self, node: cdp.dom.Node, parent: Optional[cdp.dom.Node] = None):
+        """
+        adds node and the nodes below it to the index
+
+        :param node: the node
+        :param parent: the parent of the node, if any
+        """
+        nodes = self.nodes
+        backend_nodes = self.backend_nodes
+        parents = self.parents
+        if parent is not None:
+            parents[node.node_id] = parent
+        # iterative, since a deep tree would exceed the recursion limit
+        stack = [node]
+        pop = stack.pop
+        push = stack.extend
+        while stack:
+            node = pop()
+            nodes[node.node_id] = node
+            backend_nodes[node.backend_node_id] = node
+            subnodes = _subnodes(node)
+            for child in subnodes:
+                parents[child.node_id] = node
+            push(subnodes)
+
+    def remove(self, node: cdp.dom.Node):
+        """
+        removes node and the nodes below it from the index
+
+        :param node: the node
+        """
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            self.nodes.pop(node.node_id, None)
+            self.backend_nodes.pop(node.backend_node_id, None)
+            self.parents.pop(node.node_id, None)
+            stack.extend(_subnodes(node))
+
+    def get(self, node_id: cdp.dom.NodeId) -> Optional[cdp.dom.Node]:
+        """
+        :param node_id: the node id
+        :return: the node with that node id, or None when it is not in the tree
+        """
+        return self.nodes.get(node_id)
+
+    def get_by_backend_id(
+        self, backend_node_id: cdp.dom.BackendNodeId
+    ) -> Optional[cdp.dom.Node]:
+        """
+        :param backend_node_id: the backend node id
+        :return: the node with that backend node id, or None when it is not in the tree
+        """
+        return self.backend_nodes.get(backend_node_id)
+
+    def parent(self, node: cdp.dom.Node) -> Optional[cdp.dom.Node]:
+        """
+        :param node: a node of the tree. for a node which is not in the tree, its parent_id is looked up.
+        :return: the parent node, or None for the root (or when the parent is not in the tree)
+        """
+        parent = self.parents.get(node.node_id)
+        if parent is None and node.parent_id is not None:
+            parent = self.nodes.get(node.parent_id)
+        return parent
+
+    def find_all(self, node_ids: List[cdp.dom.NodeId]) -> List[cdp.dom.Node]:
+        """
+        :param node_ids: node ids, eg: the result of DOM.querySelectorAll
+        :return: the nodes of the node ids which are in the tree, in the same order
+        """
+        nodes = self.nodes
+        return [nodes[node_id] for node_id in node_ids if node_id in nodes]
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, node_id: cdp.dom.NodeId):
+        return node_id in self.nodes
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.root.node_name} [nodes: {len(self)}]>"
+
+
+class DomMirror:
+    """
+    a copy of the document of a tab, which is fetched once and then kept up to date
+    by applying the DOM events (setChildNodes, childNodeInserted, childNodeRemoved,
+    attributeModified, attributeRemoved, characterDataModified, childNodeCountUpdated
+    and shadowRootPushed/Popped). after a documentUpdated event (eg: on navigation),
+    the document is fetched again on next use.
+
+    use :py:meth:`nodriver.Tab.mirror_dom` to enable it for a tab, after which the element
+    lookups of the tab (query_selector(_all), find_*, Element.update) read the mirror instead of
+    fetching the whole document every time. note that the DOM domain stays enabled while the
+    mirror is in use.
+
+    :param tab: the tab
+    """
+
+    def __init__(self, tab: Tab):
+        self.tab = tab
+        #: the index of the mirrored document, which is updated in place
+        self.index: Optional[DocumentIndex] = None
+        #: when set, the document is fetched again on next use
+        self.stale = True
+        #: number of times the whole document was fetched
+        self.fetches = 0
+        self._lock = asyncio.Lock()
+        self._pending: Set[asyncio.Future] = set()
+        self._handlers = {
+            cdp.dom.SetChildNodes: self._set_child_nodes,
+            cdp.dom.ChildNodeInserted: self._child_node_inserted,
+            cdp.dom.ChildNodeRemoved: self._child_node_removed,
+            cdp.dom.ChildNodeCountUpdated: self._child_node_count_updated,
+            cdp.dom.AttributeModified: self._attribute_modified,
+            cdp.dom.AttributeRemoved: self._attribute_removed,
+            cdp.dom.CharacterDataModified: self._character_data_modified,
+            cdp.dom.ShadowRootPushed: self._shadow_root_pushed,
+            cdp.dom.ShadowRootPopped: self._shadow_root_popped,
+            cdp.dom.DocumentUpdated: self._document_updated,
+        }
+
+    @property
+    def root(self) -> Optional[cdp.dom.Node]:
+        """the document node, None when the document was not fetched yet"""
+        if self.index is not None:
+            return self.index.root
+
+    async def start(self) -> DomMirror:
+        """subscribes to the DOM events and fetches the document"""
+        for event_type, handler in self._handlers.items():
+            self.tab.add_handler(event_type, handler)
+        await self.refresh()
+        return self
+
+    def stop(self):
+        """unsubscribes from the DOM events and drops the document"""
+        for event_type, handler in self._handlers.items():
+            self.tab.remove_handler(event_type, handler)
+        self.index = None
+        self.stale = True
+
+    async def refresh(self) -> DocumentIndex:
+        """fetches the whole document"""
+        # util imports element, which imports this module
+        from . import util
+        from .connection import ProtocolException
+
+        # the index is installed by the decoder, which runs when the answer is delivered.
+        # events which arrived before the answer are part of the fetched document already,
+        # the ones following it are applied to the new index.
+        command = util.get_document_command()
+        index = await self.tab.send(
+            cdp.util.Command(command.method, command.params, self._install)
+        )
+        if index is None:
+            raise ProtocolException("could not fetch the document of %s" % self.tab)
+        return index
+
+    def _install(self, result: dict) -> DocumentIndex:
+        # util imports element, which imports this module
+        from . import util
+
+        self.index = DocumentIndex(util.get_document_command().decode(result))
+        self.stale = False
+        self.fetches += 1
+        return self.index
+
+    async def get_index(self) -> DocumentIndex:
+        """
+        :return: the index of the up to date document. the document is fetched when it is stale,
+            and the children requested after mutations are waited for.
+        """
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        if self.stale:
+            async with self._lock:
+                if self.stale:
+                    await self.refresh()
+        return self.index
+
+    def _request_children(self, node: cdp.dom.Node):
+        # chrome sends inserted nodes without their children, which are pushed using
+        # setChildNodes when requested
+        future = asyncio.ensure_future(
+            self.tab.send(cdp.dom.request_child_nodes(node.node_id, -1, True))
+        )
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    def _node(self, node_id: cdp.dom.NodeId) -> Optional[cdp.dom.Node]:
+        if self.stale or self.index is None:
+            # the changes are in the next fetched document
+            return None
+        return self.index.get(node_id)
+
+    def _set_child_nodes(self, event: cdp.dom.SetChildNodes):
+        parent = self._node(event.parent_id)
+        if parent is None:
+            return
+        for child in parent.children or ():
+            self.index.remove(child)
+        parent.children = event.nodes
+        parent.child_node_count = len(event.nodes)
+        for child in event.nodes:
+            self.index.add(child, parent)
+
+    def _child_node_inserted(self, event: cdp.dom.ChildNodeInserted):
+        parent = self._node(event.parent_node_id)
+        if parent is None:
+            return
+        if parent.children is None:
+            parent.children = []
+        position = 0
+        if event.previous_node_id:
+            for position, child in enumerate(parent.children, 1):
+                if child.node_id == event.previous_node_id:
+                    break
+        parent.children.insert(position, event.node)
+        parent.child_node_count = len(parent.children)
+        self.index.add(event.node, parent)
+        if event.node.child_node_count and event.node.children is None:
+            self._request_children(event.node)
+
+    def _child_node_removed(self, event: cdp.dom.ChildNodeRemoved):
+        parent = self._node(event.parent_node_id)
+        if parent is None:
+            return
+        if parent.children:
+            parent.children[:] = [
+                child for child in parent.children if child.node_id != event.node_id
+            ]
+            parent.child_node_count = len(parent.children)
+        elif parent.child_node_count:
+            # the children were never requested, only their number is known
+            parent.child_node_count -= 1
+        node = self._node(event.node_id)
+        if node is not None:
+            self.index.remove(node)
+
+    def _child_node_count_updated(self, event: cdp.dom.ChildNodeCountUpdated):
+        node = self._node(event.node_id)
+        if node is None:
+            return
+        node.child_node_count = event.child_node_count
+        if event.child_node_count and not node.children:
+            self._request_children(node)
+
+    def _attribute_modified(self, event: cdp.dom.AttributeModified):
+        node = self._node(event.node_id)
+        if node is None:
+            return
+        if node.attributes is None:
+            node.attributes = []
+        attributes = node.attributes
+        # a flat list of names and values
+        for i in range(0, len(attributes), 2):
+            if attributes[i] == event.name:
+                attributes[i + 1] = event.value
+                break
+        else:
+            attributes.extend((event.name, event.value))
+
+    def _attribute_removed(self, event: cdp.dom.AttributeRemoved):
+        node = self._node(event.node_id)
+        if node is None or not node.attributes:
+            return
+        attributes = node.attributes
+        for i in range(0, len(attributes), 2):
+            if attributes[i] == event.name:
+                del attributes[i : i + 2]
+                break
+
+    def _character_data_modified(self, event: cdp.dom.CharacterDataModified):
+        node = self._node(event.node_id)
+        if node is not None:
+            node.node_value = event.character_data
+
+    def _shadow_root_pushed(self, event: cdp.dom.ShadowRootPushed):
+        host = self._node(event.host_id)
+        if host is None:
+            return
+        host.shadow_roots = (host.shadow_roots or []) + [event.root]
+        self.index.add(event.root, host)
+
+    def _shadow_root_popped(self, event: cdp.dom.ShadowRootPopped):
+        host = self._node(event.host_id)
+        root = self._node(event.root_id)
+        if host is None or root is None:
+            return
+        host.shadow_roots = [
+            each for each in host.shadow_roots or () if each.node_id != event.root_id
+        ] or None
+        self.index.remove(root)
+
+    def _document_updated(self, event: cdp.dom.DocumentUpdated):
+        self.stale = True
+
+    def __repr__(self):
+        state = "stale" if self.stale else "nodes: %d" % len(self.index)
+        return f"<{self.__class__.__name__} {self.tab!r} [{state}] [fetches: {self.fetches}]>"
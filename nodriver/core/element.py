@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import pathlib
@@ -10,6 +11,7 @@ import typing
 from . import util
 from ._contradict import ContraDict
 from .config import PathLike
+from .document import DocumentIndex
 from .. import cdp
 
 logger = logging.getLogger(__name__)
@@ -18,7 +20,11 @@ if typing.TYPE_CHECKING:
     from .tab import Tab
 
 
-def create(node: cdp.dom.Node, tab: Tab, tree: typing.Optional[cdp.dom.Node] = None):
+def create(
+    node: cdp.dom.Node,
+    tab: Tab,
+    tree: typing.Optional[typing.Union[cdp.dom.Node, DocumentIndex]] = None,
+):
     """
     factory for Elements
     this is used with Tab.query_selector(_all), since we already have the tree,
@@ -30,6 +36,7 @@ def create(node: cdp.dom.Node, tab: Tab, tree: typing.Optional[cdp.dom.Node] = N
     :type tab: Tab
     :param tree: [Optional] the full node tree to which <node> belongs, enhances performance.
                 when not provided, you need to call `await elem.update()` before using .children / .parent
+                when a :py:class:`DocumentIndex` is passed, the element shares it.
     :type tree:
     """
 
@@ -39,7 +46,12 @@ def create(node: cdp.dom.Node, tab: Tab, tree: typing.Optional[cdp.dom.Node] = N
 
 
 class Element:
-    def __init__(self, node: cdp.dom.Node, tab: Tab, tree: cdp.dom.Node = None):
+    def __init__(
+        self,
+        node: cdp.dom.Node,
+        tab: Tab,
+        tree: typing.Union[cdp.dom.Node, DocumentIndex] = None,
+    ):
         """
         Represents an (HTML) DOM Element
 
@@ -55,6 +67,11 @@ class Element:
         #     self._node = node.content_document
         # else:
         self._node = node
+        if isinstance(tree, DocumentIndex):
+            self._index = tree
+            tree = tree.root
+        else:
+            self._index = None
         self._tree = tree
         self._parent = None
         self._remote_object = None
@@ -241,9 +258,7 @@ class Element:
     async def remove_from_dom(self):
         """removes the element from dom"""
         await self.update()  # ensure we have latest node_id
-        node = util.filter_recurse(
-            self._tree, lambda node: node.backend_node_id == self.backend_node_id
-        )
+        node = self.index.get_by_backend_id(self.backend_node_id)
         if node:
             await self.tab.send(cdp.dom.remove_node(node.node_id))
         # self._tree = util.remove_from_tree(self.tree, self.node)
@@ -276,17 +291,18 @@ class Element:
             # self._node = _node
             # self._children.clear()
             self._parent = None
+            index = DocumentIndex(doc.node if isinstance(doc, Element) else doc)
         else:
-            doc = await self._tab.send(cdp.dom.get_document(-1, True))
+            index = await self._tab.get_document_index()
+            doc = index.root
             self._parent = None
         # if self.node_name != "IFRAME":
-        updated_node = util.filter_recurse(
-            doc, lambda n: n.backend_node_id == self._node.backend_node_id
-        )
+        updated_node = index.get_by_backend_id(self._node.backend_node_id)
         if updated_node:
             logger.debug("node seems changed, and has now been updated.")
             self._node = updated_node
         self._tree = doc
+        self._index = index
 
         self._remote_object = await self._tab.send(
             cdp.dom.resolve_node(backend_node_id=self._node.backend_node_id)
@@ -294,13 +310,11 @@ class Element:
         self.attrs.clear()
         self._make_attrs()
         if self.node_name != "IFRAME":
-            parent_node = util.filter_recurse(
-                doc, lambda n: n.node_id == self.node.parent_id
-            )
+            parent_node = index.parent(self.node)
             if not parent_node:
                 # could happen if node is for example <html>
                 return self
-            self._parent = create(parent_node, tab=self._tab, tree=self._tree)
+            self._parent = create(parent_node, tab=self._tab, tree=index)
         return self
 
     @property
@@ -315,6 +329,20 @@ class Element:
     @tree.setter
     def tree(self, tree: cdp.dom.Node):
         self._tree = tree
+        self._index = None
+
+    @property
+    def index(self) -> typing.Optional[DocumentIndex]:
+        """
+        the index of :py:obj:`~tree`, which is built on first use and shared with the
+        elements created from the same tree (eg: :py:obj:`~parent` and :py:obj:`~children`)
+        """
+        if self._index is None and self._tree is not None:
+            tree = self._tree
+            if isinstance(tree, Element):
+                tree = tree.node
+            self._index = DocumentIndex(tree)
+        return self._index
 
     @property
     def attrs(self):
@@ -334,12 +362,10 @@ class Element:
         """
         if not self.tree:
             raise RuntimeError("could not get parent since the element has no tree set")
-        parent_node = util.filter_recurse(
-            self.tree, lambda n: n.node_id == self.parent_id
-        )
+        parent_node = self.index.parent(self.node)
         if not parent_node:
             return None
-        parent_element = create(parent_node, tab=self._tab, tree=self.tree)
+        parent_element = create(parent_node, tab=self._tab, tree=self.index)
         return parent_element
 
     @property
@@ -369,7 +395,11 @@ class Element:
             return []
         if self.node.children:
             for child in self.node.children:
-                child_elem = create(child, self._tab, self.tree)
+                child_elem = create(
+                    child,
+                    self._tab,
+                    self._index if self._index is not None else self.tree,
+                )
                 if child_elem:
                     _children.append(child_elem)
         return _children
@@ -480,7 +510,11 @@ class Element:
         elif result[1]:
             return result[1]
 
-    async def get_position(self, abs=False) -> Position:
+    async def get_position(self, abs=False) -> cdp.dom.Quad:
+        """
+        :return: a Position, which is a cdp.dom.Quad with left, top, right, bottom, width,
+            height and center attributes, or None when the element has no content quads
+        """
         if not self.parent or not self.object_id:
             self._remote_object = await self._tab.send(
                 cdp.dom.resolve_node(backend_node_id=self.backend_node_id)
@@ -492,7 +526,7 @@ class Element:
             )
             if not quads:
                 raise Exception("could not find position for %s " % self)
-            pos = Position(quads[0])
+            pos = _position_class()(quads[0])
             if abs:
                 scroll_y = (await self.tab.evaluate("window.scrollY")).value
                 scroll_x = (await self.tab.evaluate("window.scrollX")).value
@@ -979,7 +1013,7 @@ class Element:
         if getattr(self, "_is_highlighted", False):
             del self._is_highlighted
             await self.tab.send(cdp.overlay.hide_highlight())
-            await self.tab.send(cdp.dom.disable())
+            await self.tab._disable_dom()
             await self.tab.send(cdp.overlay.disable())
             return
         await self.tab.send(cdp.dom.enable())
@@ -1131,38 +1165,51 @@ class Element:
         return s
 
 
-class Position(cdp.dom.Quad):
-    """helper class for element positioning"""
-
-    def __init__(self, points):
-        super().__init__(points)
-        (
-            self.left,
-            self.top,
-            self.right,
-            self.top,
-            self.right,
-            self.bottom,
-            self.left,
-            self.bottom,
-        ) = points
-        self.abs_x: float = 0
-        self.abs_y: float = 0
-        self.x = self.left
-        self.y = self.top
-        self.height, self.width = (self.bottom - self.top, self.right - self.left)
-        self.center = (
-            self.left + (self.width / 2),
-            self.top + (self.height / 2),
-        )
+@functools.lru_cache(maxsize=None)
+def _position_class() -> type:
+    # created on first use, since subclassing cdp.dom.Quad imports the dom domain
+    class Position(cdp.dom.Quad):
+        """helper class for element positioning"""
+
+        def __init__(self, points):
+            super().__init__(points)
+            (
+                self.left,
+                self.top,
+                self.right,
+                self.top,
+                self.right,
+                self.bottom,
+                self.left,
+                self.bottom,
+            ) = points
+            self.abs_x: float = 0
+            self.abs_y: float = 0
+            self.x = self.left
+            self.y = self.top
+            self.height, self.width = (self.bottom - self.top, self.right - self.left)
+            self.center = (
+                self.left + (self.width / 2),
+                self.top + (self.height / 2),
+            )
 
-    def to_viewport(self, scale=1):
-        return cdp.page.Viewport(
-            x=self.x, y=self.y, width=self.width, height=self.height, scale=scale
-        )
+        def to_viewport(self, scale=1):
+            return cdp.page.Viewport(
+                x=self.x, y=self.y, width=self.width, height=self.height, scale=scale
+            )
 
-    def __repr__(self):
-        return f"<Position(x={self.left}, y={self.top}, width={self.width}, height={self.height})>"
+        def __repr__(self):
+            return f"<Position(x={self.left}, y={self.top}, width={self.width}, height={self.height})>"
+
+    Position.__qualname__ = "Position"
+    return Position
+
+
+def __getattr__(name: str):
+    # element.Position, see _position_class
+    if name == "Position":
+        return _position_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 async def resolve_node(tab: Tab, node_id: cdp.dom.NodeId):
@@ -0,0 +1,292 @@
+"""
+metrics about the cdp traffic of a connection: commands, latencies, bytes and events.
+
+every :py:class:`~nodriver.core.connection.Connection` (so every tab, and the browser connection)
+keeps its own :py:class:`Metrics`. you can query them from python, or export them in the
+prometheus text format:
+
+.. code-block::
+
+    print(tab.metrics()["commands"]["DOM.getDocument"])
+    print(browser.metrics(prometheus=True))
+
+"""
+
+from __future__ import annotations
+
+import bisect
+import collections
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+__all__ = ["Histogram", "Metrics", "to_prometheus"]
+
+#: upper bounds (in seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    float("inf"),
+)
+
+
+class Histogram:
+    """cumulative histogram with fixed buckets, like prometheus uses"""
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        estimate of the given quantile (0..1), interpolated within the bucket.
+        None when nothing was observed yet.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for upper, count in zip(self.buckets, self.counts):
+            if count and seen + count >= rank:
+                if upper == float("inf"):
+                    return lower
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = upper
+        return lower
+
+    def merge(self, other: Histogram):
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.count += other.count
+        self.sum += other.sum
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} [count: {self.count}] [sum: {self.sum:.4f}s]>"
+
+
+class MethodStats:
+    """metrics of a single cdp method"""
+
+    __slots__ = ("calls", "errors", "timeouts", "latency")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.latency = Histogram()
+
+    def merge(self, other: MethodStats):
+        self.calls += other.calls
+        self.errors += other.errors
+        self.timeouts += other.timeouts
+        self.latency.merge(other.latency)
+
+
+class Metrics:
+    """
+    counters and histograms for the traffic of a connection.
+
+    :ivar commands: method name => :py:class:`MethodStats`
+    :ivar events: event method name => number of events received (also when nobody listens)
+    :ivar bytes_in: bytes received (responses and events)
+    :ivar bytes_out: bytes sent
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.commands: Dict[str, MethodStats] = collections.defaultdict(MethodStats)
+        self.events: Dict[str, int] = collections.defaultdict(int)
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.in_flight = 0
+
+    def command_sent(self, method: str):
+        self.commands[method].calls += 1
+
+    def sent(self, size: int):
+        self.bytes_out += size
+
+    def command_done(self, method: str, latency: float, error: bool = False):
+        stats = self.commands[method]
+        stats.latency.observe(latency)
+        if error:
+            stats.errors += 1
+
+    def command_timed_out(self, method: str):
+        self.commands[method].timeouts += 1
+
+    def received(self, size: int, event: str = None):
+        self.bytes_in += size
+        if event:
+            self.events[event] += 1
+
+    def reset(self):
+        self.__init__()
+
+    def merge(self, others: Iterable[Metrics]) -> Metrics:
+        """
+        a new Metrics instance holding the sum of this and the others
+        """
+        total = Metrics()
+        for metrics in (self, *others):
+            total.started = min(total.started, metrics.started)
+            for method, stats in metrics.commands.items():
+                total.commands[method].merge(stats)
+            for event, count in metrics.events.items():
+                total.events[event] += count
+            total.bytes_in += metrics.bytes_in
+            total.bytes_out += metrics.bytes_out
+            total.in_flight += metrics.in_flight
+        return total
+
+    def to_dict(self) -> dict:
+        uptime = max(time.monotonic() - self.started, 1e-9)
+        return {
+            "uptime": uptime,
+            "in_flight": self.in_flight,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "commands": {
+                method: dict(
+                    calls=stats.calls,
+                    errors=stats.errors,
+                    timeouts=stats.timeouts,
+                    latency=stats.latency.to_dict(),
+                )
+                for method, stats in sorted(self.commands.items())
+            },
+            "events": {
+                event: dict(count=count, rate=count / uptime)
+                for event, count in sorted(self.events.items())
+            },
+        }
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} [commands: {sum(s.calls for s in self.commands.values())}]"
+            f" [events: {sum(self.events.values())}] [in: {self.bytes_in}b] [out: {self.bytes_out}b]>"
+        )
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(
+            '%s="%s"'
+            % (k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+            for k, v in labels.items()
+        )
+        + "}"
+    )
+
+
+def to_prometheus(
+    items: Iterable[Tuple[Dict[str, str], Metrics]], prefix: str = "nodriver"
+) -> str:
+    """
+    exports metrics in the prometheus text exposition format.
+
+    :param items: (labels, metrics) pairs, eg: [({"target": tab.target_id}, tab._metrics), ...]
+    :param prefix: prefix for the metric names
+    :return: the text
+    """
+    families: Dict[str, Tuple[str, str, List[str]]] = {}
+
+    def add(name, kind, help_, labels, value):
+        name = f"{prefix}_{name}"
+        if name not in families:
+            families[name] = (kind, help_, [])
+        families[name][2].append(f"{name}{_labels(labels)} {value}")
+
+    for labels, metrics in items:
+        add("bytes_received_total", "counter", "bytes received", labels, metrics.bytes_in)
+        add("bytes_sent_total", "counter", "bytes sent", labels, metrics.bytes_out)
+        add(
+            "commands_in_flight",
+            "gauge",
+            "commands waiting for an answer",
+            labels,
+            metrics.in_flight,
+        )
+        for method, stats in sorted(metrics.commands.items()):
+            method_labels = dict(labels, method=method)
+            add("commands_total", "counter", "commands sent", method_labels, stats.calls)
+            add(
+                "command_errors_total",
+                "counter",
+                "commands answered with an error",
+                method_labels,
+                stats.errors,
+            )
+            add(
+                "command_timeouts_total",
+                "counter",
+                "commands which timed out",
+                method_labels,
+                stats.timeouts,
+            )
+            name = "command_latency_seconds"
+            help_ = "time between sending a command and receiving the answer"
+            cumulative = 0
+            for upper, count in zip(stats.latency.buckets, stats.latency.counts):
+                cumulative += count
+                le = "+Inf" if upper == float("inf") else repr(upper)
+                add(f"{name}_bucket", "histogram", help_, dict(method_labels, le=le), cumulative)
+            add(f"{name}_sum", "histogram", help_, method_labels, stats.latency.sum)
+            add(f"{name}_count", "histogram", help_, method_labels, stats.latency.count)
+        for event, count in sorted(metrics.events.items()):
+            add(
+                "events_total",
+                "counter",
+                "events received",
+                dict(labels, event=event),
+                count,
+            )
+
+    lines = []
+    written = set()
+    for name, (kind, help_, samples) in families.items():
+        # the _bucket, _sum and _count series of a histogram share one header
+        family = name
+        if kind == "histogram":
+            family = name.rsplit("_", 1)[0]
+        if family not in written:
+            written.add(family)
+            lines.append(f"# HELP {family} {help_}")
+            lines.append(f"# TYPE {family} {kind}")
+        lines.extend(samples)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,245 @@
+"""
+recording of cdp traffic, and replaying it without a browser.
+
+the recorder writes every message sent and received by the connections of a browser to a jsonl file,
+one message per line::
+
+    {"t":0.012345,"c":"browser","d":">","m":{"method":"Target.getTargets","params":{},"id":1}}
+    {"t":0.013120,"c":"browser","d":"<","m":{"id":1,"result":{"targetInfos":[...]}}}
+
+t: seconds since the recording started, c: the connection ("browser" or the target id),
+d: direction (">" sent, "<" received), m: the message as it went over the wire.
+the first line (d: "i") holds the browser info, and the settings the replay needs.
+
+the log can be replayed with Config.replay, which runs a Browser and its tabs against the log
+instead of a real browser. this makes it possible to profile and benchmark the python side
+(element creation, tree walking, handler dispatch) offline, at full speed:
+
+.. code-block::
+
+    browser = await nodriver.start(record="session.jsonl")
+    ...
+    browser = await nodriver.start(replay="session.jsonl")
+
+during replay, the n-th command sent on a connection gets the answer of the n-th recorded command
+of that connection (the ids are rewritten), and events are delivered in their recorded order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Union
+
+from .connection import ConnectionClosedError, Transport
+
+__all__ = ["Recorder", "Replay", "ReplayTransport"]
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, os.PathLike]
+
+
+class Recorder:
+    """
+    writes the cdp traffic to a jsonl file (see module docs).
+    normally created by the Browser when Config.record is set.
+
+    :param path: file to write to
+    """
+
+    def __init__(self, path: PathLike):
+        self.path = path
+        self._file = open(path, "wb")
+        self._started = time.monotonic()
+        self._keys: Dict[str, bytes] = {}
+        self.count = 0
+
+    def record(self, key: str, direction: str, message: Union[str, bytes]):
+        """
+        :param key: the connection ("browser" or the target id)
+        :param direction: ">" for sent, "<" for received
+        :param message: the encoded message
+        """
+        if self._file.closed:
+            return
+        if isinstance(message, str):
+            message = message.encode()
+        encoded_key = self._keys.get(key)
+        if encoded_key is None:
+            encoded_key = self._keys[key] = json.dumps(key).encode()
+        # the message is json already, so it is written as is
+        self._file.write(
+            b'{"t":%.6f,"c":%s,"d":"%s","m":%s}\n'
+            % (time.monotonic() - self._started, encoded_key, direction.encode(), message)
+        )
+        self.count += 1
+
+    def record_info(self, info: dict, **settings):
+        """
+        records the browser info (/json/version), and settings which the replay has to use as well.
+        """
+        self.record("browser", "i", json.dumps(dict(info, **settings)))
+
+    def flush(self):
+        if not self._file.closed:
+            self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.path} [messages: {self.count}]>"
+
+
+class Replay:
+    """
+    a recorded log (see :py:class:`Recorder`), which hands out a :py:class:`ReplayTransport`
+    for every connection in it.
+
+    :param path: the log file
+    :param speed: None (default) replays as fast as possible.
+                  a number replays events with the recorded timing, sped up by that factor (1 = real time)
+    :param strict: when True, a command which does not match the recorded command raises an exception,
+                   otherwise it is only logged.
+    """
+
+    def __init__(self, path: PathLike, speed: Optional[float] = None, strict: bool = False):
+        self.path = path
+        self.speed = speed
+        self.strict = strict
+        self.info: dict = {}
+        self.entries: Dict[str, List[tuple]] = collections.defaultdict(list)
+        with open(path, "rb") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                if entry["d"] == "i":
+                    self.info = entry["m"]
+                    continue
+                self.entries[entry["c"]].append((entry["t"], entry["d"], entry["m"]))
+        self._transports: Dict[str, ReplayTransport] = {}
+
+    def transport(self, key: str) -> ReplayTransport:
+        """the transport replaying the traffic of given connection ("browser" or a target id)"""
+        transport = self._transports.get(key)
+        if transport is None or transport.closed:
+            transport = self._transports[key] = ReplayTransport(
+                self.entries.get(key, []), self.speed, self.strict
+            )
+        return transport
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} {self.path} [connections: {len(self.entries)}]"
+            f" [messages: {sum(map(len, self.entries.values()))}]>"
+        )
+
+
+class ReplayTransport(Transport):
+    """
+    transport which answers from a recorded log instead of a browser.
+
+    :param entries: the recorded (time, direction, message) entries of one connection
+    """
+
+    def __init__(self, entries: List[tuple], speed: Optional[float] = None, strict: bool = False):
+        self.entries = entries
+        self.speed = speed
+        self.strict = strict
+        self._cursor = 0
+        # commands sent by the client, and recorded commands the cursor has passed
+        self._sent = 0
+        self._passed = 0
+        # (session id, recorded command id) => id used by the client.
+        # with flattened sessions, every tab numbers its commands on its own
+        self._ids: Dict[tuple, int] = {}
+        # recorded commands, in order
+        self._commands = [m for _, d, m in entries if d == ">"]
+        self._changed: asyncio.Event = None
+        self._opened = False
+        self._closed = False
+        self._started: float = None
+
+    async def open(self):
+        self._changed = asyncio.Event()
+        self._opened = True
+        self._closed = False
+        self._started = time.monotonic()
+
+    async def send(self, message: Union[str, bytes]):
+        message = json.loads(message)
+        if self._sent >= len(self._commands):
+            logger.warning("replay log exhausted, no answer for %s", message.get("method"))
+            return
+        recorded = self._commands[self._sent]
+        if recorded.get("method") != message.get("method"):
+            msg = "replay diverged: sent %s, but %s was recorded" % (
+                message.get("method"),
+                recorded.get("method"),
+            )
+            if self.strict:
+                raise ConnectionClosedError(msg)
+            logger.warning(msg)
+        self._ids[recorded.get("sessionId"), recorded.get("id")] = message.get("id")
+        self._sent += 1
+        self._changed.set()
+
+    async def recv(self) -> bytes:
+        while True:
+            if self._closed:
+                raise ConnectionClosedError("replay transport closed")
+            message = self._next()
+            if message is not None:
+                return message
+            self._changed.clear()
+            await self._changed.wait()
+
+    def _next(self) -> Optional[bytes]:
+        """the next message to deliver, or None when the client has to send a command first"""
+        entries = self.entries
+        while self._cursor < len(entries):
+            t, direction, message = entries[self._cursor]
+            if direction == ">":
+                # wait until the client sent the command, before delivering what comes after it
+                if self._passed >= self._sent:
+                    return None
+                self._passed += 1
+                self._cursor += 1
+                continue
+            if "id" in message:
+                key = (message.get("sessionId"), message["id"])
+                if key not in self._ids:
+                    return None
+                message = dict(message, id=self._ids[key])
+            elif self.speed:
+                delay = t / self.speed - (time.monotonic() - self._started)
+                if delay > 0:
+                    # not yet, the recv is retried by the listener
+                    asyncio.get_running_loop().call_later(delay, self._changed.set)
+                    return None
+            self._cursor += 1
+            return json.dumps(message).encode()
+        return None
+
+    async def close(self):
+        self._closed = True
+        if self._changed:
+            self._changed.set()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed or not self._opened
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} [delivered: {self._cursor}/{len(self.entries)}]"
+            f" [commands: {self._sent}/{len(self._commands)}]>"
+        )
@@ -0,0 +1,313 @@
+"""
+using nodriver from regular (non-async) code and from multiple threads.
+
+nodriver objects belong to the event loop which created them. the :py:class:`Runner` owns an event loop
+running in a background thread, and lets any thread submit work to it. the browser, tabs and elements
+can be used through synchronous proxies, which run every call on the runner's loop:
+
+.. code-block::
+
+    runner = nodriver.Runner().start()
+    browser = runner.start_browser(headless=True)
+
+    def work(url):
+        # can be called from any thread, all threads share the same browser
+        tab = browser.get(url, new_tab=True)
+        links = tab.select_all("a[href]")
+        result = [link.href for link in links]
+        tab.close()
+        return result
+
+    with concurrent.futures.ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(work, urls))
+
+    runner.stop()
+
+coroutines can be submitted directly as well, which returns a :py:class:`concurrent.futures.Future`:
+
+.. code-block::
+
+    future = runner.submit(some_coroutine(browser.unwrap()))
+    print(future.result())
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import inspect
+import logging
+import threading
+from typing import Any, Awaitable, Callable, List, Optional
+
+from . import util
+from .browser import Browser
+from .config import Config
+from .connection import Connection
+from .element import Element
+from .tab import Tab
+
+__all__ = ["Runner", "SyncProxy", "SyncBrowser", "SyncTab", "SyncElement"]
+
+logger = logging.getLogger(__name__)
+
+
+class Runner:
+    """
+    owns an asyncio event loop, running in a background thread.
+    all methods can be called from any thread, except from the runner's own thread.
+
+    can be used as a context manager, which starts and stops the runner.
+
+    :param name: name of the thread
+    """
+
+    def __init__(self, name: str = "nodriver-runner"):
+        self.name = name
+        self.loop: asyncio.AbstractEventLoop = None
+        self.browsers: List[Browser] = []
+        self._thread: threading.Thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> Runner:
+        """starts the thread and its event loop"""
+        if self.running:
+            return self
+        started = threading.Event()
+        self.loop = asyncio.new_event_loop()
+
+        def run():
+            asyncio.set_event_loop(self.loop)
+            self.loop.call_soon(started.set)
+            self.loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """
+        schedules a coroutine on the runner's loop
+
+        :param coro: the coroutine
+        :return: future which resolves to the coroutine's result
+        """
+        if not self.running:
+            raise RuntimeError("the runner is not running, call start() first")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        runs a coroutine on the runner's loop, and waits for the result
+
+        :param coro: the coroutine
+        :param timeout: seconds to wait for the result. None waits forever
+        :return: the result of the coroutine
+        """
+        if threading.current_thread() is self._thread:
+            if inspect.iscoroutine(coro):
+                coro.close()
+            raise RuntimeError(
+                "Runner.run() can not be called from the runner's own thread, await instead"
+            )
+        return self.submit(coro).result(timeout)
+
+    def call(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        calls fn(*args, **kwargs) on the runner's loop, and waits for the result.
+        when fn returns a coroutine, it is awaited.
+        """
+        return self.run(_invoke(fn, args, kwargs))
+
+    def start_browser(self, config: Config = None, **kwargs) -> SyncBrowser:
+        """
+        starts a browser on the runner's loop. accepts the same parameters as :py:func:`nodriver.start`.
+
+        :return: proxy for the browser
+        """
+        browser = self.run(util.start(config, **kwargs))
+        self.browsers.append(browser)
+        return SyncBrowser(browser, self)
+
+    def wrap(self, value: Any) -> Any:
+        """
+        wraps a Browser, Tab or Element (or a list or tuple of those) in a synchronous proxy.
+        other values are returned as is.
+        """
+        proxy = _PROXIES.get(type(value))
+        if proxy is None:
+            for cls, each in _PROXIES.items():
+                if isinstance(value, cls):
+                    proxy = each
+                    break
+        if proxy is not None:
+            return proxy(value, self)
+        if isinstance(value, (list, tuple)) and value and _PROXIES.get(type(value[0])):
+            return type(value)(self.wrap(item) for item in value)
+        if isinstance(value, asyncio.Future):
+            # eg: expect_event(), resolves on the loop, so hand out a thread safe future
+            return self.submit(_wrap_future(value))
+        return value
+
+    def stop(self, timeout: Optional[float] = 10):
+        """stops the browsers started by this runner, cancels the remaining tasks and stops the loop"""
+        if not self.running:
+            return
+
+        async def shutdown():
+            for browser in self.browsers:
+                browser.stop()
+            self.browsers.clear()
+            await asyncio.sleep(0)
+            tasks = [
+                task
+                for task in asyncio.all_tasks()
+                if task is not asyncio.current_task()
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            self.run(shutdown(), timeout)
+        except (Exception,):
+            logger.debug("exception while stopping the runner", exc_info=True)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
+            if not self._thread.is_alive():
+                self.loop.close()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def __repr__(self):
+        state = "running" if self.running else "stopped"
+        return f"<{self.__class__.__name__} {self.name} [{state}] [browsers: {len(self.browsers)}]>"
+
+
+async def _invoke(fn: Callable, args: tuple, kwargs: dict) -> Any:
+    result = fn(*args, **kwargs)
+    # only coroutines, since tabs, elements and browsers are awaitable themselves
+    if inspect.iscoroutine(result):
+        result = await result
+    return result
+
+
+async def _wrap_future(future: asyncio.Future) -> Any:
+    return await future
+
+
+class SyncProxy:
+    """
+    synchronous proxy for a nodriver object, which can be used from any thread.
+    methods (including coroutine methods) and attributes are run on the runner's loop.
+    Browser, Tab and Element results are wrapped in proxies as well.
+    """
+
+    __slots__ = ("_obj", "_runner")
+
+    def __init__(self, obj: Any, runner: Runner):
+        object.__setattr__(self, "_obj", obj)
+        object.__setattr__(self, "_runner", runner)
+
+    def unwrap(self) -> Any:
+        """the proxied object, to be used on the runner's loop only"""
+        return self._obj
+
+    def __getattr__(self, name: str) -> Any:
+        obj = self._obj
+        runner = self._runner
+        if callable(getattr(type(obj), name, None)):
+            # a method, which is looked up and called on the loop in one go
+
+            def method(*args, **kwargs):
+                return runner.wrap(runner.call(_call_method, obj, name, args, kwargs))
+
+            method.__name__ = name
+            return method
+        value = runner.call(getattr, obj, name)
+        if callable(value) and not isinstance(value, (type, *_PROXIES)):
+            # eg: handlers or functions stored on the instance
+
+            def function(*args, **kwargs):
+                return runner.wrap(runner.call(value, *args, **kwargs))
+
+            return function
+        return runner.wrap(value)
+
+    def __setattr__(self, name: str, value: Any):
+        self._runner.call(setattr, self._obj, name, _unwrap(value))
+
+    def __call__(self, *args, **kwargs):
+        return self._runner.wrap(self._runner.call(self._obj, *args, **kwargs))
+
+    def __eq__(self, other):
+        return self._obj == _unwrap(other)
+
+    def __hash__(self):
+        return id(self._obj)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self._runner.call(repr, self._obj)}>"
+
+
+class SyncBrowser(SyncProxy):
+    """synchronous proxy for a :py:class:`~nodriver.Browser`"""
+
+    __slots__ = ()
+
+    def __iter__(self):
+        return iter(self.tabs)
+
+    def stop(self):
+        runner = self._runner
+        runner.call(self._obj.stop)
+        if self._obj in runner.browsers:
+            runner.browsers.remove(self._obj)
+
+
+class SyncTab(SyncProxy):
+    """synchronous proxy for a :py:class:`~nodriver.Tab`"""
+
+    __slots__ = ()
+
+
+class SyncElement(SyncProxy):
+    """synchronous proxy for an :py:class:`~nodriver.Element`"""
+
+    __slots__ = ()
+
+    def __getitem__(self, item):
+        return self._runner.call(self._obj.__getitem__, item)
+
+
+_PROXIES = {
+    Browser: SyncBrowser,
+    Tab: SyncTab,
+    Element: SyncElement,
+    Connection: SyncTab,
+}
+
+
+def _call_method(obj: Any, name: str, args: tuple, kwargs: dict) -> Any:
+    return getattr(obj, name)(
+        *map(_unwrap, args), **{k: _unwrap(v) for k, v in kwargs.items()}
+    )
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, SyncProxy):
+        return value.unwrap()
+    if isinstance(value, (list, tuple)) and value and isinstance(value[0], SyncProxy):
+        return type(value)(_unwrap(item) for item in value)
+    return value
@@ -0,0 +1,445 @@
+"""
+columnar snapshots of a page, captured with DOMSnapshot.captureSnapshot.
+
+a snapshot holds every node of the page (including iframes) in one round trip, as columns
+instead of objects: one entry per node in each column, and strings as indices into a shared
+string table. when numpy is installed the columns are numpy arrays, otherwise array.array's.
+the helpers work with either, and are vectorized when numpy is available.
+
+.. code-block::
+
+    snap = await tab.snapshot()
+    links = snap.find(tag="a", attribute="href", visible=True)
+    for i, text in zip(links, snap.texts(links)):
+        print(text, snap.attributes(i)["href"], snap.bounds(i))
+
+"""
+
+from __future__ import annotations
+
+import array
+import bisect
+import functools
+import itertools
+from typing import Dict, List, Optional, Sequence, Tuple
+
+__all__ = ["PageSnapshot", "DEFAULT_STYLES"]
+
+#: the computed styles which are captured by default, used by :py:meth:`PageSnapshot.visible`
+DEFAULT_STYLES = ("display", "visibility", "opacity")
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    """numpy, or None when it is not installed. imported on first use, since it is slow to import"""
+    try:
+        import numpy
+    except ImportError:
+        # optional, the columns are array.array's without it
+        return None
+    return numpy
+
+
+def _ints(values: Sequence[int]):
+    column = array.array("q", values)
+    numpy = _numpy()
+    if numpy is not None:
+        return numpy.frombuffer(column, dtype=numpy.int64)
+    return column
+
+
+def _floats(values: Sequence[float]):
+    column = array.array("d", values)
+    numpy = _numpy()
+    if numpy is not None:
+        return numpy.frombuffer(column, dtype=numpy.float64)
+    return column
+
+
+class PageSnapshot:
+    """
+    a columnar snapshot of a page, see :py:meth:`nodriver.Tab.snapshot`.
+
+    nodes are numbered 0 .. len(snapshot) - 1, in document order. the nodes of an iframe
+    document follow the nodes of the document which holds the iframe, see :py:attr:`document`
+    and :py:attr:`document_owner`. string columns hold indices into :py:attr:`strings`,
+    -1 meaning none.
+
+    node columns (one entry per node):
+
+        - parent: index of the parent node, -1 for the root of a document
+        - node_type: the DOM node type (1 element, 3 text, 9 document, ...)
+        - node_name: node name (string index), eg: "DIV", "#text"
+        - node_value: node value (string index), eg: the text of a text node
+        - backend_node_id: corresponds to cdp.dom.Node.backend_node_id
+        - document: index of the document of the node
+        - attr_start, attr_end: the range of the node's attributes in attr_name and attr_value
+        - layout: index of the node's layout row, -1 when the node is not rendered
+
+    attribute columns: attr_name, attr_value (string indices)
+
+    layout columns (one entry per rendered node):
+
+        - layout_node: index of the node
+        - layout_bounds: x, y, width and height. a numpy array of shape (rows, 4),
+          or a flat array.array without numpy
+        - layout_text: the rendered text (string index)
+        - styles: computed style name => column of values (string indices)
+
+    :param result: the result of DOMSnapshot.captureSnapshot, as JSON
+    :param computed_styles: the computed styles which were captured
+    """
+
+    def __init__(self, result: dict, computed_styles: Sequence[str] = DEFAULT_STYLES):
+        self.strings: List[str] = result["strings"]
+        self.computed_styles = tuple(computed_styles)
+        documents = result["documents"]
+
+        parent: List[int] = []
+        node_type: List[int] = []
+        node_name: List[int] = []
+        node_value: List[int] = []
+        backend_node_id: List[int] = []
+        document: List[int] = []
+        attr_start: List[int] = []
+        attr_end: List[int] = []
+        attr_name: List[int] = []
+        attr_value: List[int] = []
+        layout_node: List[int] = []
+        layout_bounds: List[float] = []
+        layout_text: List[int] = []
+        styles: List[List[int]] = [[] for _ in self.computed_styles]
+        #: document index => index of the iframe (or other frame owner) node, -1 if none
+        self.document_owner: List[int] = [-1] * len(documents)
+
+        offsets = []
+        for index, doc in enumerate(documents):
+            nodes = doc["nodes"]
+            offset = len(parent)
+            offsets.append(offset)
+            count = len(nodes["parentIndex"])
+            parent.extend(p + offset if p >= 0 else -1 for p in nodes["parentIndex"])
+            node_type.extend(nodes["nodeType"])
+            node_name.extend(nodes["nodeName"])
+            node_value.extend(nodes["nodeValue"])
+            backend_node_id.extend(nodes["backendNodeId"])
+            document.extend([index] * count)
+            pairs = nodes.get("attributes") or [[]] * count
+            # attributes are flat lists of name and value pairs
+            start = len(attr_name)
+            ends = [start + size // 2 for size in itertools.accumulate(map(len, pairs))]
+            attr_start.extend([start] + ends[:-1] if ends else ())
+            attr_end.extend(ends)
+            flat = list(itertools.chain.from_iterable(pairs))
+            attr_name.extend(flat[0::2])
+            attr_value.extend(flat[1::2])
+
+            layout = doc["layout"]
+            layout_node.extend(i + offset for i in layout["nodeIndex"])
+            layout_bounds.extend(itertools.chain.from_iterable(layout["bounds"]))
+            layout_text.extend(layout["text"])
+            for column, values in zip(styles, zip(*layout["styles"])):
+                column.extend(values)
+
+        for index, doc in enumerate(documents):
+            owners = doc["nodes"].get("contentDocumentIndex") or {}
+            for node, content in zip(owners.get("index", ()), owners.get("value", ())):
+                self.document_owner[content] = node + offsets[index]
+
+        layout = [-1] * len(parent)
+        for row, node in enumerate(layout_node):
+            layout[node] = row
+
+        self.parent = _ints(parent)
+        self.node_type = _ints(node_type)
+        self.node_name = _ints(node_name)
+        self.node_value = _ints(node_value)
+        self.backend_node_id = _ints(backend_node_id)
+        self.document = _ints(document)
+        self.attr_start = _ints(attr_start)
+        self.attr_end = _ints(attr_end)
+        self.attr_name = _ints(attr_name)
+        self.attr_value = _ints(attr_value)
+        self.layout = _ints(layout)
+        self.layout_node = _ints(layout_node)
+        self.layout_bounds = _floats(layout_bounds)
+        numpy = _numpy()
+        if numpy is not None:
+            self.layout_bounds = self.layout_bounds.reshape(-1, 4)
+        self.layout_text = _ints(layout_text)
+        self.styles: Dict[str, object] = {
+            name: _ints(column) for name, column in zip(self.computed_styles, styles)
+        }
+        #: the documents (main document and iframes), without their nodes
+        self.documents: List[dict] = [
+            {
+                key: value
+                for key, value in doc.items()
+                if key not in ("nodes", "layout", "textBoxes")
+            }
+            for doc in documents
+        ]
+        self._string_ids: Optional[Dict[str, int]] = None
+        self._subtree_end = None
+        self._text_nodes = None
+        self._owner = None
+
+    def __len__(self):
+        return len(self.parent)
+
+    def string(self, index: int) -> Optional[str]:
+        """
+        :param index: a string index, as found in the columns
+        :return: the string, None for -1
+        """
+        if index < 0:
+            return None
+        return self.strings[index]
+
+    def string_id(self, value: str) -> int:
+        """
+        :param value: a string
+        :return: the index of value in the string table, -1 if it does not occur
+        """
+        if self._string_ids is None:
+            # the first occurrence wins
+            strings = self.strings
+            self._string_ids = dict(
+                zip(reversed(strings), range(len(strings) - 1, -1, -1))
+            )
+        return self._string_ids.get(value, -1)
+
+    def name(self, node: int) -> str:
+        """the node name of a node, eg: "DIV" """
+        return self.strings[self.node_name[node]]
+
+    def attributes(self, node: int) -> Dict[str, str]:
+        """the attributes of a node"""
+        strings = self.strings
+        start, end = int(self.attr_start[node]), int(self.attr_end[node])
+        return {
+            strings[name]: strings[value]
+            for name, value in zip(
+                self.attr_name[start:end], self.attr_value[start:end]
+            )
+        }
+
+    def bounds(self, node: int) -> Optional[Tuple[float, float, float, float]]:
+        """
+        :return: x, y, width and height of a node, None when it is not rendered
+        """
+        row = int(self.layout[node])
+        if row < 0:
+            return None
+        if _numpy() is not None:
+            return tuple(self.layout_bounds[row].tolist())
+        return tuple(self.layout_bounds[row * 4 : row * 4 + 4])
+
+    def style(self, node: int, name: str) -> Optional[str]:
+        """
+        :param node: the node
+        :param name: a computed style which was captured, eg: "display"
+        :return: the computed style of a node, None when it is not rendered
+        """
+        row = int(self.layout[node])
+        if row < 0:
+            return None
+        return self.string(int(self.styles[name][row]))
+
+    def find(
+        self,
+        tag: Optional[str] = None,
+        attribute: Optional[str] = None,
+        value: Optional[str] = None,
+        node_type: Optional[int] = None,
+        visible: Optional[bool] = None,
+    ):
+        """
+        finds nodes by tag, attribute and visibility. all given conditions have to match.
+
+        :param tag: tag name, case insensitive for html elements, eg: "a"
+        :param attribute: nodes which have this attribute
+        :param value: nodes of which the attribute has this value (exact match)
+        :param node_type: nodes of this node type
+        :param visible: True for visible nodes only, False for invisible nodes only (see :py:meth:`visible`)
+        :return: the indices of the nodes, as array
+        """
+        numpy = _numpy()
+        if numpy is not None:
+            mask = numpy.ones(len(self), dtype=bool)
+            if tag is not None:
+                mask &= numpy.isin(self.node_name, self._tag_ids(tag))
+            if node_type is not None:
+                mask &= self.node_type == node_type
+            if attribute is not None:
+                match = self.attr_name == self.string_id(attribute)
+                if value is not None:
+                    match &= self.attr_value == self.string_id(value)
+                owners = numpy.zeros(len(self), dtype=bool)
+                owners[self._attr_owner()[match]] = True
+                mask &= owners
+            if visible is not None:
+                shown = self._visible_mask()
+                mask &= shown if visible else ~shown
+            return numpy.flatnonzero(mask)
+
+        nodes = range(len(self))
+        if tag is not None:
+            ids = set(self._tag_ids(tag))
+            nodes = [i for i in nodes if self.node_name[i] in ids]
+        if node_type is not None:
+            nodes = [i for i in nodes if self.node_type[i] == node_type]
+        if attribute is not None:
+            name_id = self.string_id(attribute)
+            value_id = self.string_id(value) if value is not None else None
+            owner = self._attr_owner()
+            owners = set()
+            for i, (name, each) in enumerate(zip(self.attr_name, self.attr_value)):
+                if name == name_id and (value_id is None or each == value_id):
+                    owners.add(owner[i])
+            nodes = [i for i in nodes if i in owners]
+        if visible is not None:
+            shown = self._visible_mask()
+            nodes = [i for i in nodes if shown[i] == visible]
+        return _ints(nodes)
+
+    def visible(self):
+        """
+        the nodes which are rendered with a non-zero size, and (as far as the captured
+        computed styles tell) are not hidden by display, visibility or opacity.
+
+        :return: the indices of the nodes, as array
+        """
+        numpy = _numpy()
+        if numpy is not None:
+            return numpy.flatnonzero(self._visible_mask())
+        return _ints(i for i, shown in enumerate(self._visible_mask()) if shown)
+
+    def text(self, node: int, separator: str = " ") -> str:
+        """
+        the text of a node and the nodes below it (like :py:attr:`nodriver.Element.text_all`),
+        within the same document. this includes the text of scripts and styles.
+
+        :param node: the node
+        :param separator: joins the texts of the text nodes
+        """
+        return self.texts([node], separator)[0]
+
+    def texts(self, nodes: Sequence[int], separator: str = " ") -> List[str]:
+        """
+        the texts of many nodes at once, see :py:meth:`text`
+
+        :param nodes: the nodes, eg: the result of :py:meth:`find`
+        :param separator: joins the texts of the text nodes
+        """
+        positions, values = self._texts()
+        end = self._subtree_ends()
+        numpy = _numpy()
+        if numpy is not None:
+            nodes = numpy.asarray(nodes, dtype=numpy.int64)
+            starts = numpy.searchsorted(positions, nodes).tolist()
+            stops = numpy.searchsorted(positions, end[nodes]).tolist()
+        else:
+            starts = [bisect.bisect_left(positions, node) for node in nodes]
+            stops = [bisect.bisect_left(positions, end[node]) for node in nodes]
+        return [
+            separator.join(values[start:stop]) for start, stop in zip(starts, stops)
+        ]
+
+    def _tag_ids(self, tag: str) -> List[int]:
+        return [self.string_id(each) for each in {tag, tag.upper()}]
+
+    def _attr_owner(self):
+        # attribute index => node index
+        owner = self._owner
+        if owner is None:
+            numpy = _numpy()
+            if numpy is not None:
+                owner = numpy.repeat(
+                    numpy.arange(len(self)), self.attr_end - self.attr_start
+                )
+            else:
+                owner = array.array("q")
+                for node, (start, end) in enumerate(
+                    zip(self.attr_start, self.attr_end)
+                ):
+                    owner.extend([node] * (end - start))
+            self._owner = owner
+        return owner
+
+    def _visible_mask(self):
+        # node index => whether it is visible
+        numpy = _numpy()
+        if numpy is not None:
+            bounds = self.layout_bounds
+            rows = (bounds[:, 2] > 0) & (bounds[:, 3] > 0)
+            for name, hidden in self._hidden_styles():
+                rows &= ~numpy.isin(self.styles[name], hidden)
+            mask = numpy.zeros(len(self), dtype=bool)
+            mask[self.layout_node[rows]] = True
+            return mask
+        bounds = self.layout_bounds
+        rows = [
+            bounds[row * 4 + 2] > 0 and bounds[row * 4 + 3] > 0
+            for row in range(len(self.layout_node))
+        ]
+        for name, hidden in self._hidden_styles():
+            hidden = set(hidden)
+            rows = [
+                shown and value not in hidden
+                for shown, value in zip(rows, self.styles[name])
+            ]
+        mask = [False] * len(self)
+        for node, shown in zip(self.layout_node, rows):
+            mask[node] = shown
+        return mask
+
+    def _hidden_styles(self) -> List[Tuple[str, List[int]]]:
+        # the captured styles and their values (string indices) which hide a node
+        hidden = {
+            "display": ("none",),
+            "visibility": ("hidden", "collapse"),
+            "opacity": ("0",),
+        }
+        return [
+            (name, [self.string_id(value) for value in hidden[name]])
+            for name in self.computed_styles
+            if name in hidden
+        ]
+
+    def _subtree_ends(self):
+        # node index => index after its last descendant. the nodes are in document order,
+        # so the nodes below a node directly follow it
+        if self._subtree_end is None:
+            end = list(range(1, len(self) + 1))
+            parent = self.parent.tolist() if _numpy() is not None else self.parent
+            for node in range(len(self) - 1, -1, -1):
+                up = parent[node]
+                if up >= 0 and end[node] > end[up]:
+                    end[up] = end[node]
+            self._subtree_end = _ints(end)
+        return self._subtree_end
+
+    def _texts(self) -> Tuple[Sequence[int], List[str]]:
+        # the text nodes in document order, and their values
+        if self._text_nodes is None:
+            numpy = _numpy()
+            if numpy is not None:
+                positions = numpy.flatnonzero(self.node_type == 3)
+                indices = self.node_value[positions].tolist()
+            else:
+                positions = [i for i, each in enumerate(self.node_type) if each == 3]
+                indices = [self.node_value[i] for i in positions]
+            strings = self.strings
+            values = [strings[i] if i >= 0 else "" for i in indices]
+            self._text_nodes = positions, values
+        return self._text_nodes
+
+    def __repr__(self):
+        return "<%s [nodes: %d] [documents: %d] [strings: %d] [numpy: %s]>" % (
+            self.__class__.__name__,
+            len(self),
+            len(self.documents),
+            len(self.strings),
+            _numpy() is not None,
+        )
@@ -12,6 +12,8 @@ from . import element
 from . import util
 from .config import PathLike
 from .connection import Connection, ProtocolException
+from .document import DocumentIndex, DomMirror
+from .snapshot import DEFAULT_STYLES, PageSnapshot
 from .. import cdp
 
 logger = logging.getLogger(__name__)
@@ -129,6 +131,7 @@ class Tab(Connection):
         super().__init__(websocket_url, target, browser, **kwargs)
         self.browser = browser
         self._dom = None
+        self._dom_mirror: Optional[DomMirror] = None
         self._window_id = None
 
     @property
@@ -136,14 +139,22 @@ class Tab(Connection):
         """
         get the inspector url. this url can be used in another browser to show you the devtools interface for
         current tab. useful for debugging (and headless)
-        :return:
+
+        not available when the browser is controlled through pipes (see Config.use_pipe),
+        since it does not serve http then.
+        :return: the url, or None when using pipes
         :rtype:
         """
+        if self.browser.config.use_pipe:
+            return None
         return f"http://{self.browser.config.host}:{self.browser.config.port}/devtools/inspector.html?ws={self.websocket_url[5:]}"
 
     def inspector_open(self):
         import webbrowser
 
+        if not self.inspector_url:
+            logger.warning("the inspector is not available when using pipes")
+            return
         webbrowser.open(self.inspector_url, new=2)
 
     async def open_external_inspector(self):
@@ -153,6 +164,9 @@ class Tab(Connection):
         """
         import webbrowser
 
+        if not self.inspector_url:
+            logger.warning("the inspector is not available when using pipes")
+            return
         webbrowser.open(self.inspector_url)
 
     async def find(
@@ -315,7 +329,11 @@ class Tab(Connection):
         return items
 
     async def get(
-        self, url="chrome://welcome", new_tab: bool = False, new_window: bool = False
+        self,
+        url="chrome://welcome",
+        new_tab: bool = False,
+        new_window: bool = False,
+        wait_until: str = None,
     ):
         """top level get. utilizes the first tab to retrieve given url.
 
@@ -326,6 +344,9 @@ class Tab(Connection):
         :param url: the url to navigate to
         :param new_tab: open new tab
         :param new_window:  open new window
+        :param wait_until: wait for "networkidle0", "networkidle2", "load" or "domcontentloaded"
+            instead of waiting for the connection to be idle. see :py:meth:`~wait`
+        :raises asyncio.TimeoutError: when the wait_until condition was not met within 30 seconds
         :return: Page
         """
         if not self.browser:
@@ -336,7 +357,13 @@ class Tab(Connection):
             new_tab = True
 
         if new_tab:
-            return await self.browser.get(url, new_tab, new_window)
+            return await self.browser.get(url, new_tab, new_window, wait_until)
+        elif wait_until:
+            # start tracking before navigating, so no request is missed
+            await self.network_idle.start()
+            frame_id, loader_id, *_ = await self.send(cdp.page.navigate(url))
+            await self._wait_until(wait_until, loader_id=loader_id)
+            return self
         else:
             frame_id, loader_id, *_ = await self.send(cdp.page.navigate(url))
             await self
@@ -361,8 +388,10 @@ class Tab(Connection):
         :rtype:
         """
 
+        index = None
         if not _node:
-            doc: cdp.dom.Node = await self.send(cdp.dom.get_document(-1, True))
+            index = await self.get_document_index()
+            doc = index.root
         else:
             doc = _node
             if _node.node_name == "IFRAME":
@@ -388,22 +417,17 @@ class Tab(Connection):
                     )
                     return await self.query_selector_all(selector, _node)
             else:
-                await self.send(cdp.dom.disable())
+                await self._disable_dom()
                 raise
         if not node_ids:
             return []
-        items = []
-
-        for nid in node_ids:
-            node = util.filter_recurse(doc, lambda n: n.node_id == nid)
-            # we pass along the retrieved document tree,
-            # to improve performance
-            if not node:
-                continue
-            elem = element.create(node, self, doc)
-            items.append(elem)
-
-        return items
+        # we pass along the retrieved document tree (and its index),
+        # to improve performance
+        if index is None:
+            index = DocumentIndex(
+                doc.node if isinstance(doc, element.Element) else doc
+            )
+        return [element.create(node, self, index) for node in index.find_all(node_ids)]
 
     async def query_selector(
         self,
@@ -420,8 +444,10 @@ class Tab(Connection):
         """
         selector = selector.strip()
 
+        index = None
         if not _node:
-            doc: cdp.dom.Node = await self.send(cdp.dom.get_document(-1, True))
+            index = await self.get_document_index()
+            doc = index.root
         else:
             doc = _node
             if _node.node_name == "IFRAME":
@@ -445,14 +471,18 @@ class Tab(Connection):
                     )
                     return await self.query_selector(selector, _node)
             else:
-                await self.send(cdp.dom.disable())
+                await self._disable_dom()
                 raise
         if not node_id:
             return
-        node = util.filter_recurse(doc, lambda n: n.node_id == node_id)
+        if index is None:
+            index = DocumentIndex(
+                doc.node if isinstance(doc, element.Element) else doc
+            )
+        node = index.get(node_id)
         if not node:
             return
-        return element.create(node, self, doc)
+        return element.create(node, self, index)
 
     async def find_elements_by_text(
         self,
@@ -472,7 +502,8 @@ class Tab(Connection):
         :rtype:
         """
         text = text.strip()
-        doc = await self.send(cdp.dom.get_document(-1, True))
+        index = await self.get_document_index()
+        doc = index.root
         search_id, nresult = await self.send(cdp.dom.perform_search(text, True))
         if nresult:
             node_ids = await self.send(
@@ -485,7 +516,7 @@ class Tab(Connection):
 
         items = []
         for nid in node_ids:
-            node = util.filter_recurse(doc, lambda n: n.node_id == nid)
+            node = index.get(nid)
             if not node:
                 node = await self.send(cdp.dom.resolve_node(node_id=nid))
                 if not node:
@@ -493,7 +524,7 @@ class Tab(Connection):
                 # remote_object = await self.send(cdp.dom.resolve_node(backend_node_id=node.backend_node_id))
                 # node_id = await self.send(cdp.dom.request_node(object_id=remote_object.object_id))
             try:
-                elem = element.create(node, self, doc)
+                elem = element.create(node, self, index)
             except:  # noqa
                 continue
             if elem.node_type == 3:
@@ -530,13 +561,16 @@ class Tab(Connection):
                     )
                     if iframe_text_nodes:
                         iframe_text_elems = [
-                            element.create(text_node, self, iframe_elem.tree)
+                            element.create(text_node, self, iframe_elem.index)
                             for text_node in iframe_text_nodes
                         ]
-                        items.extend(
-                            text_node.parent for text_node in iframe_text_elems
-                        )
-        await self.send(cdp.dom.disable())
+                        # the search results may have included these already
+                        found = {item.backend_node_id for item in items if item}
+                        for text_elem in iframe_text_elems:
+                            parent = text_elem.parent
+                            if not parent or parent.backend_node_id not in found:
+                                items.append(parent)
+        await self._disable_dom()
         return items or []
 
     async def find_element_by_text(
@@ -561,7 +595,8 @@ class Tab(Connection):
         :return:
         :rtype:
         """
-        doc = await self.send(cdp.dom.get_document(-1, True))
+        index = await self.get_document_index()
+        doc = index.root
         text = text.strip()
         search_id, nresult = await self.send(cdp.dom.perform_search(text, True))
 
@@ -572,9 +607,9 @@ class Tab(Connection):
             node_ids = []
         items = []
         for nid in node_ids:
-            node = util.filter_recurse(doc, lambda n: n.node_id == nid)
+            node = index.get(nid)
             try:
-                elem = element.create(node, self, doc)
+                elem = element.create(node, self, index)
             except:  # noqa
                 continue
             if elem.node_type == 3:
@@ -610,10 +645,15 @@ class Tab(Connection):
                 )
                 if iframe_text_nodes:
                     iframe_text_elems = [
-                        element.create(text_node, self, iframe_elem.tree)
+                        element.create(text_node, self, iframe_elem.index)
                         for text_node in iframe_text_nodes
                     ]
-                    items.extend(text_node.parent for text_node in iframe_text_elems)
+                    # the search results may have included these already
+                    found = {item.backend_node_id for item in items if item}
+                    for text_elem in iframe_text_elems:
+                        parent = text_elem.parent
+                        if not parent or parent.backend_node_id not in found:
+                            items.append(parent)
         try:
             if not items:
                 return
@@ -630,7 +670,7 @@ class Tab(Connection):
                     if elem:
                         return elem
         finally:
-            await self.send(cdp.dom.disable())
+            await self._disable_dom()
 
     async def back(self):
         """
@@ -888,13 +928,89 @@ class Tab(Connection):
         )
         return window_id, bounds
 
+    @property
+    def dom_mirror(self) -> Optional[DomMirror]:
+        """the dom mirror of this tab, when enabled using :py:meth:`mirror_dom`"""
+        return self._dom_mirror
+
+    async def mirror_dom(self, enabled: bool = True) -> Optional[DomMirror]:
+        """
+        keeps a copy of the document of this tab, which is updated using the DOM events,
+        so element lookups (query_selector(_all), find_*, Element.update) don't fetch the
+        whole document on every call. the document is only fetched again after it has been
+        replaced, eg: by navigating. see :py:class:`nodriver.core.document.DomMirror`
+
+        worth it on large pages which are queried a lot.
+
+        :param enabled: False stops mirroring
+        :return: the mirror, or None when disabled
+        """
+        if enabled and self._dom_mirror is None:
+            self._dom_mirror = await DomMirror(self).start()
+        elif not enabled and self._dom_mirror is not None:
+            self._dom_mirror.stop()
+            self._dom_mirror = None
+        return self._dom_mirror
+
+    async def get_document_index(self) -> DocumentIndex:
+        """
+        the index of the whole document, including shadow roots and iframes.
+        it is read from the dom mirror when enabled (see :py:meth:`mirror_dom`), otherwise
+        the document is fetched.
+
+        :return: the index, of which .root is the document node
+        """
+        if self._dom_mirror is not None:
+            return await self._dom_mirror.get_index()
+        doc = await self.send(util.get_document_command())
+        if doc is None:
+            raise ProtocolException("could not fetch the document of %s" % self)
+        return DocumentIndex(doc)
+
+    async def snapshot(
+        self,
+        computed_styles: typing.Sequence[str] = DEFAULT_STYLES,
+        timeout: Optional[float] = None,
+    ) -> Optional[PageSnapshot]:
+        """
+        captures the whole page, including iframes, in one round trip, as columns
+        (parent, node type, name, value, attributes, layout bounds and computed styles) instead
+        of elements. much faster than going through elements when extracting data from
+        many nodes. see :py:class:`nodriver.core.snapshot.PageSnapshot`
+
+        .. code-block::
+
+            snap = await tab.snapshot()
+            links = snap.find(tag="a", attribute="href", visible=True)
+            print(snap.texts(links))
+
+        :param computed_styles: the computed styles to capture, the defaults are used by PageSnapshot.visible()
+        :param timeout: seconds to wait for the answer, see :py:meth:`~send`
+        :return: the snapshot
+        """
+        computed_styles = list(computed_styles)
+        # the result is decoded into columns directly, instead of into cdp.dom_snapshot classes
+        result = await self.send_raw(
+            "DOMSnapshot.captureSnapshot",
+            {"computedStyles": computed_styles},
+            timeout=timeout,
+        )
+        if result is None:
+            return None
+        return PageSnapshot(result, computed_styles)
+
+    async def _disable_dom(self):
+        # the dom mirror needs the DOM domain to stay enabled, to receive its events
+        if self._dom_mirror is None:
+            await self.send(cdp.dom.disable())
+
     async def get_content(self):
         """
         gets the current page source content (html)
         :return:
         :rtype:
         """
-        doc: cdp.dom.Node = await self.send(cdp.dom.get_document(-1, True))
+        doc = (await self.get_document_index()).root
         return await self.send(
             cdp.dom.get_outer_html(backend_node_id=doc.backend_node_id)
         )
@@ -1340,19 +1456,15 @@ class Tab(Connection):
         # there must be a better way...
         origin = "/".join(self.url.split("/", 3)[:-1])
 
-        await asyncio.gather(
-            *[
-                self.send(
-                    cdp.dom_storage.set_dom_storage_item(
-                        storage_id=cdp.dom_storage.StorageId(
-                            is_local_storage=True, security_origin=origin
-                        ),
-                        key=str(key),
-                        value=str(val),
-                    )
-                )
-                for key, val in items.items()
-            ]
+        await self.send_many(
+            cdp.dom_storage.set_dom_storage_item(
+                storage_id=cdp.dom_storage.StorageId(
+                    is_local_storage=True, security_origin=origin
+                ),
+                key=str(key),
+                value=str(val),
+            )
+            for key, val in items.items()
         )
 
     def __call__(
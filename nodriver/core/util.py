@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import functools
 import logging
 import shutil
 import types
@@ -22,6 +24,16 @@ logger = logging.getLogger(__name__)
 T = typing.TypeVar("T")
 
 
+@functools.lru_cache(maxsize=None)
+def get_document_command() -> cdp.util.Command:
+    """
+    DOM.getDocument(depth=-1, pierce=True), which fetches the whole document.
+    most element lookups send it, so it is made once (see cdp.util.Command).
+    made on first use, since it imports the dom domain.
+    """
+    return cdp.util.Command.of(cdp.dom.get_document(-1, True))
+
+
 async def start(
     config: Optional[Config] = None,
     *,
@@ -298,11 +310,22 @@ def compare_target_info(
     :return:
     :rtype:
     """
-    d1 = info1.__dict__
-    d2 = info2.__dict__
+    d1 = cdp_fields(info1)
+    d2 = cdp_fields(info2)
     return [(k, v, d2[k]) for (k, v) in d1.items() if d2[k] != v]
 
 
+def cdp_fields(obj) -> dict:
+    """
+    returns the fields of a cdp object (eg: TargetInfo, Cookie) as a (shallow) dict.
+    the cdp types are slotted, so they don't have a __dict__.
+
+    :param obj: instance of a cdp type
+    :return: {field_name: value}
+    """
+    return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+
+
 def loop():
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)